@@ -0,0 +1,380 @@
+"""
+스레드형 댓글 로더 (최상위 댓글 커서 페이지 + 스레드별 앞쪽 답글 N개)
+
+기존 get_comments: 게시글의 삭제되지 않은 댓글 전체를 한 번에 조회해서 하나씩 응답 모델로 변환
+→ 댓글이 수천 개인 경기 스레드 글은 응답이 수 MB
+
+- 최상위 댓글만 (created_at, comment_id) 키셋으로 limit개, 스레드마다 답글 앞쪽 replies개 + 전체 답글 수
+- comment_threads RPC 한 번으로 조회 (없으면 최상위 페이지 + 그 페이지 답글 쿼리 2개)
+- 조회 결과(최상위/답글 순서 무관)를 한 번 순회해서 스레드 조립
+- 첫 페이지는 조립 결과를 프로세스 메모리에 캐시, 그 게시글의 댓글 쓰기(작성/수정/삭제) 시 무효화
+  (캐시된 첫 페이지를 지우고, 조회 중이던 이전 결과는 저장하지 않음 - 무효화 횟수는 조회 중인 게시글만 보관)
+- 좋아요는 카운터 버퍼에만 더해지고 응답 시 버퍼 증가분을 얹으므로 좋아요마다 무효화하지 않음
+  → 버퍼가 그 댓글의 좋아요를 DB에 반영한 직후에 무효화 (캐시된 반영 전 값 + 0으로 뒤로 가지 않게)
+- 같은 첫 페이지 동시 미스는 조회 하나로 합침 (SingleFlight)
+- posts.comment_count는 adjust_comment_count RPC로 DB에서 원자적으로 증감 (읽고 쓰기 경합 없음)
+- RPC가 없을 때(PGRST202/404)만 대체 경로로 전환, 타임아웃 등 다른 오류로는 전환하지 않음
+
+📌 Supabase SQL (선택, 없으면 쿼리 2개 / 기존 읽고 쓰기로 동작):
+    create or replace function comment_threads(
+        p_post_id text, p_after_created_at text, p_after_id text, p_limit int, p_replies int
+    ) returns setof jsonb language sql stable as $$
+        with top as (
+            select * from comments
+             where post_id = p_post_id and parent_comment_id is null and is_deleted = false
+               and (p_after_created_at is null
+                    or created_at > p_after_created_at::timestamptz
+                    or (created_at = p_after_created_at::timestamptz and comment_id > p_after_id))
+             order by created_at, comment_id
+             limit p_limit + 1
+        ), replies as (
+            select r.*,
+                   row_number() over (partition by r.parent_comment_id order by r.created_at, r.comment_id) as rn,
+                   count(*) over (partition by r.parent_comment_id) as reply_count
+              from comments r join top t on r.parent_comment_id = t.comment_id
+             where r.is_deleted = false
+        )
+        select to_jsonb(t) || jsonb_build_object('reply_count',
+                   coalesce((select max(r.reply_count) from replies r where r.parent_comment_id = t.comment_id), 0))
+          from top t
+        union all
+        select to_jsonb(r) - 'rn' - 'reply_count' from replies r where r.rn <= p_replies;
+    $$;
+
+    create or replace function adjust_comment_count(p_post_id text, p_delta int)
+    returns int language sql as $$
+        update posts set comment_count = greatest(comment_count + p_delta, 0)
+         where post_id = p_post_id
+        returning comment_count;
+    $$;
+
+    create index if not exists comments_parent_created_at_idx
+        on comments (parent_comment_id, created_at, comment_id) where is_deleted = false;
+
+Example:
+    >>> threads, next_cursor = await get_comment_thread_loader().load_page(db, post_id, limit=20, replies=3)
+    >>> get_comment_thread_loader().invalidate(post_id)  # 댓글 쓰기 후
+"""
+import logging
+import os
+import threading
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from llm_service.utils.single_flight import SingleFlight
+from llm_service.utils.ttl_cache import TTLCache
+
+from .counter_buffer import get_counter_buffer
+from .db_executor import db_execute, is_missing_rpc_error
+from .pagination import apply_keyset, decode_cursor, encode_cursor, split_page
+
+logger = logging.getLogger(__name__)
+
+COMMENT_THREAD_CACHE_SIZE = int(os.getenv("COMMENT_THREAD_CACHE_SIZE", "1000"))
+COMMENT_THREAD_CACHE_TTL_SECONDS = float(os.getenv("COMMENT_THREAD_CACHE_TTL_SECONDS", "30"))
+COMMENT_THREADS_RPC = "comment_threads"
+COMMENT_COUNT_RPC = "adjust_comment_count"
+
+
+def _reply_cursor(row: dict) -> str:
+    created_at = row["created_at"]
+    return encode_cursor(created_at if isinstance(created_at, str) else created_at.isoformat(), row["comment_id"])
+
+
+def assemble_threads(rows: List[dict], replies_per_thread: int) -> List[Dict[str, Any]]:
+    """
+    댓글 행 → 스레드 목록 (한 번 순회)
+
+    최상위 댓글과 답글이 섞여 있어도 됨 (답글은 스레드 안에서 작성순으로 들어온다고 가정)
+    스레드 순서는 최상위 댓글 순서, 최상위 댓글이 없는 답글은 버림
+
+    Returns:
+        [{"comment": 행, "replies": 앞쪽 답글 행, "reply_count": 전체 답글 수, "next_reply_cursor": ...}]
+    """
+    threads: Dict[str, Dict[str, Any]] = {}
+    order: List[str] = []
+    for row in rows:
+        parent_id = row.get("parent_comment_id")
+        thread_id = parent_id or row["comment_id"]
+        thread = threads.get(thread_id)
+        if thread is None:
+            thread = threads[thread_id] = {"comment": None, "replies": [], "reply_count": 0, "seen": 0}
+        if parent_id is None:
+            thread["comment"] = row
+            thread["reply_count"] = row.get("reply_count") or 0
+            order.append(thread_id)
+        else:
+            thread["seen"] += 1
+            if len(thread["replies"]) < replies_per_thread:
+                thread["replies"].append(row)
+
+    result = []
+    for thread_id in order:
+        thread = threads[thread_id]
+        reply_count = max(thread.pop("seen"), thread["reply_count"])
+        thread["reply_count"] = reply_count
+        replies = thread["replies"]
+        thread["next_reply_cursor"] = (
+            _reply_cursor(replies[-1]) if replies and reply_count > len(replies) else None
+        )
+        result.append(thread)
+    return result
+
+
+class CommentThreadLoader:
+    """
+    스레드형 댓글 조회 + 첫 페이지 캐시
+
+    Args:
+        maxsize: 캐시할 (게시글, 페이지 크기, 답글 수) 조합 수
+        ttl_seconds: 첫 페이지 캐시 유지 시간 (다른 인스턴스의 쓰기는 이 시간 안에 반영)
+    """
+
+    def __init__(
+        self,
+        maxsize: int = COMMENT_THREAD_CACHE_SIZE,
+        ttl_seconds: float = COMMENT_THREAD_CACHE_TTL_SECONDS,
+    ):
+        self.cache = TTLCache(maxsize=maxsize, ttl_seconds=ttl_seconds)
+        self.flights = SingleFlight()
+        self._lock = threading.Lock()
+        # 캐시한 적 있는 (페이지 크기, 답글 수) 조합 (무효화 시 게시글의 첫 페이지를 모두 지우려고, 쿼리 범위로 제한됨)
+        self._shapes: Set[Tuple[int, int]] = set()
+        # 첫 페이지를 조회 중인 게시글만: [진행 중 조회 수, 조회 도중 무효화 횟수] (조회가 모두 끝나면 삭제)
+        self._loading: Dict[str, List[int]] = {}
+        # 좋아요 증가분이 카운터 버퍼에 남아 있는 댓글 → 게시글 (반영되면 그 게시글 첫 페이지 무효화)
+        self._liked: Dict[str, str] = {}
+        self.rpc_available: Optional[bool] = None
+        self.count_rpc_available: Optional[bool] = None
+        self.loads = {"rpc": 0, "queries": 0}
+        self.rpc_errors = 0
+        self.invalidations = 0
+
+    def _generation(self, post_id: str) -> int:
+        """조회 중인 첫 페이지가 시작된 뒤의 무효화 횟수 (조회 중이 아니면 0)"""
+        with self._lock:
+            entry = self._loading.get(post_id)
+            return entry[1] if entry is not None else 0
+
+    def _begin_load(self, post_id: str) -> int:
+        with self._lock:
+            entry = self._loading.setdefault(post_id, [0, 0])
+            entry[0] += 1
+            return entry[1]
+
+    def _end_load(self, post_id: str, generation: int) -> bool:
+        """조회 종료 (조회 도중 무효화가 없었으면 True)"""
+        with self._lock:
+            entry = self._loading[post_id]
+            entry[0] -= 1
+            if entry[0] == 0:
+                del self._loading[post_id]
+            return entry[1] == generation
+
+    def invalidate(self, post_id: str) -> None:
+        """댓글 작성/수정/삭제 후, 좋아요 반영 후 호출 (다음 첫 페이지 요청에서 다시 조회)"""
+        with self._lock:
+            entry = self._loading.get(post_id)
+            if entry is not None:
+                entry[1] += 1
+            shapes = list(self._shapes)
+            self.invalidations += 1
+        for limit, replies in shapes:
+            self.cache.delete((post_id, limit, replies))
+
+    def track_like(self, post_id: str, comment_id: str) -> None:
+        """댓글 좋아요를 카운터 버퍼에 더할 때 호출 (버퍼가 DB에 반영하면 첫 페이지 무효화)"""
+        with self._lock:
+            self._liked[comment_id] = post_id
+
+    def counters_flushed(self, keys: List[Tuple[str, str]]) -> None:
+        """카운터 버퍼 반영 알림 (CounterBuffer.add_flush_listener): 좋아요가 반영된 댓글의 게시글 무효화"""
+        with self._lock:
+            post_ids = {
+                self._liked.pop(row_id)
+                for table, row_id in keys
+                if table == "comments" and row_id in self._liked
+            }
+        for post_id in post_ids:
+            self.invalidate(post_id)
+
+    # ============================================
+    # DB 조회
+    # ============================================
+
+    async def _fetch_rpc(self, db, post_id: str, limit: int, replies: int, cursor: Optional[str]) -> List[dict]:
+        after_created_at, after_id = decode_cursor(cursor) if cursor else (None, None)
+        result = await db_execute(db.rpc(COMMENT_THREADS_RPC, {
+            "p_post_id": post_id,
+            "p_after_created_at": after_created_at,
+            "p_after_id": after_id,
+            "p_limit": limit,
+            "p_replies": replies,
+        }))
+        return result.data or []
+
+    async def _fetch_queries(self, db, post_id: str, limit: int, replies: int, cursor: Optional[str]) -> List[dict]:
+        """RPC가 없을 때: 최상위 댓글 페이지 + 그 페이지 스레드들의 답글 (쿼리 2개)"""
+        query = (
+            db.table("comments").select("*")
+            .eq("post_id", post_id).is_("parent_comment_id", "null").eq("is_deleted", False)
+        )
+        result = await db_execute(apply_keyset(query, "comment_id", cursor, desc=False).limit(limit + 1))
+        top = result.data or []
+        if not top or replies <= 0:
+            return top
+        reply_result = await db_execute(
+            db.table("comments").select("*")
+            .in_("parent_comment_id", [row["comment_id"] for row in top[:limit]])
+            .eq("is_deleted", False)
+            .order("created_at").order("comment_id")
+        )
+        return top + (reply_result.data or [])
+
+    async def _fetch(self, db, post_id: str, limit: int, replies: int, cursor: Optional[str]) -> List[dict]:
+        if self.rpc_available is not False:
+            try:
+                rows = await self._fetch_rpc(db, post_id, limit, replies, cursor)
+                self.rpc_available = True
+                self.loads["rpc"] += 1
+                return rows
+            except Exception as e:
+                if not is_missing_rpc_error(e):
+                    # 일시적 오류일 수 있으므로 RPC는 계속 사용, 이번 조회만 쿼리로 (조회라 다시 읽어도 안전)
+                    self.rpc_errors += 1
+                    logger.warning(f"⚠️ {COMMENT_THREADS_RPC} RPC 실패, 이번 조회는 쿼리 2개로: {e}")
+                else:
+                    if self.rpc_available is not False:
+                        logger.info(f"⏭️ {COMMENT_THREADS_RPC} RPC 없음, 쿼리 2개로 조회: {e}")
+                    self.rpc_available = False
+        rows = await self._fetch_queries(db, post_id, limit, replies, cursor)
+        self.loads["queries"] += 1
+        return rows
+
+    async def _load(self, db, post_id: str, limit: int, replies: int, cursor: Optional[str]) -> Tuple[List[dict], Optional[str]]:
+        rows = await self._fetch(db, post_id, limit, replies, cursor)
+        top = [row for row in rows if row.get("parent_comment_id") is None]
+        page, next_cursor = split_page(top, limit, "comment_id")
+        if len(page) < len(top):
+            # 다음 페이지 확인용으로 더 읽은 최상위 댓글의 답글은 제외
+            extra = {row["comment_id"] for row in top[len(page):]}
+            rows = [row for row in rows if row["comment_id"] not in extra and row.get("parent_comment_id") not in extra]
+        return assemble_threads(rows, replies), next_cursor
+
+    # ============================================
+    # 조회
+    # ============================================
+
+    async def load_page(
+        self, db, post_id: str, limit: int, replies: int, cursor: Optional[str] = None
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        스레드 한 페이지 (첫 페이지는 캐시)
+
+        반환하는 행은 캐시와 공유하므로 수정하지 말 것 (카운터 반영 등은 복사본에)
+
+        Returns:
+            (스레드 목록, 다음 페이지 커서)
+        """
+        if cursor:
+            return await self._load(db, post_id, limit, replies, cursor)
+
+        key = (post_id, limit, replies)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+
+        async def load_and_store():
+            generation = self._begin_load(post_id)
+            try:
+                page = await self._load(db, post_id, limit, replies, None)
+            finally:
+                unchanged = self._end_load(post_id, generation)
+            if unchanged:
+                with self._lock:
+                    self._shapes.add((limit, replies))
+                self.cache.set(key, page)
+            return page
+
+        # 무효화 이후 요청은 그 전에 시작한 조회에 합치지 않음
+        page, _ = await self.flights.do(key + (self._generation(post_id),), load_and_store)
+        return page
+
+    async def load_replies(
+        self, db, post_id: str, comment_id: str, limit: int, cursor: Optional[str] = None
+    ) -> Tuple[List[dict], Optional[str]]:
+        """한 스레드의 답글 (created_at, comment_id) 오름차순 키셋 페이지"""
+        query = (
+            db.table("comments").select("*")
+            .eq("post_id", post_id).eq("parent_comment_id", comment_id).eq("is_deleted", False)
+        )
+        result = await db_execute(apply_keyset(query, "comment_id", cursor, desc=False).limit(limit + 1))
+        return split_page(result.data or [], limit, "comment_id")
+
+    # ============================================
+    # 댓글 수
+    # ============================================
+
+    async def adjust_comment_count(self, db, post_id: str, delta: int) -> Optional[int]:
+        """
+        posts.comment_count += delta (0 미만으로 내려가지 않음)
+
+        RPC가 없으면 기존처럼 읽고 쓰기 (동시 요청끼리 증감분 유실 가능)
+        RPC가 다른 이유로 실패하면 로그만 남기고 다시 적용하지 않음 (타임아웃이면 DB는 이미 반영했을 수 있음)
+
+        Returns:
+            변경 후 댓글 수 (알 수 없으면 None)
+        """
+        if not delta:
+            return None
+        if self.count_rpc_available is not False:
+            try:
+                result = await db_execute(db.rpc(COMMENT_COUNT_RPC, {"p_post_id": post_id, "p_delta": delta}))
+                self.count_rpc_available = True
+                data = result.data
+                if isinstance(data, list):
+                    data = data[0] if data else None
+                if isinstance(data, dict):
+                    data = data.get(COMMENT_COUNT_RPC, data.get("comment_count"))
+                return data
+            except Exception as e:
+                if not is_missing_rpc_error(e):
+                    self.rpc_errors += 1
+                    logger.error(f"❌ {COMMENT_COUNT_RPC} 실패 ({post_id}, {delta:+d}), 다시 적용하지 않음: {e}")
+                    return None
+                if self.count_rpc_available is not False:
+                    logger.warning(f"⚠️ {COMMENT_COUNT_RPC} RPC 없음, 댓글 수를 읽고 쓰기로 갱신 (동시 요청 시 유실 가능): {e}")
+                self.count_rpc_available = False
+
+        post_result = await db_execute(db.table("posts").select("comment_count").eq("post_id", post_id))
+        if not post_result.data:
+            return None
+        new_count = max(0, (post_result.data[0].get("comment_count") or 0) + delta)
+        await db_execute(db.table("posts").update({"comment_count": new_count}).eq("post_id", post_id))
+        return new_count
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "first_pages": self.cache.get_stats(),
+            "coalesced": self.flights.shared,
+            "loads": dict(self.loads),
+            "rpc_available": self.rpc_available,
+            "count_rpc_available": self.count_rpc_available,
+            "rpc_errors": self.rpc_errors,
+            "invalidations": self.invalidations,
+            "liked_comments": len(self._liked),
+        }
+
+
+# ============================================
+# 싱글톤
+# ============================================
+_comment_thread_loader: Optional[CommentThreadLoader] = None
+
+
+def get_comment_thread_loader() -> CommentThreadLoader:
+    """공용 스레드형 댓글 로더 (처음 호출 시 생성)"""
+    global _comment_thread_loader
+    if _comment_thread_loader is None:
+        _comment_thread_loader = CommentThreadLoader()
+        get_counter_buffer().add_flush_listener(_comment_thread_loader.counters_flushed)
+    return _comment_thread_loader
@@ -0,0 +1,437 @@
+"""
+조회수 / 좋아요 write-behind 카운터 버퍼
+
+기존: 조회/좋아요마다 행을 읽고 update({"views": 읽은 값 + 1})
+→ 요청당 DB 왕복 2번, 동시 요청끼리 같은 값을 읽어서 증가분 유실, 인기 게시글 행에 락 경합
+
+- 증가분은 메모리에 (테이블, id)별로 합산만 하고 (DB 호출 없음)
+- FLUSH 주기마다 합산된 증가분을 increment_counters RPC 한 번으로 반영 (행마다 `views = views + delta`)
+- 반영 중/반영 실패한 증가분도 읽기 경로(buffered)에 포함 → 응답 값이 뒤로 가지 않음
+- 반영 실패 시 증가분을 버퍼로 되돌려서 다음 주기에 재시도 (버퍼 행 수는 COUNTER_MAX_BACKLOG_ROWS까지)
+  단, 보낸 뒤 응답을 못 받은 배치(읽기 타임아웃 등)는 되돌리지 않음 (아래 반영 보장)
+- 시작 시 RPC 배포 여부 확인 → 없으면 error 로그 후 행별 읽고 update로 반영 (원자적이지 않음)
+- 종료(lifespan) 시 남은 증가분 반영
+- 반영이 끝난 행은 add_flush_listener로 등록한 콜백에 알림 (반영 전 값을 캐시한 쪽의 무효화용)
+
+📌 반영 보장: 증가분은 최대 한 번 반영 (at-most-once, 중복 반영 없음)
+   RPC/update를 보낸 뒤 읽기 타임아웃·응답 도중 연결 끊김이면 DB가 이미 커밋했을 수 있으므로
+   그 배치는 반영된 것으로 보고 다시 보내지 않음 → 실제로는 반영되지 않았다면 그 증가분은 유실
+   (get_stats()의 unconfirmed_rows로 집계, 조회수/좋아요라 중복보다 유실을 택함)
+⚠️ 프로세스가 비정상 종료되면 마지막 주기(기본 5초)의 증가분은 유실될 수 있음 (조회수/좋아요만 사용)
+⚠️ 인스턴스가 여러 개면 각자 버퍼를 반영 (RPC가 덧셈이라 합계는 맞음, 응답 값은 자기 버퍼만 포함)
+
+📌 Supabase SQL (SQL Editor에서 한 번 실행):
+    create or replace function increment_counters(updates jsonb)
+    returns void language sql as $$
+        update posts p
+           set views = p.views + coalesce((u->'deltas'->>'views')::int, 0),
+               likes = p.likes + coalesce((u->'deltas'->>'likes')::int, 0)
+          from jsonb_array_elements(updates) u
+         where u->>'table' = 'posts' and p.post_id = u->>'id';
+        update comments c
+           set likes = c.likes + coalesce((u->'deltas'->>'likes')::int, 0)
+          from jsonb_array_elements(updates) u
+         where u->>'table' = 'comments' and c.comment_id = u->>'id';
+    $$;
+
+Example:
+    >>> counters = get_counter_buffer()
+    >>> views = post["views"] + counters.increment("posts", post_id, "views")
+"""
+import asyncio
+import logging
+import os
+import threading
+import time
+from collections import Counter
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .db_executor import db_execute, is_missing_rpc_error, is_unconfirmed_write_error
+from .dependencies import get_optional_supabase_db
+
+logger = logging.getLogger(__name__)
+
+COUNTER_FLUSH_INTERVAL_SECONDS = float(os.getenv("COUNTER_FLUSH_INTERVAL_SECONDS", "5"))
+# 버퍼에 쌓인 행이 이 수를 넘으면 주기를 기다리지 않고 반영
+COUNTER_FLUSH_MAX_PENDING = int(os.getenv("COUNTER_FLUSH_MAX_PENDING", "1000"))
+# RPC 한 번에 보내는 최대 행 수
+COUNTER_FLUSH_BATCH_SIZE = int(os.getenv("COUNTER_FLUSH_BATCH_SIZE", "500"))
+COUNTER_FLUSH_RPC = "increment_counters"
+# 반영이 계속 실패할 때 버퍼에 쌓아 둘 최대 행 수 (넘는 새 행의 증가분은 버림)
+COUNTER_MAX_BACKLOG_ROWS = int(os.getenv("COUNTER_MAX_BACKLOG_ROWS", "100000"))
+
+# 버퍼로 증가시킬 수 있는 테이블 → 카운터 컬럼 (RPC SQL과 같게 유지)
+COUNTER_FIELDS: Dict[str, Tuple[str, ...]] = {
+    "posts": ("views", "likes"),
+    "comments": ("likes",),
+}
+# RPC가 없을 때 행별 update에 쓰는 id 컬럼
+COUNTER_ID_COLUMNS: Dict[str, str] = {"posts": "post_id", "comments": "comment_id"}
+
+RowKey = Tuple[str, str]  # (테이블, 행 id)
+
+
+class CounterBuffer:
+    """
+    카운터 증가분 합산 + 주기 반영 (FastAPI lifespan에서 시작/종료)
+
+    Args:
+        db_getter: Supabase 클라이언트 반환 함수 (None을 반환하면 반영 보류)
+        interval_seconds: 반영 주기
+        max_pending: 이 행 수를 넘으면 바로 반영
+        batch_size: RPC 한 번에 보내는 최대 행 수
+        max_backlog: 버퍼에 쌓아 둘 최대 행 수 (반영이 계속 실패할 때 메모리 상한)
+    """
+
+    def __init__(
+        self,
+        db_getter: Callable[[], Any] = get_optional_supabase_db,
+        interval_seconds: float = COUNTER_FLUSH_INTERVAL_SECONDS,
+        max_pending: int = COUNTER_FLUSH_MAX_PENDING,
+        batch_size: int = COUNTER_FLUSH_BATCH_SIZE,
+        max_backlog: int = COUNTER_MAX_BACKLOG_ROWS,
+    ):
+        self.db_getter = db_getter
+        self.interval_seconds = interval_seconds
+        self.max_pending = max_pending
+        self.batch_size = batch_size
+        self.max_backlog = max_backlog
+        self.rpc_available: Optional[bool] = None
+        # 증가는 이벤트 루프/스레드 어디서든 올 수 있으므로 짧은 락으로 보호
+        self._lock = threading.Lock()
+        self._pending: Dict[RowKey, Counter] = {}
+        self._inflight: Dict[RowKey, Counter] = {}
+        self._flush_lock: Optional[asyncio.Lock] = None
+        self._wake: Optional[asyncio.Event] = None
+        self._stop = False
+        self._task: Optional[asyncio.Task] = None
+        self._flush_listeners: List[Callable[[List[RowKey]], None]] = []
+
+        self.increments = 0
+        self.flushes = 0
+        self.rpc_calls = 0
+        self.flushed_rows = 0
+        self.row_updates = 0
+        self.dropped = 0
+        self.flush_errors = 0
+        self.unconfirmed_rows = 0  # 응답을 못 받아서 반영됐다고 보고 재시도하지 않은 행 수
+        self.last_flush_ms: Optional[float] = None
+        self.last_flush_at: Optional[float] = None
+
+    # ============================================
+    # 증가 / 읽기
+    # ============================================
+
+    def increment(self, table: str, row_id: str, field: str, delta: int = 1) -> int:
+        """
+        증가분 합산 (DB 호출 없음)
+
+        Returns:
+            아직 DB에 반영되지 않은 이 카운터의 증가분 (이번 증가 포함)
+
+        Raises:
+            ValueError: COUNTER_FIELDS에 없는 테이블/컬럼
+        """
+        if field not in COUNTER_FIELDS.get(table, ()):
+            raise ValueError(f"Unsupported counter: {table}.{field}")
+
+        key = (table, row_id)
+        with self._lock:
+            self.increments += 1
+            if key not in self._pending and len(self._pending) >= self.max_backlog:
+                # 반영이 계속 실패하는 중 → 버퍼가 끝없이 커지지 않도록 새 행은 버림
+                self.dropped += 1
+            else:
+                self._pending.setdefault(key, Counter())[field] += delta
+            buffered = self._buffered_locked(key, field)
+            full = len(self._pending) >= self.max_pending
+
+        if full and self._wake is not None:
+            self._wake.set()
+        return buffered
+
+    def buffered(self, table: str, row_id: str, field: str) -> int:
+        """DB에 아직 반영되지 않은 증가분 (반영 중인 값 포함)"""
+        with self._lock:
+            return self._buffered_locked((table, row_id), field)
+
+    def _buffered_locked(self, key: RowKey, field: str) -> int:
+        total = 0
+        for source in (self._pending, self._inflight):
+            deltas = source.get(key)
+            if deltas:
+                total += deltas[field]
+        return total
+
+    def apply(self, table: str, row: dict, id_column: str) -> dict:
+        """DB에서 읽은 행의 카운터 컬럼에 버퍼 증가분을 더함 (목록 응답용, 제자리 수정)"""
+        key = (table, row.get(id_column))
+        with self._lock:
+            if key not in self._pending and key not in self._inflight:
+                return row
+            for field in COUNTER_FIELDS[table]:
+                if field in row:
+                    row[field] = (row[field] or 0) + self._buffered_locked(key, field)
+        return row
+
+    # ============================================
+    # 반영
+    # ============================================
+
+    def _take_pending(self) -> Dict[RowKey, Counter]:
+        with self._lock:
+            batch, self._pending = self._pending, {}
+            for key, deltas in batch.items():
+                self._inflight.setdefault(key, Counter()).update(deltas)
+            return batch
+
+    def _finish(self, batch: Dict[RowKey, Counter], ok: bool) -> None:
+        """반영 끝난 증가분을 inflight에서 빼고, 실패했으면 pending으로 되돌림 (max_backlog 행까지)"""
+        dropped = 0
+        with self._lock:
+            for key, deltas in batch.items():
+                inflight = self._inflight.get(key)
+                if inflight is not None:
+                    inflight.subtract(deltas)
+                    if not any(inflight.values()):
+                        del self._inflight[key]
+                if not ok:
+                    if key not in self._pending and len(self._pending) >= self.max_backlog:
+                        dropped += 1
+                        continue
+                    self._pending.setdefault(key, Counter()).update(deltas)
+            self.dropped += dropped
+        if dropped:
+            logger.error(f"❌ 카운터 버퍼 상한({self.max_backlog}행) 초과, {dropped}행 증가분 버림")
+
+    def add_flush_listener(self, listener: Callable[[List[RowKey]], None]) -> None:
+        """반영이 끝난 (테이블, id) 목록을 받을 콜백 등록 (DB 값이 바뀐 행의 캐시 무효화 등)"""
+        self._flush_listeners.append(listener)
+
+    def _notify_flushed(self, keys: List[RowKey]) -> None:
+        if not keys:
+            return
+        for listener in self._flush_listeners:
+            try:
+                listener(keys)
+            except Exception as e:
+                logger.warning(f"⚠️ 카운터 반영 알림 실패: {e}")
+
+    @staticmethod
+    def build_updates(batch: Dict[RowKey, Counter]) -> List[dict]:
+        """RPC 인자 (행 id 순으로 정렬 → 인스턴스끼리 같은 순서로 행 락)"""
+        return [
+            {"table": table, "id": row_id, "deltas": {f: d for f, d in deltas.items() if d}}
+            for (table, row_id), deltas in sorted(batch.items())
+            if any(deltas.values())
+        ]
+
+    def _rpc_missing(self, error: Exception) -> None:
+        self.rpc_available = False
+        logger.error(
+            f"❌ {COUNTER_FLUSH_RPC} RPC가 배포되지 않음 → 행별 update로 반영 "
+            f"(동시 인스턴스끼리 증가분 유실 가능, 모듈 docstring의 SQL을 실행할 것): {error}"
+        )
+
+    async def check_rpc(self) -> Optional[bool]:
+        """
+        RPC 배포 여부 확인 (빈 배열로 호출 → DB 변경 없음, 반영기 시작 시 1회)
+
+        없으면 error 로그 후 행별 update로 반영, 일시 오류면 다음 반영 때 다시 판단
+        """
+        db = self.db_getter() if self.db_getter else None
+        if db is None or self.rpc_available is not None:
+            return self.rpc_available
+        try:
+            await db_execute(db.rpc(COUNTER_FLUSH_RPC, {"updates": []}))
+            self.rpc_available = True
+        except Exception as e:
+            if is_missing_rpc_error(e):
+                self._rpc_missing(e)
+            else:
+                logger.warning(f"⚠️ {COUNTER_FLUSH_RPC} RPC 확인 실패 (다음 반영 시 재시도): {e}")
+        return self.rpc_available
+
+    async def _row_values(self, db, update: dict) -> Optional[dict]:
+        """RPC가 없을 때: 한 행을 읽고 카운터 컬럼에 증가분을 더한 값 (삭제된 행이면 None)"""
+        table, row_id, deltas = update["table"], update["id"], update["deltas"]
+        result = await db_execute(
+            db.table(table).select(",".join(deltas)).eq(COUNTER_ID_COLUMNS[table], row_id)
+        )
+        if not result.data:
+            return None
+        row = result.data[0]
+        return {field: (row.get(field) or 0) + delta for field, delta in deltas.items()}
+
+    async def flush(self) -> int:
+        """
+        쌓인 증가분을 RPC로 반영 (반영한 행 수 반환)
+
+        RPC가 없으면(PGRST202/404) 행별 update로 반영,
+        그 외 실패는 증가분을 버퍼로 되돌리고 다음 주기에 재시도
+        (응답을 못 받은 쓰기는 반영된 것으로 보고 되돌리지 않음 → 모듈 docstring의 반영 보장)
+        """
+        if self._flush_lock is None:
+            self._flush_lock = asyncio.Lock()
+
+        async with self._flush_lock:
+            if not self._pending:
+                return 0
+            db = self.db_getter() if self.db_getter else None
+            if db is None:
+                self.flush_errors += 1
+                logger.warning("⚠️ 카운터 반영 보류 (Supabase 미설정)")
+                return 0
+
+            batch = self._take_pending()
+            updates = self.build_updates(batch)
+            started = time.perf_counter()
+            done = 0
+            writing = 0  # 응답을 기다리는 쓰기 요청의 행 수
+            try:
+                while done < len(updates):
+                    chunk = updates[done:done + self.batch_size]
+                    if self.rpc_available is not False:
+                        try:
+                            writing = len(chunk)
+                            await db_execute(db.rpc(COUNTER_FLUSH_RPC, {"updates": chunk}))
+                            writing = 0
+                            self.rpc_available = True
+                            self.rpc_calls += 1
+                            done += len(chunk)
+                            continue
+                        except Exception as e:
+                            if not is_missing_rpc_error(e):
+                                raise
+                            writing = 0
+                            self._rpc_missing(e)
+                    for update in chunk:
+                        values = await self._row_values(db, update)
+                        if values is not None:
+                            writing = 1
+                            await db_execute(
+                                db.table(update["table"]).update(values)
+                                .eq(COUNTER_ID_COLUMNS[update["table"]], update["id"])
+                            )
+                            writing = 0
+                            self.row_updates += 1
+                        done += 1
+            except Exception as e:
+                self.flush_errors += 1
+                unconfirmed = writing if is_unconfirmed_write_error(e) else 0
+                if unconfirmed:
+                    # DB가 이미 커밋했을 수 있음 → 다시 보내면 두 번 더해지므로 반영된 것으로 처리
+                    self.unconfirmed_rows += unconfirmed
+                    done += unconfirmed
+                # 이미 반영된 행은 빼고 나머지만 되돌림
+                applied = {(u["table"], u["id"]) for u in updates[:done]}
+                self._finish({k: v for k, v in batch.items() if k in applied}, ok=True)
+                self._finish({k: v for k, v in batch.items() if k not in applied}, ok=False)
+                self._notify_flushed(sorted(applied))
+                logger.warning(
+                    f"⚠️ 카운터 반영 실패 ({len(updates) - done}행 재시도 예정, "
+                    f"응답 없는 {unconfirmed}행은 재시도 안 함): {e}"
+                )
+                return done
+
+            self._finish(batch, ok=True)
+            self._notify_flushed(sorted(batch))
+            self.flushes += 1
+            self.flushed_rows += done
+            self.last_flush_ms = round((time.perf_counter() - started) * 1000, 1)
+            self.last_flush_at = time.time()
+            logger.debug(f"🔄 카운터 반영 {done}행 ({self.last_flush_ms}ms)")
+            return done
+
+    # ============================================
+    # 주기 실행
+    # ============================================
+
+    async def _loop(self) -> None:
+        logger.info(f"🔄 카운터 반영기 시작 (주기 {self.interval_seconds}s)")
+        try:
+            await self.check_rpc()
+        except Exception as e:
+            logger.warning(f"⚠️ {COUNTER_FLUSH_RPC} RPC 확인 오류: {e}")
+        while not self._stop:
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=self.interval_seconds)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error(f"❌ 카운터 반영 루프 오류: {e}", exc_info=True)
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._stop = False
+            self._wake = asyncio.Event()
+            self._task = asyncio.create_task(self._loop())
+
+    async def stop(self) -> None:
+        """주기 실행 종료 + 남은 증가분 반영"""
+        self._stop = True
+        if self._task is not None:
+            self._wake.set()
+            try:
+                await asyncio.wait_for(self._task, timeout=5)
+            except (asyncio.TimeoutError, asyncio.CancelledError):
+                self._task.cancel()
+            self._task = None
+        await self.flush()
+        logger.info(f"✅ 카운터 반영기 종료 (남은 증가분 {self.get_stats()['pending_rows']}행)")
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            pending_rows = len(self._pending)
+            pending_delta = sum(sum(d.values()) for d in self._pending.values())
+            inflight_rows = len(self._inflight)
+        return {
+            "running": self._task is not None and not self._task.done(),
+            "interval_seconds": self.interval_seconds,
+            "increments": self.increments,
+            "pending_rows": pending_rows,
+            "pending_delta": pending_delta,
+            "inflight_rows": inflight_rows,
+            "flushes": self.flushes,
+            "rpc_calls": self.rpc_calls,
+            "flushed_rows": self.flushed_rows,
+            "rpc_available": self.rpc_available,
+            "row_updates": self.row_updates,
+            "dropped": self.dropped,
+            "flush_errors": self.flush_errors,
+            "unconfirmed_rows": self.unconfirmed_rows,
+            "last_flush_ms": self.last_flush_ms,
+            "last_flush_age_seconds": (
+                round(time.time() - self.last_flush_at, 1) if self.last_flush_at else None
+            ),
+        }
+
+
+# ============================================
+# 싱글톤 (lifespan에서 시작/종료)
+# ============================================
+_counter_buffer: Optional[CounterBuffer] = None
+
+
+def get_counter_buffer() -> CounterBuffer:
+    """공용 카운터 버퍼 (처음 호출 시 생성, 주기 반영은 start_counter_flusher)"""
+    global _counter_buffer
+    if _counter_buffer is None:
+        _counter_buffer = CounterBuffer()
+    return _counter_buffer
+
+
+def start_counter_flusher() -> CounterBuffer:
+    """주기 반영 시작 (이벤트 루프 안(lifespan)에서 호출해야 함)"""
+    buffer = get_counter_buffer()
+    buffer.start()
+    return buffer
+
+
+async def stop_counter_flusher() -> None:
+    """주기 반영 종료 + 남은 증가분 반영 (lifespan shutdown에서 호출)"""
+    if _counter_buffer is not None:
+        await _counter_buffer.stop()
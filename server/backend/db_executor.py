@@ -0,0 +1,206 @@
+"""
+Supabase 쿼리 실행기 (동기 supabase-py 호출을 이벤트 루프 밖에서 실행)
+
+supabase-py Client는 동기 HTTP(httpx.Client)라서 async 라우터 안에서 `.execute()`를 부르면
+응답이 올 때까지 워커의 이벤트 루프 전체가 멈춤 (다른 요청도 모두 대기)
+→ 크기가 정해진 전용 스레드 풀에서 실행하고 라우터는 await로 기다림
+
+- 스레드들은 같은 Client(= 같은 httpx 연결 풀)를 공유 → 연결 재사용
+- 풀이 다 차면 나머지 호출은 큐에서 대기 (대기 시간/동시 실행 수를 통계로 노출)
+- SUPABASE_EXECUTION=inline이면 기존처럼 이벤트 루프에서 바로 실행 (부하 테스트 비교용)
+
+Example:
+    >>> result = await db_execute(db.table("posts").select("*").eq("post_id", post_id))
+"""
+import asyncio
+import logging
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# thread: 전용 스레드 풀 / inline: 이벤트 루프에서 바로 실행 (기존 동작)
+SUPABASE_EXECUTION = os.getenv("SUPABASE_EXECUTION", "thread").lower()
+# httpx 기본 keep-alive 연결 수(20) 이하로 유지
+SUPABASE_MAX_WORKERS = int(os.getenv("SUPABASE_MAX_WORKERS", "16"))
+# 대기/실행 시간 분위수 계산에 쓰는 최근 호출 수
+LATENCY_SAMPLE_SIZE = 1000
+
+
+def _percentile(samples, q: float) -> Optional[float]:
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    return round(ordered[min(len(ordered) - 1, int(len(ordered) * q))], 2)
+
+
+class DBExecutor:
+    """
+    동기 DB 호출 실행 + 풀 포화 통계
+
+    Args:
+        max_workers: 동시에 실행할 DB 호출 수 (스레드 수)
+        mode: "thread" | "inline"
+    """
+
+    def __init__(self, max_workers: int = SUPABASE_MAX_WORKERS, mode: str = SUPABASE_EXECUTION):
+        self.max_workers = max_workers
+        self.mode = mode
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.errors = 0
+        self.active = 0
+        self.queued = 0
+        self.max_active = 0
+        self.max_queued = 0
+        self.saturated_calls = 0  # 빈 스레드가 없어서 큐에서 기다린 호출 수
+        self._wait_ms = deque(maxlen=LATENCY_SAMPLE_SIZE)
+        self._run_ms = deque(maxlen=LATENCY_SAMPLE_SIZE)
+
+    def _get_pool(self) -> ThreadPoolExecutor:
+        if self._pool is None:
+            with self._lock:
+                if self._pool is None:
+                    self._pool = ThreadPoolExecutor(
+                        max_workers=self.max_workers, thread_name_prefix="supabase"
+                    )
+        return self._pool
+
+    def _call(self, fn: Callable[[], Any], submitted: float) -> Any:
+        started = time.perf_counter()
+        with self._lock:
+            self.queued -= 1
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+            self._wait_ms.append((started - submitted) * 1000)
+        try:
+            return fn()
+        finally:
+            with self._lock:
+                self.active -= 1
+                self._run_ms.append((time.perf_counter() - started) * 1000)
+
+    def _dequeue_if_cancelled(self, future: Future) -> None:
+        """큐에서 기다리다 취소된 호출 (_call이 실행되지 않음 → 대기 수를 여기서 줄임)"""
+        if future.cancelled():
+            with self._lock:
+                self.queued -= 1
+
+    async def run(self, fn: Callable[[], Any]) -> Any:
+        """fn()을 스레드 풀에서 실행하고 결과 반환 (예외는 그대로 전달)"""
+        if self.mode == "inline":
+            self.calls += 1
+            try:
+                return fn()
+            except Exception:
+                self.errors += 1
+                raise
+
+        with self._lock:
+            self.calls += 1
+            if self.active + self.queued >= self.max_workers:
+                self.saturated_calls += 1
+            self.queued += 1
+            self.max_queued = max(self.max_queued, self.queued)
+
+        # 요청 취소 시 아직 시작 전이면 스레드 풀 작업도 취소됨 (시작한 뒤에는 끝까지 실행)
+        future = self._get_pool().submit(self._call, fn, time.perf_counter())
+        future.add_done_callback(self._dequeue_if_cancelled)
+        try:
+            return await asyncio.wrap_future(future)
+        except Exception:
+            self.errors += 1
+            raise
+
+    def get_stats(self) -> Dict[str, Any]:
+        """풀 포화 통계 (saturation_rate: 큐에서 기다린 호출 비율)"""
+        with self._lock:
+            wait_ms = list(self._wait_ms)
+            run_ms = list(self._run_ms)
+            return {
+                "mode": self.mode,
+                "max_workers": self.max_workers,
+                "active": self.active,
+                "queued": self.queued,
+                "max_active": self.max_active,
+                "max_queued": self.max_queued,
+                "calls": self.calls,
+                "errors": self.errors,
+                "saturated_calls": self.saturated_calls,
+                "saturation_rate": round(self.saturated_calls / self.calls, 4) if self.calls else 0.0,
+                "wait_ms_p50": _percentile(wait_ms, 0.5),
+                "wait_ms_p95": _percentile(wait_ms, 0.95),
+                "run_ms_p50": _percentile(run_ms, 0.5),
+                "run_ms_p95": _percentile(run_ms, 0.95),
+            }
+
+    def shutdown(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+
+
+# ============================================
+# 싱글톤
+# ============================================
+_db_executor: Optional[DBExecutor] = None
+
+
+def get_db_executor() -> DBExecutor:
+    """공용 DB 실행기 (처음 호출 시 생성, 스레드는 첫 쿼리 때 생성)"""
+    global _db_executor
+    if _db_executor is None:
+        _db_executor = DBExecutor()
+    return _db_executor
+
+
+async def db_execute(query) -> Any:
+    """
+    PostgREST 쿼리 빌더(.table(...)/.rpc(...) 체인)를 실행하고 응답 반환
+
+    라우터에서 `query.execute()` 대신 사용
+    """
+    return await get_db_executor().run(query.execute)
+
+
+def is_missing_rpc_error(error: Exception) -> bool:
+    """
+    RPC 함수가 배포되지 않아서 난 오류인지 (PostgREST PGRST202 / HTTP 404)
+
+    타임아웃/연결 오류 등 그 외 오류는 일시적일 수 있으므로 RPC 사용을 포기하지 않는다.
+    (타임아웃은 DB가 이미 커밋했을 수도 있음 → 호출자가 같은 변경을 다시 적용하면 안 됨)
+    """
+    code = str(getattr(error, "code", None) or "")
+    if code in ("PGRST202", "404"):
+        return True
+    text = str(error)
+    return "PGRST202" in text or "Could not find the function" in text
+
+
+def is_unconfirmed_write_error(error: Exception) -> bool:
+    """
+    요청은 DB까지 갔지만 응답을 못 받았을 수 있는 오류인지 (읽기 타임아웃 / 응답 도중 연결 끊김)
+
+    이 경우 DB는 이미 커밋했을 수 있음 → 덧셈 같은 비멱등 쓰기를 다시 보내면 두 번 반영될 수 있다.
+    연결 실패/연결·쓰기 타임아웃(요청이 다 가지 않음)과 DB 오류 응답(롤백됨)은 반영되지 않은 것이 확실하므로 False
+    """
+    if isinstance(error, (httpx.ConnectError, httpx.ConnectTimeout, httpx.WriteTimeout, httpx.PoolTimeout)):
+        return False
+    return isinstance(error, (
+        httpx.TimeoutException, httpx.ReadError, httpx.RemoteProtocolError, TimeoutError, ConnectionResetError,
+    ))
+
+
+def close_db_executor() -> None:
+    """스레드 풀 종료 (lifespan shutdown에서 호출)"""
+    global _db_executor
+    if _db_executor is not None:
+        _db_executor.shutdown()
+        _db_executor = None
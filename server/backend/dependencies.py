@@ -12,6 +12,8 @@ from supabase import Client
 
 from .models import UserResponse
 from .supabase_config import get_supabase_client
+from .db_executor import db_execute
+from .user_cache import get_user_cache
 
 logger = logging.getLogger(__name__)
 
@@ -99,6 +101,33 @@ def verify_token(token: str) -> dict:
 # 3. 현재 사용자 의존성
 # ============================================
 
+async def _load_user(uid: str) -> UserResponse:
+    """Supabase users에서 사용자 조회 (사용자 캐시 미스 시)"""
+    supabase = get_supabase_client()
+    result = await db_execute(supabase.table("users").select("*").eq("uid", uid))
+    
+    if not result.data or len(result.data) == 0:
+        logger.warning(f"⚠️ 사용자 미발견: {uid}")
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="User not found",
+        )
+    
+    user_data = result.data[0]
+    
+    # UserResponse 생성
+    user = UserResponse(
+        uid=uid,
+        email=user_data.get("email"),
+        username=user_data.get("username"),
+        created_at=user_data.get("created_at"),
+        updated_at=user_data.get("updated_at")
+    )
+    
+    logger.info(f"✅ 사용자 조회 성공: {user.username} ({uid})")
+    return user
+
+
 async def get_current_user(
     credentials = Depends(security),
 ) -> UserResponse:
@@ -140,31 +169,9 @@ async def get_current_user(
             detail="Invalid authentication credentials",
         )
     
-    # Supabase에서 사용자 정보 조회
+    # 사용자 정보 조회 (캐시 미스일 때만 Supabase)
     try:
-        supabase = get_supabase_client()
-        result = supabase.table("users").select("*").eq("uid", uid).execute()
-        
-        if not result.data or len(result.data) == 0:
-            logger.warning(f"⚠️ 사용자 미발견: {uid}")
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="User not found",
-            )
-        
-        user_data = result.data[0]
-        
-        # UserResponse 생성
-        user = UserResponse(
-            uid=uid,
-            email=user_data.get("email"),
-            username=user_data.get("username"),
-            created_at=user_data.get("created_at"),
-            updated_at=user_data.get("updated_at")
-        )
-        
-        logger.info(f"✅ 사용자 조회 성공: {user.username} ({uid})")
-        return user
+        return await get_user_cache().get_or_load(uid, lambda: _load_user(uid))
         
     except HTTPException:
         raise
@@ -0,0 +1,377 @@
+"""
+Football 데이터 백그라운드 갱신기
+
+사용자 요청이 캐시 미스를 낼 때까지 기다리지 않고, 주기적으로 공용 캐시(메모리 + Firestore)를 채움
+- 라이브 경기 (모든 리그): 진행 중 경기가 있으면 자주, 없으면 드물게 (adaptive)
+- 리그별 예정 경기 (오늘/이번 주 일정, 캘린더 Tool이 같은 키를 읽음)
+- 리그별 순위표
+
+호출 한도(10 requests/minute)는 라우터와 같은 토큰 버킷을 쓰고,
+갱신기 몫은 FOOTBALL_REFRESH_QUOTA_SHARE 이하로 주기를 늘려서 맞춤.
+사용자 요청이 토큰을 기다리는 중이면 갱신을 미룸.
+
+⚠️ 호출 한도는 API 키 단위이므로 인스턴스를 여러 개 띄우면 share를 인스턴스 수로 나눌 것
+
+Example:
+    >>> refresher = start_football_refresher()   # lifespan 시작
+    >>> await refresher.stop()                    # lifespan 종료
+"""
+import asyncio
+import logging
+import os
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from llm_service.external_apis.football_data import (
+    FOOTBALL_API_RATE_LIMIT_PER_MINUTE,
+    LIVE_MATCHES_CACHE_KEY,
+    FootballDataClient,
+    matches_cache_key,
+    standings_cache_key,
+)
+from llm_service.external_apis.rate_limiter import RateLimitExceeded
+
+from .dependencies import get_optional_firestore_db
+from .routers import football_data
+from .routers.football_data import CACHE_DURATION_HOURS, LIVE_CACHE_MINUTES
+
+logger = logging.getLogger(__name__)
+
+# adaptive: 라이브 경기 유무로 주기 조절 / fixed: 항상 라이브 주기 / off: 갱신기 사용 안 함
+FOOTBALL_REFRESH_MODE = os.getenv("FOOTBALL_REFRESH_MODE", "adaptive").lower()
+FOOTBALL_REFRESH_QUOTA_SHARE = float(os.getenv("FOOTBALL_REFRESH_QUOTA_SHARE", "0.5"))
+FOOTBALL_LIVE_POLL_SECONDS = float(os.getenv("FOOTBALL_LIVE_POLL_SECONDS", "60"))
+FOOTBALL_IDLE_POLL_SECONDS = float(os.getenv("FOOTBALL_IDLE_POLL_SECONDS", "600"))
+
+# 캐시 신선 기간이 끝나기 전에 갱신 (TTL의 80% 시점)
+REFRESH_BEFORE_EXPIRY = 0.8
+
+# 사용자 요청용으로 남겨 둘 토큰 수 (라이브 갱신은 예외)
+RESERVED_TOKENS = 2
+
+# 킥오프 전후 이 시간 안의 예정 경기가 있으면 라이브 모드
+KICKOFF_WINDOW_MINUTES = 15
+
+# 갱신기가 가져오는 예정 경기 수 (API 최대치, 캘린더 Tool과 같은 캐시 키)
+FIXTURES_LIMIT = 100
+
+LIVE_STATUSES = {"IN_PLAY", "PAUSED", "LIVE"}
+
+
+@dataclass
+class RefreshJob:
+    """갱신 작업 하나 (캐시 키 1개)"""
+
+    name: str
+    cache_key: str
+    fetch: Callable[[Any], Awaitable[Any]]  # client → 코루틴
+    cache_minutes: int
+    interval_seconds: float
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    live: bool = False
+    next_run: float = 0.0
+    runs: int = 0
+    errors: int = 0
+    last_run: Optional[float] = None
+
+
+def unique_competitions() -> List[str]:
+    """COMPETITIONS에서 별칭(CL = EC)을 뺀 리그 코드"""
+    seen = set()
+    codes = []
+    for code, comp_id in FootballDataClient.COMPETITIONS.items():
+        if comp_id not in seen:
+            seen.add(comp_id)
+            codes.append(code)
+    return codes
+
+
+def has_live_activity(live_matches: Optional[List[dict]], fixtures: List[dict], now: datetime) -> bool:
+    """진행 중 경기가 있거나 킥오프가 임박/직후인 예정 경기가 있는지"""
+    if any(m.get("status") in LIVE_STATUSES for m in live_matches or []):
+        return True
+    window = timedelta(minutes=KICKOFF_WINDOW_MINUTES)
+    for match in fixtures:
+        try:
+            kickoff = datetime.fromisoformat(match.get("utcDate", "").replace("Z", "+00:00"))
+        except ValueError:
+            continue
+        if abs(kickoff - now) <= window:
+            return True
+    return False
+
+
+class FootballRefresher:
+    """
+    공용 캐시 주기 갱신 (FastAPI lifespan에서 시작/종료)
+
+    Args:
+        client: AsyncFootballDataClient (토큰 버킷 포함)
+        mode: "adaptive" | "fixed"
+        competitions: 갱신할 리그 코드 (기본: COMPETITIONS 전체, 별칭 제외)
+        quota_share: 분당 호출 한도 중 갱신기가 쓸 비율
+        db_getter: Firestore 클라이언트 반환 함수 (None이면 메모리 캐시만)
+    """
+
+    def __init__(
+        self,
+        client,
+        mode: str = FOOTBALL_REFRESH_MODE,
+        competitions: Optional[List[str]] = None,
+        quota_share: float = FOOTBALL_REFRESH_QUOTA_SHARE,
+        rate_per_minute: float = FOOTBALL_API_RATE_LIMIT_PER_MINUTE,
+        db_getter: Callable[[], Any] = get_optional_firestore_db,
+    ):
+        self.client = client
+        self.mode = mode
+        self.competitions = competitions or unique_competitions()
+        self.quota_share = quota_share
+        self.rate_per_minute = rate_per_minute
+        self.db_getter = db_getter
+        self.live_active = mode == "fixed"
+        self.deferred = 0
+        self._task: Optional[asyncio.Task] = None
+        self._stop = asyncio.Event()
+        self.jobs = self._build_jobs()
+        self._stretch = self._quota_stretch()
+
+    # ============================================
+    # 작업 구성
+    # ============================================
+
+    def _build_jobs(self) -> List[RefreshJob]:
+        fixtures_interval = LIVE_CACHE_MINUTES * 60 * REFRESH_BEFORE_EXPIRY
+        standings_interval = CACHE_DURATION_HOURS * 3600 * REFRESH_BEFORE_EXPIRY
+
+        jobs = [
+            RefreshJob(
+                name="live",
+                cache_key=LIVE_MATCHES_CACHE_KEY,
+                fetch=lambda client: client.get_live_matches(),
+                cache_minutes=LIVE_CACHE_MINUTES,
+                interval_seconds=FOOTBALL_IDLE_POLL_SECONDS,
+                metadata={"status": "LIVE", "cache_duration_minutes": LIVE_CACHE_MINUTES},
+                live=True,
+            )
+        ]
+        for code in self.competitions:
+            jobs.append(
+                RefreshJob(
+                    name=f"fixtures_{code}",
+                    cache_key=matches_cache_key(code, "SCHEDULED", FIXTURES_LIMIT),
+                    fetch=lambda client, code=code: client.get_matches(
+                        competition=code, status="SCHEDULED", limit=FIXTURES_LIMIT
+                    ),
+                    cache_minutes=LIVE_CACHE_MINUTES,
+                    interval_seconds=fixtures_interval,
+                    metadata={
+                        "competition": code,
+                        "status": "SCHEDULED",
+                        "cache_duration_minutes": LIVE_CACHE_MINUTES,
+                    },
+                )
+            )
+        for code in self.competitions:
+            jobs.append(
+                RefreshJob(
+                    name=f"standings_{code}",
+                    cache_key=standings_cache_key(code),
+                    fetch=lambda client, code=code: client.get_standings(code),
+                    cache_minutes=CACHE_DURATION_HOURS * 60,
+                    interval_seconds=standings_interval,
+                    metadata={"competition": code},
+                )
+            )
+        return jobs
+
+    def _quota_stretch(self) -> float:
+        """
+        갱신기 분당 호출 수가 한도 몫을 넘으면 모든 주기를 같은 비율로 늘림
+
+        라이브 주기는 가장 짧은 값(FOOTBALL_LIVE_POLL_SECONDS) 기준으로 계산
+        """
+        budget = self.rate_per_minute * self.quota_share
+        per_minute = sum(60 / self._base_interval(job, live=True) for job in self.jobs)
+        if budget <= 0:
+            return float("inf")
+        return max(1.0, per_minute / budget)
+
+    def _base_interval(self, job: RefreshJob, live: bool) -> float:
+        if job.live:
+            return FOOTBALL_LIVE_POLL_SECONDS if live else FOOTBALL_IDLE_POLL_SECONDS
+        return job.interval_seconds
+
+    def interval_for(self, job: RefreshJob) -> float:
+        """작업별 현재 주기 (초)"""
+        return self._base_interval(job, self.live_active) * self._stretch
+
+    # ============================================
+    # 실행
+    # ============================================
+
+    def _has_headroom(self, job: RefreshJob) -> bool:
+        """사용자 요청이 토큰을 기다리고 있지 않고 여유 토큰이 있는지"""
+        bucket = getattr(self.client, "bucket", None)
+        if bucket is None:
+            return True
+        stats = bucket.get_stats()
+        if stats["queued"] > 0 or stats["paused_for"] > 0:
+            return False
+        reserve = 0 if job.live else RESERVED_TOKENS
+        return stats["tokens"] >= 1 + reserve
+
+    async def _run_job(self, job: RefreshJob, db) -> None:
+        # 라우터와 같은 경로로 저장 (메모리 + Firestore, 같은 키의 사용자 미스와 호출 합침)
+        await football_data.fetch_and_cache(
+            db,
+            job.cache_key,
+            lambda: job.fetch(self.client),
+            cache_minutes=job.cache_minutes,
+            metadata=job.metadata,
+            force_refresh=True,
+        )
+
+    def _update_mode(self) -> None:
+        """캐시에 올라간 라이브/예정 경기로 라이브 모드 판단 (adaptive만)"""
+        if self.mode != "adaptive":
+            return
+        cache = football_data.football_cache
+        live_matches = cache.peek(LIVE_MATCHES_CACHE_KEY)
+        fixtures: List[dict] = []
+        for job in self.jobs:
+            if job.name.startswith("fixtures_"):
+                fixtures.extend(cache.peek(job.cache_key) or [])
+        active = has_live_activity(live_matches, fixtures, datetime.now(timezone.utc))
+        if active != self.live_active:
+            self.live_active = active
+            logger.info(f"🔄 라이브 갱신 모드 {'ON' if active else 'OFF'}")
+            # 주기가 바뀌었으니 라이브 작업 다음 실행 시각 재계산
+            for job in self.jobs:
+                if job.live and job.last_run is not None:
+                    job.next_run = job.last_run + self.interval_for(job)
+
+    async def run_due(self) -> int:
+        """지금 실행할 때가 된 작업 실행 (실행한 작업 수 반환)"""
+        now = time.monotonic()
+        db = self.db_getter() if self.db_getter else None
+        ran = 0
+
+        for job in sorted(self.jobs, key=lambda j: (not j.live, j.next_run)):
+            if job.next_run > now:
+                continue
+            if not self._has_headroom(job):
+                self.deferred += 1
+                job.next_run = time.monotonic() + 5
+                continue
+
+            try:
+                await self._run_job(job, db)
+                job.runs += 1
+                ran += 1
+            except RateLimitExceeded as e:
+                job.errors += 1
+                job.next_run = time.monotonic() + max(e.retry_after, 1.0)
+                logger.warning(f"⚠️ 갱신 보류 (호출 한도) {job.name}: {e}")
+                continue
+            except Exception as e:
+                job.errors += 1
+                logger.warning(f"⚠️ 갱신 실패 {job.name}: {e}")
+
+            job.last_run = time.monotonic()
+            job.next_run = job.last_run + self.interval_for(job)
+
+        if ran:
+            self._update_mode()
+        return ran
+
+    async def _loop(self) -> None:
+        logger.info(
+            f"🔄 Football 갱신기 시작 (mode={self.mode}, 리그 {len(self.competitions)}개, "
+            f"주기 배율 {self._stretch:.2f})"
+        )
+        while not self._stop.is_set():
+            try:
+                await self.run_due()
+            except Exception as e:
+                logger.error(f"❌ Football 갱신 루프 오류: {e}", exc_info=True)
+
+            delay = max(1.0, min(job.next_run for job in self.jobs) - time.monotonic())
+            try:
+                await asyncio.wait_for(self._stop.wait(), timeout=delay)
+            except asyncio.TimeoutError:
+                pass
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._stop = asyncio.Event()
+            self._task = asyncio.create_task(self._loop())
+
+    async def stop(self) -> None:
+        self._stop.set()
+        if self._task is not None:
+            try:
+                await asyncio.wait_for(self._task, timeout=5)
+            except (asyncio.TimeoutError, asyncio.CancelledError):
+                self._task.cancel()
+            self._task = None
+        logger.info("✅ Football 갱신기 종료")
+
+    def get_stats(self) -> Dict[str, Any]:
+        now = time.monotonic()
+        return {
+            "mode": self.mode,
+            "live_active": self.live_active,
+            "running": self._task is not None and not self._task.done(),
+            "interval_stretch": round(self._stretch, 2),
+            "deferred": self.deferred,
+            "jobs": {
+                job.name: {
+                    "interval_seconds": round(self.interval_for(job)),
+                    "runs": job.runs,
+                    "errors": job.errors,
+                    "next_run_in": round(max(0.0, job.next_run - now)),
+                }
+                for job in self.jobs
+            },
+        }
+
+
+# ============================================
+# 싱글톤 (lifespan에서 시작)
+# ============================================
+_football_refresher: Optional[FootballRefresher] = None
+
+
+def get_football_refresher() -> Optional[FootballRefresher]:
+    """실행 중인 갱신기 (시작하지 않았으면 None)"""
+    return _football_refresher
+
+
+def start_football_refresher() -> Optional[FootballRefresher]:
+    """
+    갱신기 시작 (FOOTBALL_REFRESH_MODE=off 또는 API 키가 없으면 None)
+
+    이벤트 루프 안(lifespan)에서 호출해야 함
+    """
+    global _football_refresher
+    if FOOTBALL_REFRESH_MODE == "off":
+        logger.info("⏭️ Football 갱신기 비활성화 (FOOTBALL_REFRESH_MODE=off)")
+        return None
+
+    client = football_data.get_football_api()
+    if client is None:
+        logger.warning("⚠️ Football-Data API 키가 없어 갱신기를 시작하지 않음")
+        return None
+
+    _football_refresher = FootballRefresher(client)
+    _football_refresher.start()
+    return _football_refresher
+
+
+async def stop_football_refresher() -> None:
+    global _football_refresher
+    if _football_refresher is not None:
+        await _football_refresher.stop()
+        _football_refresher = None
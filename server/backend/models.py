@@ -207,7 +207,7 @@ class PostResponse(BaseModel):
     author_id: str = Field(..., description="작성자 UID")
     author_username: str = Field(..., description="작성자 이름")
     title: str = Field(..., description="제목")
-    content: str = Field(..., description="내용")
+    content: Optional[str] = Field(default=None, description="내용 (커서 목록 조회에서는 생략)")
     category: str = Field(..., description="카테고리")
     views: int = Field(default=0, description="조회수")
     likes: int = Field(default=0, description="좋아요 수")
@@ -235,9 +235,10 @@ class PostResponse(BaseModel):
 class PostListResponse(BaseModel):
     """게시글 목록 응답"""
     posts: List[PostResponse] = Field(..., description="게시글 리스트")
-    total_count: int = Field(..., description="총 게시글 수")
-    page: int = Field(..., description="현재 페이지")
+    total_count: Optional[int] = Field(default=None, description="총 게시글 수 (커서 모드는 count 파라미터에 따라 추정값/생략)")
+    page: Optional[int] = Field(default=None, description="현재 페이지 (offset 모드)")
     page_size: int = Field(..., description="페이지당 개수")
+    next_cursor: Optional[str] = Field(default=None, description="다음 페이지 커서 (커서 모드, 마지막 페이지면 None)")
     
     class Config:
         json_schema_extra = {
@@ -245,7 +246,29 @@ class PostListResponse(BaseModel):
                 "posts": [...],
                 "total_count": 150,
                 "page": 1,
-                "page_size": 10
+                "page_size": 10,
+                "next_cursor": None
+            }
+        }
+
+
+class PostSearchHit(PostResponse):
+    """게시글 검색 결과 (BM25 점수 포함)"""
+    score: float = Field(..., description="검색 점수 (BM25)")
+
+
+class PostSearchResponse(BaseModel):
+    """게시글 검색 응답"""
+    query: str = Field(..., description="검색어")
+    posts: List[PostSearchHit] = Field(..., description="점수순 게시글 리스트")
+    total_matches: int = Field(..., description="검색어와 매칭된 전체 게시글 수")
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "query": "아스날 분석",
+                "posts": [...],
+                "total_matches": 42
             }
         }
 
@@ -309,7 +332,8 @@ class CommentResponse(BaseModel):
 class CommentListResponse(BaseModel):
     """댓글 목록 응답 (계층 구조 포함)"""
     comments: list[CommentResponse] = Field(..., description="댓글 목록")
-    total_count: int = Field(..., description="전체 댓글 수")
+    total_count: Optional[int] = Field(default=None, description="전체 댓글 수 (커서 모드는 count 파라미터에 따라 추정값/생략)")
+    next_cursor: Optional[str] = Field(default=None, description="다음 페이지 커서 (limit 지정 시, 마지막 페이지면 None)")
     
     class Config:
         json_schema_extra = {
@@ -320,6 +344,28 @@ class CommentListResponse(BaseModel):
         }
 
 
+class CommentThread(BaseModel):
+    """댓글 스레드 (최상위 댓글 + 앞쪽 답글)"""
+    comment: CommentResponse = Field(..., description="최상위 댓글")
+    replies: List[CommentResponse] = Field(..., description="앞쪽 답글 (작성순, 최대 replies개)")
+    reply_count: int = Field(..., description="전체 답글 수")
+    next_reply_cursor: Optional[str] = Field(default=None, description="나머지 답글 커서 (/replies의 cursor, 없으면 None)")
+
+
+class CommentThreadListResponse(BaseModel):
+    """스레드형 댓글 목록 응답"""
+    threads: List[CommentThread] = Field(..., description="최상위 댓글 스레드 (작성순)")
+    next_cursor: Optional[str] = Field(default=None, description="다음 페이지 커서 (마지막 페이지면 None)")
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "threads": [],
+                "next_cursor": None
+            }
+        }
+
+
 # ============================================
 # 4. Football Data 관련 모델
 # ============================================
@@ -530,9 +576,10 @@ class ReportResponse(BaseModel):
 class ReportListResponse(BaseModel):
     """신고 목록 응답"""
     reports: List[ReportResponse] = Field(..., description="신고 목록")
-    total_count: int = Field(..., description="전체 신고 수")
-    page: int = Field(..., description="현재 페이지")
+    total_count: Optional[int] = Field(default=None, description="전체 신고 수 (커서 모드는 count 파라미터에 따라 추정값/생략)")
+    page: Optional[int] = Field(default=None, description="현재 페이지 (offset 모드)")
     page_size: int = Field(..., description="페이지당 개수")
+    next_cursor: Optional[str] = Field(default=None, description="다음 페이지 커서 (커서 모드, 마지막 페이지면 None)")
 
 
 class ReportAction(BaseModel):
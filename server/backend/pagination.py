@@ -0,0 +1,98 @@
+"""
+목록 조회 키셋(커서) 페이지네이션 헬퍼 (posts / comments / reports 공용)
+
+OFFSET + count="exact"는 깊은 페이지일수록 앞의 행을 모두 읽고 버리고, 매 요청마다 전체 개수를 센다
+→ (created_at, id) 정렬 키로 "마지막으로 본 행 다음부터" 조회 (인덱스 범위 스캔, 페이지 깊이와 무관)
+
+- 커서: 마지막 행의 (created_at, id)를 감싼 불투명 문자열 (base64url JSON)
+- page_size + 1개를 읽어서 다음 페이지 존재 여부 판단 (개수 쿼리 없음)
+- 개수: none (기본) / estimated (Postgres 통계 기반 추정) / exact
+
+📌 권장 인덱스 (Supabase SQL Editor):
+    create index if not exists posts_created_at_post_id_idx
+        on posts (created_at desc, post_id desc) where is_deleted = false;
+    create index if not exists comments_post_created_at_idx
+        on comments (post_id, created_at, comment_id) where is_deleted = false;
+    create index if not exists reports_created_at_report_id_idx
+        on reports (created_at desc, report_id desc);
+    create index if not exists reports_reporter_created_at_idx
+        on reports (reporter_id, created_at desc, report_id desc);
+"""
+
+import base64
+import json
+import re
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+from fastapi import HTTPException, status
+
+# count 쿼리 파라미터 값 (none이면 개수 생략)
+COUNT_MODES_PATTERN = "^(none|estimated|exact)$"
+PAGINATION_MODES_PATTERN = "^(offset|cursor)$"
+
+# 커서의 id는 PostgREST 필터 문자열에 들어가므로 안전한 문자만 허용
+_CURSOR_ID_RE = re.compile(r"^[\w\-.:]+$")
+
+
+def encode_cursor(created_at: str, row_id: str) -> str:
+    """마지막 행의 (created_at, id) → 커서 문자열"""
+    raw = json.dumps([created_at, row_id], separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[str, str]:
+    """
+    커서 문자열 → (created_at, id)
+
+    Raises:
+        HTTPException: 400 (형식이 잘못된 커서)
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        created_at, row_id = json.loads(raw)
+        datetime.fromisoformat(created_at)
+        if not isinstance(row_id, str) or not _CURSOR_ID_RE.match(row_id):
+            raise ValueError(row_id)
+    except Exception:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+    return created_at, row_id
+
+
+def count_method(count: str) -> Optional[str]:
+    """count 파라미터 → Supabase select(count=...) 값"""
+    return None if count == "none" else count
+
+
+def apply_keyset(query, id_column: str, cursor: Optional[str], desc: bool = True):
+    """
+    커서 이후 행만 조회하도록 필터 + (created_at, id) 정렬 적용
+
+    (created_at, id) < (커서 created_at, 커서 id) 를 PostgREST or 필터로 표현 (오름차순이면 >)
+    """
+    if cursor:
+        created_at, row_id = decode_cursor(cursor)
+        op = "lt" if desc else "gt"
+        query = query.or_(
+            f'created_at.{op}."{created_at}",'
+            f'and(created_at.eq."{created_at}",{id_column}.{op}.{row_id})'
+        )
+    return query.order("created_at", desc=desc).order(id_column, desc=desc)
+
+
+def split_page(rows: List[dict], page_size: int, id_column: str) -> Tuple[List[dict], Optional[str]]:
+    """
+    page_size + 1개 조회 결과 → (이번 페이지 행, 다음 커서)
+
+    다음 커서는 더 읽을 행이 있을 때만 (마지막 페이지면 None)
+    """
+    if len(rows) <= page_size:
+        return rows, None
+    rows = rows[:page_size]
+    created_at = rows[-1]["created_at"]
+    if isinstance(created_at, datetime):
+        created_at = created_at.isoformat()
+    return rows, encode_cursor(created_at, rows[-1][id_column])
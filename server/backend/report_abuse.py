@@ -0,0 +1,302 @@
+"""
+신고 남용 통계 (신고자별 누적/슬라이딩 윈도우 카운터)
+
+기존: 신고 1건마다 그 신고자의 전체 신고 내역을 select("*")로 읽어서 파이썬에서 다시 집계
+→ 신고 이력이 길수록 신고 접수가 느려짐 (이력 1만 건이면 매번 1만 행 전송)
+
+- 신고자별 통계를 처음 한 번만 DB 집계로 채움 (reporter_abuse_stats RPC, 없으면 개수 쿼리)
+- 이후에는 메모리에서 갱신: 신고 접수 시 +1, 관리자 처리 시 기각/처리 수 조정
+- 최근 1시간/24시간 신고 수, 24시간 내 대상 유저별 신고 수는 시간순 deque로 유지 (만료분만 제거)
+- REPORT_ABUSE_RESEED_SECONDS마다 DB에서 다시 집계 (다른 인스턴스에서 접수/처리된 신고 반영)
+
+📌 Supabase SQL (선택, 없으면 개수 쿼리 4개로 채움):
+    create or replace function reporter_abuse_stats(p_reporter_id text, p_since text)
+    returns json language sql stable as $$
+        select json_build_object(
+            'total_reports', count(*),
+            'dismissed_count', count(*) filter (where status = 'dismissed'),
+            'resolved_count', count(*) filter (where status = 'resolved'),
+            'recent', coalesce(
+                json_agg(json_build_object('created_at', created_at, 'target_author_id', target_author_id)
+                         order by created_at)
+                    filter (where created_at::timestamptz > p_since::timestamptz),
+                '[]'::json)
+        )
+        from reports where reporter_id = p_reporter_id;
+    $$;
+
+Example:
+    >>> tracker = get_report_abuse_tracker()
+    >>> snapshot = await tracker.snapshot(db, reporter_id)
+    >>> tracker.record_report(reporter_id, created_at, target_author_id)  # 신고 저장 후
+"""
+import asyncio
+import logging
+import os
+import threading
+from collections import Counter, deque
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, Deque, Dict, Optional, Tuple
+
+from llm_service.utils.single_flight import SingleFlight
+from llm_service.utils.ttl_cache import TTLCache
+
+from .db_executor import db_execute, is_missing_rpc_error
+
+logger = logging.getLogger(__name__)
+
+REPORT_ABUSE_SETTINGS = {
+    "max_reports_per_hour": 10,
+    "max_reports_per_day": 30,
+    "dismissed_threshold": 0.7,
+    "min_reports_for_threshold": 5,
+    "target_concentration_limit": 3,
+}
+
+REPORT_ABUSE_CACHE_SIZE = int(os.getenv("REPORT_ABUSE_CACHE_SIZE", "10000"))
+REPORT_ABUSE_RESEED_SECONDS = float(os.getenv("REPORT_ABUSE_RESEED_SECONDS", "300"))
+REPORT_ABUSE_RPC = "reporter_abuse_stats"
+
+HOUR = timedelta(hours=1)
+DAY = timedelta(days=1)
+
+
+def parse_report_time(value: Any) -> Optional[datetime]:
+    """created_at → 로컬 naive datetime (datetime.now()와 비교 가능하게)"""
+    if not value:
+        return None
+    try:
+        parsed = value if isinstance(value, datetime) else datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone().replace(tzinfo=None)
+    return parsed
+
+
+@dataclass
+class ReporterStats:
+    """
+    신고자 한 명의 통계
+
+    dismissed_count / resolved_count는 기존 집계와 같은 기준
+    (resolved_count는 "resolved" 상태만, 기각률 = 기각 수 / 처리 수)
+    """
+
+    total_reports: int = 0
+    dismissed_count: int = 0
+    resolved_count: int = 0
+    hour: Deque[datetime] = field(default_factory=deque)
+    day: Deque[Tuple[datetime, Optional[str]]] = field(default_factory=deque)
+    target_counts: Counter = field(default_factory=Counter)
+    # 24시간 내 신고 수가 집중 한도 이상인 대상 유저 수
+    hot_targets: int = 0
+
+    def add_recent(self, created_at: datetime, target_author_id: Optional[str], limit: int) -> None:
+        """최근 신고 추가 (시간순으로 호출)"""
+        self.hour.append(created_at)
+        self.day.append((created_at, target_author_id))
+        if target_author_id:
+            self.target_counts[target_author_id] += 1
+            if self.target_counts[target_author_id] == limit:
+                self.hot_targets += 1
+
+    def expire(self, now: datetime, limit: int) -> None:
+        """윈도우 밖으로 나간 신고 제거 (제거한 만큼만 비용)"""
+        while self.hour and self.hour[0] <= now - HOUR:
+            self.hour.popleft()
+        while self.day and self.day[0][0] <= now - DAY:
+            _, target = self.day.popleft()
+            if target:
+                if self.target_counts[target] == limit:
+                    self.hot_targets -= 1
+                self.target_counts[target] -= 1
+                if self.target_counts[target] <= 0:
+                    del self.target_counts[target]
+
+    def apply_status(self, status: Optional[str], sign: int) -> None:
+        if status == "dismissed":
+            self.dismissed_count += sign
+        elif status == "resolved":
+            self.resolved_count += sign
+
+
+class ReportAbuseTracker:
+    """
+    신고자별 통계 캐시
+
+    Args:
+        maxsize: 메모리에 유지할 신고자 수
+        reseed_seconds: DB에서 다시 집계하는 주기
+        settings: REPORT_ABUSE_SETTINGS (대상 집중 한도)
+    """
+
+    def __init__(
+        self,
+        maxsize: int = REPORT_ABUSE_CACHE_SIZE,
+        reseed_seconds: float = REPORT_ABUSE_RESEED_SECONDS,
+        settings: Optional[dict] = None,
+    ):
+        self.settings = settings or REPORT_ABUSE_SETTINGS
+        self.cache = TTLCache(maxsize=maxsize, ttl_seconds=reseed_seconds)
+        self.flights = SingleFlight()
+        self._lock = threading.Lock()
+        self.seeds = {"rpc": 0, "queries": 0}
+        self.rpc_available: Optional[bool] = None
+        self.recorded = 0
+        self.status_updates = 0
+
+    @property
+    def _limit(self) -> int:
+        return self.settings["target_concentration_limit"]
+
+    # ============================================
+    # DB 집계 (처음 한 번 / 재집계)
+    # ============================================
+
+    async def _seed_rpc(self, db, reporter_id: str, since: datetime) -> dict:
+        result = await db_execute(db.rpc(REPORT_ABUSE_RPC, {
+            "p_reporter_id": reporter_id,
+            "p_since": since.isoformat(),
+        }))
+        data = result.data
+        if isinstance(data, list):
+            data = data[0] if data else {}
+        return data or {}
+
+    async def _seed_queries(self, db, reporter_id: str, since: datetime) -> dict:
+        """RPC가 없을 때: 개수 쿼리 3개 + 최근 24시간 행 (전체 이력은 읽지 않음)"""
+
+        def count_query(status: Optional[str] = None):
+            query = db.table("reports").select("report_id", count="exact").eq("reporter_id", reporter_id)
+            if status:
+                query = query.eq("status", status)
+            return db_execute(query.limit(1))
+
+        total, dismissed, resolved, recent = await asyncio.gather(
+            count_query(),
+            count_query("dismissed"),
+            count_query("resolved"),
+            db_execute(
+                db.table("reports").select("created_at,target_author_id")
+                .eq("reporter_id", reporter_id).gt("created_at", since.isoformat()).order("created_at")
+            ),
+        )
+        return {
+            "total_reports": total.count or 0,
+            "dismissed_count": dismissed.count or 0,
+            "resolved_count": resolved.count or 0,
+            "recent": recent.data or [],
+        }
+
+    async def _seed(self, db, reporter_id: str) -> ReporterStats:
+        # 오프셋을 붙여서 보냄 (naive 로컬 시각은 DB 세션 시간대로 해석됨)
+        since = datetime.now(timezone.utc) - DAY
+        data = None
+        if self.rpc_available is not False:
+            try:
+                data = await self._seed_rpc(db, reporter_id, since)
+                self.rpc_available = True
+                self.seeds["rpc"] += 1
+            except Exception as e:
+                if not is_missing_rpc_error(e):
+                    # 일시적 오류일 수 있으므로 RPC는 계속 사용, 이번 집계만 개수 쿼리로 (조회라 다시 읽어도 안전)
+                    logger.warning(f"⚠️ {REPORT_ABUSE_RPC} RPC 실패, 이번 집계는 개수 쿼리로: {e}")
+                else:
+                    if self.rpc_available is not False:
+                        logger.info(f"⏭️ {REPORT_ABUSE_RPC} RPC 없음, 개수 쿼리로 집계: {e}")
+                    self.rpc_available = False
+        if data is None:
+            data = await self._seed_queries(db, reporter_id, since)
+            self.seeds["queries"] += 1
+
+        stats = ReporterStats(
+            total_reports=data.get("total_reports", 0),
+            dismissed_count=data.get("dismissed_count", 0),
+            resolved_count=data.get("resolved_count", 0),
+        )
+        recent = [
+            (parse_report_time(row.get("created_at")), row.get("target_author_id"))
+            for row in data.get("recent") or []
+        ]
+        for created_at, target in sorted((r for r in recent if r[0] is not None), key=lambda r: r[0]):
+            stats.add_recent(created_at, target, self._limit)
+        self.cache.set(reporter_id, stats)
+        return stats
+
+    async def _get(self, db, reporter_id: str) -> ReporterStats:
+        stats = self.cache.get(reporter_id)
+        if stats is None:
+            stats, _ = await self.flights.do(("reporter", reporter_id), lambda: self._seed(db, reporter_id))
+        return stats
+
+    # ============================================
+    # 조회 / 갱신
+    # ============================================
+
+    async def snapshot(self, db, reporter_id: str, now: Optional[datetime] = None) -> dict:
+        """
+        신고자 통계 (기존 check_reporter_abuse 집계와 같은 값)
+
+        Returns:
+            total_reports, reports_last_hour, reports_last_day, dismissed_count, resolved_count,
+            max_target_count, hot_targets
+        """
+        stats = await self._get(db, reporter_id)
+        now = now or datetime.now()
+        with self._lock:
+            stats.expire(now, self._limit)
+            return {
+                "total_reports": stats.total_reports,
+                "reports_last_hour": len(stats.hour),
+                "reports_last_day": len(stats.day),
+                "dismissed_count": stats.dismissed_count,
+                "resolved_count": stats.resolved_count,
+                "max_target_count": max(stats.target_counts.values(), default=0) if stats.hot_targets else 0,
+                "hot_targets": stats.hot_targets,
+            }
+
+    def record_report(self, reporter_id: str, created_at: Any, target_author_id: Optional[str]) -> None:
+        """신고 저장 후 호출 (통계가 메모리에 없으면 다음 조회 때 DB에서 집계하므로 생략)"""
+        stats = self.cache.get(reporter_id)
+        parsed = parse_report_time(created_at)
+        if stats is None or parsed is None:
+            return
+        with self._lock:
+            stats.total_reports += 1
+            stats.add_recent(parsed, target_author_id, self._limit)
+            self.recorded += 1
+
+    def record_status_change(self, reporter_id: str, old_status: Optional[str], new_status: Optional[str]) -> None:
+        """관리자 처리로 신고 상태가 바뀐 후 호출 (기각/처리 수 조정)"""
+        stats = self.cache.get(reporter_id)
+        if stats is None or old_status == new_status:
+            return
+        with self._lock:
+            stats.apply_status(old_status, -1)
+            stats.apply_status(new_status, +1)
+            self.status_updates += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "reporters": self.cache.get_stats(),
+            "seeds": dict(self.seeds),
+            "rpc_available": self.rpc_available,
+            "recorded": self.recorded,
+            "status_updates": self.status_updates,
+        }
+
+
+# ============================================
+# 싱글톤
+# ============================================
+_report_abuse_tracker: Optional[ReportAbuseTracker] = None
+
+
+def get_report_abuse_tracker() -> ReportAbuseTracker:
+    """공용 신고 남용 통계 (처음 호출 시 생성)"""
+    global _report_abuse_tracker
+    if _report_abuse_tracker is None:
+        _report_abuse_tracker = ReportAbuseTracker()
+    return _report_abuse_tracker
@@ -28,6 +28,8 @@ from ..dependencies import (
     get_firebase_auth,
     handle_auth_error,
 )
+from ..db_executor import db_execute
+from ..user_cache import get_user_cache
 
 logger = logging.getLogger(__name__)
 
@@ -100,7 +102,7 @@ async def signup(
                 "is_suspended": False,
             }
 
-            result = db.table("users").insert(user_doc).execute()
+            result = await db_execute(db.table("users").insert(user_doc))
             
             if not result.data:
                 raise Exception("Failed to insert user into Supabase")
@@ -131,6 +133,7 @@ async def signup(
             updated_at=None,
         )
 
+        get_user_cache().put(user_response)
         logger.info(f"✅ 회원가입 완료: {user_data.username}")
 
         return AuthResponse(
@@ -180,7 +183,7 @@ async def login(
         logger.info(f"🔐 로그인 요청: {login_data.email}")
 
         # Supabase에서 사용자 조회
-        result = db.table("users").select("*").eq("email", login_data.email).execute()
+        result = await db_execute(db.table("users").select("*").eq("email", login_data.email))
 
         if not result.data or len(result.data) == 0:
             logger.warning(f"⚠️ 사용자 미발견: {login_data.email}")
@@ -205,6 +208,7 @@ async def login(
             updated_at=user_data.get("updated_at"),
         )
 
+        get_user_cache().put(user_response)
         logger.info(f"✅ 로그인 성공: {user_response.username}")
 
         return AuthResponse(
@@ -313,7 +317,7 @@ async def update_user(
         update_dict["updated_at"] = datetime.now().isoformat()
 
         # Supabase 업데이트
-        result = db.table("users").update(update_dict).eq("uid", current_user.uid).execute()
+        result = await db_execute(db.table("users").update(update_dict).eq("uid", current_user.uid))
 
         if not result.data:
             raise HTTPException(
@@ -321,6 +325,7 @@ async def update_user(
                 detail="User not found"
             )
 
+        get_user_cache().invalidate(current_user.uid)
         logger.info(f"✅ 사용자 정보 수정 완료: {current_user.uid}")
 
         return UserResponse(
@@ -363,9 +368,9 @@ async def update_activity(
         now = datetime.now().isoformat()
         
         # Supabase에 마지막 활동 시각 저장
-        db.table("users").update({
+        await db_execute(db.table("users").update({
             "updated_at": now,
-        }).eq("uid", current_user.uid).execute()
+        }).eq("uid", current_user.uid))
         
         logger.debug(f"✅ 활동 시각 업데이트: {current_user.uid}")
         
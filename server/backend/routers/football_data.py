@@ -1,42 +1,67 @@
 import logging
-from datetime import datetime, timedelta
-from typing import Optional
+import math
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Awaitable, Callable, Optional, Tuple, Union
 from fastapi import APIRouter, HTTPException, status, Depends, Query, Path
 from firebase_admin import firestore
 
-from llm_service.external_apis.football_data import FootballDataClient
+from llm_service.external_apis.football_data import (
+    LIVE_MATCHES_CACHE_KEY,
+    AsyncFootballDataClient,
+    get_async_football_client,
+    get_football_cache,
+    matches_cache_key,
+    standings_cache_key,
+)
+from llm_service.external_apis.rate_limiter import RateLimitExceeded
 from ..dependencies import get_optional_firestore_db, get_firestore_db
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/football", tags=["Football Data"])
 
-# Football-Data 클라이언트
-try:
-    football_client = FootballDataClient()
-    logger.info("✅ Football-Data 클라이언트 초기화 성공")
-except Exception as e:
-    logger.error(f"❌ Football-Data 클라이언트 초기화 실패: {e}")
-    football_client = None
+# Football-Data 클라이언트 (비동기, 공용 커넥션 풀 + 10 req/min 토큰 버킷)
+def get_football_api() -> Optional[AsyncFootballDataClient]:
+    """공용 Football-Data 클라이언트 반환 (API 키가 없으면 None)"""
+    try:
+        return get_async_football_client()
+    except ValueError as e:
+        logger.error(f"❌ Football-Data 클라이언트 초기화 실패: {e}")
+        return None
+
+
+def rate_limited_error(e: RateLimitExceeded) -> HTTPException:
+    """호출 한도 초과 → 429 (Retry-After 포함)"""
+    return HTTPException(
+        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+        detail=f"Football-Data API 호출 한도 초과: {e}",
+        headers={"Retry-After": str(max(1, math.ceil(e.retry_after)))},
+    )
 
 
 # ============================================
 # 1. 캐싱 유틸리티
 # ============================================
 
-CACHE_DURATION_HOURS = 1  # 캐시 유효 시간: 1시간
+CACHE_DURATION_HOURS = 1  # 캐시 유효 시간: 1시간 (순위표/팀)
 
+# 경기 캐시 시간 (분): 진행 중/예정 경기는 짧게, 끝난 경기는 길게
+LIVE_CACHE_MINUTES = 10
+FINISHED_CACHE_MINUTES = 60
 
-def get_cache(db: firestore.client, cache_key: str) -> Optional[dict]:
-    """
-    Firestore 캐시에서 데이터 조회
 
-    Args:
-        db: Firestore 클라이언트
-        cache_key: 캐시 키
+def match_cache_minutes(match_status: str) -> int:
+    """경기 상태별 캐시 시간 (끝난 경기 60분, LIVE/SCHEDULED 등 바뀔 수 있는 경기 10분)"""
+    return FINISHED_CACHE_MINUTES if match_status in ["FINISHED", "AWARDED"] else LIVE_CACHE_MINUTES
+
+
+def get_cache_entry(db: firestore.client, cache_key: str) -> Optional[Tuple[Any, float]]:
+    """
+    Firestore 캐시 원본 조회 (만료 판단은 호출자)
 
     Returns:
-        캐시된 데이터 또는 None (만료된 경우)
+        (데이터, 저장 시각 epoch 초) 또는 None
     """
     try:
         cache_doc = db.collection("cache").document(cache_key).get()
@@ -47,23 +72,42 @@ def get_cache(db: firestore.client, cache_key: str) -> Optional[dict]:
 
         cache_data = cache_doc.to_dict()
         updated_at = cache_data.get("updated_at")
-
-        # 캐시 유효성 확인
-        now = datetime.now()
-        elapsed = (now - updated_at).total_seconds()
-
-        if elapsed > CACHE_DURATION_HOURS * 3600:
-            logger.info(f"⏰ 캐시 만료: {cache_key} ({elapsed:.0f}초 경과)")
+        if updated_at is None:
             return None
-
-        logger.info(f"✅ 캐시 히트: {cache_key} ({elapsed:.0f}초 캐시됨)")
-        return cache_data.get("data")
+        # Firestore는 UTC aware datetime을 반환 (naive는 로컬 시각으로 간주)
+        return cache_data.get("data"), updated_at.timestamp()
 
     except Exception as e:
         logger.warning(f"⚠️ 캐시 조회 실패: {e}")
         return None
 
 
+def get_cache(db: firestore.client, cache_key: str) -> Optional[dict]:
+    """
+    Firestore 캐시에서 데이터 조회
+
+    Args:
+        db: Firestore 클라이언트
+        cache_key: 캐시 키
+
+    Returns:
+        캐시된 데이터 또는 None (만료된 경우)
+    """
+    entry = get_cache_entry(db, cache_key)
+    if entry is None:
+        return None
+
+    data, updated_at = entry
+    elapsed = time.time() - updated_at
+
+    if elapsed > CACHE_DURATION_HOURS * 3600:
+        logger.info(f"⏰ 캐시 만료: {cache_key} ({elapsed:.0f}초 경과)")
+        return None
+
+    logger.info(f"✅ 캐시 히트: {cache_key} ({elapsed:.0f}초 캐시됨)")
+    return data
+
+
 def set_cache(
     db: firestore.client, cache_key: str, data: dict, metadata: Optional[dict] = None
 ) -> bool:
@@ -80,10 +124,11 @@ def set_cache(
         성공 여부
     """
     try:
+        now = datetime.now(timezone.utc)
         cache_doc = {
             "data": data,
-            "updated_at": datetime.now(),
-            "expires_at": datetime.now() + timedelta(hours=CACHE_DURATION_HOURS),
+            "updated_at": now,
+            "expires_at": now + timedelta(hours=CACHE_DURATION_HOURS),
         }
 
         if metadata:
@@ -109,6 +154,7 @@ def clear_cache(db: firestore.client, cache_key: str) -> bool:
     Returns:
         성공 여부
     """
+    football_cache.invalidate(cache_key)
     try:
         db.collection("cache").document(cache_key).delete()
         logger.info(f"✅ 캐시 삭제: {cache_key}")
@@ -118,6 +164,77 @@ def clear_cache(db: firestore.client, cache_key: str) -> bool:
         return False
 
 
+class FirestoreCacheStore:
+    """TwoTierCache의 L2 (Firestore cache 컬렉션)"""
+
+    def __init__(self, db: firestore.client):
+        self.db = db
+
+    def get(self, key: str) -> Optional[Tuple[Any, float]]:
+        return get_cache_entry(self.db, key)
+
+    def set(self, key: str, value: Any, metadata: Optional[dict] = None) -> None:
+        set_cache(self.db, key, value, metadata=metadata)
+
+
+# 2단 캐시: 인메모리 L1 → Firestore L2 → API (백그라운드 갱신기/Agent Tool과 공용)
+# 신선 기간이 지난 항목은 같은 기간만큼 stale로 즉시 반환하고 백그라운드에서 1회 갱신
+football_cache = get_football_cache()
+
+# 동시 캐시 미스 합치기: cache_key별로 업스트림 호출 + 캐시 저장은 한 번만
+# (킥오프 직후 몰리는 요청이 각각 API를 호출하고 같은 Firestore 문서를 덮어쓰는 것 방지)
+football_flights = football_cache.flights
+
+
+async def fetch_and_cache(
+    db: Optional[firestore.client],
+    cache_key: str,
+    fetch: Callable[[], Awaitable[Any]],
+    cache_minutes: Union[int, Callable[[Any], int]],
+    metadata: Union[dict, Callable[[Any], dict], None] = None,
+    force_refresh: bool = False,
+) -> Tuple[Any, str]:
+    """
+    2단 캐시 조회, 미스 시 업스트림 호출 후 L1/Firestore 저장
+
+    Args:
+        db: Firestore 클라이언트 (None이면 L1만 사용)
+        cache_key: 캐시 키 (single-flight 키로도 사용)
+        fetch: 업스트림 호출 코루틴 함수
+        cache_minutes: 신선 기간 (분) 또는 결과 → 분 함수
+        metadata: Firestore 메타데이터 (dict 또는 결과 → dict 함수)
+        force_refresh: 캐시 무시
+
+    Returns:
+        (데이터, 출처) - 출처: "memory" | "store" | "stale" | "api" (빈 결과는 캐시하지 않음)
+    """
+    if callable(cache_minutes):
+        ttl_seconds = lambda data: cache_minutes(data) * 60
+    else:
+        ttl_seconds = cache_minutes * 60
+
+    data, tier = await football_cache.get_or_fetch(
+        cache_key,
+        fetch,
+        ttl_seconds=ttl_seconds,
+        store=FirestoreCacheStore(db) if db else None,
+        metadata=metadata if callable(metadata) else (lambda _: metadata),
+        force_refresh=force_refresh,
+    )
+    if tier != "api":
+        logger.info(f"✅ 캐시 히트 ({tier}): {cache_key}")
+    return data, tier
+
+
+def cache_fields(tier: str) -> dict:
+    """응답 캐시 필드 (source/cached는 기존 형식 유지, cache_tier로 상세 출처)"""
+    return {
+        "source": "api" if tier == "api" else "cache",
+        "cached": tier != "api",
+        "cache_tier": tier,
+    }
+
+
 # ============================================
 # 2. 순위표 API (Standings)
 # ============================================
@@ -141,8 +258,8 @@ async def get_standings(
     순위표 조회 (캐싱 포함)
 
     캐시 전략:
-    - 1시간 유효
-    - 만료 시 Football-Data API 호출
+    - 메모리(L1) → Firestore(L2) → API 순서로 조회, 1시간 유효
+    - 만료 후 1시간까지는 이전 데이터를 즉시 반환하고 백그라운드에서 갱신
     - force_refresh=true로 캐시 무시 가능
 
     Args:
@@ -157,6 +274,7 @@ async def get_standings(
         >>> GET /api/football/standings?competition=PL
         >>> GET /api/football/standings?competition=PL&force_refresh=true
     """
+    football_client = get_football_api()
     if not football_client:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
@@ -164,27 +282,22 @@ async def get_standings(
         )
 
     try:
-        cache_key = f"standings_{competition}"
+        cache_key = standings_cache_key(competition)
 
         logger.info(f"📖 순위표 조회: {competition} (force_refresh={force_refresh})")
 
-        # 1. 캐시 확인 (force_refresh=false인 경우)
-        if db and not force_refresh:
-            cached_data = get_cache(db, cache_key)
-            if cached_data:
-                return {
-                    "success": True,
-                    "data": cached_data,
-                    "source": "cache",
-                    "cached": True,
-                    "timestamp": datetime.now().isoformat(),
-                }
-        else:
+        if force_refresh:
             logger.info(f"🔄 캐시 무시, 강제 새로고침: {competition}")
 
-        # 2. API에서 데이터 가져오기
-        logger.info(f"🔄 Football-Data API 호출: {competition}")
-        standings = football_client.get_standings(competition)
+        # 캐시(메모리 → Firestore) 확인, 미스 시 API 호출 + 저장 (동시 요청은 한 번만)
+        standings, tier = await fetch_and_cache(
+            db,
+            cache_key,
+            lambda: football_client.get_standings(competition),
+            cache_minutes=CACHE_DURATION_HOURS * 60,
+            metadata={"competition": competition},
+            force_refresh=force_refresh,
+        )
 
         if not standings:
             raise HTTPException(
@@ -192,20 +305,17 @@ async def get_standings(
                 detail=f"Failed to fetch standings for {competition}",
             )
 
-        # 3. 캐시에 저장
-        if db:
-            set_cache(db, cache_key, standings, metadata={"competition": competition})
-
         return {
             "success": True,
             "data": standings,
-            "source": "api",
-            "cached": False,
+            **cache_fields(tier),
             "timestamp": datetime.now().isoformat(),
         }
 
     except HTTPException:
         raise
+    except RateLimitExceeded as e:
+        raise rate_limited_error(e)
     except Exception as e:
         logger.error(f"❌ 순위표 조회 실패: {e}", exc_info=True)
         raise HTTPException(
@@ -240,7 +350,7 @@ async def get_matches(
     """
     경기 조회 (캐싱 포함)
 
-    캐시 전략:
+    캐시 전략 (메모리 → Firestore, 만료 후에는 stale 반환 + 백그라운드 갱신):
     - FINISHED: 1시간 캐싱
     - SCHEDULED/LIVE: 10분 캐싱
 
@@ -257,6 +367,7 @@ async def get_matches(
     Example:
         >>> GET /api/football/matches?competition=PL&status=FINISHED&limit=10
     """
+    football_client = get_football_api()
     if not football_client:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
@@ -265,29 +376,26 @@ async def get_matches(
 
     try:
         # LIVE는 캐싱 짧게, FINISHED는 길게
-        cache_duration = 10 if status in ["SCHEDULED", "LIVE"] else 60
+        cache_duration = match_cache_minutes(status)
 
-        cache_key = f"matches_{competition}_{status}_{limit}"
+        cache_key = matches_cache_key(competition, status, limit)
 
         logger.info(f"🎮 경기 조회: {competition}/{status} (limit={limit})")
 
-        # 1. 캐시 확인
-        if db and not force_refresh:
-            cached_data = get_cache(db, cache_key)
-            if cached_data:
-                return {
-                    "success": True,
-                    "data": cached_data,
-                    "source": "cache",
-                    "cached": True,
-                    "cache_duration_minutes": cache_duration,
-                    "timestamp": datetime.now().isoformat(),
-                }
-
-        # 2. API에서 데이터 가져오기
-        logger.info(f"🔄 Football-Data API 호출: 경기")
-        matches = football_client.get_matches(
-            competition=competition, status=status, limit=limit
+        # 캐시 확인, 미스 시 API 호출 + 저장 (기간은 상태에 따라, 동시 요청은 한 번만)
+        matches, tier = await fetch_and_cache(
+            db,
+            cache_key,
+            lambda: football_client.get_matches(
+                competition=competition, status=status, limit=limit
+            ),
+            cache_minutes=cache_duration,
+            force_refresh=force_refresh,
+            metadata={
+                "competition": competition,
+                "status": status,
+                "cache_duration_minutes": cache_duration,
+            },
         )
 
         if not matches:
@@ -296,30 +404,18 @@ async def get_matches(
                 detail="Failed to fetch matches",
             )
 
-        # 3. 캐시에 저장 (기간은 상태에 따라)
-        if db:
-            set_cache(
-                db,
-                cache_key,
-                matches,
-                metadata={
-                    "competition": competition,
-                    "status": status,
-                    "cache_duration_minutes": cache_duration,
-                },
-            )
-
         return {
             "success": True,
             "data": matches,
-            "source": "api",
-            "cached": False,
+            **cache_fields(tier),
             "cache_duration_minutes": cache_duration,
             "timestamp": datetime.now().isoformat(),
         }
 
     except HTTPException:
         raise
+    except RateLimitExceeded as e:
+        raise rate_limited_error(e)
     except Exception as e:
         logger.error(f"❌ 경기 조회 실패: {e}")
         raise HTTPException(
@@ -328,38 +424,36 @@ async def get_matches(
         )
 
 
+# /matches/{match_id}보다 먼저 등록 ("live"가 match_id로 매칭되어 422가 나지 않도록)
 @router.get(
-    "/matches/{match_id}",
+    "/matches/live",
     status_code=status.HTTP_200_OK,
     responses={
-        200: {"description": "경기 상세 조회 성공"},
-        404: {"description": "경기를 찾을 수 없음"},
+        200: {"description": "라이브 경기 조회 성공"},
         503: {"description": "Football-Data API 오류"},
     },
 )
-async def get_match_details(
-    match_id: int = Path(..., description="경기 ID"),
+async def get_live_matches(
     force_refresh: bool = Query(False, description="캐시 무시"),
     db: firestore.client = Depends(get_optional_firestore_db),
 ):
     """
-    특정 경기 상세 정보 조회 (캐싱 포함)
+    진행 중인 라이브 경기 조회 (모든 리그)
 
     캐시 전략:
-    - FINISHED 경기: 24시간 캐싱
-    - 진행 중/예정 경기: 10분 캐싱
+    - 10분 캐싱 (실시간 정보이므로 짧게)
 
     Args:
-        match_id: 경기 ID
         force_refresh: 캐시 무시
         db: Firestore 클라이언트
 
     Returns:
-        경기 상세 정보
+        라이브 경기 목록
 
     Example:
-        >>> GET /api/football/matches/401828
+        >>> GET /api/football/matches/live
     """
+    football_client = get_football_api()
     if not football_client:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
@@ -367,88 +461,78 @@ async def get_match_details(
         )
 
     try:
-        cache_key = f"match_{match_id}"
-
-        logger.info(f"🎮 경기 상세 조회: {match_id} (force_refresh={force_refresh})")
+        cache_key = LIVE_MATCHES_CACHE_KEY
+        cache_duration = LIVE_CACHE_MINUTES  # 10분 캐싱
 
-        # 1. 캐시 확인
-        if db and not force_refresh:
-            cached_data = get_cache(db, cache_key)
-            if cached_data:
-                return {
-                    "success": True,
-                    "data": cached_data,
-                    "source": "cache",
-                    "cached": True,
-                    "timestamp": datetime.now().isoformat(),
-                }
-
-        # 2. API에서 데이터 가져오기
-        logger.info(f"🔄 Football-Data API 호출: 경기 {match_id}")
-        match_data = football_client.get_match_details(match_id)
-
-        if not match_data:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Match {match_id} not found",
-            )
+        logger.info(f"🎮 라이브 경기 조회 (force_refresh={force_refresh})")
 
-        # 3. 캐시에 저장 (경기 상태에 따라 캐시 시간 조정)
-        if db:
-            match_status = match_data.get("status", "")
-            # FINISHED 경기는 더 오래 캐싱
-            cache_metadata = {
-                "match_id": match_id,
-                "status": match_status,
-            }
-            set_cache(db, cache_key, match_data, metadata=cache_metadata)
+        # 캐시 확인, 미스 시 API 호출 + 저장 (킥오프 직후 몰리는 요청은 한 번만 호출)
+        matches, tier = await fetch_and_cache(
+            db,
+            cache_key,
+            football_client.get_live_matches,
+            cache_minutes=cache_duration,
+            force_refresh=force_refresh,
+            metadata={
+                "status": "LIVE",
+                "cache_duration_minutes": cache_duration,
+            },
+        )
 
+        # 라이브 경기가 없을 수도 있으므로 빈 배열 반환
         return {
             "success": True,
-            "data": match_data,
-            "source": "api",
-            "cached": False,
+            "data": matches or [],
+            **cache_fields(tier),
+            "cache_duration_minutes": cache_duration,
             "timestamp": datetime.now().isoformat(),
         }
 
     except HTTPException:
         raise
+    except RateLimitExceeded as e:
+        raise rate_limited_error(e)
     except Exception as e:
-        logger.error(f"❌ 경기 상세 조회 실패 (ID: {match_id}): {e}")
+        logger.error(f"❌ 라이브 경기 조회 실패: {e}")
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail="Failed to fetch match details",
+            detail="Failed to fetch live matches",
         )
 
 
 @router.get(
-    "/matches/live",
+    "/matches/{match_id}",
     status_code=status.HTTP_200_OK,
     responses={
-        200: {"description": "라이브 경기 조회 성공"},
+        200: {"description": "경기 상세 조회 성공"},
+        404: {"description": "경기를 찾을 수 없음"},
         503: {"description": "Football-Data API 오류"},
     },
 )
-async def get_live_matches(
+async def get_match_details(
+    match_id: int = Path(..., description="경기 ID"),
     force_refresh: bool = Query(False, description="캐시 무시"),
     db: firestore.client = Depends(get_optional_firestore_db),
 ):
     """
-    진행 중인 라이브 경기 조회 (모든 리그)
+    특정 경기 상세 정보 조회 (캐싱 포함)
 
-    캐시 전략:
-    - 10분 캐싱 (실시간 정보이므로 짧게)
+    캐시 전략 (메모리 → Firestore, 만료 후에는 stale 반환 + 백그라운드 갱신):
+    - FINISHED 경기: 1시간 캐싱
+    - 진행 중/예정 경기: 10분 캐싱
 
     Args:
+        match_id: 경기 ID
         force_refresh: 캐시 무시
         db: Firestore 클라이언트
 
     Returns:
-        라이브 경기 목록
+        경기 상세 정보
 
     Example:
-        >>> GET /api/football/matches/live
+        >>> GET /api/football/matches/401828
     """
+    football_client = get_football_api()
     if not football_client:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
@@ -456,67 +540,43 @@ async def get_live_matches(
         )
 
     try:
-        cache_key = "matches_live_all"
-        cache_duration = 10  # 10분 캐싱
-
-        logger.info(f"🎮 라이브 경기 조회 (force_refresh={force_refresh})")
+        cache_key = f"match_{match_id}"
 
-        # 1. 캐시 확인
-        if db and not force_refresh:
-            cached_data = get_cache(db, cache_key)
-            if cached_data:
-                return {
-                    "success": True,
-                    "data": cached_data,
-                    "source": "cache",
-                    "cached": True,
-                    "cache_duration_minutes": cache_duration,
-                    "timestamp": datetime.now().isoformat(),
-                }
-
-        # 2. API에서 데이터 가져오기
-        logger.info(f"🔄 Football-Data API 호출: 라이브 경기")
-        matches = football_client.get_live_matches()
+        logger.info(f"🎮 경기 상세 조회: {match_id} (force_refresh={force_refresh})")
 
-        if not matches:
-            # 라이브 경기가 없을 수도 있으므로 빈 배열 반환
-            return {
-                "success": True,
-                "data": [],
-                "source": "api",
-                "cached": False,
-                "cache_duration_minutes": cache_duration,
-                "timestamp": datetime.now().isoformat(),
-            }
+        # 캐시 확인, 미스 시 API 호출 + 저장 (경기 상태에 따라 캐시 시간 조정)
+        match_data, tier = await fetch_and_cache(
+            db,
+            cache_key,
+            lambda: football_client.get_match_details(match_id),
+            # FINISHED 경기는 더 오래 캐싱
+            cache_minutes=lambda data: match_cache_minutes(data.get("status", "")),
+            metadata=lambda data: {"match_id": match_id, "status": data.get("status", "")},
+            force_refresh=force_refresh,
+        )
 
-        # 3. 캐시에 저장
-        if db:
-            set_cache(
-                db,
-                cache_key,
-                matches,
-                metadata={
-                    "status": "LIVE",
-                    "cache_duration_minutes": cache_duration,
-                },
+        if not match_data:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Match {match_id} not found",
             )
 
         return {
             "success": True,
-            "data": matches,
-            "source": "api",
-            "cached": False,
-            "cache_duration_minutes": cache_duration,
+            "data": match_data,
+            **cache_fields(tier),
             "timestamp": datetime.now().isoformat(),
         }
 
     except HTTPException:
         raise
+    except RateLimitExceeded as e:
+        raise rate_limited_error(e)
     except Exception as e:
-        logger.error(f"❌ 라이브 경기 조회 실패: {e}")
+        logger.error(f"❌ 경기 상세 조회 실패 (ID: {match_id}): {e}")
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail="Failed to fetch live matches",
+            detail="Failed to fetch match details",
         )
 
 
@@ -547,6 +607,7 @@ async def get_teams(
     Example:
         >>> GET /api/football/teams/PL
     """
+    football_client = get_football_api()
     if not football_client:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
@@ -558,21 +619,15 @@ async def get_teams(
 
         logger.info(f"⚽ 팀 조회: {competition}")
 
-        # 1. 캐시 확인
-        if not force_refresh:
-            cached_data = get_cache(db, cache_key)
-            if cached_data:
-                return {
-                    "success": True,
-                    "data": cached_data,
-                    "source": "cache",
-                    "cached": True,
-                    "timestamp": datetime.now().isoformat(),
-                }
-
-        # 2. API에서 데이터 가져오기
-        logger.info(f"🔄 Football-Data API 호출: 팀")
-        teams = football_client.get_teams_by_competition(competition)
+        # 캐시 확인, 미스 시 API 호출 + 저장
+        teams, tier = await fetch_and_cache(
+            db,
+            cache_key,
+            lambda: football_client.get_teams_by_competition(competition),
+            cache_minutes=CACHE_DURATION_HOURS * 60,
+            metadata={"competition": competition},
+            force_refresh=force_refresh,
+        )
 
         if not teams:
             raise HTTPException(
@@ -580,19 +635,17 @@ async def get_teams(
                 detail=f"Failed to fetch teams for {competition}",
             )
 
-        # 3. 캐시에 저장
-        set_cache(db, cache_key, teams, metadata={"competition": competition})
-
         return {
             "success": True,
             "data": teams,
-            "source": "api",
-            "cached": False,
+            **cache_fields(tier),
             "timestamp": datetime.now().isoformat(),
         }
 
     except HTTPException:
         raise
+    except RateLimitExceeded as e:
+        raise rate_limited_error(e)
     except Exception as e:
         logger.error(f"❌ 팀 조회 실패: {e}")
         raise HTTPException(
@@ -679,7 +732,7 @@ async def get_cache_stats(db: firestore.client = Depends(get_firestore_db)):
         total_count = len(cache_docs)
         expired_count = 0
         valid_count = 0
-        now = datetime.now()
+        now = datetime.now(timezone.utc)
 
         for doc in cache_docs:
             expires_at = doc.get("expires_at")
@@ -693,6 +746,7 @@ async def get_cache_stats(db: firestore.client = Depends(get_firestore_db)):
             "valid_cache": valid_count,
             "expired_cache": expired_count,
             "cache_duration_hours": CACHE_DURATION_HOURS,
+            "memory_cache": football_cache.get_stats(),
             "timestamp": datetime.now().isoformat(),
         }
 
@@ -712,10 +766,17 @@ async def get_cache_stats(db: firestore.client = Depends(get_firestore_db)):
 @router.get("/health", response_model=dict)
 async def football_health():
     """Football-Data 서비스 헬스 체크"""
+    from ..football_refresher import get_football_refresher  # 순환 import 방지
+
+    football_client = get_football_api()
+    refresher = get_football_refresher()
     return {
         "status": "healthy",
         "service": "football_data",
         "api_available": football_client is not None,
+        "rate_limit": football_client.get_stats() if football_client else None,
+        "single_flight": football_flights.get_stats(),
+        "refresher": refresher.get_stats() if refresher else None,
         "timestamp": datetime.now().isoformat(),
     }
 
@@ -723,9 +784,18 @@ async def football_health():
 @router.get("/competitions")
 async def get_competitions():
     """리그 목록 조회"""
+    football_client = get_football_api()
+    if not football_client:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Football-Data API client not available",
+        )
+
     try:
-        competitions = football_client.get_competitions()
+        competitions = await football_client.get_competitions()
         return {"success": True, "data": competitions}
+    except RateLimitExceeded as e:
+        raise rate_limited_error(e)
     except Exception as e:
         logger.error(f"❌ 리그 목록 조회 실패: {e}")
         raise HTTPException(status_code=503, detail=str(e))
@@ -6,6 +6,7 @@ Supabase (PostgreSQL)를 사용한 게시글 관리 시스템
 📖 Supabase: https://supabase.com/docs
 """
 
+import asyncio
 import logging
 from datetime import datetime
 from typing import Optional
@@ -14,25 +15,74 @@ from supabase import Client
 import uuid
 
 from ..models import (
-    PostCreate, PostUpdate, PostResponse, PostListResponse,
-    CommentCreate, CommentUpdate, CommentResponse, CommentListResponse,
+    PostCreate, PostUpdate, PostResponse, PostListResponse, PostSearchHit, PostSearchResponse,
+    CommentCreate, CommentUpdate, CommentResponse, CommentListResponse, CommentThread, CommentThreadListResponse,
     UserResponse, MessageResponse
 )
 from ..dependencies import get_current_user, get_supabase_db, get_optional_user
+from ..comment_threads import get_comment_thread_loader
+from ..counter_buffer import get_counter_buffer
+from ..db_executor import db_execute, get_db_executor
+from ..pagination import (
+    COUNT_MODES_PATTERN, PAGINATION_MODES_PATTERN,
+    apply_keyset, count_method, split_page,
+)
+from llm_service.utils.post_search_index import get_post_search_index
 
-# 콘텐츠 필터링 서비스
+# 콘텐츠 필터링 서비스 (첫 게시글/댓글 작성 시 생성, 실패 시 None → 필터링 생략)
 try:
-    from llm_service.services.content_safety_service import ContentSafetyService
-    content_safety_service = ContentSafetyService()
-    logging.getLogger(__name__).info("✅ ContentSafetyService 초기화 완료")
+    from llm_service.services.content_safety_service import get_content_safety_service
 except Exception as e:
-    content_safety_service = None
-    logging.getLogger(__name__).warning(f"⚠️ ContentSafetyService 초기화 실패: {e}")
+    logging.getLogger(__name__).warning(f"⚠️ ContentSafetyService import 실패: {e}")
+
+    def get_content_safety_service():
+        return None
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(tags=["Posts"])
 
+# 목록(커서 모드) 조회 컬럼 - 본문(content) 제외
+POST_LIST_COLUMNS = (
+    "post_id,author_id,author_username,title,category,"
+    "views,likes,comment_count,created_at,updated_at"
+)
+
+# 검색 인덱스 적재 중 503 응답의 Retry-After (초)
+POST_SEARCH_RETRY_AFTER_SECONDS = 5
+
+
+def _to_post_response(data: dict) -> PostResponse:
+    """posts 행 → PostResponse (content가 없는 목록 행도 허용)"""
+    return PostResponse(
+        post_id=data.get("post_id"),
+        author_id=data.get("author_id"),
+        author_username=data.get("author_username"),
+        title=data.get("title"),
+        content=data.get("content"),
+        category=data.get("category"),
+        views=data.get("views", 0),
+        likes=data.get("likes", 0),
+        comment_count=data.get("comment_count", 0),
+        created_at=data.get("created_at"),
+        updated_at=data.get("updated_at")
+    )
+
+
+def _to_comment_response(data: dict) -> CommentResponse:
+    """comments 행 → CommentResponse"""
+    return CommentResponse(
+        comment_id=data.get("comment_id"),
+        post_id=data.get("post_id"),
+        author_id=data.get("author_id"),
+        author_username=data.get("author_username"),
+        content=data.get("content"),
+        likes=data.get("likes", 0),
+        parent_comment_id=data.get("parent_comment_id"),
+        created_at=data.get("created_at"),
+        updated_at=data.get("updated_at")
+    )
+
 
 # ============================================
 # 1. 게시글 생성 (Create Post)
@@ -52,11 +102,18 @@ async def create_post(
     try:
         logger.info(f"📝 게시글 생성: {current_user.username}")
         
-        # 콘텐츠 필터링
+        # 콘텐츠 필터링 (+ optimistic 모드면 카테고리 자동 분류를 동시에 실행)
+        content_safety_service = get_content_safety_service()
+        final_category = post_data.category or "general"
+        category_task = None
+        if content_safety_service and final_category == "general" and content_safety_service.optimistic:
+            category_task = asyncio.ensure_future(
+                content_safety_service.classify_category_async(post_data.title, post_data.content)
+            )
         if content_safety_service:
             try:
                 text_to_check = f"{post_data.title}\n{post_data.content}"
-                check_result = content_safety_service.check_input(text_to_check)
+                check_result = await content_safety_service.check_input_async(text_to_check)
                 if not check_result.is_safe:
                     raise HTTPException(
                         status_code=status.HTTP_400_BAD_REQUEST,
@@ -73,12 +130,11 @@ async def create_post(
                 logger.warning(f"⚠️ 콘텐츠 필터링 실패: {e}")
         
         # 카테고리 자동 분류
-        final_category = post_data.category or "general"
         if content_safety_service and final_category == "general":
             try:
-                auto_category = content_safety_service.classify_category(
+                auto_category = await (category_task or content_safety_service.classify_category_async(
                     post_data.title, post_data.content
-                )
+                ))
                 if auto_category and auto_category != "general":
                     final_category = auto_category
             except:
@@ -103,13 +159,15 @@ async def create_post(
             "updated_at": None
         }
         
-        result = db.table("posts").insert(post_doc).execute()
+        result = await db_execute(db.table("posts").insert(post_doc))
         
         if not result.data:
             raise Exception("Failed to insert post")
         
+        get_post_search_index().upsert(post_doc)
+
         # 유저의 post_count 증가
-        db.rpc("increment_post_count", {"user_uid": current_user.uid}).execute()
+        await db_execute(db.rpc("increment_post_count", {"user_uid": current_user.uid}))
         
         logger.info(f"✅ 게시글 생성 완료: {post_id}")
         
@@ -149,15 +207,35 @@ async def get_posts(
     page: int = Query(1, ge=1),
     page_size: int = Query(10, ge=1, le=100),
     category: Optional[str] = Query(None),
+    pagination: str = Query(
+        "offset", pattern=PAGINATION_MODES_PATTERN,
+        description="offset: 기존 페이지 번호 방식 / cursor: 키셋 페이지네이션 (본문 제외)"
+    ),
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서 (지정 시 cursor 모드)"),
+    count: Optional[str] = Query(
+        None, pattern=COUNT_MODES_PATTERN,
+        description="총 개수 계산 (기본: offset=exact, cursor=none)"
+    ),
     db: Client = Depends(get_supabase_db),
     current_user: Optional[UserResponse] = Depends(get_optional_user)
 ) -> PostListResponse:
-    """게시글 목록 조회 (페이징)"""
+    """
+    게시글 목록 조회 (페이징)
+
+    - offset 모드: page 번호로 조회, 본문 포함, 총 개수 exact (기존 동작)
+    - cursor 모드: (created_at, post_id) 키셋으로 다음 페이지 조회, 본문 제외,
+      응답의 next_cursor를 다음 요청의 cursor로 전달
+    """
     try:
-        logger.info(f"📖 게시글 목록 조회: page={page}, size={page_size}")
+        use_cursor = pagination == "cursor" or cursor is not None
+        count = count or ("none" if use_cursor else "exact")
         
-        # 기본 쿼리
-        query = db.table("posts").select("*", count="exact")
+        if use_cursor:
+            logger.info(f"📖 게시글 목록 조회 (커서): size={page_size}, cursor={'있음' if cursor else '없음'}")
+            query = db.table("posts").select(POST_LIST_COLUMNS, count=count_method(count))
+        else:
+            logger.info(f"📖 게시글 목록 조회: page={page}, size={page_size}")
+            query = db.table("posts").select("*", count=count_method(count))
         
         # 삭제되지 않은 게시글만
         query = query.eq("is_deleted", False)
@@ -166,38 +244,35 @@ async def get_posts(
         if category:
             query = query.eq("category", category)
         
-        # 정렬 및 페이징
-        offset = (page - 1) * page_size
-        result = query.order("created_at", desc=True).range(offset, offset + page_size - 1).execute()
-        
-        total_count = result.count if result.count else 0
-        
-        # PostResponse 리스트 생성
-        posts = []
-        for data in result.data:
-            posts.append(PostResponse(
-                post_id=data.get("post_id"),
-                author_id=data.get("author_id"),
-                author_username=data.get("author_username"),
-                title=data.get("title"),
-                content=data.get("content"),
-                category=data.get("category"),
-                views=data.get("views", 0),
-                likes=data.get("likes", 0),
-                comment_count=data.get("comment_count", 0),
-                created_at=data.get("created_at"),
-                updated_at=data.get("updated_at")
+        next_cursor = None
+        if use_cursor:
+            # 정렬 키 (created_at, post_id) 기준 커서 이후 page_size + 1개 (다음 페이지 여부 확인용)
+            result = await db_execute(apply_keyset(query, "post_id", cursor).limit(page_size + 1))
+            rows, next_cursor = split_page(result.data, page_size, "post_id")
+        else:
+            # 정렬 및 페이징 (같은 시각 게시글은 post_id로 고정 → 페이지 간 중복/누락 방지)
+            offset = (page - 1) * page_size
+            result = await db_execute(query.order("created_at", desc=True).order("post_id", desc=True).range(
+                offset, offset + page_size - 1
             ))
+            rows = result.data
+        
+        # 아직 반영 전인 조회수/좋아요 포함
+        counters = get_counter_buffer()
+        posts = [_to_post_response(counters.apply("posts", data, "post_id")) for data in rows]
         
         logger.info(f"✅ {len(posts)}개 게시글 조회")
         
         return PostListResponse(
             posts=posts,
-            total_count=total_count,
-            page=page,
-            page_size=page_size
+            total_count=None if count == "none" else (result.count or 0),
+            page=None if use_cursor else page,
+            page_size=page_size,
+            next_cursor=next_cursor
         )
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"❌ 게시글 목록 조회 실패: {e}")
         raise HTTPException(
@@ -206,6 +281,95 @@ async def get_posts(
         )
 
 
+# ============================================
+# 게시글 검색 (/{post_id}보다 먼저 등록)
+# ============================================
+
+@router.get(
+    "/search",
+    response_model=PostSearchResponse,
+    status_code=status.HTTP_200_OK
+)
+async def search_posts(
+    q: str = Query(..., min_length=1, max_length=100, description="검색어"),
+    limit: int = Query(10, ge=1, le=50),
+    category: Optional[str] = Query(None),
+    db: Client = Depends(get_supabase_db)
+) -> PostSearchResponse:
+    """
+    게시글 검색 (제목/본문, BM25 점수순)
+
+    - 메모리 역색인에서 순위 계산 → 상위 limit개만 DB에서 최신 값으로 조회
+    - 인덱스는 앱 시작 시 백그라운드로 적재, 적재가 끝나기 전에는 503 (Retry-After)
+    """
+    try:
+        logger.info(f"🔍 게시글 검색: q={q!r}, limit={limit}")
+
+        index = get_post_search_index()
+        # 처음/오래됐으면 백그라운드 적재 (요청은 적재를 기다리지 않음)
+        index.ensure_loaded(db, wait=False)
+        if not index.ready:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Search index is loading",
+                headers={"Retry-After": str(POST_SEARCH_RETRY_AFTER_SECONDS)},
+            )
+
+        hits, total_matches = index.search(q, limit=limit, category=category)
+
+        rows = {}
+        if hits:
+            result = await db_execute(
+                db.table("posts").select("*")
+                .in_("post_id", [hit.post_id for hit in hits])
+                .eq("is_deleted", False)
+            )
+            rows = {row["post_id"]: row for row in result.data or []}
+
+        # 다른 인스턴스에서 삭제된 글은 제외, 아직 반영 전인 조회수/좋아요 포함
+        counters = get_counter_buffer()
+        posts = [
+            PostSearchHit(
+                **_to_post_response(counters.apply("posts", rows[hit.post_id], "post_id")).model_dump(),
+                score=hit.score,
+            )
+            for hit in hits
+            if hit.post_id in rows
+        ]
+
+        logger.info(f"✅ 검색 결과 {len(posts)}개 (매칭 {total_matches}개)")
+
+        return PostSearchResponse(query=q, posts=posts, total_matches=total_matches)
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"❌ 게시글 검색 실패: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to search posts"
+        )
+
+
+# ============================================
+# 헬스 체크 (/{post_id}보다 먼저 등록해야 /health가 게시글 조회로 잡히지 않음)
+# ============================================
+
+@router.get("/health", response_model=dict)
+async def posts_health():
+    """Posts 서비스 헬스 체크"""
+    return {
+        "status": "healthy",
+        "service": "posts",
+        "database": "supabase",
+        "counters": get_counter_buffer().get_stats(),
+        "db_pool": get_db_executor().get_stats(),
+        "search_index": get_post_search_index().get_stats(),
+        "comment_threads": get_comment_thread_loader().get_stats(),
+        "timestamp": datetime.now().isoformat()
+    }
+
+
 # ============================================
 # 3. 게시글 상세 조회 (Get Post)
 # ============================================
@@ -223,7 +387,7 @@ async def get_post(
     try:
         logger.info(f"📖 게시글 조회: {post_id}")
         
-        result = db.table("posts").select("*").eq("post_id", post_id).execute()
+        result = await db_execute(db.table("posts").select("*").eq("post_id", post_id))
         
         if not result.data or len(result.data) == 0:
             raise HTTPException(
@@ -233,9 +397,8 @@ async def get_post(
         
         post_data = result.data[0]
         
-        # 조회수 증가
-        new_views = post_data.get("views", 0) + 1
-        db.table("posts").update({"views": new_views}).eq("post_id", post_id).execute()
+        # 조회수 증가 (버퍼에 합산, 주기적으로 한 번에 반영)
+        new_views = post_data.get("views", 0) + get_counter_buffer().increment("posts", post_id, "views")
         
         return PostResponse(
             post_id=post_data.get("post_id"),
@@ -281,7 +444,7 @@ async def update_post(
         logger.info(f"✏️ 게시글 수정: {post_id}")
         
         # 게시글 조회
-        result = db.table("posts").select("*").eq("post_id", post_id).execute()
+        result = await db_execute(db.table("posts").select("*").eq("post_id", post_id))
         
         if not result.data or len(result.data) == 0:
             raise HTTPException(
@@ -299,13 +462,14 @@ async def update_post(
             )
         
         # 콘텐츠 필터링
+        content_safety_service = get_content_safety_service()
         new_title = post_data.title if post_data.title else post.get("title")
         new_content = post_data.content if post_data.content else post.get("content")
         
         if content_safety_service and (post_data.title or post_data.content):
             try:
                 text_to_check = f"{new_title}\n{new_content}"
-                check_result = content_safety_service.check_input(text_to_check)
+                check_result = await content_safety_service.check_input_async(text_to_check)
                 if not check_result.is_safe:
                     raise HTTPException(
                         status_code=status.HTTP_400_BAD_REQUEST,
@@ -337,12 +501,13 @@ async def update_post(
         update_dict["updated_at"] = datetime.now().isoformat()
         
         # Supabase 업데이트
-        db.table("posts").update(update_dict).eq("post_id", post_id).execute()
+        await db_execute(db.table("posts").update(update_dict).eq("post_id", post_id))
+        get_post_search_index().upsert({**post, **update_dict})
         
         logger.info(f"✅ 게시글 수정 완료: {post_id}")
         
         # 수정된 데이터 반환
-        updated_post = {**post, **update_dict}
+        updated_post = get_counter_buffer().apply("posts", {**post, **update_dict}, "post_id")
         
         return PostResponse(
             post_id=updated_post.get("post_id"),
@@ -386,7 +551,7 @@ async def delete_post(
     try:
         logger.info(f"🗑️ 게시글 삭제: {post_id}")
         
-        result = db.table("posts").select("*").eq("post_id", post_id).execute()
+        result = await db_execute(db.table("posts").select("*").eq("post_id", post_id))
         
         if not result.data or len(result.data) == 0:
             raise HTTPException(
@@ -404,10 +569,11 @@ async def delete_post(
             )
         
         # 소프트 삭제
-        db.table("posts").update({"is_deleted": True}).eq("post_id", post_id).execute()
+        await db_execute(db.table("posts").update({"is_deleted": True}).eq("post_id", post_id))
+        get_post_search_index().remove(post_id)
         
         # 관련 댓글도 소프트 삭제
-        db.table("comments").update({"is_deleted": True}).eq("post_id", post_id).execute()
+        await db_execute(db.table("comments").update({"is_deleted": True}).eq("post_id", post_id))
         
         logger.info(f"✅ 게시글 삭제 완료: {post_id}")
         
@@ -443,9 +609,10 @@ async def add_comment(
         logger.info(f"💬 댓글 추가: {post_id}")
         
         # 콘텐츠 필터링
+        content_safety_service = get_content_safety_service()
         if content_safety_service:
             try:
-                check_result = content_safety_service.check_input(comment_data.content)
+                check_result = await content_safety_service.check_input_async(comment_data.content)
                 if not check_result.is_safe:
                     raise HTTPException(
                         status_code=status.HTTP_400_BAD_REQUEST,
@@ -460,7 +627,7 @@ async def add_comment(
                 pass
         
         # 게시글 존재 확인
-        post_result = db.table("posts").select("*").eq("post_id", post_id).execute()
+        post_result = await db_execute(db.table("posts").select("post_id").eq("post_id", post_id))
         if not post_result.data:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -484,15 +651,15 @@ async def add_comment(
         }
         
         # 댓글 저장
-        db.table("comments").insert(comment_doc).execute()
+        await db_execute(db.table("comments").insert(comment_doc))
         
-        # 게시글의 댓글 수 증가
-        post_data = post_result.data[0]
-        new_count = post_data.get("comment_count", 0) + 1
-        db.table("posts").update({"comment_count": new_count}).eq("post_id", post_id).execute()
+        # 게시글의 댓글 수 증가 (DB에서 원자적으로 +1)
+        threads = get_comment_thread_loader()
+        await threads.adjust_comment_count(db, post_id, 1)
+        threads.invalidate(post_id)
         
         # 유저의 comment_count 증가
-        db.rpc("increment_comment_count", {"user_uid": current_user.uid}).execute()
+        await db_execute(db.rpc("increment_comment_count", {"user_uid": current_user.uid}))
         
         logger.info(f"✅ 댓글 추가 완료: {comment_id}")
         
@@ -528,34 +695,44 @@ async def add_comment(
 )
 async def get_comments(
     post_id: str,
+    limit: Optional[int] = Query(None, ge=1, le=200, description="페이지당 댓글 수 (지정 시 커서 페이지네이션)"),
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서 (응답의 next_cursor)"),
+    count: str = Query("none", pattern=COUNT_MODES_PATTERN, description="커서 모드 총 개수 계산"),
     db: Client = Depends(get_supabase_db)
 ) -> CommentListResponse:
-    """게시글의 댓글 목록 조회"""
+    """
+    게시글의 댓글 목록 조회
+
+    - limit/cursor 없음: 전체 댓글 (기존 동작)
+    - limit 또는 cursor 지정: (created_at, comment_id) 오름차순 키셋으로 limit개씩
+    """
     try:
         logger.info(f"💬 댓글 목록 조회: {post_id}")
         
-        result = db.table("comments").select("*").eq("post_id", post_id).eq("is_deleted", False).order("created_at").execute()
-        
-        all_comments = []
-        for data in result.data:
-            all_comments.append(CommentResponse(
-                comment_id=data.get("comment_id"),
-                post_id=data.get("post_id"),
-                author_id=data.get("author_id"),
-                author_username=data.get("author_username"),
-                content=data.get("content"),
-                likes=data.get("likes", 0),
-                parent_comment_id=data.get("parent_comment_id"),
-                created_at=data.get("created_at"),
-                updated_at=data.get("updated_at")
-            ))
+        next_cursor = None
+        if limit is None and cursor is None:
+            result = await db_execute(db.table("comments").select("*").eq("post_id", post_id).eq("is_deleted", False).order("created_at"))
+            rows = result.data
+            total_count = len(rows)
+        else:
+            page_size = limit or 50
+            query = db.table("comments").select("*", count=count_method(count)).eq("post_id", post_id).eq("is_deleted", False)
+            result = await db_execute(apply_keyset(query, "comment_id", cursor, desc=False).limit(page_size + 1))
+            rows, next_cursor = split_page(result.data, page_size, "comment_id")
+            total_count = None if count == "none" else (result.count or 0)
+        
+        counters = get_counter_buffer()
+        all_comments = [_to_comment_response(counters.apply("comments", data, "comment_id")) for data in rows]
         
         logger.info(f"✅ {len(all_comments)}개 댓글 조회")
         return CommentListResponse(
             comments=all_comments,
-            total_count=len(all_comments)
+            total_count=total_count,
+            next_cursor=next_cursor
         )
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"❌ 댓글 조회 실패: {e}")
         raise HTTPException(
@@ -564,6 +741,97 @@ async def get_comments(
         )
 
 
+# ============================================
+# 7-1. 스레드형 댓글 조회 (Get Comment Threads)
+# ============================================
+
+@router.get(
+    "/{post_id}/comments/threads",
+    response_model=CommentThreadListResponse,
+    status_code=status.HTTP_200_OK
+)
+async def get_comment_threads(
+    post_id: str,
+    limit: int = Query(20, ge=1, le=100, description="페이지당 최상위 댓글 수"),
+    replies: int = Query(3, ge=0, le=20, description="스레드마다 함께 보낼 답글 수"),
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서 (응답의 next_cursor)"),
+    db: Client = Depends(get_supabase_db)
+) -> CommentThreadListResponse:
+    """
+    스레드형 댓글 목록 조회
+
+    - 최상위 댓글을 작성순 키셋 페이지로 limit개, 각 스레드에 앞쪽 답글 replies개 + 전체 답글 수
+    - 나머지 답글은 /{post_id}/comments/{comment_id}/replies?cursor=next_reply_cursor
+    - 첫 페이지는 캐시 (이 게시글의 댓글 쓰기 시 무효화)
+    """
+    try:
+        logger.info(f"💬 스레드형 댓글 조회: {post_id} (limit={limit}, replies={replies})")
+
+        page, next_cursor = await get_comment_thread_loader().load_page(db, post_id, limit, replies, cursor)
+
+        # 캐시와 공유하는 행이므로 복사본에 아직 반영 전인 좋아요 수 포함
+        counters = get_counter_buffer()
+
+        def to_response(data: dict) -> CommentResponse:
+            return _to_comment_response(counters.apply("comments", dict(data), "comment_id"))
+
+        threads = [
+            CommentThread(
+                comment=to_response(thread["comment"]),
+                replies=[to_response(reply) for reply in thread["replies"]],
+                reply_count=thread["reply_count"],
+                next_reply_cursor=thread["next_reply_cursor"],
+            )
+            for thread in page
+        ]
+
+        logger.info(f"✅ {len(threads)}개 스레드 조회")
+        return CommentThreadListResponse(threads=threads, next_cursor=next_cursor)
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"❌ 스레드형 댓글 조회 실패: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to fetch comment threads"
+        )
+
+
+@router.get(
+    "/{post_id}/comments/{comment_id}/replies",
+    response_model=CommentListResponse,
+    status_code=status.HTTP_200_OK
+)
+async def get_comment_replies(
+    post_id: str,
+    comment_id: str,
+    limit: int = Query(20, ge=1, le=100, description="페이지당 답글 수"),
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서 (스레드의 next_reply_cursor 또는 응답의 next_cursor)"),
+    db: Client = Depends(get_supabase_db)
+) -> CommentListResponse:
+    """한 스레드의 답글 목록 (작성순 키셋 페이지)"""
+    try:
+        logger.info(f"💬 답글 조회: {comment_id}")
+
+        rows, next_cursor = await get_comment_thread_loader().load_replies(db, post_id, comment_id, limit, cursor)
+
+        counters = get_counter_buffer()
+        replies = [_to_comment_response(counters.apply("comments", data, "comment_id")) for data in rows]
+
+        logger.info(f"✅ {len(replies)}개 답글 조회")
+        return CommentListResponse(comments=replies, next_cursor=next_cursor)
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"❌ 답글 조회 실패: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to fetch replies"
+        )
+
+
 # ============================================
 # 8. 댓글 수정 (Update Comment)
 # ============================================
@@ -584,7 +852,7 @@ async def update_comment(
     try:
         logger.info(f"✏️ 댓글 수정: {comment_id}")
         
-        result = db.table("comments").select("*").eq("comment_id", comment_id).execute()
+        result = await db_execute(db.table("comments").select("*").eq("comment_id", comment_id))
         
         if not result.data:
             raise HTTPException(
@@ -607,9 +875,10 @@ async def update_comment(
             )
         
         # 콘텐츠 필터링
+        content_safety_service = get_content_safety_service()
         if content_safety_service:
             try:
-                check_result = content_safety_service.check_input(comment_data.content)
+                check_result = await content_safety_service.check_input_async(comment_data.content)
                 if not check_result.is_safe:
                     raise HTTPException(
                         status_code=status.HTTP_400_BAD_REQUEST,
@@ -625,11 +894,12 @@ async def update_comment(
             "updated_at": datetime.now().isoformat()
         }
         
-        db.table("comments").update(update_dict).eq("comment_id", comment_id).execute()
+        await db_execute(db.table("comments").update(update_dict).eq("comment_id", comment_id))
+        get_comment_thread_loader().invalidate(post_id)
         
         logger.info(f"✅ 댓글 수정 완료: {comment_id}")
         
-        updated_comment = {**comment, **update_dict}
+        updated_comment = get_counter_buffer().apply("comments", {**comment, **update_dict}, "comment_id")
         
         return CommentResponse(
             comment_id=updated_comment.get("comment_id"),
@@ -672,7 +942,7 @@ async def delete_comment(
     try:
         logger.info(f"🗑️ 댓글 삭제: {comment_id}")
         
-        result = db.table("comments").select("*").eq("comment_id", comment_id).execute()
+        result = await db_execute(db.table("comments").select("*").eq("comment_id", comment_id))
         
         if not result.data:
             raise HTTPException(
@@ -694,17 +964,23 @@ async def delete_comment(
                 detail="Not authorized to delete this comment"
             )
         
-        # 대댓글 소프트 삭제
-        db.table("comments").update({"is_deleted": True}).eq("parent_comment_id", comment_id).execute()
+        # 대댓글 소프트 삭제 (이번에 삭제된 행만 반환)
+        replies_result = await db_execute(
+            db.table("comments").update({"is_deleted": True})
+            .eq("parent_comment_id", comment_id).eq("is_deleted", False)
+        )
         
         # 댓글 소프트 삭제
-        db.table("comments").update({"is_deleted": True}).eq("comment_id", comment_id).execute()
+        comment_result = await db_execute(
+            db.table("comments").update({"is_deleted": True})
+            .eq("comment_id", comment_id).eq("is_deleted", False)
+        )
         
-        # 게시글의 댓글 수 감소
-        post_result = db.table("posts").select("comment_count").eq("post_id", post_id).execute()
-        if post_result.data:
-            new_count = max(0, post_result.data[0].get("comment_count", 1) - 1)
-            db.table("posts").update({"comment_count": new_count}).eq("post_id", post_id).execute()
+        # 게시글의 댓글 수 감소 (이번에 삭제된 댓글 + 대댓글 수만큼, DB에서 원자적으로)
+        threads = get_comment_thread_loader()
+        deleted = len(comment_result.data or []) + len(replies_result.data or [])
+        await threads.adjust_comment_count(db, post_id, -deleted)
+        threads.invalidate(post_id)
         
         logger.info(f"✅ 댓글 삭제 완료: {comment_id}")
         
@@ -739,7 +1015,7 @@ async def like_comment(
     try:
         logger.info(f"👍 댓글 좋아요: {comment_id}")
         
-        result = db.table("comments").select("*").eq("comment_id", comment_id).execute()
+        result = await db_execute(db.table("comments").select("*").eq("comment_id", comment_id))
         
         if not result.data:
             raise HTTPException(
@@ -755,8 +1031,10 @@ async def like_comment(
                 detail="Comment does not belong to this post"
             )
         
-        new_likes = comment.get("likes", 0) + 1
-        db.table("comments").update({"likes": new_likes}).eq("comment_id", comment_id).execute()
+        # 좋아요 증가 (버퍼에 합산, 주기적으로 한 번에 반영)
+        # 캐시된 첫 페이지는 응답 시 버퍼 증가분을 얹으므로 유지, 버퍼가 DB에 반영한 뒤에 무효화
+        get_comment_thread_loader().track_like(post_id, comment_id)
+        new_likes = comment.get("likes", 0) + get_counter_buffer().increment("comments", comment_id, "likes")
         
         logger.info(f"✅ 댓글 좋아요 완료: {comment_id}")
         
@@ -780,18 +1058,3 @@ async def like_comment(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to like comment"
         )
-
-
-# ============================================
-# 11. 헬스 체크
-# ============================================
-
-@router.get("/health", response_model=dict)
-async def posts_health():
-    """Posts 서비스 헬스 체크"""
-    return {
-        "status": "healthy",
-        "service": "posts",
-        "database": "supabase",
-        "timestamp": datetime.now().isoformat()
-    }
@@ -18,63 +18,70 @@ from ..models import (
     WarningResponse, UserWarningStatus, MessageResponse, UserResponse
 )
 from ..dependencies import get_current_user, get_supabase_db
+from ..db_executor import db_execute
+from ..report_abuse import REPORT_ABUSE_SETTINGS, get_report_abuse_tracker
+from ..pagination import (
+    COUNT_MODES_PATTERN, PAGINATION_MODES_PATTERN,
+    apply_keyset, count_method, split_page,
+)
+from llm_service.utils.post_search_index import get_post_search_index
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(tags=["Reports"])
 
 
-# ============================================
-# 악의적 신고자 감지 설정
-# ============================================
+def _to_report_response(data: dict) -> ReportResponse:
+    """reports 행 → ReportResponse"""
+    return ReportResponse(
+        report_id=data.get("report_id"),
+        reporter_id=data.get("reporter_id"),
+        reporter_username=data.get("reporter_username"),
+        target_type=ReportTargetType(data.get("target_type")),
+        target_id=data.get("target_id"),
+        target_author_id=data.get("target_author_id"),
+        category=ReportCategory(data.get("category")),
+        reason=data.get("reason"),
+        status=ReportStatus(data.get("status")),
+        admin_note=data.get("admin_note"),
+        created_at=data.get("created_at"),
+        resolved_at=data.get("resolved_at")
+    )
+
+
+async def _list_reports(query, page: int, page_size: int, cursor: Optional[str], use_cursor: bool):
+    """
+    reports 목록 페이징 (offset / cursor 공용)
+
+    Returns:
+        (행 리스트, 개수 결과, 다음 커서)
+    """
+    if use_cursor:
+        result = await db_execute(apply_keyset(query, "report_id", cursor).limit(page_size + 1))
+        rows, next_cursor = split_page(result.data, page_size, "report_id")
+        return rows, result.count, next_cursor
+
+    offset = (page - 1) * page_size
+    result = await db_execute(query.order("created_at", desc=True).order("report_id", desc=True).range(
+        offset, offset + page_size - 1
+    ))
+    return result.data, result.count, None
 
-REPORT_ABUSE_SETTINGS = {
-    "max_reports_per_hour": 10,
-    "max_reports_per_day": 30,
-    "dismissed_threshold": 0.7,
-    "min_reports_for_threshold": 5,
-    "target_concentration_limit": 3,
-}
 
+# ============================================
+# 악의적 신고자 감지
+# ============================================
 
 async def check_reporter_abuse(db: Client, reporter_id: str) -> dict:
-    """신고자의 신고 남용 여부 체크"""
-    now = datetime.now()
-    one_hour_ago = (now - timedelta(hours=1)).isoformat()
-    one_day_ago = (now - timedelta(days=1)).isoformat()
-
-    # 신고자의 모든 신고 조회
-    result = db.table("reports").select("*").eq("reporter_id", reporter_id).execute()
-    all_reports = result.data or []
-
-    # 통계 계산
-    total_reports = len(all_reports)
-    reports_last_hour = 0
-    reports_last_day = 0
-    dismissed_count = 0
-    resolved_count = 0
-    target_counts = {}
-
-    for data in all_reports:
-        created_at = data.get("created_at")
-        report_status = data.get("status")
-        target_author = data.get("target_author_id")
-
-        if created_at:
-            if created_at > one_hour_ago:
-                reports_last_hour += 1
-            if created_at > one_day_ago:
-                reports_last_day += 1
-                if target_author:
-                    target_counts[target_author] = target_counts.get(target_author, 0) + 1
-
-        if report_status == "dismissed":
-            dismissed_count += 1
-        elif report_status in ["resolved", "dismissed"]:
-            resolved_count += 1
+    """신고자의 신고 남용 여부 체크 (신고자별 누적 통계, DB 집계는 처음 한 번만)"""
+    snapshot = await get_report_abuse_tracker().snapshot(db, reporter_id)
+    reports_last_hour = snapshot["reports_last_hour"]
+    reports_last_day = snapshot["reports_last_day"]
+    dismissed_count = snapshot["dismissed_count"]
+    resolved_count = snapshot["resolved_count"]
 
     stats = {
-        "total_reports": total_reports,
+        "total_reports": snapshot["total_reports"],
         "reports_last_hour": reports_last_hour,
         "reports_last_day": reports_last_day,
         "dismissed_count": dismissed_count,
@@ -114,14 +121,14 @@ async def check_reporter_abuse(db: Client, reporter_id: str) -> dict:
             }
 
     # 4. 특정 유저 집중 신고
-    for target_id, count in target_counts.items():
-        if count >= settings["target_concentration_limit"]:
-            return {
-                "is_abusive": True,
-                "reason": f"같은 유저를 24시간 내 {count}회 신고했습니다.",
-                "abuse_type": "targeting",
-                "stats": stats
-            }
+    count = snapshot["max_target_count"]
+    if count >= settings["target_concentration_limit"]:
+        return {
+            "is_abusive": True,
+            "reason": f"같은 유저를 24시간 내 {count}회 신고했습니다.",
+            "abuse_type": "targeting",
+            "stats": stats
+        }
 
     return {"is_abusive": False, "reason": None, "stats": stats}
 
@@ -169,7 +176,7 @@ async def create_report(
             target_author_id = report_data.target_id
             
         elif report_data.target_type == ReportTargetType.POST:
-            result = db.table("posts").select("author_id").eq("post_id", report_data.target_id).execute()
+            result = await db_execute(db.table("posts").select("author_id").eq("post_id", report_data.target_id))
             if result.data:
                 target_author_id = result.data[0].get("author_id")
                 if target_author_id == current_user.uid:
@@ -179,7 +186,7 @@ async def create_report(
                     )
                     
         elif report_data.target_type == ReportTargetType.COMMENT:
-            result = db.table("comments").select("author_id").eq("comment_id", report_data.target_id).execute()
+            result = await db_execute(db.table("comments").select("author_id").eq("comment_id", report_data.target_id))
             if result.data:
                 target_author_id = result.data[0].get("author_id")
                 if target_author_id == current_user.uid:
@@ -207,7 +214,8 @@ async def create_report(
             "resolved_at": None
         }
 
-        db.table("reports").insert(report_doc).execute()
+        await db_execute(db.table("reports").insert(report_doc))
+        get_report_abuse_tracker().record_report(current_user.uid, now, target_author_id)
         
         logger.info(f"✅ 신고 생성 완료: {report_id}")
 
@@ -246,45 +254,34 @@ async def create_report(
 async def get_my_reports(
     page: int = Query(1, ge=1),
     page_size: int = Query(10, ge=1, le=50),
+    pagination: str = Query("offset", pattern=PAGINATION_MODES_PATTERN),
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서 (지정 시 cursor 모드)"),
+    count: Optional[str] = Query(None, pattern=COUNT_MODES_PATTERN, description="총 개수 계산 (기본: offset=exact, cursor=none)"),
     current_user: UserResponse = Depends(get_current_user),
     db: Client = Depends(get_supabase_db)
 ) -> ReportListResponse:
-    """내가 신고한 내역 조회"""
+    """내가 신고한 내역 조회 (offset 또는 (created_at, report_id) 커서 페이징)"""
     try:
         logger.info(f"📖 내 신고 내역 조회: {current_user.uid}")
 
-        offset = (page - 1) * page_size
-        
-        result = db.table("reports").select("*", count="exact").eq(
+        use_cursor = pagination == "cursor" or cursor is not None
+        count = count or ("none" if use_cursor else "exact")
+
+        query = db.table("reports").select("*", count=count_method(count)).eq(
             "reporter_id", current_user.uid
-        ).order("created_at", desc=True).range(offset, offset + page_size - 1).execute()
-
-        total_count = result.count if result.count else 0
-
-        reports = []
-        for data in result.data:
-            reports.append(ReportResponse(
-                report_id=data.get("report_id"),
-                reporter_id=data.get("reporter_id"),
-                reporter_username=data.get("reporter_username"),
-                target_type=ReportTargetType(data.get("target_type")),
-                target_id=data.get("target_id"),
-                target_author_id=data.get("target_author_id"),
-                category=ReportCategory(data.get("category")),
-                reason=data.get("reason"),
-                status=ReportStatus(data.get("status")),
-                admin_note=data.get("admin_note"),
-                created_at=data.get("created_at"),
-                resolved_at=data.get("resolved_at")
-            ))
+        )
+        rows, total, next_cursor = await _list_reports(query, page, page_size, cursor, use_cursor)
 
         return ReportListResponse(
-            reports=reports,
-            total_count=total_count,
-            page=page,
-            page_size=page_size
+            reports=[_to_report_response(data) for data in rows],
+            total_count=None if count == "none" else (total or 0),
+            page=None if use_cursor else page,
+            page_size=page_size,
+            next_cursor=next_cursor
         )
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"❌ 신고 내역 조회 실패: {e}")
         raise HTTPException(
@@ -306,49 +303,37 @@ async def get_all_reports(
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
     status_filter: Optional[str] = Query(None),
+    pagination: str = Query("offset", pattern=PAGINATION_MODES_PATTERN),
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서 (지정 시 cursor 모드)"),
+    count: Optional[str] = Query(None, pattern=COUNT_MODES_PATTERN, description="총 개수 계산 (기본: offset=exact, cursor=none)"),
     current_user: UserResponse = Depends(get_current_user),
     db: Client = Depends(get_supabase_db)
 ) -> ReportListResponse:
-    """관리자용 전체 신고 목록 조회"""
+    """관리자용 전체 신고 목록 조회 (offset 또는 (created_at, report_id) 커서 페이징)"""
     try:
         # 관리자 권한 확인 (TODO: 실제 관리자 체크 추가)
         logger.info(f"📖 관리자 신고 목록 조회: {current_user.uid}")
 
-        offset = (page - 1) * page_size
-        
-        query = db.table("reports").select("*", count="exact")
+        use_cursor = pagination == "cursor" or cursor is not None
+        count = count or ("none" if use_cursor else "exact")
+
+        query = db.table("reports").select("*", count=count_method(count))
         
         if status_filter:
             query = query.eq("status", status_filter)
         
-        result = query.order("created_at", desc=True).range(offset, offset + page_size - 1).execute()
-
-        total_count = result.count if result.count else 0
-
-        reports = []
-        for data in result.data:
-            reports.append(ReportResponse(
-                report_id=data.get("report_id"),
-                reporter_id=data.get("reporter_id"),
-                reporter_username=data.get("reporter_username"),
-                target_type=ReportTargetType(data.get("target_type")),
-                target_id=data.get("target_id"),
-                target_author_id=data.get("target_author_id"),
-                category=ReportCategory(data.get("category")),
-                reason=data.get("reason"),
-                status=ReportStatus(data.get("status")),
-                admin_note=data.get("admin_note"),
-                created_at=data.get("created_at"),
-                resolved_at=data.get("resolved_at")
-            ))
+        rows, total, next_cursor = await _list_reports(query, page, page_size, cursor, use_cursor)
 
         return ReportListResponse(
-            reports=reports,
-            total_count=total_count,
-            page=page,
-            page_size=page_size
+            reports=[_to_report_response(data) for data in rows],
+            total_count=None if count == "none" else (total or 0),
+            page=None if use_cursor else page,
+            page_size=page_size,
+            next_cursor=next_cursor
         )
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"❌ 관리자 신고 목록 조회 실패: {e}")
         raise HTTPException(
@@ -377,7 +362,7 @@ async def process_report(
         logger.info(f"⚖️ 신고 처리: {report_id} → {action.status}")
 
         # 신고 조회
-        result = db.table("reports").select("*").eq("report_id", report_id).execute()
+        result = await db_execute(db.table("reports").select("*").eq("report_id", report_id))
         
         if not result.data:
             raise HTTPException(
@@ -395,14 +380,17 @@ async def process_report(
             "resolved_at": now if action.status in [ReportStatus.RESOLVED, ReportStatus.DISMISSED] else None
         }
         
-        db.table("reports").update(update_data).eq("report_id", report_id).execute()
+        await db_execute(db.table("reports").update(update_data).eq("report_id", report_id))
+        get_report_abuse_tracker().record_status_change(
+            report.get("reporter_id"), report.get("status"), action.status.value
+        )
 
         # 경고 발급
         if action.issue_warning and report.get("target_author_id"):
             warning_id = str(uuid.uuid4())[:8]
             
             # 대상 유저 정보 조회
-            user_result = db.table("users").select("username").eq("uid", report.get("target_author_id")).execute()
+            user_result = await db_execute(db.table("users").select("username").eq("uid", report.get("target_author_id")))
             username = user_result.data[0].get("username") if user_result.data else "Unknown"
             
             warning_doc = {
@@ -416,21 +404,22 @@ async def process_report(
                 "created_at": now,
                 "expires_at": (datetime.now() + timedelta(days=90)).isoformat()
             }
-            db.table("warnings").insert(warning_doc).execute()
+            await db_execute(db.table("warnings").insert(warning_doc))
             
             # 유저의 warning_count 증가
-            db.table("users").update({
+            await db_execute(db.table("users").update({
                 "warning_count": user_result.data[0].get("warning_count", 0) + 1 if user_result.data else 1
-            }).eq("uid", report.get("target_author_id")).execute()
+            }).eq("uid", report.get("target_author_id")))
             
             logger.info(f"⚠️ 경고 발급: {report.get('target_author_id')} (severity: {action.warning_severity})")
 
         # 콘텐츠 삭제
         if action.delete_content:
             if report.get("target_type") == "post":
-                db.table("posts").update({"is_deleted": True}).eq("post_id", report.get("target_id")).execute()
+                await db_execute(db.table("posts").update({"is_deleted": True}).eq("post_id", report.get("target_id")))
+                get_post_search_index().remove(report.get("target_id"))
             elif report.get("target_type") == "comment":
-                db.table("comments").update({"is_deleted": True}).eq("comment_id", report.get("target_id")).execute()
+                await db_execute(db.table("comments").update({"is_deleted": True}).eq("comment_id", report.get("target_id")))
             
             logger.info(f"🗑️ 콘텐츠 삭제: {report.get('target_type')}:{report.get('target_id')}")
 
@@ -480,7 +469,7 @@ async def get_user_warnings(
         logger.info(f"⚠️ 경고 현황 조회: {user_id}")
 
         # 유저 정보 조회
-        user_result = db.table("users").select("*").eq("uid", user_id).execute()
+        user_result = await db_execute(db.table("users").select("*").eq("uid", user_id))
         
         if not user_result.data:
             raise HTTPException(
@@ -491,7 +480,7 @@ async def get_user_warnings(
         user_data = user_result.data[0]
 
         # 경고 목록 조회
-        warnings_result = db.table("warnings").select("*").eq("user_id", user_id).order("created_at", desc=True).execute()
+        warnings_result = await db_execute(db.table("warnings").select("*").eq("user_id", user_id).order("created_at", desc=True))
 
         now = datetime.now().isoformat()
         active_warnings = []
@@ -542,5 +531,6 @@ async def reports_health():
         "status": "healthy",
         "service": "reports",
         "database": "supabase",
+        "abuse_tracker": get_report_abuse_tracker().get_stats(),
         "timestamp": datetime.now().isoformat()
     }
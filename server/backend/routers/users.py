@@ -18,6 +18,8 @@ from ..models import (
     UserProfileResponse, UserProfileUpdate
 )
 from ..dependencies import get_current_user, get_supabase_db
+from ..db_executor import db_execute
+from ..user_cache import get_user_cache
 
 logger = logging.getLogger(__name__)
 
@@ -107,7 +109,7 @@ async def update_current_user(
         update_data["updated_at"] = datetime.now().isoformat()
         
         # Supabase 업데이트
-        result = db.table("users").update(update_data).eq("uid", current_user.uid).execute()
+        result = await db_execute(db.table("users").update(update_data).eq("uid", current_user.uid))
         
         if not result.data:
             raise HTTPException(
@@ -116,6 +118,7 @@ async def update_current_user(
             )
         
         updated_data = result.data[0]
+        get_user_cache().invalidate(current_user.uid)
         
         updated_user = UserResponse(
             uid=current_user.uid,
@@ -164,7 +167,7 @@ async def get_user_profile(
         logger.info(f"👤 유저 프로필 조회: {user_id}")
         
         # Supabase에서 사용자 조회
-        result = db.table("users").select("*").eq("uid", user_id).execute()
+        result = await db_execute(db.table("users").select("*").eq("uid", user_id))
         
         if not result.data or len(result.data) == 0:
             logger.warning(f"⚠️ 사용자 미발견: {user_id}")
@@ -263,7 +266,7 @@ async def update_my_profile(
         update_data["updated_at"] = datetime.now().isoformat()
         
         # Supabase 업데이트
-        result = db.table("users").update(update_data).eq("uid", current_user.uid).execute()
+        result = await db_execute(db.table("users").update(update_data).eq("uid", current_user.uid))
         
         if not result.data:
             raise HTTPException(
@@ -272,6 +275,7 @@ async def update_my_profile(
             )
         
         user_data = result.data[0]
+        get_user_cache().invalidate(current_user.uid)
         
         # 프로필 응답 생성
         profile = UserProfileResponse(
@@ -317,5 +321,6 @@ async def users_health():
         "status": "healthy",
         "service": "users",
         "database": "supabase",
+        "user_cache": get_user_cache().get_stats(),
         "timestamp": datetime.now().isoformat()
     }
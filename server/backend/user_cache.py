@@ -0,0 +1,211 @@
+"""
+인증 사용자 캐시 (get_current_user의 users 조회 생략)
+
+기존: 인증이 필요한 요청마다 JWT 검증 후 users 테이블 select("*") 한 번 (글/댓글/좋아요/신고 모두)
+→ uid별 UserResponse를 TTL 동안 메모리에 보관
+
+- 로그인/회원가입 시 미리 채움 (직후 요청부터 DB 조회 없음)
+- 사용자 정보 수정(update_current_user / update_my_profile / auth.update_user) 시 무효화
+- 같은 uid 동시 미스는 DB 조회 하나로 합침 (SingleFlight, 무효화 이후 요청은 새 조회)
+- 조회 도중 무효화되면 조회 결과를 캐시에 넣지 않음 (수정 전 값이 다시 들어가는 것 방지)
+- 선택: 워커/인스턴스 간 공유 저장소 (SharedUserStore 프로토콜, configure_user_cache로 연결)
+
+⚠️ 공유 저장소 없이 워커를 여러 개 띄우면 다른 워커의 캐시는 TTL(기본 60초) 동안 이전 값일 수 있음
+   (UserResponse는 username/email 정도라 허용, 권한/정지 여부는 이 캐시로 판단하지 않음)
+
+Example:
+    >>> user = await get_user_cache().get_or_load(uid, load_user)
+    >>> get_user_cache().invalidate(uid)  # 프로필 수정 후
+"""
+import logging
+import os
+import threading
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Protocol
+
+from llm_service.utils.single_flight import SingleFlight
+from llm_service.utils.ttl_cache import TTLCache
+
+from .models import UserResponse
+
+logger = logging.getLogger(__name__)
+
+USER_CACHE_SIZE = int(os.getenv("USER_CACHE_SIZE", "10000"))
+USER_CACHE_TTL_SECONDS = float(os.getenv("USER_CACHE_TTL_SECONDS", "60"))
+
+
+class SharedUserStore(Protocol):
+    """워커 간 공유 저장소 인터페이스 (Redis 등, 동기 함수)"""
+
+    def get(self, uid: str) -> Optional[dict]:
+        """UserResponse JSON dict 또는 None"""
+
+    def set(self, uid: str, value: dict, ttl_seconds: float) -> None:
+        """값 저장 (ttl_seconds 후 만료)"""
+
+    def delete(self, uid: str) -> None:
+        """값 삭제"""
+
+
+class UserCache:
+    """
+    uid → UserResponse 캐시
+
+    Args:
+        maxsize: 메모리 캐시 최대 사용자 수
+        ttl_seconds: 한 번 조회한 사용자 정보를 재사용하는 시간
+        shared: 공유 저장소 (None이면 프로세스 메모리만)
+    """
+
+    def __init__(
+        self,
+        maxsize: int = USER_CACHE_SIZE,
+        ttl_seconds: float = USER_CACHE_TTL_SECONDS,
+        shared: Optional[SharedUserStore] = None,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.shared = shared
+        self.local = TTLCache(maxsize=maxsize, ttl_seconds=ttl_seconds)
+        self.flights = SingleFlight()
+        self._lock = threading.Lock()
+        # 조회 중인 uid만: [진행 중 조회 수, 조회 도중 무효화 횟수]
+        # (조회가 모두 끝나면 삭제 → 크기는 동시 조회 수 이하)
+        self._loading: Dict[str, List[int]] = {}
+        self.db_loads = 0
+        self.shared_hits = 0
+        self.invalidations = 0
+        self.shared_errors = 0
+
+    def _begin_load(self, uid: str) -> int:
+        """조회 시작 (반환값: 지금까지의 무효화 횟수)"""
+        with self._lock:
+            entry = self._loading.setdefault(uid, [0, 0])
+            entry[0] += 1
+            return entry[1]
+
+    def _generation(self, uid: str) -> int:
+        """진행 중인 조회가 시작된 뒤의 무효화 횟수 (조회 중이 아니면 0)"""
+        with self._lock:
+            entry = self._loading.get(uid)
+            return entry[1] if entry is not None else 0
+
+    def _end_load(self, uid: str, generation: int) -> bool:
+        """조회 종료 (조회 도중 무효화가 없었으면 True)"""
+        with self._lock:
+            entry = self._loading[uid]
+            entry[0] -= 1
+            if entry[0] == 0:
+                del self._loading[uid]
+            return entry[1] == generation
+
+    def _get_shared(self, uid: str) -> Optional[UserResponse]:
+        if self.shared is None:
+            return None
+        try:
+            data = self.shared.get(uid)
+            return UserResponse(**data) if data else None
+        except Exception as e:
+            self.shared_errors += 1
+            logger.warning(f"⚠️ 사용자 공유 캐시 조회 실패 ({uid}): {e}")
+            return None
+
+    def _set_shared(self, user: UserResponse) -> None:
+        if self.shared is None:
+            return
+        try:
+            self.shared.set(user.uid, user.model_dump(mode="json"), self.ttl_seconds)
+        except Exception as e:
+            self.shared_errors += 1
+            logger.warning(f"⚠️ 사용자 공유 캐시 저장 실패 ({user.uid}): {e}")
+
+    def get(self, uid: str) -> Optional[UserResponse]:
+        """캐시 조회 (메모리 → 공유 저장소)"""
+        user = self.local.get(uid)
+        if user is not None:
+            return user
+        user = self._get_shared(uid)
+        if user is not None:
+            self.shared_hits += 1
+            self.local.set(uid, user)
+        return user
+
+    def put(self, user: UserResponse) -> None:
+        """사용자 정보 저장 (로그인/회원가입 직후)"""
+        self.local.set(user.uid, user)
+        self._set_shared(user)
+
+    def invalidate(self, uid: str) -> None:
+        """사용자 정보가 바뀌었을 때 호출 (다음 요청에서 DB 재조회)"""
+        with self._lock:
+            entry = self._loading.get(uid)
+            if entry is not None:
+                entry[1] += 1
+            self.invalidations += 1
+        self.local.delete(uid)
+        if self.shared is not None:
+            try:
+                self.shared.delete(uid)
+            except Exception as e:
+                self.shared_errors += 1
+                logger.warning(f"⚠️ 사용자 공유 캐시 삭제 실패 ({uid}): {e}")
+
+    async def get_or_load(self, uid: str, load: Callable[[], Awaitable[UserResponse]]) -> UserResponse:
+        """
+        캐시에 있으면 반환, 없으면 load()로 조회 후 저장
+
+        load()의 예외(사용자 없음 등)는 그대로 전달하고 캐시하지 않음
+        """
+        user = self.get(uid)
+        if user is not None:
+            return user
+
+        async def load_and_store() -> UserResponse:
+            generation = self._begin_load(uid)
+            try:
+                self.db_loads += 1
+                loaded = await load()
+            finally:
+                unchanged = self._end_load(uid, generation)
+            if unchanged:
+                self.put(loaded)
+            return loaded
+
+        # 무효화 이후 요청은 그 전에 시작한 조회(수정 전 값)에 합치지 않음
+        user, _ = await self.flights.do(("user", uid, self._generation(uid)), load_and_store)
+        return user
+
+    def clear(self) -> None:
+        self.local.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **self.local.get_stats(),
+            "ttl_seconds": self.ttl_seconds,
+            "db_loads": self.db_loads,
+            "coalesced": self.flights.shared,
+            "shared_backend": type(self.shared).__name__ if self.shared is not None else None,
+            "shared_hits": self.shared_hits,
+            "shared_errors": self.shared_errors,
+            "invalidations": self.invalidations,
+        }
+
+
+# ============================================
+# 싱글톤
+# ============================================
+_user_cache: Optional[UserCache] = None
+
+
+def get_user_cache() -> UserCache:
+    """공용 사용자 캐시 (처음 호출 시 생성)"""
+    global _user_cache
+    if _user_cache is None:
+        _user_cache = UserCache()
+    return _user_cache
+
+
+def configure_user_cache(shared: Optional[SharedUserStore] = None, **kwargs) -> UserCache:
+    """공유 저장소/크기/TTL을 지정해서 공용 캐시 교체 (앱 시작 시 한 번)"""
+    global _user_cache
+    _user_cache = UserCache(shared=shared, **kwargs)
+    logger.info(f"✅ 사용자 캐시 설정 (공유 저장소: {type(shared).__name__ if shared else '없음'})")
+    return _user_cache
@@ -0,0 +1,113 @@
+"""
+Agent 생성 비용 마이크로 벤치마크
+
+개인화 요청(user_id 포함) 1,000건 기준 요청당 오버헤드 비교
+- before: 요청마다 Tool 리스트 재구성 + initialize_agent() 호출 (기존 방식)
+- after : AgentFactory 캐시 + ContextVar로 user_id 바인딩
+
+LLM 호출은 포함하지 않음 (Agent 준비 비용만 측정)
+
+📖 실행 방법:
+    cd server
+    python benchmarks/bench_agent_factory.py --calls 1000
+"""
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault("OPENAI_API_KEY", "sk-bench")
+
+from langchain.agents import initialize_agent, AgentType
+from langchain.tools import Tool
+from langchain_openai import ChatOpenAI
+
+from llm_service.tools import (
+    RAGSearchTool,
+    MatchAnalysisTool,
+    PlayerCompareTool,
+    PostsSearchTool,
+    PersonalizedFanPreferenceTool,
+    CalendarTool,
+    PersonalizedCalendarTool,
+    YouTubeHighlightTool,
+    WeatherTool,
+    bind_user_id,
+    create_fan_preference_tool,
+)
+from llm_service.tools.calendar_tool import calendar_query
+from llm_service.utils.agent_factory import AgentFactory
+
+base_tools = [
+    RAGSearchTool,
+    MatchAnalysisTool,
+    PlayerCompareTool,
+    PostsSearchTool,
+    CalendarTool,
+    YouTubeHighlightTool,
+    WeatherTool,
+]
+llm = ChatOpenAI(model="gpt-4o-mini", temperature=0.7)
+
+
+def before(user_id: str):
+    """기존 방식: 요청마다 Tool/Agent 재생성"""
+    tools = base_tools.copy()
+    tools.append(create_fan_preference_tool(user_id=user_id))
+    calendar_tool_with_user = Tool(
+        name="calendar",
+        description="경기 일정을 조회하는 도구입니다...",
+        func=lambda query: calendar_query(query.strip(), user_id=user_id),
+    )
+    tools = [t for t in tools if t.name != "calendar"]
+    tools.append(calendar_tool_with_user)
+    return initialize_agent(
+        tools=tools,
+        llm=llm,
+        agent=AgentType.ZERO_SHOT_REACT_DESCRIPTION,
+        verbose=True,
+        handle_parsing_errors=True,
+        max_iterations=10,
+        max_execution_time=60,
+    )
+
+
+factory = AgentFactory(
+    base_tools=base_tools,
+    personalized_tools=[PersonalizedFanPreferenceTool, PersonalizedCalendarTool],
+    llm=llm,
+)
+
+
+def after(user_id: str):
+    """팩토리 방식: 캐시된 Agent + 실행 시점 user_id 바인딩"""
+    agent = factory.get_agent(personalized=True)
+    with bind_user_id(user_id):
+        return agent
+
+
+def run(label: str, fn, calls: int) -> float:
+    start = time.perf_counter()
+    for i in range(calls):
+        fn(f"user_{i % 50}")
+    elapsed = time.perf_counter() - start
+    print(f"{label:<8} total {elapsed * 1000:9.1f} ms   per call {elapsed / calls * 1e6:9.1f} µs")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Agent 생성 비용 벤치마크")
+    parser.add_argument("--calls", type=int, default=1000, help="개인화 요청 수")
+    args = parser.parse_args()
+
+    print(f"🔧 개인화 요청 {args.calls}건")
+    t_before = run("before", before, args.calls)
+    t_after = run("after", after, args.calls)
+    print(f"⚡ {t_before / max(t_after, 1e-9):.0f}x 빠름 (Agent 생성 {factory.build_count}회)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,185 @@
+"""
+비동기 LLM 클라이언트 벤치마크
+
+가짜 OpenAI 서버(응답 지연 시뮬레이션)를 로컬에 띄우고,
+/api/llm/chat 동시 요청 N개를 보내는 동안 /health 응답 지연을 측정한다.
+
+- blocking: 기존 방식 (async 핸들러 안에서 동기 OpenAI 클라이언트 호출)
+- async   : OpenAIService.chat() (AsyncOpenAI + 공용 커넥션 풀 + 동시성 제한)
+
+📖 실행 방법:
+    cd server
+    python benchmarks/bench_async_llm_client.py --requests 50 --delay 0.5
+
+기대 결과: async 모드에서 /health p95 지연이 수 ms 수준으로 평탄하게 유지됨
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import threading
+import time
+from pathlib import Path
+
+import httpx
+import uvicorn
+from fastapi import FastAPI
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+FAKE_OPENAI_PORT = 18901
+APP_PORT = 18902
+
+
+# ============================================
+# 가짜 OpenAI 서버
+# ============================================
+
+def build_fake_openai_app(delay: float) -> FastAPI:
+    fake = FastAPI()
+
+    @fake.post("/v1/chat/completions")
+    async def chat_completions(body: dict):
+        await asyncio.sleep(delay)
+        return {
+            "id": "chatcmpl-bench",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": body.get("model", "gpt-4o-mini"),
+            "choices": [
+                {
+                    "index": 0,
+                    "message": {"role": "assistant", "content": "벤치마크 응답입니다."},
+                    "finish_reason": "stop",
+                }
+            ],
+            "usage": {"prompt_tokens": 10, "completion_tokens": 10, "total_tokens": 20},
+        }
+
+    @fake.post("/v1/embeddings")
+    async def embeddings(body: dict):
+        await asyncio.sleep(delay / 5)
+        inputs = body.get("input") or []
+        if isinstance(inputs, str):
+            inputs = [inputs]
+        return {
+            "object": "list",
+            "data": [
+                {"object": "embedding", "index": i, "embedding": [0.0] * 8}
+                for i in range(len(inputs))
+            ],
+            "model": body.get("model", "text-embedding-3-small"),
+            "usage": {"prompt_tokens": 1, "total_tokens": 1},
+        }
+
+    return fake
+
+
+# ============================================
+# 측정 대상 앱 (/health + /api/llm/chat)
+# ============================================
+
+def build_bench_app(mode: str) -> FastAPI:
+    from llm_service.services.openai_service import get_openai_service
+
+    service = get_openai_service()
+    app = FastAPI()
+
+    @app.get("/health")
+    async def health():
+        return {"status": "healthy"}
+
+    @app.post("/api/llm/chat")
+    async def chat(body: dict):
+        messages = [{"role": "user", "content": body.get("message", "")}]
+        if mode == "blocking":
+            # 기존 방식: 동기 클라이언트가 이벤트 루프를 점유
+            response = service.client.chat.completions.create(
+                model=service.chat_model, messages=messages
+            )
+            answer = response.choices[0].message.content
+        else:
+            answer = await service.chat(messages=messages)
+        return {"response": answer}
+
+    return app
+
+
+def start_server(app: FastAPI, port: int) -> uvicorn.Server:
+    config = uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning")
+    server = uvicorn.Server(config)
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    while not server.started:
+        time.sleep(0.05)
+    return server
+
+
+# ============================================
+# 부하 생성 + /health 지연 측정
+# ============================================
+
+async def measure(base_url: str, n_requests: int, probe_interval: float) -> dict:
+    async with httpx.AsyncClient(base_url=base_url, timeout=120) as client:
+        done = asyncio.Event()
+        health_latencies = []
+
+        async def probe():
+            while not done.is_set():
+                start = time.perf_counter()
+                await client.get("/health")
+                health_latencies.append((time.perf_counter() - start) * 1000)
+                await asyncio.sleep(probe_interval)
+
+        async def one_chat(i: int):
+            r = await client.post("/api/llm/chat", json={"message": f"질문 {i}"})
+            r.raise_for_status()
+
+        probe_task = asyncio.create_task(probe())
+        start = time.perf_counter()
+        await asyncio.gather(*(one_chat(i) for i in range(n_requests)))
+        elapsed = time.perf_counter() - start
+        done.set()
+        await probe_task
+
+    health_latencies.sort()
+    return {
+        "chat_total_s": elapsed,
+        "health_samples": len(health_latencies),
+        "health_p50_ms": statistics.median(health_latencies),
+        "health_p95_ms": health_latencies[int(len(health_latencies) * 0.95) - 1]
+        if len(health_latencies) >= 20
+        else health_latencies[-1],
+        "health_max_ms": health_latencies[-1],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="비동기 LLM 클라이언트 벤치마크")
+    parser.add_argument("--requests", type=int, default=50, help="동시 chat 요청 수")
+    parser.add_argument("--delay", type=float, default=0.5, help="가짜 LLM 응답 지연 (초)")
+    parser.add_argument("--probe-interval", type=float, default=0.05, help="/health 측정 간격 (초)")
+    args = parser.parse_args()
+
+    os.environ["OPENAI_API_KEY"] = "sk-bench"
+    os.environ["OPENAI_BASE_URL"] = f"http://127.0.0.1:{FAKE_OPENAI_PORT}/v1"
+
+    start_server(build_fake_openai_app(args.delay), FAKE_OPENAI_PORT)
+
+    print(f"🔧 동시 요청 {args.requests}개, LLM 지연 {args.delay}s")
+    print(f"{'mode':<10}{'chat total(s)':>15}{'health n':>10}{'p50(ms)':>10}{'p95(ms)':>10}{'max(ms)':>10}")
+    for port_offset, mode in enumerate(["blocking", "async"]):
+        port = APP_PORT + port_offset
+        server = start_server(build_bench_app(mode), port)
+        result = asyncio.run(measure(f"http://127.0.0.1:{port}", args.requests, args.probe_interval))
+        server.should_exit = True
+        print(
+            f"{mode:<10}{result['chat_total_s']:>15.2f}{result['health_samples']:>10}"
+            f"{result['health_p50_ms']:>10.1f}{result['health_p95_ms']:>10.1f}{result['health_max_ms']:>10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+콜드 스타트 벤치마크 (time-to-first-200)
+
+uvicorn 프로세스를 새로 띄우고 /health가 처음 200을 반환할 때까지 걸린 시간을 N회 측정한다.
+Cloud Run처럼 인스턴스가 새로 뜰 때 첫 요청을 받기까지의 시간에 해당한다.
+
+📖 실행 방법:
+    cd server
+    python benchmarks/bench_cold_start.py --runs 5
+    WARMUP_ON_STARTUP=true python benchmarks/bench_cold_start.py --runs 5
+
+기대 결과: 서비스 생성이 첫 요청/백그라운드 워밍업으로 미뤄져
+WARMUP_ON_STARTUP 여부와 관계없이 /health 첫 200 시간이 import 시간 수준으로 유지됨
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import httpx
+
+SERVER_DIR = Path(__file__).resolve().parent.parent
+APP_PORT = 18910
+
+
+def measure_once(port: int, timeout: float) -> float:
+    """서버 프로세스 시작 → /health 첫 200까지 걸린 시간 (초)"""
+    env = dict(os.environ)
+    env.setdefault("OPENAI_API_KEY", "sk-bench")
+
+    started = time.perf_counter()
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--port", str(port), "--log-level", "warning"],
+        cwd=SERVER_DIR,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    url = f"http://127.0.0.1:{port}/health"
+    # 로컬 서버 폴링이므로 프록시 환경변수는 무시
+    client = httpx.Client(timeout=1.0, trust_env=False)
+    try:
+        while time.perf_counter() - started < timeout:
+            if proc.poll() is not None:
+                raise RuntimeError(f"서버 프로세스 종료 (exit {proc.returncode})")
+            try:
+                if client.get(url).status_code == 200:
+                    return time.perf_counter() - started
+            except httpx.HTTPError:
+                pass
+            time.sleep(0.02)
+        raise TimeoutError(f"{timeout}s 안에 /health 200 응답 없음")
+    finally:
+        client.close()
+        proc.terminate()
+        try:
+            proc.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="콜드 스타트 벤치마크")
+    parser.add_argument("--runs", type=int, default=5, help="측정 횟수")
+    parser.add_argument("--port", type=int, default=APP_PORT)
+    parser.add_argument("--timeout", type=float, default=60.0, help="1회 최대 대기 시간 (초)")
+    args = parser.parse_args()
+
+    print(f"🚀 콜드 스타트 측정 {args.runs}회 (WARMUP_ON_STARTUP={os.getenv('WARMUP_ON_STARTUP', 'false')})")
+    samples = []
+    for i in range(args.runs):
+        elapsed = measure_once(args.port, args.timeout)
+        samples.append(elapsed)
+        print(f"  #{i + 1}: {elapsed * 1000:.0f} ms")
+
+    print(
+        f"\n📊 time-to-first-200: "
+        f"min {min(samples) * 1000:.0f} ms / "
+        f"median {statistics.median(samples) * 1000:.0f} ms / "
+        f"max {max(samples) * 1000:.0f} ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
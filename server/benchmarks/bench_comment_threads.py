@@ -0,0 +1,139 @@
+"""
+댓글 조회 벤치마크 (전체 댓글 한 번에 vs 스레드형 첫 페이지)
+
+댓글 N개인 경기 스레드 게시글 (최상위 댓글 30%, 나머지는 답글)을 posts 라우터로 조회
+- before: GET /{post_id}/comments (삭제되지 않은 댓글 전체)
+- after : GET /{post_id}/comments/threads?limit=20&replies=3 (RPC 한 번, 첫 페이지는 캐시)
+
+가짜 DB는 호출마다 --latency-ms 대기 + 응답 행을 JSON으로 직렬화/역직렬화 (PostgREST 전송 대역)
+응답 크기와 지연 중앙값을 출력
+
+📖 실행 방법:
+    cd server
+    python benchmarks/bench_comment_threads.py --comments 500 5000 --requests 30 --latency-ms 5
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import random
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import httpx
+from fastapi import FastAPI
+
+from backend import comment_threads, db_executor
+from backend.dependencies import get_supabase_db
+from backend.routers import posts as posts_router
+
+
+def make_comments(n, seed=0):
+    rng = random.Random(seed)
+    start = datetime(2025, 1, 1, 10, 0)
+    comments, top_ids = [], []
+    for i in range(n):
+        parent = rng.choice(top_ids) if top_ids and rng.random() > 0.3 else None
+        comment_id = f"c{i:06d}"
+        if parent is None:
+            top_ids.append(comment_id)
+        comments.append({
+            "comment_id": comment_id, "post_id": "hot", "author_id": f"user-{rng.randint(0, 999)}",
+            "author_username": "tester", "content": "골 장면 다시 봐도 소름이네요 " * rng.randint(1, 6),
+            "likes": rng.randint(0, 50), "parent_comment_id": parent, "is_deleted": False,
+            "created_at": (start + timedelta(seconds=i)).isoformat(), "updated_at": None,
+        })
+    return comments
+
+
+class FakeSupabase:
+    """comments 테이블 + comment_threads RPC 대역 (호출마다 지연 + JSON 전송)"""
+
+    def __init__(self, comments, latency):
+        self.comments = comments
+        self.latency = latency
+        self.calls = 0
+
+    def _respond(self, rows):
+        self.calls += 1
+        time.sleep(self.latency)
+        return SimpleNamespace(data=json.loads(json.dumps(rows)), count=None)
+
+    def table(self, name):
+        db = self
+
+        class _Query:
+            def __getattr__(self, attr):
+                return lambda *args, **kwargs: self
+
+            def execute(self):
+                return db._respond(db.comments)
+
+        return _Query()
+
+    def rpc(self, name, params):
+        db = self
+
+        def execute():
+            top = [c for c in db.comments if c["parent_comment_id"] is None][:params["p_limit"] + 1]
+            by_parent = {}
+            for c in db.comments:
+                if c["parent_comment_id"]:
+                    by_parent.setdefault(c["parent_comment_id"], []).append(c)
+            rows = [{**c, "reply_count": len(by_parent.get(c["comment_id"], []))} for c in top]
+            for c in top:
+                rows += by_parent.get(c["comment_id"], [])[:params["p_replies"]]
+            return db._respond(rows)
+
+        return SimpleNamespace(execute=execute)
+
+
+async def run(n, args):
+    db = FakeSupabase(make_comments(n), args.latency_ms / 1000)
+    comment_threads._comment_thread_loader = comment_threads.CommentThreadLoader()
+    app = FastAPI()
+    app.include_router(posts_router.router, prefix="/api/posts")
+    app.dependency_overrides[get_supabase_db] = lambda: db
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as client:
+        for name, url in (
+            ("before", "/api/posts/hot/comments"),
+            ("after", "/api/posts/hot/comments/threads?limit=20&replies=3"),
+        ):
+            db.calls = 0
+            latencies, size = [], 0
+            for _ in range(args.requests):
+                started = time.perf_counter()
+                response = await client.get(url)
+                latencies.append((time.perf_counter() - started) * 1000)
+                assert response.status_code == 200, response.text
+                size = len(response.content)
+            print(
+                f"댓글 {n:6d}개  {name:6s} 응답 {size / 1024:8.1f} KB   "
+                f"지연 중앙값 {statistics.median(latencies):7.2f} ms   DB 호출 {db.calls}회/{args.requests}요청"
+            )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="댓글 조회 벤치마크")
+    parser.add_argument("--comments", type=int, nargs="+", default=[500, 5000], help="게시글의 댓글 수")
+    parser.add_argument("--requests", type=int, default=30, help="조회 횟수")
+    parser.add_argument("--latency-ms", type=float, default=5.0, help="DB 호출 1회 지연")
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    print(f"🔧 같은 게시글 댓글 {args.requests}회 조회, DB 지연 {args.latency_ms}ms")
+    for n in args.comments:
+        asyncio.run(run(n, args))
+    db_executor.close_db_executor()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+"""
+콘텐츠 필터 벤치마크 (ContentSafetyService.check_input / filter_text)
+
+게시글 길이(200~800자)의 합성 코퍼스 N건으로 비교 (LLM 검사 제외, 규칙만)
+- before: 패턴마다 re.findall / re.sub, 블랙리스트 단어마다 `in` 검사 (기존 방식)
+- after : 초기화 시 컴파일한 alternation 한 번 스캔 + Aho-Corasick 블랙리스트
+
+두 방식의 판정(안전 여부/카테고리)이 모든 글에서 같은지도 확인
+
+📖 실행 방법:
+    cd server
+    python benchmarks/bench_content_safety.py --posts 10000 --blacklist 500
+"""
+
+import argparse
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from llm_service.services.content_safety_service import ContentCategory, ContentSafetyService
+
+SENTENCES = [
+    "오늘 토트넘 경기 정말 재미있었습니다.",
+    "손흥민의 침투 타이밍이 이번 시즌 가장 좋았던 것 같아요.",
+    "아스널은 4-3-3 포메이션에서 측면 전환이 빨라졌네요.",
+    "후반전 교체 카드가 경기 흐름을 완전히 바꿨습니다.",
+    "Haaland scored again, his positioning in the box is unreal.",
+    "The pressing from the midfield was much better than last week.",
+    "다음 주 챔피언스리그 일정은 어떻게 되나요?",
+    "수비 라인이 너무 높아서 뒷공간을 자주 내줬어요.",
+    "이적시장 루머가 많은데 공식 발표를 기다려 봐야겠죠.",
+    "관중석 분위기가 최고였고 응원가도 끝까지 이어졌습니다.",
+]
+# 일부 글에만 섞는 문장 (차단 대상)
+BAD_SENTENCES = [
+    "시발 심판 판정 진짜 너무하네.",
+    "중고판매합니다 카톡 주세요 010-1234-5678",
+    "https://spam.example.com/promo 에서 확인하세요",
+    "이건 자살골이나 다름없었다.",
+]
+
+
+def build_corpus(posts: int, bad_ratio: float, seed: int = 42) -> list:
+    """게시글 길이(200~800자) 합성 코퍼스"""
+    rng = random.Random(seed)
+    corpus = []
+    for _ in range(posts):
+        target = rng.randint(200, 800)
+        parts = []
+        length = 0
+        while length < target:
+            sentence = rng.choice(SENTENCES)
+            parts.append(sentence)
+            length += len(sentence) + 1
+        if rng.random() < bad_ratio:
+            parts.insert(rng.randrange(len(parts)), rng.choice(BAD_SENTENCES))
+        corpus.append(" ".join(parts))
+    return corpus
+
+
+def build_blacklist(size: int, seed: int = 7) -> list:
+    """금지어 합성 목록 (코퍼스에 거의 등장하지 않는 단어)"""
+    rng = random.Random(seed)
+    syllables = "가나다라마바사아자차카타파하거너더러머버서어저처커터퍼허"
+    return ["".join(rng.choice(syllables) for _ in range(rng.randint(3, 5))) for _ in range(size)]
+
+
+# ==================== 기존 방식 ====================
+def before_check(service: ContentSafetyService, text: str):
+    text_lower = text.lower()
+    for word in service.custom_blacklist:
+        if word.lower() in text_lower:
+            return ContentCategory.HARMFUL
+    for category, patterns in service.harmful_patterns.items():
+        for pattern in patterns:
+            if re.findall(pattern, text_lower, re.IGNORECASE):
+                return category
+    for pattern in service.spam_patterns:
+        if re.findall(pattern, text_lower, re.IGNORECASE):
+            return ContentCategory.SPAM
+    return None
+
+
+def before_filter(service: ContentSafetyService, text: str, replacement: str = "***") -> str:
+    result = text
+    all_patterns = []
+    for patterns in service.harmful_patterns.values():
+        all_patterns.extend(patterns)
+    all_patterns.extend(service.spam_patterns)
+    for pattern in all_patterns:
+        if re.findall(pattern, result, re.IGNORECASE):
+            result = re.sub(pattern, replacement, result, flags=re.IGNORECASE)
+    for word in service.custom_blacklist:
+        if word.lower() in result.lower():
+            result = re.sub(re.escape(word), replacement, result, flags=re.IGNORECASE)
+    return result
+
+
+def timeit(fn, corpus) -> float:
+    """전체 코퍼스 처리 시간 (초)"""
+    start = time.perf_counter()
+    for text in corpus:
+        fn(text)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="콘텐츠 필터 벤치마크")
+    parser.add_argument("--posts", type=int, default=10000, help="게시글 수")
+    parser.add_argument("--bad-ratio", type=float, default=0.1, help="차단 대상 글 비율")
+    parser.add_argument("--blacklist", type=int, default=500, help="커스텀 블랙리스트 단어 수")
+    args = parser.parse_args()
+
+    corpus = build_corpus(args.posts, args.bad_ratio)
+    service = ContentSafetyService(use_llm=False)
+    service.custom_blacklist = build_blacklist(args.blacklist)
+    service._compile_rules()
+
+    avg_len = sum(len(t) for t in corpus) / len(corpus)
+    print(f"🔧 게시글 {len(corpus):,}건 (평균 {avg_len:.0f}자), 블랙리스트 {len(service.custom_blacklist)}개")
+
+    mismatches = sum(
+        1 for text in corpus
+        if before_check(service, text) != service.check_input(text, use_llm_fallback=False).category
+    )
+    blocked = sum(1 for text in corpus if not service.check_input(text, use_llm_fallback=False).is_safe)
+    print(f"🎯 차단 {blocked:,}건, 기존 방식과 판정 불일치 {mismatches}건")
+
+    cases = [
+        ("check_input", lambda t: before_check(service, t), lambda t: service.check_input(t, use_llm_fallback=False)),
+        ("filter_text", lambda t: before_filter(service, t), service.filter_text),
+    ]
+    for label, before, after in cases:
+        t_before = timeit(before, corpus)
+        t_after = timeit(after, corpus)
+        print(
+            f"{label:<12} before {t_before:7.2f} s ({t_before / len(corpus) * 1e6:7.1f} µs/건)   "
+            f"after {t_after:7.2f} s ({t_after / len(corpus) * 1e6:7.1f} µs/건)   "
+            f"⚡ {t_before / max(t_after, 1e-9):.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
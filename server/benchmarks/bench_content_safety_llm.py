@@ -0,0 +1,111 @@
+"""
+LLM 입력 검사 지연 벤치마크 (chat 핸들러 흐름 모사)
+
+요청 하나 = 입력 검사(LLM) → RAG 검색 → 답변 생성, 동시 요청 N개
+실제 ContentSafetyService에 지연만 흉내 내는 가짜 OpenAI 클라이언트를 붙여 비교
+- before    : 동기 check_input (LLM 호출 동안 이벤트 루프 정지 → 동시 요청이 줄 섬)
+- async     : begin_check 기본 모드 (루프는 안 막지만 검사 → RAG 순서)
+- optimistic: begin_check optimistic 모드 (검사와 RAG 동시 진행, 응답 직전 확인)
+- cached    : 같은 질문 재요청 (판정 캐시 히트 → LLM 검사 없음)
+
+📖 실행 방법:
+    cd server
+    python benchmarks/bench_content_safety_llm.py --requests 20 --moderation-ms 400 --rag-ms 300 --answer-ms 800
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import statistics
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from llm_service.services.content_safety_service import ContentSafetyService
+
+SAFE_REPLY = json.dumps({"is_safe": True, "category": "safe", "reason": "안전"})
+
+
+def _reply():
+    return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=SAFE_REPLY))])
+
+
+class SyncCompletions:
+    def __init__(self, delay: float):
+        self.delay = delay
+
+    def create(self, **kwargs):
+        time.sleep(self.delay)
+        return _reply()
+
+
+class AsyncCompletions:
+    def __init__(self, delay: float):
+        self.delay = delay
+
+    async def create(self, **kwargs):
+        await asyncio.sleep(self.delay)
+        return _reply()
+
+
+def build_service(moderation: float, optimistic: bool) -> ContentSafetyService:
+    service = ContentSafetyService(use_llm=False, optimistic=optimistic)
+    service.use_llm = True
+    service.llm_client = SimpleNamespace(chat=SimpleNamespace(completions=SyncCompletions(moderation)))
+    service.async_llm_client = SimpleNamespace(chat=SimpleNamespace(completions=AsyncCompletions(moderation)))
+    return service
+
+
+async def handle(service: ContentSafetyService, query: str, mode: str, rag: float, answer: float) -> float:
+    """chat 핸들러 한 건 (요청 지연 반환)"""
+    start = time.perf_counter()
+    if mode == "before":
+        assert service.check_input(query).is_safe
+        await asyncio.sleep(rag)
+        await asyncio.sleep(answer)
+    else:
+        check = await service.begin_check(query)
+        assert check.current.is_safe
+        await asyncio.sleep(rag)
+        await asyncio.sleep(answer)
+        assert (await check.result()).is_safe
+    return time.perf_counter() - start
+
+
+async def run_mode(mode: str, args) -> list:
+    service = build_service(args.moderation_ms / 1000, optimistic=(mode == "optimistic"))
+    queries = [f"손흥민 최근 폼은? #{i}" for i in range(args.requests)]
+    if mode == "cached":
+        await asyncio.gather(*(service.check_input_async(q) for q in queries))
+    return await asyncio.gather(*(
+        handle(service, q, mode, args.rag_ms / 1000, args.answer_ms / 1000) for q in queries
+    ))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="LLM 입력 검사 지연 벤치마크")
+    parser.add_argument("--requests", type=int, default=20, help="동시 요청 수")
+    parser.add_argument("--moderation-ms", type=float, default=400, help="LLM 입력 검사 지연")
+    parser.add_argument("--rag-ms", type=float, default=300, help="RAG 검색 지연")
+    parser.add_argument("--answer-ms", type=float, default=800, help="답변 생성 지연")
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    print(
+        f"🔧 동시 요청 {args.requests}건, 검사 {args.moderation_ms:.0f} ms / "
+        f"RAG {args.rag_ms:.0f} ms / 답변 {args.answer_ms:.0f} ms"
+    )
+    for mode in ("before", "async", "optimistic", "cached"):
+        latencies = asyncio.run(run_mode(mode, args))
+        print(
+            f"{mode:<11} p50 {statistics.median(latencies) * 1000:8.0f} ms   "
+            f"max {max(latencies) * 1000:8.0f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+"""
+조회수 카운터 쓰기 벤치마크 (read-modify-write vs write-behind 버퍼)
+
+인기 게시글 몇 개에 조회가 몰리는 상황 (Zipf 분포)을 동시 요청 C개로 재현
+- before: 조회마다 select → update({"views": 읽은 값 + 1}) (DB 왕복 2번, 동시 요청끼리 증가분 유실)
+- after : CounterBuffer.increment (메모리) + 주기마다 increment_counters RPC 한 번
+
+가짜 DB는 호출마다 --latency-ms 만큼 대기 (Supabase 왕복 대역)하고 쓰기 호출 수를 셈
+최종 조회수가 실제 조회 수와 같은지(유실 여부)도 확인
+
+📖 실행 방법:
+    cd server
+    python benchmarks/bench_counter_buffer.py --views 20000 --concurrency 50 --interval 1
+"""
+
+import argparse
+import asyncio
+import logging
+import random
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from backend.counter_buffer import CounterBuffer
+
+
+class FakeSupabase:
+    """posts.views만 있는 가짜 DB (호출마다 지연, 쓰기 호출 수 집계)"""
+
+    def __init__(self, post_ids, latency):
+        self.views = {post_id: 0 for post_id in post_ids}
+        self.latency = latency
+        self.writes = 0
+        self.write_times = []
+
+    def read(self, post_id):
+        time.sleep(self.latency)
+        return self.views[post_id]
+
+    def write(self, post_id, value):
+        time.sleep(self.latency)
+        self.views[post_id] = value
+        self._count_write()
+
+    def rpc(self, name, params):
+        db = self
+
+        def execute():
+            time.sleep(db.latency)
+            for update in params["updates"]:
+                db.views[update["id"]] += update["deltas"]["views"]
+            db._count_write()
+            return SimpleNamespace(data=None)
+
+        return SimpleNamespace(execute=execute)
+
+    def _count_write(self):
+        self.writes += 1
+        self.write_times.append(time.perf_counter())
+
+
+def zipf_views(posts: int, views: int, seed: int = 42) -> list:
+    rng = random.Random(seed)
+    weights = [1 / (rank + 1) for rank in range(posts)]
+    return rng.choices([f"post-{i}" for i in range(posts)], weights=weights, k=views)
+
+
+async def run_viewers(stream, concurrency, view):
+    queue = asyncio.Queue()
+    for post_id in stream:
+        queue.put_nowait(post_id)
+
+    async def worker():
+        while not queue.empty():
+            await view(queue.get_nowait())
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+
+
+async def before(stream, db, concurrency):
+    async def view(post_id):
+        current = await asyncio.to_thread(db.read, post_id)
+        await asyncio.to_thread(db.write, post_id, current + 1)
+
+    await run_viewers(stream, concurrency, view)
+
+
+async def after(stream, db, concurrency, interval):
+    buffer = CounterBuffer(db_getter=lambda: db, interval_seconds=interval, max_pending=10 ** 9)
+    buffer.start()
+
+    async def view(post_id):
+        await asyncio.to_thread(db.read, post_id)  # 게시글 select는 그대로
+        buffer.increment("posts", post_id, "views")
+
+    await run_viewers(stream, concurrency, view)
+    await buffer.stop()
+    return buffer
+
+
+def report(label, db, stream, elapsed):
+    expected = Counter(stream)
+    lost = sum(expected[p] - db.views[p] for p in expected)
+    print(
+        f"{label:7s} {elapsed:6.2f}s  조회 {len(stream) / elapsed:8.0f}/s  "
+        f"DB 쓰기 {db.writes:6,}회 ({db.writes / elapsed:7.1f}/s)  유실 {lost:,}회"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="조회수 카운터 쓰기 벤치마크")
+    parser.add_argument("--posts", type=int, default=200, help="게시글 수")
+    parser.add_argument("--views", type=int, default=20000, help="조회 수")
+    parser.add_argument("--concurrency", type=int, default=50, help="동시 요청 수")
+    parser.add_argument("--latency-ms", type=float, default=2.0, help="DB 호출 1회 지연")
+    parser.add_argument("--interval", type=float, default=1.0, help="버퍼 반영 주기 (초)")
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    stream = zipf_views(args.posts, args.views)
+    top = Counter(stream).most_common(1)[0]
+    print(
+        f"🔧 게시글 {args.posts}개, 조회 {len(stream):,}회 (최다 {top[0]} {top[1]:,}회), "
+        f"동시 {args.concurrency}, DB 지연 {args.latency_ms}ms, 반영 주기 {args.interval}s"
+    )
+    latency = args.latency_ms / 1000
+    post_ids = [f"post-{i}" for i in range(args.posts)]
+
+    db = FakeSupabase(post_ids, latency)
+    start = time.perf_counter()
+    asyncio.run(before(stream, db, args.concurrency))
+    report("before", db, stream, time.perf_counter() - start)
+
+    db = FakeSupabase(post_ids, latency)
+    start = time.perf_counter()
+    buffer = asyncio.run(after(stream, db, args.concurrency, args.interval))
+    report("after", db, stream, time.perf_counter() - start)
+    stats = buffer.get_stats()
+    print(f"⚡ 반영 {stats['flushes']}회, RPC {stats['rpc_calls']}회, 행 {stats['flushed_rows']:,}개 (주기당 1회)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""
+Supabase 호출 실행 방식 벤치마크 (inline vs 스레드 풀) - GET /api/posts p95
+
+posts 라우터만 올린 FastAPI 앱에 동시 요청 C개를 계속 보냄 (httpx ASGITransport, 같은 이벤트 루프)
+가짜 Supabase Client는 execute()마다 --latency-ms 만큼 블로킹 (PostgREST 왕복 대역)
+
+- inline: 기존처럼 라우터 안에서 바로 execute() → 쿼리 하나가 루프 전체를 막음 (사실상 순차 처리)
+- thread: db_execute로 전용 스레드 풀에서 실행 → 풀 크기만큼 동시에 대기
+
+실제 서버 비교는 locustfile의 DBReadUser (SUPABASE_EXECUTION=inline/thread로 서버를 띄워서 두 번 실행)
+
+📖 실행 방법:
+    cd server
+    python benchmarks/bench_db_executor.py --requests 400 --concurrency 50 --latency-ms 20
+"""
+
+import argparse
+import asyncio
+import logging
+import statistics
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import httpx
+from fastapi import FastAPI
+
+from backend import db_executor
+from backend.dependencies import get_supabase_db
+from backend.routers import posts as posts_router
+
+ROWS = [
+    {
+        "post_id": f"post-{i}", "author_id": "u1", "author_username": "tester", "title": f"제목 {i}",
+        "content": "본문", "category": "general", "views": 0, "likes": 0, "comment_count": 0,
+        "created_at": "2025-01-01T10:00:00+00:00", "updated_at": None,
+    }
+    for i in range(20)
+]
+
+
+class SlowQuery:
+    """PostgREST 빌더 대역 (체인 메서드는 자기 자신, execute는 블로킹 지연)"""
+
+    def __init__(self, latency):
+        self.latency = latency
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: self
+
+    def execute(self):
+        time.sleep(self.latency)
+        return SimpleNamespace(data=ROWS, count=len(ROWS))
+
+
+class SlowSupabase:
+    def __init__(self, latency):
+        self.latency = latency
+
+    def table(self, name):
+        return SlowQuery(self.latency)
+
+
+async def run_load(mode, args):
+    db_executor._db_executor = db_executor.DBExecutor(max_workers=args.workers, mode=mode)
+    app = FastAPI()
+    app.include_router(posts_router.router, prefix="/api/posts")
+    app.dependency_overrides[get_supabase_db] = lambda: SlowSupabase(args.latency_ms / 1000)
+
+    latencies = []
+    remaining = args.requests
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as client:
+        async def user():
+            nonlocal remaining
+            while remaining > 0:
+                remaining -= 1
+                started = time.perf_counter()
+                response = await client.get("/api/posts?page=1&page_size=20")
+                latencies.append((time.perf_counter() - started) * 1000)
+                assert response.status_code == 200, response.text
+
+        started = time.perf_counter()
+        await asyncio.gather(*(user() for _ in range(args.concurrency)))
+        elapsed = time.perf_counter() - started
+
+    stats = db_executor.get_db_executor().get_stats()
+    db_executor.close_db_executor()
+    latencies.sort()
+    p95 = latencies[int(len(latencies) * 0.95) - 1]
+    print(
+        f"{mode:7s} {len(latencies) / elapsed:7.1f} req/s   p50 {statistics.median(latencies):7.1f} ms   "
+        f"p95 {p95:7.1f} ms   풀 대기 p95 {stats['wait_ms_p95'] or 0:6.1f} ms   포화 {stats['saturation_rate']:.0%}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Supabase 호출 실행 방식 벤치마크")
+    parser.add_argument("--requests", type=int, default=400, help="총 요청 수")
+    parser.add_argument("--concurrency", type=int, default=50, help="동시 사용자 수")
+    parser.add_argument("--latency-ms", type=float, default=20.0, help="DB 호출 1회 지연")
+    parser.add_argument("--workers", type=int, default=db_executor.SUPABASE_MAX_WORKERS, help="스레드 풀 크기")
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    print(
+        f"🔧 GET /api/posts {args.requests}회, 동시 {args.concurrency}, "
+        f"DB 지연 {args.latency_ms}ms, 풀 {args.workers}"
+    )
+    for mode in ("inline", "thread"):
+        asyncio.run(run_load(mode, args))
+
+
+if __name__ == "__main__":
+    main()
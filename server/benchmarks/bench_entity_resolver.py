@@ -0,0 +1,98 @@
+"""
+선수/팀 이름 퍼지 매칭 벤치마크 (EntityResolver)
+
+선수 데이터를 현재의 N배로 키운 합성 데이터에서 오타 질의 1건당 비용 비교
+- before: 모든 별칭과 difflib 유사도 선형 비교 (인덱스 없는 퍼지 매칭)
+- after : EntityResolver (자모 trigram posting 인덱스 → 후보만 채점)
+
+📖 실행 방법:
+    cd server
+    python benchmarks/bench_entity_resolver.py --scale 10 --queries 200
+"""
+
+import argparse
+import difflib
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from bench_player_stats import build_dataset
+from llm_service.scrapers import add_ko_names  # noqa: F401  (내장 별칭 import 비용은 측정에서 제외)
+from llm_service.utils.entity_resolver import EntityResolver, build_entities, name_key
+
+SYLLABLES = ["ka", "lo", "mi", "ren", "so", "ta", "vic", "do", "bel", "ha", "nu", "ri", "zan", "pe", "gor", "li"]
+
+
+def realistic_name(rng: random.Random) -> str:
+    """'Player 프리미어리그 12' 같은 공통 접두어 없이 실제 이름처럼 서로 다른 이름"""
+    def word(parts):
+        return "".join(rng.choice(SYLLABLES) for _ in range(parts)).capitalize()
+    return f"{word(2)} {word(3)}"
+
+
+def typo(name: str, rng: random.Random) -> str:
+    """글자 하나 삭제 (사용자 오타 흉내)"""
+    i = rng.randrange(len(name))
+    return name[:i] + name[i + 1:]
+
+
+def linear_best(aliases, query: str):
+    """기존 방식: 모든 별칭과 SequenceMatcher 비교"""
+    key = name_key(query)
+    best, best_score = None, 0.0
+    for alias_key, entity in aliases:
+        score = difflib.SequenceMatcher(None, key, alias_key).ratio()
+        if score > best_score:
+            best, best_score = entity, score
+    return best
+
+
+def timeit(fn, queries) -> float:
+    """질의당 평균 시간 (초)"""
+    start = time.perf_counter()
+    for q in queries:
+        fn(q)
+    return (time.perf_counter() - start) / len(queries)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="EntityResolver 벤치마크")
+    parser.add_argument("--scale", type=int, default=10, help="현재 데이터 대비 배수")
+    parser.add_argument("--queries", type=int, default=200, help="측정 질의 수")
+    args = parser.parse_args()
+
+    data = build_dataset(args.scale)
+    players = [(league, p) for league, ps in data.items() for p in ps]
+    rng = random.Random(7)
+    for _, player in players:
+        player["name"] = realistic_name(rng)
+    targets = [p for _, p in rng.sample(players, args.queries)]
+    queries = [typo(p["name"], rng) for p in targets]
+
+    start = time.perf_counter()
+    resolver = EntityResolver(build_entities(players))
+    build_time = time.perf_counter() - start
+    aliases = [(name_key(alias), e) for e in resolver.entities for alias in e.aliases]
+
+    print(f"🔧 선수 {len(players):,}명, 별칭 {len(aliases):,}개, 질의 {args.queries}건")
+    print(f"📦 인덱스 생성: {build_time * 1000:.1f} ms (파일 변경 시 1회)")
+
+    t_before = timeit(lambda q: linear_best(aliases, q), queries[: max(1, args.queries // 20)])
+    t_after = timeit(lambda q: resolver.best(q), queries)
+    hits = 0
+    for query, target in zip(queries, targets):
+        match = resolver.best(query, kind="player")
+        hits += bool(match and match.entity.data.get("espn_id") == target["espn_id"])
+    print(
+        f"resolve      before {t_before * 1000:9.2f} ms   after {t_after * 1e6:8.2f} µs   "
+        f"⚡ {t_before / max(t_after, 1e-9):,.0f}x"
+    )
+    print(f"🎯 오타 질의 정답률: {hits / len(queries):.0%}")
+
+
+if __name__ == "__main__":
+    main()
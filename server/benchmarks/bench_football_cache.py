@@ -0,0 +1,113 @@
+"""
+축구 데이터 캐시 히트 지연 벤치마크
+
+같은 키 반복 조회 기준 요청당 캐시 조회 비용 비교
+- before: 매 요청 Firestore 조회 (기존 get_cache 방식)
+- after : TwoTierCache 메모리(L1) 히트, 미스 시에만 Firestore
+- stale : 신선 기간이 지난 항목 (즉시 반환 + 백그라운드 갱신 1회)
+
+Firestore/Football-Data 왕복은 지연을 흉내 내는 대역으로 대체
+
+📖 실행 방법:
+    cd server
+    python benchmarks/bench_football_cache.py --requests 200 --store-latency-ms 20
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from llm_service.utils.two_tier_cache import TwoTierCache
+
+
+class SlowStore:
+    """Firestore 대역 (읽기/쓰기마다 고정 지연)"""
+
+    def __init__(self, latency: float, age_seconds: float = 0.0):
+        self.latency = latency
+        self.entries = {"standings_PL": ({"standings": list(range(20))}, time.time() - age_seconds)}
+        self.reads = 0
+
+    def get(self, key):
+        self.reads += 1
+        time.sleep(self.latency)
+        return self.entries.get(key)
+
+    def set(self, key, value, metadata=None):
+        time.sleep(self.latency)
+        self.entries[key] = (value, time.time())
+
+
+def summarize(label: str, samples) -> float:
+    ordered = sorted(samples)
+    p50 = statistics.median(ordered) * 1e6
+    p95 = ordered[int(len(ordered) * 0.95) - 1] * 1e6
+    print(f"{label:<8} p50 {p50:10.1f} µs   p95 {p95:10.1f} µs")
+    return p50
+
+
+async def before(store: SlowStore, requests: int):
+    """기존 방식: 매 요청 Firestore 조회"""
+    samples = []
+    for _ in range(requests):
+        start = time.perf_counter()
+        await asyncio.to_thread(store.get, "standings_PL")
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+async def after(store: SlowStore, requests: int, upstream_latency: float):
+    """TwoTierCache: 첫 요청만 Firestore, 이후 메모리"""
+    cache = TwoTierCache()
+    calls = 0
+
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(upstream_latency)
+        return {"standings": list(range(20))}
+
+    samples = []
+    for _ in range(requests):
+        start = time.perf_counter()
+        await cache.get_or_fetch("standings_PL", fetch, ttl_seconds=3600, store=store)
+        samples.append(time.perf_counter() - start)
+    await cache.wait_refreshes()
+    return samples, calls, cache.get_stats()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="축구 데이터 캐시 히트 지연 벤치마크")
+    parser.add_argument("--requests", type=int, default=200, help="요청 수")
+    parser.add_argument("--store-latency-ms", type=float, default=20, help="Firestore 왕복 지연 (ms)")
+    parser.add_argument("--upstream-latency-ms", type=float, default=300, help="Football-Data 호출 지연 (ms)")
+    args = parser.parse_args()
+
+    store_latency = args.store_latency_ms / 1000
+    upstream_latency = args.upstream_latency_ms / 1000
+    print(f"🔧 요청 {args.requests}건, Firestore {args.store_latency_ms:.0f}ms, API {args.upstream_latency_ms:.0f}ms")
+
+    store = SlowStore(store_latency)
+    t_before = summarize("before", asyncio.run(before(store, args.requests)))
+
+    store = SlowStore(store_latency)
+    samples, calls, stats = asyncio.run(after(store, args.requests, upstream_latency))
+    t_after = summarize("after", samples)
+    print(f"         Firestore 조회 {store.reads}회, API 호출 {calls}회")
+
+    # 신선 기간(1시간)이 지난 항목: 요청은 기다리지 않고 백그라운드에서 1회 갱신
+    store = SlowStore(store_latency, age_seconds=3700)
+    samples, calls, stats = asyncio.run(after(store, args.requests, upstream_latency))
+    summarize("stale", samples)
+    print(f"         stale 응답 {stats['stale']}회, 백그라운드 API 호출 {calls}회")
+
+    print(f"⚡ 히트 지연 {t_before / max(t_after, 1e-9):.0f}x 감소")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+답변 캐시 Keyword 매칭 벤치마크 (CacheService.get_cached_answer의 점수 계산 구간)
+
+합성 캐시 답변 N건 (LLM 답변 길이 300~1500자)에 대해 조회 1건당 후보 k개 점수 계산 비교
+- before: 후보마다 calculate_keyword_match(질문, 답변 본문) (매 조회마다 답변 전체 정규식 추출)
+- after : 저장 시 추출해 둔 키워드 JSON을 읽어 score_keyword_candidates 한 번 (질문만 추출)
+
+두 방식의 점수가 모든 후보에서 같은지도 확인
+
+📖 실행 방법:
+    cd server
+    python benchmarks/bench_keyword_match.py --answers 2000 --top-k 3
+"""
+
+import argparse
+import logging
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from llm_service.utils.keyword_matcher import (
+    calculate_keyword_match,
+    dump_keywords,
+    extract_keywords,
+    load_keywords,
+    score_keyword_candidates,
+)
+
+SENTENCES = [
+    "손흥민은 이번 시즌 토트넘에서 리그 12골 6도움을 기록하고 있습니다.",
+    "Tottenham pressed high in the first half and Son Heung-min found space behind the line.",
+    "아스널은 4-3-3 포메이션에서 측면 전환이 빨라졌고 2024년 이후 실점이 줄었습니다.",
+    "홀란드는 맨시티 합류 후 Premier League 득점 기록을 새로 썼습니다.",
+    "다음 경기는 12월 3일 리버풀 원정이며 오늘 훈련에서 부상자가 복귀했습니다.",
+    "Real Madrid and Barcelona are level on points at the top of La Liga.",
+    "첼시는 최근 5경기에서 3승 1무 1패로 순위를 끌어올렸습니다.",
+    "분데스리가에서는 바이에른이 작년보다 빠른 페이스로 승점을 쌓고 있습니다.",
+]
+QUERIES = [
+    "손흥민 최근 폼은?", "토트넘 다음 경기 언제야", "홀란드 득점 기록", "아스널 전술 분석",
+    "Premier League 순위", "리버풀 원정 일정", "레알마드리드 바르셀로나 승점", "첼시 최근 전적",
+]
+
+
+def build_answers(count: int, seed: int = 42) -> list:
+    rng = random.Random(seed)
+    answers = []
+    for _ in range(count):
+        target = rng.randint(300, 1500)
+        parts = []
+        while sum(len(p) + 1 for p in parts) < target:
+            parts.append(rng.choice(SENTENCES))
+        answers.append(" ".join(parts))
+    return answers
+
+
+def main():
+    parser = argparse.ArgumentParser(description="답변 캐시 Keyword 매칭 벤치마크")
+    parser.add_argument("--answers", type=int, default=2000, help="캐시 답변 수")
+    parser.add_argument("--lookups", type=int, default=5000, help="조회 수")
+    parser.add_argument("--top-k", type=int, default=3, help="조회당 후보 수")
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    answers = build_answers(args.answers)
+    # cache_answer가 metadata에 저장하는 값 (ChromaDB에서는 문자열로 돌아옴)
+    stored = [dump_keywords(extract_keywords(answer)) for answer in answers]
+
+    rng = random.Random(7)
+    lookups = [
+        (rng.choice(QUERIES), rng.sample(range(len(answers)), args.top_k))
+        for _ in range(args.lookups)
+    ]
+    avg_len = sum(len(a) for a in answers) / len(answers)
+    print(f"🔧 캐시 답변 {len(answers):,}건 (평균 {avg_len:.0f}자), 조회 {len(lookups):,}건 x 후보 {args.top_k}개")
+
+    start = time.perf_counter()
+    before = [[calculate_keyword_match(query, answers[i]) for i in ids] for query, ids in lookups]
+    t_before = time.perf_counter() - start
+
+    start = time.perf_counter()
+    after = [score_keyword_candidates(query, [load_keywords(stored[i]) for i in ids]) for query, ids in lookups]
+    t_after = time.perf_counter() - start
+
+    mismatches = sum(1 for b, a in zip(before, after) if b != a)
+    print(f"🎯 점수 불일치 {mismatches}건")
+    print(
+        f"조회당 점수 계산   before {t_before / len(lookups) * 1e6:8.1f} µs   "
+        f"after {t_after / len(lookups) * 1e6:8.1f} µs   ⚡ {t_before / max(t_after, 1e-9):.1f}x"
+    )
+
+
+if __name__ == "__main__":
+    main()
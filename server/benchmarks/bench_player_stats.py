@@ -0,0 +1,133 @@
+"""
+선수 통계 조회 벤치마크 (stats 라우터)
+
+espn_player_ids.json 크기를 현재의 N배로 키운 합성 파일로 요청당 비용 비교
+- before: 요청마다 JSON 로드 + 정렬 / 전체 리그 선형 탐색 (기존 방식)
+- after : PlayerStatsStore (한 번 로드, 미리 정렬된 순위 슬라이스, 이름 인덱스)
+
+현재 파일 크기는 espn_id_collector 기본값 기준 (7개 리그 x 100명)
+
+📖 실행 방법:
+    cd server
+    python benchmarks/bench_player_stats.py --scale 10 --requests 200
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from llm_service.services.player_stats_store import PlayerStatsStore
+
+LEAGUES = ["프리미어리그", "라리가", "분데스리가", "세리에A", "리그1", "MLS", "챔피언스리그"]
+PLAYERS_PER_LEAGUE = 100
+
+
+def build_dataset(scale: int) -> dict:
+    """리그별 PLAYERS_PER_LEAGUE x scale명 합성 데이터"""
+    rng = random.Random(42)
+    data = {}
+    espn_id = 1
+    for league in LEAGUES:
+        players = []
+        for i in range(PLAYERS_PER_LEAGUE * scale):
+            players.append({
+                "name": f"Player {league} {i}",
+                "ko_name": f"선수{espn_id}",
+                "espn_id": espn_id,
+                "team": f"Team {i % 20}",
+                "goals": rng.randint(0, 30),
+                "assists": rng.randint(0, 20),
+                "matches": rng.randint(0, 38),
+            })
+            espn_id += 1
+        data[league] = players
+    return data
+
+
+# ==================== 기존 방식 ====================
+def before_top_scorers(path: str, league: str, limit: int):
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    if league not in data:
+        return []
+    return sorted(data[league], key=lambda x: x.get("goals", 0), reverse=True)[:limit]
+
+
+def before_find_player(path: str, player_name: str):
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    for players in data.values():
+        for player in players:
+            if player.get("name", "").lower() == player_name.lower():
+                return player
+            if player.get("ko_name", "").lower() == player_name.lower():
+                return player
+    return None
+
+
+def timeit(fn, requests: int) -> float:
+    """요청당 평균 시간 (초)"""
+    start = time.perf_counter()
+    for i in range(requests):
+        fn(i)
+    return (time.perf_counter() - start) / requests
+
+
+def main():
+    parser = argparse.ArgumentParser(description="선수 통계 조회 벤치마크")
+    parser.add_argument("--scale", type=int, default=10, help="현재 파일 대비 배수")
+    parser.add_argument("--requests", type=int, default=200, help="측정 요청 수")
+    args = parser.parse_args()
+
+    data = build_dataset(args.scale)
+    total = sum(len(p) for p in data.values())
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "espn_player_ids.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+        size_mb = os.path.getsize(path) / 1024 / 1024
+        print(f"🔧 선수 {total:,}명 ({size_mb:.1f} MB), 요청 {args.requests}건")
+
+        # 마지막 리그의 선수 → 선형 탐색 최악에 가까운 경우
+        last_league = data[LEAGUES[-1]]
+        names = [last_league[i % len(last_league)]["ko_name"] for i in range(args.requests)]
+
+        store = PlayerStatsStore(path)
+        start = time.perf_counter()
+        store.leagues()
+        load_time = time.perf_counter() - start
+
+        cases = [
+            (
+                "top-scorers",
+                lambda i: before_top_scorers(path, LEAGUES[i % len(LEAGUES)], 20),
+                lambda i: store.top_scorers(LEAGUES[i % len(LEAGUES)], 20),
+            ),
+            (
+                "player",
+                lambda i: before_find_player(path, names[i]),
+                lambda i: store.find_player(names[i]),
+            ),
+        ]
+
+        print(f"📦 최초 로드 + 인덱싱: {load_time * 1000:.1f} ms (1회)")
+        for label, before, after in cases:
+            assert before(0) == after(0)
+            t_before = timeit(before, max(1, args.requests // 10))
+            t_after = timeit(after, args.requests)
+            print(
+                f"{label:<12} before {t_before * 1000:9.2f} ms   after {t_after * 1e6:8.2f} µs   "
+                f"⚡ {t_before / max(t_after, 1e-9):,.0f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+"""
+게시글 검색 벤치마크 (전체 순회 부분 문자열 vs 2-gram BM25 인덱스)
+
+합성 게시글 N개 (축구 어휘 조합, 제목 + 본문 100~300자)
+- scan : 검색마다 모든 글의 제목/본문에 `keyword in text` (기존 방식을 전체 글로 확장한 경우, 순위 없음)
+- index: PostSearchIndex.search (BM25 상위 10개)
+
+인덱스 구축 시간/메모리, 검색 지연 p50/p95, 생성/수정/삭제 갱신 지연(압축은 백그라운드)을 출력
+
+📖 실행 방법:
+    cd server
+    python benchmarks/bench_post_search.py --posts 100000 --queries 200
+"""
+
+import argparse
+import logging
+import random
+import resource
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from llm_service.utils.post_search_index import PostSearchIndex
+
+PLAYERS = ["손흥민", "황희찬", "이강인", "김민재", "홀란드", "살라", "케인", "음바페", "사카", "외데고르"]
+TEAMS = ["토트넘", "아스날", "맨시티", "리버풀", "첼시", "맨유", "뉴캐슬", "울버햄튼", "바이에른", "파리"]
+WORDS = [
+    "경기", "분석", "전술", "골", "어시스트", "이적", "부상", "복귀", "선발", "교체", "압박", "역습",
+    "수비", "공격", "중원", "세트피스", "프리킥", "페널티", "득점왕", "우승", "강등", "시즌", "감독", "인터뷰",
+    "하이라이트", "평점", "레전드", "유망주", "계약", "연봉", "주장", "데뷔", "해트트릭", "클린시트", "VAR",
+]
+ENDINGS = ["입니다", "했습니다", "같네요", "인가요", "대박", "ㅋㅋ", "최고", "아쉽네요"]
+
+SYLLABLES = "가나다라마바사아자차카타파하강남동리민서성수영우원재전정준지진태현호훈"
+
+QUERIES = ["손흥민", "아스날 전술", "이강인 이적", "해트트릭", "골", "맨시티 우승 전망", "VAR", "김민재 수비 분석"]
+
+
+def make_posts(n, seed=0):
+    rng = random.Random(seed)
+    # 자주 나오는 축구 어휘 + 드물게 나오는 임의 단어 5000개 (Zipf 분포에 가깝게)
+    rare = ["".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 3))) for _ in range(5000)]
+    vocabulary = PLAYERS + TEAMS + WORDS + rare
+    weights = [1 / (rank + 1) for rank in range(len(vocabulary))]
+    posts = []
+    for i in range(n):
+        words = [
+            word + rng.choice(["", "", "의", "이", "가", "을", "는"])
+            for word in rng.choices(vocabulary, weights, k=rng.randint(15, 50))
+        ]
+        posts.append({
+            "post_id": f"post-{i:06d}",
+            "author_id": f"user-{rng.randint(0, 5000)}",
+            "author_username": "tester",
+            "title": f"{rng.choice(TEAMS)} {rng.choice(PLAYERS)} {rng.choice(WORDS)} {rng.choice(ENDINGS)}",
+            "content": " ".join(words) + " " + rng.choice(ENDINGS),
+            "category": rng.choice(["general", "축구분석", "이적소식"]),
+            "created_at": f"2025-01-01T00:00:{i:06d}",
+        })
+    return posts
+
+
+def percentile(samples, q):
+    samples = sorted(samples)
+    return samples[max(int(len(samples) * q) - 1, 0)]
+
+
+def timed(fn, queries):
+    latencies = []
+    for query in queries:
+        started = time.perf_counter()
+        fn(query)
+        latencies.append((time.perf_counter() - started) * 1000)
+    return latencies
+
+
+def main():
+    parser = argparse.ArgumentParser(description="게시글 검색 벤치마크")
+    parser.add_argument("--posts", type=int, default=100000, help="합성 게시글 수")
+    parser.add_argument("--queries", type=int, default=200, help="검색 횟수 (index)")
+    parser.add_argument("--scan-queries", type=int, default=16, help="검색 횟수 (scan, 느려서 적게)")
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    posts = make_posts(args.posts)
+    rng = random.Random(1)
+    queries = [rng.choice(QUERIES) for _ in range(args.queries)]
+
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    started = time.perf_counter()
+    index = PostSearchIndex(refresh_seconds=0)
+    index.build(posts)
+    build_seconds = time.perf_counter() - started
+    memory_mb = (resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - rss_before) / 1024
+    stats = index.get_stats()
+    print(
+        f"🔧 게시글 {args.posts}개 인덱스 구축 {build_seconds:.1f}s, "
+        f"단어 {stats['terms']}개, 최대 RSS 증가 약 {memory_mb:.0f}MB"
+    )
+
+    def scan(query):
+        keyword = query.lower()
+        return [p for p in posts if keyword in f"{p['title']}\n{p['content']}".lower()]
+
+    for name, fn, sample in (
+        ("scan", scan, queries[:args.scan_queries]),
+        ("index", lambda q: index.search(q, limit=10), queries),
+    ):
+        latencies = timed(fn, sample)
+        print(
+            f"{name:6s} 검색 {len(sample):4d}회   p50 {statistics.median(latencies):8.2f} ms   "
+            f"p95 {percentile(latencies, 0.95):8.2f} ms"
+        )
+
+    for query in QUERIES:
+        hits, total = index.search(query, limit=3)
+        print(f"   {query!r:14s} 매칭 {total:6d}개, 1위: {hits[0].post['title'] if hits else '-'}")
+
+    # 생성/수정/삭제 갱신 지연
+    fresh = make_posts(1000, seed=2)
+    for i, post in enumerate(fresh):
+        post["post_id"] = f"new-{i:04d}"
+    update_ms = timed(index.upsert, fresh)
+    remove_ms = timed(index.remove, [post["post_id"] for post in fresh])
+    # 압축은 백그라운드 스레드 (갱신 지연에는 포함되지 않음)
+    while index.get_stats()["compacting"]:
+        time.sleep(0.05)
+    stats = index.get_stats()
+    print(
+        f"갱신   upsert p95 {percentile(update_ms, 0.95):.3f} ms   remove p95 {percentile(remove_ms, 0.95):.3f} ms   "
+        f"압축 {stats['compactions']}회 (백그라운드, 마지막 {stats['last_compaction_seconds'] or 0}s)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,206 @@
+"""
+질문 분류 벤치마크 (question_classifier 규칙 엔진 + 분류 캐시)
+
+EXPERIMENT_RESULTS.md 실험 1의 47개 질문 (단순 20 + 복잡 27, tests/test_question_classifier.py)
+- 정확도: 단순/복잡/전체 + 축약형 감지율, 질문별로 어떤 규칙이 판정했는지
+- 처리량: before (키워드 목록마다 `in` 스캔 + 매번 re 모듈 호출, 기존 방식)
+          vs after (Aho-Corasick 한 번 스캔 + 미리 컴파일한 정규식)
+- 두 방식의 판정이 모든 질문에서 같은지 확인
+- is_complex_question 전체 경로 (ChromaDB 단계 제외): 캐시 미스 / 히트, 캐시 크기 상한
+
+📖 실행 방법:
+    cd server
+    python benchmarks/bench_question_classifier.py --rounds 2000
+"""
+
+import argparse
+import asyncio
+import logging
+import random
+import re
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from llm_service.utils import question_classifier
+from llm_service.utils.question_classifier import is_complex_question, match_rules
+from tests.test_question_classifier import (
+    ABBREVIATED_QUESTIONS,
+    COMPLEX_QUESTIONS,
+    REAL_WORLD_QUESTIONS,
+    SIMPLE_QUESTIONS,
+)
+
+
+# ==================== 기존 방식 ====================
+def before_rules(query: str):
+    """리팩토링 전 is_complex_question의 규칙 판단 부분 (True/False/None)"""
+    query_lower = query.lower()
+    if any(k in query_lower for k in ["그리고", "또한", "또", "그리고도", "동시에", "and", "also", "plus", "또한"]):
+        return True
+    has_verb = any(k in query_lower for k in ["알려주고", "보여주고", "알려줘", "보여줘", "알려주면서", "보여주면서"])
+    has_connector = any(k in query_lower for k in ["도", "또", "그리고", "또한"])
+    if has_verb and has_connector:
+        return True
+    if re.search(r'(하고|해주고|해줘).*?(도|또|그리고)', query_lower):
+        return True
+    if re.search(r'\b\d{6,}\b', query):
+        return True
+    entity_pattern = r'[가-힣]{2,6}(?:리그)?|[A-Z][a-z]+(?:\s+[A-Z][a-z]+){0,2}'
+    if any(k in query_lower for k in [
+        "누가 더", "어느 쪽이", "어느 게", "어느 것이", "어느 팀이",
+        "누가 나아요", "누가 좋아요", "누가 더 나아요", "누가 더 좋아요",
+        "어느 게 나아요", "어느 게 좋아요", "어느 쪽이 나아요", "어느 쪽이 좋아요",
+    ]):
+        matches = [m.strip() for m in re.findall(entity_pattern, query) if m.strip() and len(m.strip()) >= 2]
+        if len(set(matches)) >= 2:
+            return True
+    markers = ['?', '는', '은', '이', '가', '을', '를', '의', '에', '에서', '에게', '에게서']
+    exclude_words = [
+        '최근', '폼', '정보', '순위', '결과', '점수', '경기', '일정', '스케줄',
+        '전적', '통계', '득점', '어시스트', '나이', '소속', '팀', '리그',
+        '우승', '감독', '홈구장', '팬', '횟수', '시즌', '시작일', '날짜',
+        'recent', 'form', 'info', 'rank', 'result', 'score', 'match', 'schedule',
+    ]
+    if not any(m in query for m in markers):
+        words = query.split()
+        for i in range(len(words) - 1):
+            w1, w2 = words[i], words[i + 1]
+            if w1.lower() in exclude_words or w2.lower() in exclude_words:
+                continue
+            e1 = re.match(r'^[가-힣]{2,4}$', w1) or re.match(r'^[A-Z][a-z]+$', w1)
+            e2 = re.match(r'^[가-힣]{2,4}$', w2) or re.match(r'^[A-Z][a-z]+$', w2)
+            if e1 and e2 and not any(
+                k in query_lower for k in ["vs", "대", "비교", "compare", "versus", "와", "과", "누가", "어느"]
+            ):
+                return True
+    if any(k in query_lower for k in ["vs", "대", "비교", "compare", "versus"]):
+        if re.search(r'(.+?)\s+(?:vs|대|와|과)\s+(.+?)(?:\s+비교)?', query, re.IGNORECASE):
+            return True
+        matches = [m.strip() for m in re.findall(entity_pattern, query) if m.strip() and len(m.strip()) >= 2]
+        if len(set(matches)) >= 2:
+            return True
+        if "비교" in query_lower and len(matches) < 2:
+            return False
+    if any(k in query_lower for k in [
+        "분석하고", "분석 후", "분석해서", "보여주고", "보여주면서", "보여줘 그리고",
+        "알려주고", "알려주면서", "알려줘 그리고", "비교하고", "비교 후", "비교해서",
+        "analyze and", "compare and", "show and",
+    ]):
+        return True
+    if re.search(r'(.+?)(하고|해주고|해줘|후|후에).*?(도|또|그리고).*?(보여줘|알려줘|보여주고|알려주고|분석|비교|통계)', query_lower):
+        return True
+    if any(k in query_lower for k in ["영상", "비디오", "video", "youtube", "유튜브", "클립"]):
+        return True
+    if any(k in query_lower for k in ["커뮤니티", "게시판", "게시글", "글", "포스트", "community", "post", "posts"]):
+        return True
+    if any(k in query_lower for k in ["경기 결과", "경기 점수", "경기 스코어", "경기 승부", "match result", "score"]):
+        return False
+    if any(k in query_lower for k in [
+        "경기 일정", "일정", "스케줄", "schedule", "calendar", "오늘 경기", "내일 경기",
+        "이번 주", "이번 달", "주간", "월간", "경기표", "fixture", "matches",
+    ]):
+        return True
+    if any(k in query_lower for k in ["내가 좋아하는", "내 팀", "내 선호도", "fanpicker", "선호"]):
+        return True
+    return None
+
+
+def after_rules(query: str):
+    matched = match_rules(query)
+    return None if matched is None else matched.is_complex
+
+
+def build_fuzz(queries, count: int, seed: int = 42) -> list:
+    """47개 질문의 어절을 무작위로 섞은 질문 (판정 일치 확인용)"""
+    rng = random.Random(seed)
+    tokens = [token for query in queries for token in query.split()] + ["vs", "123456", "Son", "Kane", "?"]
+    return [" ".join(rng.choice(tokens) for _ in range(rng.randint(1, 6))) for _ in range(count)]
+
+
+def timeit(fn, queries, rounds: int) -> float:
+    """질문당 평균 시간 (µs)"""
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for query in queries:
+            fn(query)
+    return (time.perf_counter() - start) / (rounds * len(queries)) * 1e6
+
+
+async def classify_all(queries) -> float:
+    start = time.perf_counter()
+    for query in queries:
+        await is_complex_question(query, use_llm_fallback=False)
+    return (time.perf_counter() - start) / len(queries) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description="질문 분류 벤치마크")
+    parser.add_argument("--rounds", type=int, default=2000, help="47개 질문 반복 횟수 (처리량 측정)")
+    parser.add_argument("--fuzz", type=int, default=20000, help="판정 일치 확인용 무작위 질문 수")
+    parser.add_argument("--stream", type=int, default=50000, help="캐시 상한 확인용 서로 다른 질문 수")
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    # ChromaDB 유사 질문 단계는 제외 (규칙 + 메모리 캐시만 측정)
+    question_classifier._get_classification_rag = lambda: None
+
+    labeled = [(q, False) for q in SIMPLE_QUESTIONS] + [(q, True) for q in COMPLEX_QUESTIONS]
+    queries = [q for q, _ in labeled]
+    extra = ABBREVIATED_QUESTIONS + REAL_WORLD_QUESTIONS
+
+    # ---------- 정확도 ----------
+    predictions = {q: bool(after_rules(q)) for q in queries + extra}
+    simple_ok = sum(1 for q in SIMPLE_QUESTIONS if not predictions[q])
+    complex_ok = sum(1 for q in COMPLEX_QUESTIONS if predictions[q])
+    abbreviated_ok = sum(1 for q in ABBREVIATED_QUESTIONS if predictions[q])
+    print(f"🔧 질문 {len(queries)}개 (단순 {len(SIMPLE_QUESTIONS)} + 복잡 {len(COMPLEX_QUESTIONS)})")
+    print(
+        f"🎯 전체 {simple_ok + complex_ok}/{len(queries)} ({(simple_ok + complex_ok) / len(queries):.1%})   "
+        f"단순 {simple_ok}/{len(SIMPLE_QUESTIONS)}   복잡 {complex_ok}/{len(COMPLEX_QUESTIONS)}   "
+        f"축약형 {abbreviated_ok}/{len(ABBREVIATED_QUESTIONS)}"
+    )
+    for query, expected in labeled:
+        if predictions[query] != expected:
+            matched = match_rules(query)
+            print(f"   ❌ {query} → {'복잡' if predictions[query] else '단순'} (규칙: {matched.rule if matched else '없음'})")
+
+    fired = Counter(getattr(match_rules(q), "rule", "(LLM/기본값)") for q in queries)
+    print("📋 판정 규칙: " + ", ".join(f"{rule} {count}" for rule, count in fired.most_common()))
+
+    checked = queries + extra + build_fuzz(queries + extra, args.fuzz)
+    mismatches = [q for q in checked if before_rules(q) != after_rules(q)]
+    print(f"🔍 기존 방식과 판정 불일치 {len(mismatches)}건 ({len(checked):,}개 중)")
+    for query in mismatches[:5]:
+        print(f"   ❌ {query!r}: before {before_rules(query)} / after {after_rules(query)}")
+
+    # ---------- 처리량 ----------
+    t_before = timeit(before_rules, queries, args.rounds)
+    t_after = timeit(after_rules, queries, args.rounds)
+    print(
+        f"규칙 판단    before {t_before:6.2f} µs/건 ({1e6 / t_before:9,.0f} 건/s)   "
+        f"after {t_after:6.2f} µs/건 ({1e6 / t_after:9,.0f} 건/s)   ⚡ {t_before / t_after:.1f}x"
+    )
+
+    cache = question_classifier._question_classification_cache
+    cache.clear()
+    t_miss = asyncio.run(classify_all(queries))
+    t_hit = asyncio.run(classify_all(queries))
+    print(f"전체 경로    캐시 미스 {t_miss:6.2f} µs/건   캐시 히트 {t_hit:6.2f} µs/건")
+
+    # ---------- 캐시 상한 ----------
+    cache.clear()
+    stream = [f"{queries[i % len(queries)]} #{i}" for i in range(args.stream)]
+    asyncio.run(classify_all(stream + stream[-len(queries):]))
+    stats = cache.get_stats()
+    print(
+        f"캐시        서로 다른 질문 {args.stream:,}개 → 크기 {stats['size']:,}/{stats['maxsize']:,}, "
+        f"제거 {stats['evictions']:,}, 히트율 {stats['hit_rate']:.2%}"
+    )
+
+
+if __name__ == "__main__":
+    main()
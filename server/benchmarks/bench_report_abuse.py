@@ -0,0 +1,164 @@
+"""
+신고 남용 체크 벤치마크 (전체 이력 스캔 vs 신고자별 누적 통계)
+
+신고 이력이 N건인 신고자가 신고를 계속 접수하는 상황 (신고 1건 = 남용 체크 + 저장)
+- before: 매번 select("*").eq("reporter_id") → 전체 행 수신 + 파이썬에서 다시 집계
+- after : ReportAbuseTracker.snapshot (처음 한 번만 RPC 집계) + record_report
+
+가짜 DB는 호출마다 --latency-ms 만큼 대기하고, 응답 행을 JSON으로 직렬화/역직렬화 (PostgREST 전송 대역)
+이력이 길어져도 after의 신고당 지연이 그대로인지 확인
+
+📖 실행 방법:
+    cd server
+    python benchmarks/bench_report_abuse.py --history 100 1000 10000 --reports 20 --latency-ms 5
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import random
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from backend import db_executor
+from backend.report_abuse import ReportAbuseTracker
+
+STATUSES = ["pending", "reviewing", "resolved", "dismissed"]
+
+
+def make_history(n, now):
+    rng = random.Random(n)
+    return [
+        {
+            "report_id": f"r{i}", "reporter_id": "reporter", "reporter_username": "tester",
+            "target_type": "post", "target_id": f"post-{rng.randint(0, 5000)}",
+            "target_author_id": f"user-{rng.randint(0, 200)}", "category": "spam",
+            "reason": "스팸 게시글입니다 신고합니다", "status": rng.choice(STATUSES), "admin_note": None,
+            "created_at": (now - timedelta(minutes=rng.randint(1, 60 * 24 * 365))).isoformat(), "resolved_at": None,
+        }
+        for i in range(n)
+    ]
+
+
+class FakeSupabase:
+    """reports 테이블 + reporter_abuse_stats RPC 대역 (호출마다 지연 + JSON 전송)"""
+
+    def __init__(self, rows, latency):
+        self.rows = rows
+        self.latency = latency
+
+    def _respond(self, data):
+        time.sleep(self.latency)
+        return SimpleNamespace(data=json.loads(json.dumps(data)), count=None)
+
+    def table(self, name):
+        db = self
+
+        class _Query:
+            def select(self, *args, **kwargs):
+                return self
+
+            def eq(self, field, value):
+                return self
+
+            def execute(self):
+                return db._respond(db.rows)
+
+        return _Query()
+
+    def rpc(self, name, params):
+        db = self
+
+        def execute():
+            # DB 안에서 집계 → 요약만 전송
+            recent = [
+                {"created_at": r["created_at"], "target_author_id": r["target_author_id"]}
+                for r in db.rows if r["created_at"] > params["p_since"]
+            ]
+            return db._respond({
+                "total_reports": len(db.rows),
+                "dismissed_count": sum(r["status"] == "dismissed" for r in db.rows),
+                "resolved_count": sum(r["status"] == "resolved" for r in db.rows),
+                "recent": recent,
+            })
+
+        return SimpleNamespace(execute=execute)
+
+
+async def legacy_check(db, reporter_id):
+    """기존 check_reporter_abuse 집계"""
+    now = datetime.now()
+    one_hour_ago = (now - timedelta(hours=1)).isoformat()
+    one_day_ago = (now - timedelta(days=1)).isoformat()
+    result = await db_executor.db_execute(db.table("reports").select("*").eq("reporter_id", reporter_id))
+    hour = day = dismissed = resolved = 0
+    targets = {}
+    for data in result.data or []:
+        created_at = data.get("created_at")
+        if created_at:
+            if created_at > one_hour_ago:
+                hour += 1
+            if created_at > one_day_ago:
+                day += 1
+                target = data.get("target_author_id")
+                if target:
+                    targets[target] = targets.get(target, 0) + 1
+        if data.get("status") == "dismissed":
+            dismissed += 1
+        elif data.get("status") in ["resolved", "dismissed"]:
+            resolved += 1
+    return hour, day, dismissed, resolved, targets
+
+
+async def run(history, args):
+    now = datetime.now()
+    db = FakeSupabase(make_history(history, now), args.latency_ms / 1000)
+    tracker = ReportAbuseTracker()
+
+    async def before():
+        await legacy_check(db, "reporter")
+
+    async def after():
+        await tracker.snapshot(db, "reporter")
+        tracker.record_report("reporter", datetime.now().isoformat(), None)
+
+    results = {}
+    for name, create in (("before", before), ("after", after)):
+        latencies = []
+        for _ in range(args.reports):
+            started = time.perf_counter()
+            await create()
+            latencies.append((time.perf_counter() - started) * 1000)
+        # 첫 신고(after는 DB 집계)와 이후 신고를 나눠서 표시
+        results[name] = (latencies[0], statistics.median(latencies[1:]))
+
+    (b_first, b_rest), (a_first, a_rest) = results["before"], results["after"]
+    print(
+        f"이력 {history:6d}건   before 첫 {b_first:7.2f} ms / 이후 {b_rest:7.2f} ms   "
+        f"after 첫 {a_first:7.2f} ms / 이후 {a_rest:6.3f} ms"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="신고 남용 체크 벤치마크")
+    parser.add_argument("--history", type=int, nargs="+", default=[100, 1000, 10000], help="신고자의 기존 신고 수")
+    parser.add_argument("--reports", type=int, default=20, help="연속 신고 수")
+    parser.add_argument("--latency-ms", type=float, default=5.0, help="DB 호출 1회 지연")
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    print(f"🔧 신고 {args.reports}회 연속 접수, DB 지연 {args.latency_ms}ms (신고당 지연, 중앙값)")
+    for history in args.history:
+        asyncio.run(run(history, args))
+    db_executor.close_db_executor()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+import 시간 프로파일 리포트
+
+`python -X importtime -c "import main"`을 별도 프로세스로 실행해서
+누적 시간 기준 상위 모듈과 최상위 패키지별 합계를 출력한다.
+(콜드 스타트에서 어떤 의존성이 시간을 쓰는지 확인용)
+
+📖 실행 방법:
+    cd server
+    python benchmarks/profile_imports.py --top 25
+    python benchmarks/profile_imports.py --module llm_service.routers.chat
+
+기대 결과: google.generativeai / PIL / chromadb 클라이언트 생성이 상위에 보이지 않음
+(Gemini는 첫 이미지 분석 시, ChromaDB/OpenAI 클라이언트는 첫 요청 시 생성)
+"""
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+SERVER_DIR = Path(__file__).resolve().parent.parent
+
+LINE_RE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+
+def run_importtime(module: str) -> Tuple[List[Tuple[str, int, int, int]], float]:
+    """
+    -X importtime으로 모듈 import
+
+    Returns:
+        ([(모듈, self_us, cumulative_us, depth)], 전체 wall time 초)
+    """
+    env = dict(os.environ)
+    # import 시점에 키 검사하는 모듈이 있어도 프로파일은 끝까지 진행
+    env.setdefault("OPENAI_API_KEY", "sk-profile")
+    code = f"import time; t = time.perf_counter(); import {module}; print(time.perf_counter() - t)"
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=SERVER_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        raise SystemExit(f"❌ import 실패:\n{proc.stderr[-2000:]}")
+
+    rows = []
+    for line in proc.stderr.splitlines():
+        match = LINE_RE.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            rows.append((name, int(self_us), int(cumulative_us), len(indent) // 2))
+    wall = float(proc.stdout.strip().splitlines()[-1])
+    return rows, wall
+
+
+def summarize_packages(rows: List[Tuple[str, int, int, int]]) -> Dict[str, int]:
+    """최상위 패키지별 self 시간 합계 (us)"""
+    totals: Dict[str, int] = defaultdict(int)
+    for name, self_us, _, _ in rows:
+        totals[name.split(".")[0]] += self_us
+    return totals
+
+
+def main():
+    parser = argparse.ArgumentParser(description="import 시간 프로파일")
+    parser.add_argument("--module", default="main", help="프로파일할 모듈 (기본: main)")
+    parser.add_argument("--top", type=int, default=20, help="출력할 상위 항목 수")
+    args = parser.parse_args()
+
+    rows, wall = run_importtime(args.module)
+
+    print(f"\n📦 import {args.module}: {wall * 1000:.0f} ms (모듈 {len(rows)}개)")
+
+    print(f"\n⏱️ 누적 시간 상위 {args.top}개 (ms)")
+    for name, self_us, cumulative_us, depth in sorted(rows, key=lambda r: r[2], reverse=True)[: args.top]:
+        print(f"  {cumulative_us / 1000:8.1f}  (self {self_us / 1000:6.1f})  {'  ' * depth}{name}")
+
+    print(f"\n📊 최상위 패키지별 합계 상위 {args.top}개 (ms)")
+    totals = summarize_packages(rows)
+    for package, total_us in sorted(totals.items(), key=lambda item: item[1], reverse=True)[: args.top]:
+        print(f"  {total_us / 1000:8.1f}  {package}")
+
+
+if __name__ == "__main__":
+    main()
@@ -7,13 +7,25 @@ OpenAI + LangChain + ChromaDB를 사용한 AI 기반 축구 분석 서비스
 __version__ = "0.1.0"
 __author__ = "FSF Team"
 
-# 주요 클래스/함수 임포트
-from .services.openai_service import OpenAIService
-from .services.rag_service import RAGService
-from .services.data_ingestion import DataIngestionService
+# 주요 클래스/함수는 첫 접근 시 임포트 (패키지 import만으로 LangChain/Chroma를 로드하지 않음)
+_LAZY_EXPORTS = {
+    "OpenAIService": ".services.openai_service",
+    "RAGService": ".services.rag_service",
+    "DataIngestionService": ".services.data_ingestion",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        import importlib
+
+        module = importlib.import_module(_LAZY_EXPORTS[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "OpenAIService",
     "RAGService",
     "DataIngestionService",
-]
\ No newline at end of file
+]
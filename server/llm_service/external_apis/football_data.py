@@ -5,16 +5,94 @@ Football-Data.org API 클라이언트 (완전한 구현)
 🔗 API URL: https://api.football-data.org/v4
 
 라이센스: 대부분 무료, 10 requests/minute 제한
+
+- FootballDataClient: 동기 클라이언트 (스크립트/Tool 스레드용)
+- AsyncFootballDataClient: 비동기 클라이언트 (async 라우트용)
+  공용 httpx 커넥션 풀 + 프로세스 공용 우선순위 토큰 버킷 + 429/Retry-After 처리
 """
 
+import asyncio
 import os
+import threading
+import time
 import logging
+import httpx
 import requests
-from typing import Optional, List, Dict, Any
+from typing import Any, Awaitable, Callable, Dict, List, Optional, TypeVar
 from datetime import datetime
 
+from .rate_limiter import AsyncTokenBucket, RateLimitExceeded, RequestPriority
+from ..utils.two_tier_cache import TwoTierCache
+
 logger = logging.getLogger(__name__)
 
+# Football-Data 호출 한도 (무료 플랜: 10 requests/minute)
+FOOTBALL_API_RATE_LIMIT_PER_MINUTE = float(os.getenv("FOOTBALL_API_RATE_LIMIT_PER_MINUTE", "10"))
+FOOTBALL_API_BURST = float(os.getenv("FOOTBALL_API_BURST", "10"))
+FOOTBALL_API_TIMEOUT_SECONDS = float(os.getenv("FOOTBALL_API_TIMEOUT_SECONDS", "10"))
+FOOTBALL_API_MAX_CONNECTIONS = int(os.getenv("FOOTBALL_API_MAX_CONNECTIONS", "10"))
+FOOTBALL_API_MAX_RETRIES = int(os.getenv("FOOTBALL_API_MAX_RETRIES", "2"))
+
+# 인메모리 L1 캐시 크기 (라우터/백그라운드 갱신기/Agent Tool 공용, Firestore 앞단)
+FOOTBALL_L1_CACHE_SIZE = int(os.getenv("FOOTBALL_L1_CACHE_SIZE", "512"))
+
+# 공용 캐시 키 (라우터와 Tool이 같은 항목을 읽도록)
+LIVE_MATCHES_CACHE_KEY = "matches_live_all"
+
+# 우선순위별 최대 대기 시간 (초) - 초과 예상 시 대기하지 않고 RateLimitExceeded
+# 라이브 스코어는 오래 기다려도 받고, 팀 목록처럼 자주 안 바뀌는 데이터는 빨리 포기 (캐시로 대체)
+PRIORITY_MAX_WAIT_SECONDS = {
+    RequestPriority.LIVE: 30.0,
+    RequestPriority.MATCH: 20.0,
+    RequestPriority.STANDINGS: 10.0,
+    RequestPriority.TEAMS: 5.0,
+}
+
+
+def _require_api_key(api_key: Optional[str] = None) -> str:
+    """API 키 조회 (없으면 ValueError)"""
+    api_key = api_key or os.getenv("FOOTBALL_DATA_API_KEY") or os.getenv("FOOTBALL_API_KEY")
+    if not api_key:
+        raise ValueError(
+            "Football-Data API 키가 필요합니다. "
+            "다음 중 하나를 .env에 설정하세요:\n"
+            "  - FOOTBALL_DATA_API_KEY=your-key\n"
+            "  - FOOTBALL_API_KEY=your-key\n"
+            "가입: https://www.football-data.org/client/register"
+        )
+    return api_key
+
+
+def _extract_teams(data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """순위표 응답에서 팀 정보 추출 (첫 번째 테이블 = 리그 순위)"""
+    standings = data.get("standings", [])
+    if not standings:
+        return []
+
+    teams = []
+    for entry in standings[0].get("table", []):
+        team_data = entry.get("team", {})
+        teams.append({
+            "id": team_data.get("id"),
+            "name": team_data.get("name"),
+            "shortName": team_data.get("shortName", ""),
+            "tla": team_data.get("tla", ""),  # Three Letter Abbreviation
+            "crest": team_data.get("crest", ""),  # 로고 URL
+            "website": team_data.get("website", ""),
+            "founded": team_data.get("founded", ""),
+            "venue": team_data.get("venue", ""),
+            "position": entry.get("position"),  # 순위
+            "points": entry.get("points"),  # 포인트
+            "played_games": entry.get("playedGames"),  # 경기 수
+            "wins": entry.get("won"),
+            "draws": entry.get("draw"),
+            "losses": entry.get("lost"),
+            "goals_for": entry.get("goalsFor"),
+            "goals_against": entry.get("goalsAgainst"),
+            "goal_difference": entry.get("goalDifference"),
+        })
+    return teams
+
 
 class FootballDataClient:
     """Football-Data.org API 클라이언트"""
@@ -34,17 +112,7 @@ class FootballDataClient:
 
     def __init__(self):
         """Football-Data API 클라이언트 초기화"""
-        self.api_key = os.getenv("FOOTBALL_DATA_API_KEY") or os.getenv(
-            "FOOTBALL_API_KEY"
-        )
-        if not self.api_key:
-            raise ValueError(
-                "Football-Data API 키가 필요합니다. "
-                "다음 중 하나를 .env에 설정하세요:\n"
-                "  - FOOTBALL_DATA_API_KEY=your-key\n"
-                "  - FOOTBALL_API_KEY=your-key\n"
-                "가입: https://www.football-data.org/client/register"
-            )
+        self.api_key = _require_api_key()
 
         self.headers = {
             "X-Auth-Token": self.api_key,
@@ -296,41 +364,7 @@ class FootballDataClient:
             response = self.session.get(url, timeout=10)
             response.raise_for_status()
 
-            data = response.json()
-            standings = data.get("standings", [])
-
-            # standings에서 팀 정보 추출
-            teams = []
-            if standings and len(standings) > 0:
-                # 첫 번째 테이블 (일반적으로 리그 순위)
-                table = standings[0].get("table", [])
-
-                # 각 순위 항목에서 팀 정보 추출
-                for entry in table:
-                    team_data = entry.get("team", {})
-
-                    # 팀 데이터 정제
-                    team = {
-                        "id": team_data.get("id"),
-                        "name": team_data.get("name"),
-                        "shortName": team_data.get("shortName", ""),
-                        "tla": team_data.get("tla", ""),  # Three Letter Abbreviation
-                        "crest": team_data.get("crest", ""),  # 로고 URL
-                        "website": team_data.get("website", ""),
-                        "founded": team_data.get("founded", ""),
-                        "venue": team_data.get("venue", ""),
-                        "position": entry.get("position"),  # 순위
-                        "points": entry.get("points"),  # 포인트
-                        "played_games": entry.get("playedGames"),  # 경기 수
-                        "wins": entry.get("won"),
-                        "draws": entry.get("draw"),
-                        "losses": entry.get("lost"),
-                        "goals_for": entry.get("goalsFor"),
-                        "goals_against": entry.get("goalsAgainst"),
-                        "goal_difference": entry.get("goalDifference"),
-                    }
-
-                    teams.append(team)
+            teams = _extract_teams(response.json())
 
             logger.info(
                 f"✅ {competition} {len(teams)}개 팀 조회 성공 " f"(순위표에서 추출)"
@@ -410,3 +444,378 @@ class FootballDataClient:
         """세션 종료"""
         self.session.close()
         logger.info("✅ FootballDataClient 세션 종료")
+
+
+class AsyncFootballDataClient:
+    """
+    Football-Data.org 비동기 클라이언트
+
+    - httpx.AsyncClient 커넥션 풀 공유 (get_async_football_client 싱글톤)
+    - 모든 호출은 프로세스 공용 토큰 버킷을 통과 (우선순위: 라이브 > 경기 > 순위표 > 팀 목록)
+    - 429 응답 시 Retry-After만큼 버킷 전체를 멈추고 대기 예산 안에서 재시도
+    - 응답 헤더(X-Requests-Available-Minute)로 서버 측 남은 호출 수와 동기화
+
+    한도 때문에 처리하지 못하면 RateLimitExceeded (retry_after 포함),
+    그 외 HTTP 오류는 동기 클라이언트와 같이 빈 값(None/[])을 반환한다.
+    """
+
+    COMPETITIONS = FootballDataClient.COMPETITIONS
+    BASE_URL = FootballDataClient.BASE_URL
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        base_url: Optional[str] = None,
+        bucket: Optional[AsyncTokenBucket] = None,
+        max_retries: int = FOOTBALL_API_MAX_RETRIES,
+    ):
+        self.api_key = _require_api_key(api_key)
+        self.bucket = bucket or get_football_rate_limiter()
+        self.max_retries = max_retries
+        self.http = httpx.AsyncClient(
+            base_url=base_url or self.BASE_URL,
+            headers={"X-Auth-Token": self.api_key},
+            timeout=httpx.Timeout(FOOTBALL_API_TIMEOUT_SECONDS),
+            limits=httpx.Limits(
+                max_connections=FOOTBALL_API_MAX_CONNECTIONS,
+                max_keepalive_connections=FOOTBALL_API_MAX_CONNECTIONS,
+            ),
+        )
+        self.requests_sent = 0
+        self.rate_limited = 0
+
+        logger.info("✅ AsyncFootballDataClient 초기화 완료")
+
+    @property
+    def is_closed(self) -> bool:
+        return self.http.is_closed
+
+    # ============================================
+    # 요청 공통 처리 (토큰 버킷 + 429)
+    # ============================================
+
+    @staticmethod
+    def _header_seconds(response: httpx.Response, name: str) -> Optional[float]:
+        value = response.headers.get(name)
+        try:
+            return float(value) if value is not None else None
+        except ValueError:
+            return None
+
+    def _sync_quota(self, response: httpx.Response) -> None:
+        """서버가 알려준 남은 호출 수가 0이면 카운터 리셋까지 버킷 정지"""
+        available = self._header_seconds(response, "X-Requests-Available-Minute")
+        reset = self._header_seconds(response, "X-RequestCounter-Reset")
+        if available is not None and available <= 0 and reset:
+            self.bucket.pause(reset)
+
+    def _retry_after(self, response: httpx.Response) -> float:
+        """429 응답의 대기 시간 (Retry-After → X-RequestCounter-Reset → 토큰 1개 충전 시간)"""
+        for name in ("Retry-After", "X-RequestCounter-Reset"):
+            seconds = self._header_seconds(response, name)
+            if seconds is not None:
+                return max(seconds, 0.0)
+        return 1 / self.bucket.refill_per_second
+
+    async def _request(
+        self,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        priority: RequestPriority = RequestPriority.MATCH,
+        max_wait: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """
+        토큰 버킷을 거쳐 GET 요청
+
+        Args:
+            path: BASE_URL 기준 경로 (예: "/matches")
+            priority: 호출 우선순위
+            max_wait: 최대 대기 시간 (None이면 PRIORITY_MAX_WAIT_SECONDS)
+
+        Raises:
+            RateLimitExceeded: 대기 예산 안에 호출할 수 없음 (큐 대기 또는 429 반복)
+            httpx.HTTPError: 429 이외의 HTTP/네트워크 오류
+        """
+        budget = PRIORITY_MAX_WAIT_SECONDS[priority] if max_wait is None else max_wait
+        deadline = time.monotonic() + budget
+
+        retry_after = 0.0
+        for attempt in range(self.max_retries + 1):
+            await self.bucket.acquire(priority, max_wait=max(0.0, deadline - time.monotonic()))
+            response = await self.http.get(path, params=params)
+            self.requests_sent += 1
+
+            if response.status_code != 429:
+                self._sync_quota(response)
+                response.raise_for_status()
+                return response.json()
+
+            self.rate_limited += 1
+            retry_after = self._retry_after(response)
+            self.bucket.pause(retry_after)
+            logger.warning(
+                f"⚠️ Football-Data 429 ({path}), {retry_after:.1f}s 후 재시도 "
+                f"({attempt + 1}/{self.max_retries + 1})"
+            )
+
+        raise RateLimitExceeded(f"Football-Data 429 반복: {path}", retry_after=retry_after)
+
+    def _competition_id(self, competition: str) -> int:
+        comp_id = self.COMPETITIONS.get(competition)
+        if not comp_id:
+            raise ValueError(
+                f"지원하지 않는 리그: {competition}. "
+                f"지원: {list(self.COMPETITIONS.keys())}"
+            )
+        return comp_id
+
+    # ============================================
+    # 1. 경기 정보 (Matches)
+    # ============================================
+
+    async def get_matches(
+        self, competition: str = "PL", status: str = "FINISHED", limit: int = 10
+    ) -> List[Dict[str, Any]]:
+        """경기 목록 조회 (FootballDataClient.get_matches 비동기 버전)"""
+        comp_id = self._competition_id(competition)
+        priority = RequestPriority.LIVE if status == "LIVE" else RequestPriority.MATCH
+        try:
+            data = await self._request(
+                f"/competitions/{comp_id}/matches",
+                params={"status": status, "limit": min(limit, 100)},
+                priority=priority,
+            )
+            matches = data.get("matches", [])
+            logger.info(f"✅ {len(matches)}개 경기 조회 성공 ({competition}, {status})")
+            return matches
+        except httpx.HTTPError as e:
+            logger.error(f"❌ 경기 조회 실패: {e}")
+            return []
+
+    async def get_match_details(self, match_id: int) -> Optional[Dict[str, Any]]:
+        """특정 경기 상세 정보 조회"""
+        try:
+            match = await self._request(f"/matches/{match_id}", priority=RequestPriority.MATCH)
+            logger.info(f"✅ 경기 상세 조회 성공 (ID: {match_id})")
+            return match
+        except httpx.HTTPError as e:
+            logger.error(f"❌ 경기 상세 조회 실패 (ID: {match_id}): {e}")
+            return None
+
+    async def get_live_matches(self) -> List[Dict[str, Any]]:
+        """진행 중인 경기 조회 (최우선)"""
+        try:
+            data = await self._request(
+                "/matches", params={"status": "LIVE", "limit": 100}, priority=RequestPriority.LIVE
+            )
+            matches = data.get("matches", [])
+            logger.info(f"✅ {len(matches)}개 라이브 경기 조회")
+            return matches
+        except httpx.HTTPError as e:
+            logger.error(f"❌ 라이브 경기 조회 실패: {e}")
+            return []
+
+    # ============================================
+    # 2. 순위표 / 팀 정보
+    # ============================================
+
+    async def get_standings(self, competition: str = "PL") -> Optional[Dict[str, Any]]:
+        """순위표 조회"""
+        comp_id = self._competition_id(competition)
+        try:
+            data = await self._request(
+                f"/competitions/{comp_id}/standings", priority=RequestPriority.STANDINGS
+            )
+            logger.info(f"✅ {competition} 순위표 조회 성공")
+            return data
+        except httpx.HTTPError as e:
+            logger.error(f"❌ 순위표 조회 실패 ({competition}): {e}")
+            return None
+
+    async def get_team_info(self, team_id: int) -> Optional[Dict[str, Any]]:
+        """팀 상세 정보 조회"""
+        try:
+            team = await self._request(f"/teams/{team_id}", priority=RequestPriority.TEAMS)
+            logger.info(f"✅ 팀 정보 조회 성공 (ID: {team_id})")
+            return team
+        except httpx.HTTPError as e:
+            logger.error(f"❌ 팀 정보 조회 실패 (ID: {team_id}): {e}")
+            return None
+
+    async def get_team_squad(self, team_id: int) -> Optional[List[Dict[str, Any]]]:
+        """팀 선수단 조회"""
+        team_info = await self.get_team_info(team_id)
+        if team_info:
+            squad = team_info.get("squad", [])
+            logger.info(f"✅ 팀 선수단 조회 성공: {len(squad)}명")
+            return squad
+        return None
+
+    async def get_teams_by_competition(self, competition: str = "PL") -> List[Dict[str, Any]]:
+        """특정 리그의 모든 팀 조회 (순위표에서 추출)"""
+        comp_id = self._competition_id(competition)
+        try:
+            data = await self._request(
+                f"/competitions/{comp_id}/standings", priority=RequestPriority.TEAMS
+            )
+            teams = _extract_teams(data)
+            logger.info(f"✅ {competition} {len(teams)}개 팀 조회 성공 (순위표에서 추출)")
+            return teams
+        except httpx.HTTPError as e:
+            logger.error(f"❌ 팀 조회 실패 ({competition}): {e}")
+            return []
+
+    async def get_competitions(self) -> List[Dict[str, Any]]:
+        """리그 목록 조회"""
+        data = await self._request("/competitions", priority=RequestPriority.TEAMS)
+        competitions = data.get("competitions", [])
+        logger.info(f"✅ 리그 목록 조회 성공: {len(competitions)}개")
+        return competitions
+
+    # ============================================
+    # 3. 유틸리티
+    # ============================================
+
+    parse_match_data = FootballDataClient.parse_match_data
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "requests_sent": self.requests_sent,
+            "rate_limited": self.rate_limited,
+            "bucket": self.bucket.get_stats(),
+        }
+
+    async def close(self):
+        """커넥션 풀 종료"""
+        await self.http.aclose()
+        logger.info("✅ AsyncFootballDataClient 세션 종료")
+
+
+# ============================================
+# 싱글톤 인스턴스 (첫 사용 시 생성)
+# ============================================
+_football_client: Optional[FootballDataClient] = None
+
+
+def get_football_client() -> FootballDataClient:
+    """
+    공용 FootballDataClient 반환 (동기, 스크립트용)
+
+    호출 한도 버킷을 거치지 않으므로 서버 코드(라우터/Agent Tool)는
+    get_async_football_client / call_football_api를 사용할 것.
+    API 키가 없으면 호출 시점에 ValueError (라우터 import는 실패하지 않음)
+    """
+    global _football_client
+    if _football_client is None:
+        _football_client = FootballDataClient()
+    return _football_client
+
+
+_football_rate_limiter: Optional[AsyncTokenBucket] = None
+_async_football_client: Optional[AsyncFootballDataClient] = None
+# 서버 루프가 없을 때(스크립트 / 서버 시작 전후) 동기 호출자용 버킷 (한 번에 한 스레드만 사용)
+_fallback_rate_limiter: Optional[AsyncTokenBucket] = None
+_fallback_lock = threading.Lock()
+
+
+def _new_rate_limiter() -> AsyncTokenBucket:
+    return AsyncTokenBucket(
+        capacity=FOOTBALL_API_BURST,
+        refill_per_second=FOOTBALL_API_RATE_LIMIT_PER_MINUTE / 60,
+    )
+
+
+def get_football_rate_limiter() -> AsyncTokenBucket:
+    """프로세스 공용 Football-Data 토큰 버킷 (10 requests/minute, lifespan에서 서버 루프에 바인딩)"""
+    global _football_rate_limiter
+    if _football_rate_limiter is None:
+        _football_rate_limiter = _new_rate_limiter()
+    return _football_rate_limiter
+
+
+def get_async_football_client() -> AsyncFootballDataClient:
+    """
+    공용 AsyncFootballDataClient 반환 (종료된 경우 새로 생성)
+
+    API 키가 없으면 ValueError
+    """
+    global _async_football_client
+    if _async_football_client is None or _async_football_client.is_closed:
+        _async_football_client = AsyncFootballDataClient()
+    return _async_football_client
+
+
+T = TypeVar("T")
+
+
+def call_football_api(fetch: Callable[[AsyncFootballDataClient], Awaitable[T]]) -> T:
+    """
+    동기 코드(Agent Tool executor 스레드)에서 공용 AsyncFootballDataClient 호출
+
+    토큰 버킷이 묶인 서버 이벤트 루프에서 실행 → 라우터/갱신기와 같은 호출 한도/우선순위를 따름.
+    서버 루프가 없으면(스크립트 등) 잠금으로 한 번에 한 스레드씩, 새 루프에서 임시 클라이언트와
+    대체용 버킷으로 호출 (공용 버킷을 임시 루프에 바인딩하지 않음).
+
+    Example:
+        >>> match = call_football_api(lambda client: client.get_match_details(12345))
+
+    Raises:
+        RateLimitExceeded: 호출 한도 때문에 대기 예산 안에 처리하지 못함
+    """
+    loop = get_football_rate_limiter().loop
+    if loop is not None and loop.is_running():
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            raise RuntimeError("이벤트 루프 안에서는 AsyncFootballDataClient를 직접 await 할 것")
+
+        async def run_on_loop():
+            return await fetch(get_async_football_client())
+
+        return asyncio.run_coroutine_threadsafe(run_on_loop(), loop).result()
+
+    global _fallback_rate_limiter
+    with _fallback_lock:
+        if _fallback_rate_limiter is None:
+            _fallback_rate_limiter = _new_rate_limiter()
+
+        async def run_once():
+            client = AsyncFootballDataClient(bucket=_fallback_rate_limiter)
+            try:
+                return await fetch(client)
+            finally:
+                await client.close()
+
+        return asyncio.run(run_once())
+
+
+async def close_football_clients() -> None:
+    """공용 Football-Data 클라이언트 종료 (lifespan shutdown에서 호출)"""
+    global _async_football_client
+    if _async_football_client is not None:
+        await _async_football_client.close()
+        _async_football_client = None
+
+
+# ============================================
+# 공용 캐시 (라우터 / 백그라운드 갱신기 / Agent Tool)
+# ============================================
+_football_cache: Optional[TwoTierCache] = None
+
+
+def standings_cache_key(competition: str) -> str:
+    return f"standings_{competition}"
+
+
+def matches_cache_key(competition: str, status: str, limit: int) -> str:
+    return f"matches_{competition}_{status}_{limit}"
+
+
+def get_football_cache() -> TwoTierCache:
+    """프로세스 공용 Football 데이터 캐시 (L1 + SingleFlight)"""
+    global _football_cache
+    if _football_cache is None:
+        _football_cache = TwoTierCache(maxsize=FOOTBALL_L1_CACHE_SIZE)
+    return _football_cache
@@ -0,0 +1,237 @@
+"""
+우선순위 토큰 버킷 (asyncio)
+외부 API 호출 한도(예: Football-Data 10 requests/minute)를 프로세스 단위로 지키기 위한 스케줄러
+
+- 토큰이 있으면 즉시 통과, 없으면 우선순위 큐에서 대기
+- 토큰이 생기면 우선순위가 높은 호출(숫자가 작은 것)부터 깨움 (같은 우선순위는 FIFO)
+- 예상 대기 시간이 max_wait를 넘으면 대기하지 않고 RateLimitExceeded (부하 차단)
+- 서버가 429를 주면 pause()로 Retry-After 동안 모든 호출을 멈춤
+
+Example:
+    >>> bucket = AsyncTokenBucket(capacity=10, refill_per_second=10 / 60)
+    >>> await bucket.acquire(RequestPriority.LIVE, max_wait=30)
+"""
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from enum import IntEnum
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class RequestPriority(IntEnum):
+    """호출 우선순위 (작을수록 먼저)"""
+
+    LIVE = 0       # 라이브 스코어
+    MATCH = 1      # 경기 상세/일정
+    STANDINGS = 2  # 순위표
+    TEAMS = 3      # 팀/리그 목록 (거의 변하지 않음)
+
+
+class RateLimitExceeded(Exception):
+    """호출 한도 때문에 요청을 처리하지 않음 (retry_after초 후 재시도 권장)"""
+
+    def __init__(self, message: str, retry_after: float = 0.0):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class AsyncTokenBucket:
+    """
+    우선순위 대기열이 있는 토큰 버킷
+
+    Args:
+        capacity: 최대 토큰 수 (순간 허용 버스트)
+        refill_per_second: 초당 충전 토큰 수
+    """
+
+    def __init__(self, capacity: float, refill_per_second: float):
+        self.capacity = capacity
+        self.refill_per_second = refill_per_second
+        self._tokens = float(capacity)
+        self._updated_at = time.monotonic()
+        self._paused_until = 0.0
+        self._waiters: List[list] = []  # [priority, seq, future]
+        self._seq = itertools.count()
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+        self.acquired = 0
+        self.waited = 0
+        self.shed = 0
+        self.pauses = 0
+
+    # ============================================
+    # 내부 상태
+    # ============================================
+
+    def _refill(self, now: float) -> None:
+        if now > self._updated_at:
+            self._tokens = min(
+                self.capacity,
+                self._tokens + (now - self._updated_at) * self.refill_per_second,
+            )
+            self._updated_at = now
+
+    def _bind_loop(self) -> asyncio.AbstractEventLoop:
+        """
+        현재 이벤트 루프에 바인딩
+
+        이전 루프가 끝났을 때만 다시 바인딩 (그 루프의 대기열은 버림).
+        다른 스레드에서 아직 돌고 있는 루프에 묶여 있으면 RuntimeError
+        (대기열을 버리면 그 루프의 대기자가 영원히 깨어나지 않음)
+        """
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            if self._loop is not None and self._loop.is_running():
+                raise RuntimeError("토큰 버킷이 다른 스레드에서 실행 중인 이벤트 루프에 묶여 있음")
+            self._loop = loop
+            self._waiters = []
+            self._timer = None
+        return loop
+
+    def bind_loop(self, loop: asyncio.AbstractEventLoop) -> None:
+        """서버 이벤트 루프에 미리 바인딩 (lifespan에서, 스레드의 동기 호출자가 이 루프로 보내도록)"""
+        if self._loop is not loop:
+            if self._loop is not None and self._loop.is_running():
+                raise RuntimeError("토큰 버킷이 다른 스레드에서 실행 중인 이벤트 루프에 묶여 있음")
+            self._loop = loop
+            self._waiters = []
+            self._timer = None
+
+    def _pending(self) -> List[list]:
+        return [w for w in self._waiters if not w[2].done()]
+
+    def estimate_wait(self, priority: int = RequestPriority.MATCH) -> float:
+        """지금 요청하면 토큰을 받기까지 예상 대기 시간 (초)"""
+        now = time.monotonic()
+        self._refill(now)
+        ahead = sum(1 for w in self._pending() if w[0] <= priority)
+        paused = max(0.0, self._paused_until - now)
+        needed = ahead + 1 - self._tokens
+        if needed <= 0:
+            return paused
+        return paused + needed / self.refill_per_second
+
+    def _schedule(self) -> None:
+        """다음 토큰 시점에 _dispatch 예약"""
+        if self._timer is not None or not self._waiters or self._loop is None:
+            return
+        now = time.monotonic()
+        self._refill(now)
+        delay = max(0.0, self._paused_until - now)
+        if self._tokens < 1:
+            delay = max(delay, (1 - self._tokens) / self.refill_per_second)
+        self._timer = self._loop.call_later(delay, self._dispatch)
+
+    def _dispatch(self) -> None:
+        """토큰이 있는 만큼 우선순위 순으로 대기자 깨우기"""
+        self._timer = None
+        now = time.monotonic()
+        self._refill(now)
+        while self._waiters and self._tokens >= 1 and now >= self._paused_until:
+            _, _, future = heapq.heappop(self._waiters)
+            if future.done():  # 취소된 대기자
+                continue
+            self._tokens -= 1
+            future.set_result(None)
+        self._schedule()
+
+    # ============================================
+    # 공개 API
+    # ============================================
+
+    async def acquire(
+        self,
+        priority: int = RequestPriority.MATCH,
+        max_wait: Optional[float] = None,
+    ) -> float:
+        """
+        토큰 1개 획득 (필요하면 대기)
+
+        Args:
+            priority: RequestPriority (작을수록 먼저)
+            max_wait: 최대 대기 시간 (초). 예상 대기가 이를 넘으면 즉시 RateLimitExceeded
+
+        Returns:
+            실제 대기한 시간 (초)
+        """
+        self._bind_loop()
+        now = time.monotonic()
+        self._refill(now)
+
+        if not self._pending() and self._tokens >= 1 and now >= self._paused_until:
+            self._tokens -= 1
+            self.acquired += 1
+            return 0.0
+
+        wait = self.estimate_wait(priority)
+        if max_wait is not None and wait > max_wait:
+            self.shed += 1
+            raise RateLimitExceeded(
+                f"호출 한도 초과 (예상 대기 {wait:.1f}s > {max_wait:.1f}s)",
+                retry_after=wait,
+            )
+
+        future = self._loop.create_future()
+        heapq.heappush(self._waiters, [int(priority), next(self._seq), future])
+        self._schedule()
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # 토큰을 받은 직후 취소되면 반납하고 다음 대기자 깨우기
+                self._tokens = min(self.capacity, self._tokens + 1)
+                self._redispatch()
+            raise
+
+        self.acquired += 1
+        self.waited += 1
+        return time.monotonic() - now
+
+    @property
+    def loop(self) -> Optional[asyncio.AbstractEventLoop]:
+        """버킷이 묶인 이벤트 루프 (스레드의 동기 호출자가 같은 루프에서 대기하도록)"""
+        return self._loop
+
+    def pause(self, seconds: float) -> None:
+        """
+        seconds 동안 모든 호출 중지 (서버 429 / 남은 호출 0일 때)
+
+        남은 토큰도 비워서 재개 직후 버스트로 다시 429가 나지 않게 한다.
+        """
+        now = time.monotonic()
+        self._refill(now)
+        self._paused_until = max(self._paused_until, now + seconds)
+        self._tokens = min(self._tokens, 0.0)
+        self.pauses += 1
+        logger.warning(f"⏸️ 호출 일시 중지: {seconds:.1f}s")
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        self._schedule()
+
+    def _redispatch(self) -> None:
+        """예약된 타이머를 버리고 지금 바로 _dispatch (토큰이 반납됐을 때)"""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        self._dispatch()
+
+    def get_stats(self) -> Dict[str, Any]:
+        now = time.monotonic()
+        self._refill(now)
+        return {
+            "tokens": round(self._tokens, 2),
+            "capacity": self.capacity,
+            "refill_per_second": self.refill_per_second,
+            "queued": len(self._pending()),
+            "paused_for": round(max(0.0, self._paused_until - now), 2),
+            "acquired": self.acquired,
+            "waited": self.waited,
+            "shed": self.shed,
+            "pauses": self.pauses,
+        }
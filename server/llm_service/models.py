@@ -37,7 +37,7 @@ class ChatResponse(BaseModel):
     cache_source: str = Field(
         default="none",
         description="캐시 출처",
-        pattern="^(chromadb|firestore|llm|none)$"
+        pattern="^(memory|chromadb|firestore|llm|none)$"
     )
     cost_saved: float = Field(
         default=0.0,
@@ -72,13 +72,18 @@ class MatchAnalysisRequest(BaseModel):
         pattern="^(brief|standard|detailed)$"
     )
     include_prediction: bool = Field(default=False, description="경기 결과 예측 포함 여부")
+    league: Optional[str] = Field(
+        default=None,
+        description="RAG 검색 리그 코드 (PL, LA, BL 등, 없으면 경기의 대회 코드)"
+    )
 
     class Config:
         json_schema_extra = {
             "example": {
                 "match_id": 401828,
                 "detail_level": "standard",
-                "include_prediction": True
+                "include_prediction": True,
+                "league": "PL"
             }
         }
 
@@ -2,13 +2,26 @@
 LLM Service 라우터 모듈
 
 모든 라우터를 한 곳에서 관리
+(첫 접근 시 임포트 → main._import_router로 라우터 하나를 import할 때 다른 라우터의 실패가 번지지 않음)
 """
-from .chat import router as chat_router
-from .match_analysis import router as analysis_router
-from .player_compare import router as compare_router
+_LAZY_EXPORTS = {
+    "chat_router": ".chat",
+    "analysis_router": ".match_analysis",
+    "compare_router": ".player_compare",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        import importlib
+
+        module = importlib.import_module(_LAZY_EXPORTS[name], __name__)
+        return module.router
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "chat_router",
     "analysis_router", 
     "compare_router"
-]
\ No newline at end of file
+]
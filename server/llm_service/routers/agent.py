@@ -5,59 +5,46 @@ POST /api/llm/agent/stream (스트리밍 버전)
 """
 from fastapi import APIRouter, HTTPException
 from fastapi.responses import StreamingResponse
-from typing import List, AsyncGenerator
+from typing import List, AsyncGenerator, Optional
 import logging
 from datetime import datetime
 import json
 
 from ..models import AgentRequest, AgentResponse, ErrorResponse, ChatRequest, ChatResponse
-from ..services.openai_service import OpenAIService
-from ..services.content_safety_service import ContentSafetyService
-from ..services.cache_service import CacheService
+from ..services.openai_service import get_openai_service
+from ..services.content_safety_service import get_content_safety_service
+from ..services.cache_service import get_cache_service
 from ..tools import (
     RAGSearchTool,
     MatchAnalysisTool,
     PlayerCompareTool,
     PostsSearchTool,
-    create_fan_preference_tool,
+    PersonalizedFanPreferenceTool,
     CalendarTool,
+    PersonalizedCalendarTool,
     YouTubeHighlightTool,
     WeatherTool,
 )
-from ..tools.calendar_tool import calendar_query
 # 비용 최적화: 하이브리드 방식 (단순 질문은 chat.py, 복잡한 질문만 Agent)
-from ..utils.question_classifier import is_complex_question
+from ..utils.question_classifier import get_classifier_stats, is_complex_question
+from ..utils.agent_stream import (
+    AgentStreamCallbackHandler,
+    StreamTextFilter,
+    TOOL_STATUS_MESSAGES,
+    ToolUsageCallbackHandler,
+)
+from ..utils.agent_factory import AgentFactory, run_agent
 from ..routers.chat import chat as chat_endpoint  # 기존 chat 엔드포인트 함수
-from langchain.agents import initialize_agent, AgentType
-from langchain_openai import ChatOpenAI
+from ..routers.chat import confirm_input_safe, raise_if_unsafe_input
+import contextvars
 import os
+import threading
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/agent", tags=["AI Agent"])
 
-# 서비스 초기화
-openai_service = OpenAIService()
-
-# CacheService 초기화
-try:
-    cache_service = CacheService()
-except Exception as e:
-    logger.warning(f"⚠️ CacheService 초기화 실패 (캐시 기능 비활성화): {e}")
-    cache_service = None
-
-# Content Safety Service 초기화
-try:
-    content_safety_service = ContentSafetyService()
-except Exception as e:
-    logger.warning(f"⚠️ ContentSafetyService 초기화 실패 (필터링 기능 비활성화): {e}")
-    content_safety_service = None
-
-# LangChain LLM 초기화
-llm = ChatOpenAI(
-    model=os.getenv("OPENAI_CHAT_MODEL", "gpt-4o-mini"),
-    temperature=0.7
-)
+# 서비스(OpenAI/CacheService/ContentSafety)는 요청 시 get_xxx()로 조회 (첫 사용 시 생성)
 
 # Tool 리스트 (기본 - user_id 없이 사용)
 base_tools = [
@@ -70,16 +57,29 @@ base_tools = [
     WeatherTool,
 ]
 
-# Agent 초기화 (기본 - user_id 없이 사용)
-base_agent = initialize_agent(
-    tools=base_tools,
-    llm=llm,
-    agent=AgentType.ZERO_SHOT_REACT_DESCRIPTION,
-    verbose=True,
-    handle_parsing_errors=True,
-    max_iterations=10,  # 최대 반복 횟수 제한
-    max_execution_time=60  # 최대 실행 시간 60초
-)
+# Agent 팩토리 (첫 Agent 요청 시 생성, Tool 구성별로 한 번만 initialize_agent)
+_agent_factory: Optional[AgentFactory] = None
+_agent_factory_lock = threading.Lock()
+
+
+def get_agent_factory() -> AgentFactory:
+    """Agent 팩토리 반환 (LangChain LLM은 첫 호출 시 생성)"""
+    global _agent_factory
+    if _agent_factory is None:
+        with _agent_factory_lock:
+            if _agent_factory is None:
+                from langchain_openai import ChatOpenAI
+
+                model = os.getenv("OPENAI_CHAT_MODEL", "gpt-4o-mini")
+                _agent_factory = AgentFactory(
+                    base_tools=base_tools,
+                    personalized_tools=[PersonalizedFanPreferenceTool, PersonalizedCalendarTool],
+                    llm=ChatOpenAI(model=model, temperature=0.7),
+                    # 스트리밍용 LLM (토큰 단위 콜백 → SSE 전송)
+                    streaming_llm=ChatOpenAI(model=model, temperature=0.7, streaming=True),
+                )
+    return _agent_factory
+
 
 # Agent 시스템 프롬프트 (하이브리드: 복잡한 질문만 ReAct)
 # 제민의 제안 3: ReAct 방식 강제 (하이브리드 최적화: 복잡한 질문만)
@@ -151,28 +151,19 @@ async def agent_chat(request: AgentRequest) -> AgentResponse:
     try:
         logger.info(f"🤖 Agent 요청: {request.query}")
 
+        openai_service = get_openai_service()
+        cache_service = get_cache_service()
+        content_safety_service = get_content_safety_service()
+
         # ============================================
         # 🛡️ STEP 1: 입력 게이트웨이 - 사용자 쿼리 필터링
         # ============================================
+        # optimistic 모드면 LLM 검사는 질문 분류/Agent 실행과 동시에 진행되고 응답 직전에 확인
+        safety_check = None
         if content_safety_service:
             logger.debug("🛡️ 입력 필터링 중...")
-            input_check = content_safety_service.check_input(request.query)
-            
-            if not input_check.is_safe:
-                logger.warning(
-                    f"🚫 유해 콘텐츠 감지 (입력): "
-                    f"카테고리={input_check.category}, "
-                    f"감지된 단어={input_check.detected_words}"
-                )
-                raise HTTPException(
-                    status_code=400,
-                    detail={
-                        "error": "부적절한 내용이 포함된 요청입니다.",
-                        "error_code": "INAPPROPRIATE_CONTENT",
-                        "category": input_check.category.value if input_check.category else None,
-                        "reason": input_check.reason
-                    }
-                )
+            safety_check = await content_safety_service.begin_check(request.query)
+            raise_if_unsafe_input(safety_check.current)
             logger.debug("✅ 입력 필터링 통과")
 
         # ============================================
@@ -187,6 +178,7 @@ async def agent_chat(request: AgentRequest) -> AgentResponse:
             logger.info("💰 단순 질문 감지 → chat.py 사용 (비용 최적화: LLM 1회 호출)")
             chat_request = ChatRequest(query=request.query, top_k=5)
             chat_response = await chat_endpoint(chat_request)
+            await confirm_input_safe(safety_check)
             
             # ChatResponse를 AgentResponse로 변환
             return AgentResponse(
@@ -208,61 +200,40 @@ async def agent_chat(request: AgentRequest) -> AgentResponse:
         # ============================================
         logger.debug("🤖 Agent 실행 중...")
         
-        # user_id가 있으면 FanPreferenceTool 및 CalendarTool (user_id 포함) 활성화
-        tools = base_tools.copy()
-        agent = base_agent
+        # user_id가 있으면 개인화 Agent 사용 (FanPreferenceTool + CalendarTool 개인화 버전)
+        agent_factory = get_agent_factory()
+        agent = agent_factory.get_agent()
         # 제민의 제안 3: ReAct 프롬프트 사용 (Hallucination 방지, 정확도 향상)
         # 복잡한 질문이므로 ReAct 형식으로 명시적 사고 과정 유도
         system_prompt = REACT_AGENT_SYSTEM_PROMPT
         
         if request.user_id:
             logger.info(f"👤 사용자 ID 제공됨: {request.user_id} → FanPreferenceTool 및 CalendarTool (개인화) 활성화")
-            
-            # user_id가 있으면 FanPreferenceTool 추가
-            fan_tool = create_fan_preference_tool(user_id=request.user_id)
-            tools.append(fan_tool)
-            
-            # CalendarTool을 user_id 포함 버전으로 교체
-            from langchain.tools import Tool
-            calendar_tool_with_user = Tool(
-                name="calendar",
-                description="경기 일정을 조회하는 도구입니다. 지원 기능: 1) 특정 날짜 경기 ('오늘 경기', '내일 경기', '12월 25일 경기 일정'), 2) 특정 팀 경기 ('토트넘 경기', '맨유 경기'), 3) 사용자 선호 팀 경기 ('내가 좋아하는 팀 경기', '내 팀 경기'), 4) 주간 요약 ('이번 주 경기', '주간 일정'), 5) 월간 요약 ('이번 달 경기', '월간 일정'). 날짜 형식: '오늘', '내일', '2025-12-25', '12월 25일' 등.",
-                func=lambda query: calendar_query(query.strip(), user_id=request.user_id)
-            )
-            
-            # 기존 CalendarTool 제거하고 새로 추가
-            tools = [t for t in tools if t.name != "calendar"]
-            tools.append(calendar_tool_with_user)
-            
-            # Agent 재초기화 (새로운 Tool 포함)
-            agent = initialize_agent(
-                tools=tools,
-                llm=llm,
-                agent=AgentType.ZERO_SHOT_REACT_DESCRIPTION,
-                verbose=True,
-                handle_parsing_errors=True,
-                max_iterations=10,  # 최대 반복 횟수 제한
-                max_execution_time=60  # 최대 실행 시간 60초
-            )
+            agent = agent_factory.get_agent(personalized=True)
             
             # 프롬프트에 user_id 포함 (ReAct 프롬프트 사용)
             system_prompt = REACT_AGENT_SYSTEM_PROMPT + f"\n\n중요: 현재 사용자 ID는 {request.user_id}입니다. fan_preference 도구와 calendar 도구를 사용할 때는 이 ID를 활용하여 개인화된 답변을 제공하세요."
         
-        # Agent 실행 (동기 함수이므로 별도 스레드에서 실행)
+        # Agent 실행 (동기 함수이므로 별도 스레드에서 실행, user_id는 실행 시점에 바인딩)
+        # 실제 호출된 Tool은 콜백으로 기록, 요청 컨텍스트(임베딩 카운터 등)는 복사해서 실행
         import asyncio
         loop = asyncio.get_event_loop()
         final_prompt = system_prompt + "\n\n사용자 질문: " + request.query
+        tool_usage = ToolUsageCallbackHandler()
         result = await loop.run_in_executor(
             None,
-            lambda: agent.run(final_prompt)
+            contextvars.copy_context().run,
+            lambda: run_agent(agent, final_prompt, user_id=request.user_id, callbacks=[tool_usage])
         )
 
         # ============================================
         # 🛡️ STEP 4: 출력 필터 - LLM 응답 필터링
         # ============================================
+        await confirm_input_safe(safety_check)
+
         if content_safety_service:
             logger.debug("🛡️ 출력 필터링 중...")
-            output_check = content_safety_service.check_output(result)
+            output_check = await content_safety_service.check_output_async(result)
             
             if not output_check.is_safe:
                 logger.warning(
@@ -275,24 +246,9 @@ async def agent_chat(request: AgentRequest) -> AgentResponse:
                 logger.info("✅ 출력 필터링 적용 (유해 콘텐츠 마스킹)")
 
         # ============================================
-        # ✅ STEP 5: 사용된 Tool 추출 (간단한 추정)
+        # ✅ STEP 5: 사용된 Tool (콜백 기록, 스트리밍 경로와 동일)
         # ============================================
-        # Agent가 사용한 Tool은 로그에서 확인 가능하지만,
-        # 여기서는 간단하게 질문 내용으로 추정
-        tools_used = []
-        query_lower = request.query.lower()
-        if "커뮤니티" in query_lower or "게시판" in query_lower or "게시글" in query_lower or "글" in query_lower:
-            tools_used.append("posts_search")
-        if "경기" in query_lower or "match" in query_lower:
-            tools_used.append("match_analysis")
-        if "비교" in query_lower or "compare" in query_lower:
-            tools_used.append("player_compare")
-        if "오늘" in query_lower or "내일" in query_lower or "경기 일정" in query_lower or "일정" in query_lower:
-            tools_used.append("calendar")
-        if "내가 좋아하는" in query_lower or "내 팀" in query_lower or "내 선호도" in query_lower or "fanpicker" in query_lower:
-            tools_used.append("fan_preference")
-        if not tools_used:
-            tools_used.append("rag_search")  # 기본적으로 RAG 검색 사용
+        tools_used = tool_usage.tools_used or ["rag_search"]
 
         # 토큰 수 계산 (간단한 추정)
         tokens_used = openai_service.count_tokens(request.query) + openai_service.count_tokens(result)
@@ -339,17 +295,24 @@ async def agent_chat_stream(request: AgentRequest):
     async def generate_stream() -> AsyncGenerator[str, None]:
         try:
             logger.info(f"🤖 Agent 스트리밍 요청: {request.query}")
+
+            content_safety_service = get_content_safety_service()
             
-            # 입력 필터링
+            # 입력 필터링 (optimistic 모드면 LLM 검사는 답변 전송 직전에 확인)
+            unsafe_msg = json.dumps({
+                "type": "error",
+                "message": "부적절한 내용이 포함된 요청입니다."
+            })
+            safety_check = None
             if content_safety_service:
-                input_check = content_safety_service.check_input(request.query)
-                if not input_check.is_safe:
-                    error_msg = json.dumps({
-                        "type": "error",
-                        "message": "부적절한 내용이 포함된 요청입니다."
-                    })
-                    yield f"data: {error_msg}\n\n"
+                safety_check = await content_safety_service.begin_check(request.query)
+                if not safety_check.current.is_safe:
+                    yield f"data: {unsafe_msg}\n\n"
                     return
+
+            async def input_rejected() -> bool:
+                """답변 전송 직전 최종 입력 검사 (진행 중인 LLM 검사 대기)"""
+                return safety_check is not None and not (await safety_check.result()).is_safe
             
             # 질문 분류
             yield f"data: {json.dumps({'type': 'status', 'message': '질문을 분석하는 중...'})}\n\n"
@@ -359,7 +322,14 @@ async def agent_chat_stream(request: AgentRequest):
                 # 단순 질문은 chat.py로 처리 (타이핑 효과로 스트리밍)
                 yield f"data: {json.dumps({'type': 'status', 'message': '답변을 생성하는 중...'})}\n\n"
                 chat_request = ChatRequest(query=request.query, top_k=5)
-                chat_response = await chat_endpoint(chat_request)
+                try:
+                    chat_response = await chat_endpoint(chat_request)
+                except HTTPException as e:
+                    if e.status_code != 400:
+                        raise
+                    # chat 쪽 입력 검사(LLM)에서 차단
+                    yield f"data: {unsafe_msg}\n\n"
+                    return
                 
                 # 답변을 타이핑 효과로 스트리밍
                 yield f"data: {json.dumps({'type': 'answer_start', 'tools_used': ['rag_search']})}\n\n"
@@ -376,106 +346,69 @@ async def agent_chat_stream(request: AgentRequest):
             # 복잡 질문 - Agent 사용
             yield f"data: {json.dumps({'type': 'status', 'message': '복잡한 질문이 감지되었습니다. 적절한 도구를 선택하는 중...'})}\n\n"
             
-            # Agent 설정
-            tools = base_tools.copy()
+            # Agent 선택 (스트리밍 LLM, user_id 유무에 따라 개인화 Tool 구성)
+            agent = get_agent_factory().get_agent(personalized=bool(request.user_id), streaming=True)
             system_prompt = REACT_AGENT_SYSTEM_PROMPT
-            
-            # 기본 Agent 초기화
-            agent = initialize_agent(
-                tools=tools,
-                llm=llm,
-                agent=AgentType.ZERO_SHOT_REACT_DESCRIPTION,
-                verbose=True,
-                handle_parsing_errors=True,
-                max_iterations=10,  # 최대 반복 횟수 제한
-                max_execution_time=60  # 최대 실행 시간 60초
-            )
-            
             if request.user_id:
-                fan_tool = create_fan_preference_tool(user_id=request.user_id)
-                tools.append(fan_tool)
-                from langchain.tools import Tool
-                calendar_tool_with_user = Tool(
-                    name="calendar",
-                    description="경기 일정을 조회하는 도구입니다...",
-                    func=lambda query: calendar_query(query.strip(), user_id=request.user_id)
-                )
-                tools = [t for t in tools if t.name != "calendar"]
-                tools.append(calendar_tool_with_user)
-                
-                agent = initialize_agent(
-                    tools=tools,
-                    llm=llm,
-                    agent=AgentType.ZERO_SHOT_REACT_DESCRIPTION,
-                    verbose=True,
-                    handle_parsing_errors=True
-                )
                 system_prompt = REACT_AGENT_SYSTEM_PROMPT + f"\n\n중요: 현재 사용자 ID는 {request.user_id}입니다."
             
-            # Tool 실행 추적을 위한 콜백
-            tools_used = []
-            tool_messages = {
-                "calendar": "경기 일정을 조회하는 중...",
-                "match_analysis": "경기 데이터를 분석하는 중...",
-                "player_compare": "선수 정보를 비교하는 중...",
-                "posts_search": "커뮤니티 게시글을 검색하는 중...",
-                "fan_preference": "사용자 선호도를 확인하는 중...",
-                "rag_search": "관련 정보를 검색하는 중...",
-            }
-            
-            # 질문 내용으로 예상 Tool 추정
-            query_lower = request.query.lower()
-            if "경기 일정" in query_lower or "일정" in query_lower or "오늘" in query_lower or "내일" in query_lower:
-                yield f"data: {json.dumps({'type': 'status', 'message': tool_messages.get('calendar', '도구를 실행하는 중...')})}\n\n"
-            elif "비교" in query_lower:
-                yield f"data: {json.dumps({'type': 'status', 'message': tool_messages.get('player_compare', '도구를 실행하는 중...')})}\n\n"
-            elif "경기" in query_lower and "분석" in query_lower:
-                yield f"data: {json.dumps({'type': 'status', 'message': tool_messages.get('match_analysis', '도구를 실행하는 중...')})}\n\n"
-            elif "커뮤니티" in query_lower or "게시글" in query_lower:
-                yield f"data: {json.dumps({'type': 'status', 'message': tool_messages.get('posts_search', '도구를 실행하는 중...')})}\n\n"
-            else:
-                yield f"data: {json.dumps({'type': 'status', 'message': '관련 정보를 검색하는 중...'})}\n\n"
-            
-            # Agent 실행
+            # Agent 실행 (executor 스레드, 요청 컨텍스트 복사) - 콜백 이벤트를 큐로 받아 즉시 전송
             import asyncio
-            loop = asyncio.get_event_loop()
+            loop = asyncio.get_running_loop()
+            queue: asyncio.Queue = asyncio.Queue()
+            callback = AgentStreamCallbackHandler(loop, queue)
             final_prompt = system_prompt + "\n\n사용자 질문: " + request.query
+            done_marker = object()
             
-            yield f"data: {json.dumps({'type': 'status', 'message': 'AI가 답변을 생성하는 중...'})}\n\n"
+            def _run():
+                try:
+                    return run_agent(agent, final_prompt, user_id=request.user_id, callbacks=[callback])
+                finally:
+                    loop.call_soon_threadsafe(queue.put_nowait, done_marker)
             
-            result = await loop.run_in_executor(
-                None,
-                lambda: agent.run(final_prompt)
-            )
+            agent_future = loop.run_in_executor(None, contextvars.copy_context().run, _run)
             
-            # Tool 추정
-            if "경기 일정" in query_lower or "일정" in query_lower:
-                tools_used.append("calendar")
-            if "비교" in query_lower:
-                tools_used.append("player_compare")
-            if "경기" in query_lower and "분석" in query_lower:
-                tools_used.append("match_analysis")
-            if "커뮤니티" in query_lower or "게시글" in query_lower:
-                tools_used.append("posts_search")
-            if "내가 좋아하는" in query_lower or "내 팀" in query_lower:
-                tools_used.append("fan_preference")
-            if not tools_used:
-                tools_used.append("rag_search")
+            # 출력 필터 (가장 긴 금지어 길이만큼 모아서 마스킹)
+            text_filter = StreamTextFilter.for_service(content_safety_service)
+            answer_started = False
             
-            # 출력 필터링
-            if content_safety_service:
-                output_check = content_safety_service.check_output(result)
-                if not output_check.is_safe:
-                    result = content_safety_service.filter_text(result)
+            while True:
+                event = await queue.get()
+                if event is done_marker:
+                    break
+                
+                if event["type"] == "tool_start":
+                    tool_name = event["tool"]
+                    yield f"data: {json.dumps({'type': 'tool_start', 'tool': tool_name, 'input': event['input']})}\n\n"
+                    yield f"data: {json.dumps({'type': 'status', 'message': TOOL_STATUS_MESSAGES.get(tool_name, '도구를 실행하는 중...')})}\n\n"
+                elif event["type"] in ("tool_end", "tool_error"):
+                    yield f"data: {json.dumps(event)}\n\n"
+                elif event["type"] == "token":
+                    if not answer_started:
+                        if await input_rejected():
+                            yield f"data: {unsafe_msg}\n\n"
+                            return
+                        answer_started = True
+                        yield f"data: {json.dumps({'type': 'answer_start', 'tools_used': callback.tools_used or ['rag_search']})}\n\n"
+                    chunk = text_filter.feed(event["content"])
+                    if chunk:
+                        yield f"data: {json.dumps({'type': 'answer_chunk', 'content': chunk})}\n\n"
             
-            # 최종 답변을 타이핑 효과로 스트리밍 (토큰 단위)
-            yield f"data: {json.dumps({'type': 'answer_start', 'tools_used': tools_used})}\n\n"
+            result = await agent_future
             
-            # 답변을 한 글자씩 전송 (타이핑 효과)
-            chunk_size = 3  # 한 번에 3글자씩 전송 (더 자연스러운 효과)
-            for i in range(0, len(result), chunk_size):
-                chunk = result[i:i + chunk_size]
-                yield f"data: {json.dumps({'type': 'answer_chunk', 'content': chunk})}\n\n"
+            if answer_started:
+                chunk = text_filter.flush()
+                if chunk:
+                    yield f"data: {json.dumps({'type': 'answer_chunk', 'content': chunk})}\n\n"
+            else:
+                # 토큰 스트리밍이 없었던 경우 (파싱 오류 복구 등) - 최종 결과를 한 번에 전송
+                if await input_rejected():
+                    yield f"data: {unsafe_msg}\n\n"
+                    return
+                if content_safety_service:
+                    result = content_safety_service.filter_text(result)
+                yield f"data: {json.dumps({'type': 'answer_start', 'tools_used': callback.tools_used or ['rag_search']})}\n\n"
+                yield f"data: {json.dumps({'type': 'answer_chunk', 'content': result})}\n\n"
             
             yield f"data: {json.dumps({'type': 'answer_complete'})}\n\n"
             yield f"data: {json.dumps({'type': 'done'})}\n\n"
@@ -507,6 +440,9 @@ async def agent_health():
         "service": "agent",
         "tools_count": len(base_tools),
         "tools": [tool.name for tool in base_tools],
+        # 헬스 체크가 Agent 생성을 유발하지 않도록 생성 전에는 None
+        "agent_factory": _agent_factory.get_stats() if _agent_factory else None,
+        "question_classifier": get_classifier_stats(),
         "timestamp": datetime.now().isoformat(),
     }
 
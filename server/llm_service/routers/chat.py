@@ -1,5 +1,6 @@
 from fastapi import APIRouter, HTTPException
 from typing import Optional, Dict
+import asyncio
 import re
 import logging
 import os
@@ -7,47 +8,59 @@ import json
 from datetime import datetime
 
 from ..models import ChatRequest, ChatResponse, ErrorResponse
-from ..services.openai_service import OpenAIService
-from ..services.rag_service import RAGService
-from ..services.cache_service import CacheService  # ← 🆕 추가!
-from ..services.content_safety_service import ContentSafetyService  # ← 🆕 콘텐츠 필터링 추가!
+from ..services.openai_service import get_openai_service
+from ..services.embedding_service import get_embeddings
+from ..services.rag_service import get_rag_service
+from ..services.cache_service import get_cache_service  # ← 🆕 추가!
+from ..services.content_safety_service import (  # ← 🆕 콘텐츠 필터링 추가!
+    ContentSafetyResult,
+    PendingSafetyCheck,
+    get_content_safety_service,
+)
 from ..prompts.chat_prompts import SYSTEM_PROMPT, format_chat_context
 from ..routers.stats import get_player_stats
 from ..utils.realtime_router import is_realtime_required, should_skip_cache  # ← 🆕 Router 추가
-from ..utils.cache_judge import CacheJudge  # ← 🆕 Judge 추가
+from ..utils.cache_judge import get_cache_judge  # ← 🆕 Judge 추가
+from ..utils.entity_resolver import get_entity_resolver
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/chat", tags=["AI Chat"])
 
-# 서비스 초기화
-openai_service = OpenAIService()
-rag_service = RAGService()
-
-# CacheService 초기화 (ChromaDB 오류 시에도 서버 계속 실행)
-try:
-    cache_service = CacheService()
-except Exception as e:
-    logger.warning(f"⚠️ CacheService 초기화 실패 (캐시 기능 비활성화): {e}")
-    cache_service = None
-
-# ContentSafetyService 초기화 (콘텐츠 필터링)
-try:
-    content_safety_service = ContentSafetyService()
-except Exception as e:
-    logger.warning(f"⚠️ ContentSafetyService 초기화 실패 (필터링 기능 비활성화): {e}")
-    content_safety_service = None
-
-# CacheJudge 초기화 (캐시 데이터 충분성 판단)
-try:
-    cache_judge = CacheJudge()
-except Exception as e:
-    logger.warning(f"⚠️ CacheJudge 초기화 실패 (Judge 기능 비활성화): {e}")
-    cache_judge = None
+# 서비스는 첫 요청 시 생성 (import 시점에 OpenAI/ChromaDB 클라이언트를 만들지 않음)
+# - get_cache_service / get_content_safety_service / get_cache_judge: 초기화 실패 시 None (해당 기능만 비활성화)
+# - RAGService는 레지스트리에서 지연 생성 (get_rag_service)
 
 # 한글 매핑 테이블 제거됨 - JSON에서 ko_name 필드로 직접 검색
 
 
+def raise_if_unsafe_input(check: ContentSafetyResult) -> None:
+    """입력 검사 결과가 유해하면 400 (chat / agent 공용)"""
+    if check.is_safe:
+        return
+    logger.warning(
+        f"🚫 유해 콘텐츠 감지 (입력): "
+        f"카테고리={check.category}, "
+        f"감지된 단어={check.detected_words}, "
+        f"이유={check.reason}"
+    )
+    raise HTTPException(
+        status_code=400,
+        detail={
+            "error": "부적절한 내용이 포함된 요청입니다.",
+            "error_code": "INAPPROPRIATE_CONTENT",
+            "category": check.category.value if check.category else None,
+            "reason": check.reason
+        }
+    )
+
+
+async def confirm_input_safe(safety_check: Optional[PendingSafetyCheck]) -> None:
+    """응답 반환 직전 입력 검사 최종 확인 (optimistic 모드에서 진행 중이던 LLM 검사 대기)"""
+    if safety_check is not None:
+        raise_if_unsafe_input(await safety_check.result())
+
+
 def _is_stats_question(query: str) -> bool:
     """
     득점/어시스트/폼 등 통계성 질문인지 간단히 감지
@@ -97,10 +110,15 @@ async def _build_stats_context(query: str) -> Optional[str]:
     if not _is_stats_question(query):
         return None
 
-    # 1. 영문 이름 추출 시도
-    player_name = _extract_english_name(query)
+    # 1. 선수 이름 사전으로 매칭 (오타/부분 이름/조사 포함: "홀란드는", "haland", "Son")
+    match = get_entity_resolver().find_best_in_text(query, kind="player")
+    player_name = match.entity.name if match else None
+
+    # 2. 영문 이름 추출 시도
+    if not player_name:
+        player_name = _extract_english_name(query)
     
-    # 2. 영문 이름이 없으면 한글 이름 추출 시도
+    # 3. 영문 이름이 없으면 한글 이름 추출 시도
     if not player_name:
         korean_matches = re.findall(r"[가-힣]{2,4}", query)
         if korean_matches:
@@ -176,30 +194,24 @@ async def chat(request: ChatRequest) -> ChatResponse:
     try:
         logger.info(f"💬 챗봇 요청: {request.query}")
 
+        openai_service = get_openai_service()
+        cache_service = get_cache_service()
+        content_safety_service = get_content_safety_service()
+        cache_judge = get_cache_judge()
+
         # ============================================
         # 🛡️ STEP 0: 입력 게이트웨이 - 사용자 쿼리 필터링
         # ============================================
+        # optimistic 모드면 LLM 검사는 아래 단계와 동시에 진행되고 응답 직전에 확인
+        safety_check = None
         if content_safety_service:
             logger.debug("🛡️ 입력 필터링 중...")
-            input_check = content_safety_service.check_input(request.query)
-            
-            if not input_check.is_safe:
-                logger.warning(
-                    f"🚫 유해 콘텐츠 감지 (입력): "
-                    f"카테고리={input_check.category}, "
-                    f"감지된 단어={input_check.detected_words}, "
-                    f"이유={input_check.reason}"
-                )
-                raise HTTPException(
-                    status_code=400,
-                    detail={
-                        "error": "부적절한 내용이 포함된 요청입니다.",
-                        "error_code": "INAPPROPRIATE_CONTENT",
-                        "category": input_check.category.value if input_check.category else None,
-                        "reason": input_check.reason
-                    }
-                )
-            logger.debug("✅ 입력 필터링 통과")
+            safety_check = await content_safety_service.begin_check(request.query)
+            raise_if_unsafe_input(safety_check.current)
+            if safety_check.pending:
+                logger.debug("✅ 규칙 필터링 통과 (LLM 검사 진행 중)")
+            else:
+                logger.debug("✅ 입력 필터링 통과")
 
         # ============================================
         # 🚪 입구 (Semantic Router): 실시간 정보 필요 여부 판단
@@ -232,13 +244,14 @@ async def chat(request: ChatRequest) -> ChatResponse:
                 # 유사도 0.9 이상: Judge 스킵 (비용 절감, 바로 캐시 사용)
                 if similarity >= 0.9:
                     logger.info(f"✅ 높은 유사도 ({similarity:.2f}) → Judge 스킵, 캐시 사용 (비용 $0)")
+                    await confirm_input_safe(safety_check)
                     return ChatResponse(
                         answer=cached_answer["answer"],
                         sources=[],
                         tokens_used=0,
                         confidence=cached_answer["confidence"],
                         cache_hit=True,
-                        cache_source="chromadb",
+                        cache_source="memory" if cached_answer.get("source") == "memory_cache" else "chromadb",
                         cost_saved=0.001,
                     )
                 
@@ -254,6 +267,7 @@ async def chat(request: ChatRequest) -> ChatResponse:
                     if judge_result == "YES":
                         # Judge가 YES → 캐시 사용
                         logger.info(f"✅ Judge 승인: 캐시 사용 (이유: {judge_reason})")
+                        await confirm_input_safe(safety_check)
                         return ChatResponse(
                             answer=cached_answer["answer"],
                             sources=[],
@@ -274,6 +288,7 @@ async def chat(request: ChatRequest) -> ChatResponse:
                 else:
                     # 유사도 0.7 미만 또는 Judge 없음 → 캐시 사용 (낮은 유사도지만 일단 사용)
                     logger.info(f"🎯 캐시된 답변 반환 (유사도 {similarity:.2f}, Judge 스킵)")
+                    await confirm_input_safe(safety_check)
                     return ChatResponse(
                         answer=cached_answer["answer"],
                         sources=[],
@@ -303,8 +318,10 @@ async def chat(request: ChatRequest) -> ChatResponse:
         # ============================================
         logger.debug("Step 3️⃣: RAG 검색 중... (텍스트 임베딩 사용)")
         search_query = request.query
-        rag_results = rag_service.search(
-            collection_name="default", query=search_query, top_k=request.top_k
+        # 동기 검색(임베딩 + Chroma)은 스레드에서 → 그동안 optimistic LLM 입력 검사가 진행됨
+        rag_results = await asyncio.to_thread(
+            get_rag_service().search,
+            collection_name="default", query=search_query, top_k=request.top_k,
         )
 
         # RAG 결과를 소스로 변환
@@ -361,6 +378,9 @@ async def chat(request: ChatRequest) -> ChatResponse:
             f"(입력: {input_tokens}, 출력: {output_tokens})"
         )
 
+        # 유해 입력에 대한 답변은 캐시에 남기지 않도록 저장 전에 확인
+        await confirm_input_safe(safety_check)
+
         # ============================================
         # ✅ STEP 7: ChromaDB에 답변 저장 ($0)
         # ============================================
@@ -399,6 +419,8 @@ async def chat(request: ChatRequest) -> ChatResponse:
             cost_saved=0.0,  # ← 🆕 캐시 미스이므로 비용 발생
         )
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"❌ 챗봇 오류: {str(e)}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"챗봇 처리 실패: {str(e)}")
@@ -410,5 +432,6 @@ async def chat_health():
     return {
         "status": "healthy",
         "service": "chat",
+        "embeddings": get_embeddings().get_stats(),
         "timestamp": datetime.now().isoformat(),
     }
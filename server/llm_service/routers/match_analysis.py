@@ -9,18 +9,16 @@ import logging
 from datetime import datetime
 
 from ..models import MatchAnalysisRequest, MatchAnalysisResponse, ErrorResponse
-from ..services.openai_service import OpenAIService
-from ..services.rag_service import RAGService
-from ..external_apis.football_data import FootballDataClient
+from ..services.openai_service import get_openai_service
+from ..services.rag_service import get_rag_service, league_where
+from ..external_apis.football_data import get_async_football_client
+from ..external_apis.rate_limiter import RateLimitExceeded
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/match", tags=["Match Analysis"])
 
-# 서비스 초기화
-openai_service = OpenAIService()
-rag_service = RAGService()
-football_client = FootballDataClient()
+# 서비스는 요청 시 get_xxx()로 조회 (첫 사용 시 생성, FOOTBALL_API_KEY 누락이 import 실패로 번지지 않음)
 
 @router.post(
     "/{match_id}/analysis",
@@ -42,15 +40,27 @@ async def analyze_match(
     """
     try:
         logger.info(f"📊 경기 분석 요청: 경기 ID {match_id}")
+
+        openai_service = get_openai_service()
+        rag_service = get_rag_service()
+        football_client = get_async_football_client()
         
         # 요청 기본값 처리
         if request is None:
-            request = MatchAnalysisRequest(league="PL")
+            request = MatchAnalysisRequest(match_id=match_id)
         
         # 1️⃣ Football-Data API에서 경기 정보 조회
         try:
-            match_info = football_client.get_match(match_id)
+            match_info = await football_client.get_match_details(match_id)
+            if not match_info:
+                raise ValueError("경기 정보 없음")
             logger.info(f"✅ 경기 정보 조회 완료")
+        except RateLimitExceeded as e:
+            raise HTTPException(
+                status_code=429,
+                detail=f"Football-Data API 호출 한도 초과: {e}",
+                headers={"Retry-After": str(max(1, round(e.retry_after)))},
+            )
         except Exception as e:
             logger.error(f"❌ 경기 정보 조회 실패: {str(e)}")
             raise HTTPException(
@@ -61,18 +71,14 @@ async def analyze_match(
         # 2️⃣ RAG 검색 (두 팀의 최근 경기 등)
         home_team = match_info.get("homeTeam", {}).get("name", "Unknown")
         away_team = match_info.get("awayTeam", {}).get("name", "Unknown")
+        league = request.league or match_info.get("competition", {}).get("code")
         
-        # 각 팀별로 검색
-        home_results = rag_service.search(
-            collection_name=f"league_{request.league}",
-            query=f"{home_team} 최근 경기 전적",
-            top_k=3
-        )
-        
-        away_results = rag_service.search(
-            collection_name=f"league_{request.league}",
-            query=f"{away_team} 최근 경기 전적",
-            top_k=3
+        # 각 팀별로 검색 (임베딩 1회 배치, 해당 리그 문서만)
+        home_results, away_results = rag_service.search_batch(
+            collection_name="default",
+            queries=[f"{home_team} 최근 경기 전적", f"{away_team} 최근 경기 전적"],
+            top_k=3,
+            where=league_where(league),
         )
         
         # 소스 통합
@@ -135,10 +141,18 @@ async def analyze_match(
         
         logger.info(f"✅ 경기 분석 완료")
         
+        full_time = match_info.get("score", {}).get("fullTime", {})
+        score = (
+            f"{full_time['home']}-{full_time['away']}"
+            if full_time.get("home") is not None and full_time.get("away") is not None
+            else "-"
+        )
+
         return MatchAnalysisResponse(
             match_id=match_id,
             home_team=home_team,
             away_team=away_team,
+            score=score,
             analysis=analysis_response,
             key_factors=[
                 "홈팀 최근 폼",
@@ -182,6 +196,8 @@ async def analyze_chart(
     try:
         logger.info(f"📊 경기 차트 분석 요청: {question}")
 
+        openai_service = get_openai_service()
+
         # 이미지 파일 읽기
         image_data = await image.read()
 
@@ -8,18 +8,15 @@ import logging
 from datetime import datetime
 
 from ..models import PlayerCompareRequest, PlayerCompareResponse, ErrorResponse
-from ..services.openai_service import OpenAIService
-from ..services.rag_service import RAGService
-from ..external_apis.football_data import FootballDataClient
+from ..services.openai_service import get_openai_service
+from ..services.rag_service import get_rag_service
+from ..utils.entity_resolver import player_search_name
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/player", tags=["Player Comparison"])
 
-# 서비스 초기화
-openai_service = OpenAIService()
-rag_service = RAGService()
-football_client = FootballDataClient()
+# 서비스는 요청 시 get_xxx()로 조회 (첫 사용 시 생성, FOOTBALL_API_KEY 누락이 import 실패로 번지지 않음)
 
 PLAYER_COMPARE_SYSTEM = """당신은 축구 선수 분석 전문가입니다.
 
@@ -49,6 +46,9 @@ async def compare_players(request: PlayerCompareRequest) -> PlayerCompareRespons
     RAG 검색 → 통계 비교 → OpenAI 분석
     """
     try:
+        openai_service = get_openai_service()
+        rag_service = get_rag_service()
+
         if len(request.player_names) < 2:
             raise HTTPException(
                 status_code=400,
@@ -62,10 +62,10 @@ async def compare_players(request: PlayerCompareRequest) -> PlayerCompareRespons
         all_sources = []
         
         for player_name in request.player_names:
-            # 선수 정보 검색
+            # 선수 정보 검색 (오타/한글 표기도 정식 이름을 함께 검색)
             rag_results = rag_service.search(
-                collection_name=f"league_{request.league}",
-                query=f"{player_name} 통계 시즌 골 어시스트",
+                collection_name="default",
+                query=f"{player_search_name(player_name)} 통계 시즌 골 어시스트",
                 top_k=3
             )
             
@@ -165,10 +165,13 @@ async def get_player_insights(
     """특정 선수의 AI 인사이트"""
     try:
         logger.info(f"⚽ 선수 인사이트 요청: {player_name}")
+
+        openai_service = get_openai_service()
+        rag_service = get_rag_service()
         
         # RAG 검색
         rag_results = rag_service.search(
-            collection_name=f"league_{league}",
+            collection_name="default",
             query=f"{player_name} 성능 평가 분석",
             top_k=5
         )
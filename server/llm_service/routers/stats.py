@@ -9,8 +9,9 @@ from fastapi import APIRouter, HTTPException, Query
 from typing import Optional, List, Dict
 from datetime import datetime
 import sys
-import os
-import json
+
+from llm_service.services.player_stats_store import get_player_stats_store
+from llm_service.utils.entity_resolver import get_entity_resolver
 
 # espn_scraper_hybrid 임포트
 try:
@@ -34,9 +35,11 @@ router = APIRouter(
 
 
 # ==================== JSON 캐시에서 통계 가져오기 ====================
+# espn_player_ids.json은 PlayerStatsStore가 한 번 로드해서 인덱싱 (파일이 바뀌면 다시 로드)
+
 def get_top_scorers_from_cache(league: str = "프리미어리그", limit: int = 20) -> List[Dict]:
     """
-    JSON 캐시에서 득점 순위 가져오기
+    JSON 캐시에서 득점 순위 가져오기 (미리 정렬된 순위의 슬라이스)
 
     Args:
         league: 리그 이름 (프리미어리그, 라리가, 분데스리가 등)
@@ -46,21 +49,7 @@ def get_top_scorers_from_cache(league: str = "프리미어리그", limit: int =
         [{"name": str, "team": str, "goals": int, "assists": int, ...}, ...]
     """
     try:
-        json_file = os.path.join(os.path.dirname(__file__), '../data/espn_player_ids.json')
-
-        with open(json_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-
-        if league not in data:
-            return []
-
-        players = data[league]
-
-        # 득점순 정렬
-        sorted_players = sorted(players, key=lambda x: x.get('goals', 0), reverse=True)
-
-        return sorted_players[:limit]
-
+        return get_player_stats_store().top_scorers(league, limit)
     except Exception as e:
         print(f"❌ JSON 로드 실패: {e}")
         return []
@@ -68,24 +57,10 @@ def get_top_scorers_from_cache(league: str = "프리미어리그", limit: int =
 
 def get_top_assists_from_cache(league: str = "프리미어리그", limit: int = 20) -> List[Dict]:
     """
-    JSON 캐시에서 어시스트 순위 가져오기
+    JSON 캐시에서 어시스트 순위 가져오기 (미리 정렬된 순위의 슬라이스)
     """
     try:
-        json_file = os.path.join(os.path.dirname(__file__), '../data/espn_player_ids.json')
-
-        with open(json_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-
-        if league not in data:
-            return []
-
-        players = data[league]
-
-        # 어시스트순 정렬
-        sorted_players = sorted(players, key=lambda x: x.get('assists', 0), reverse=True)
-
-        return sorted_players[:limit]
-
+        return get_player_stats_store().top_assists(league, limit)
     except Exception as e:
         print(f"❌ JSON 로드 실패: {e}")
         return []
@@ -200,12 +175,7 @@ async def get_available_leagues():
         }
     """
     try:
-        json_file = os.path.join(os.path.dirname(__file__), '../data/espn_player_ids.json')
-
-        with open(json_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-
-        leagues = list(data.keys())
+        leagues = get_player_stats_store().leagues()
 
         return {
             "success": True,
@@ -222,7 +192,8 @@ async def get_available_leagues():
 
 def get_player_stats_from_cache(player_name: str) -> Optional[Dict]:
     """
-    JSON 캐시에서 선수 통계 가져오기 (스크래핑 없음)
+    JSON 캐시에서 선수 통계 가져오기 (스크래핑 없음, 이름 인덱스로 O(1) 조회)
+    정확히 일치하는 이름이 없으면 퍼지 매칭 ("haland", "홀란" 같은 오타/부분 이름)
     
     Args:
         player_name: 선수 이름 (영문 또는 한글)
@@ -231,26 +202,15 @@ def get_player_stats_from_cache(player_name: str) -> Optional[Dict]:
         {"name": str, "team": str, "goals": int, "assists": int, ...} 또는 None
     """
     try:
-        json_file = os.path.join(os.path.dirname(__file__), '../data/espn_player_ids.json')
-        
-        if not os.path.exists(json_file):
-            return None
-        
-        with open(json_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
-        # 모든 리그에서 선수 검색
-        for league, players in data.items():
-            for player in players:
-                # 영문 이름 매칭
-                if player.get('name', '').lower() == player_name.lower():
-                    return player
-                # 한글 이름 매칭
-                if player.get('ko_name', '').lower() == player_name.lower():
-                    return player
-        
+        store = get_player_stats_store()
+        player = store.find_player(player_name)
+        if player is None:
+            match = get_entity_resolver().best(player_name, kind="player")
+            if match:
+                player = store.find_player(match.entity.name)
+        return player
+    except FileNotFoundError:
         return None
-        
     except Exception as e:
         print(f"❌ JSON 로드 실패: {e}")
         return None
@@ -179,7 +179,8 @@ def find_espn_id(player_name: str) -> Optional[int]:
 
     1순위: 캐시에서 검색
     2순위: 이름 변형 시도 (예: "Son, Heung-Min" → "Heung-Min Son")
-    3순위: None 반환
+    3순위: 퍼지 매칭 (예: "haland", "홀란" → "Erling Haaland")
+    4순위: None 반환
 
     Args:
         player_name: 선수 이름
@@ -200,7 +201,19 @@ def find_espn_id(player_name: str) -> Optional[int]:
             if reversed_name in ESPN_ID_CACHE:
                 return ESPN_ID_CACHE[reversed_name]
 
-    # 3. 실패
+    # 3. 퍼지 매칭
+    try:
+        from llm_service.utils.entity_resolver import get_entity_resolver
+
+        match = get_entity_resolver().best(player_name, kind="player")
+        if match:
+            espn_id = ESPN_ID_CACHE.get(match.entity.name) or match.entity.data.get("espn_id")
+            if espn_id:
+                return espn_id
+    except Exception as e:
+        print(f"⚠️  퍼지 매칭 실패: {e}")
+
+    # 4. 실패
     return None
 
 
@@ -1,5 +1,23 @@
-from .openai_service import OpenAIService
-from .rag_service import RAGService
-from .cache_service import CacheService
+# 서비스 클래스는 첫 접근 시 임포트 (하위 모듈 하나만 쓰는 곳에서 전체 의존성을 로드하지 않음)
+_LAZY_EXPORTS = {
+    "OpenAIService": ".openai_service",
+    "get_openai_service": ".openai_service",
+    "RAGService": ".rag_service",
+    "get_rag_service": ".rag_service",
+    "CacheService": ".cache_service",
+    "get_cache_service": ".cache_service",
+    "PlayerStatsStore": ".player_stats_store",
+    "get_player_stats_store": ".player_stats_store",
+}
 
-__all__ = ['OpenAIService', 'RAGService', 'CacheService']
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        import importlib
+
+        module = importlib.import_module(_LAZY_EXPORTS[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+__all__ = ['OpenAIService', 'get_openai_service', 'RAGService', 'get_rag_service', 'CacheService', 'get_cache_service', 'PlayerStatsStore', 'get_player_stats_store']
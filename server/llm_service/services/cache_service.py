@@ -3,12 +3,36 @@ from typing import Optional, Dict, Any
 import logging
 import hashlib
 import os
-
-from .rag_service import RAGService
-from ..utils.keyword_matcher import calculate_keyword_match, should_skip_judge_by_keyword
+import threading
+import time
+
+from .rag_service import get_rag_service
+from ..utils.keyword_matcher import (
+    KEYWORD_EXTRACTOR_VERSION,
+    dump_keywords,
+    extract_keywords,
+    load_keywords,
+    score_keyword_candidates,
+    score_keywords,
+    should_skip_judge_by_keyword,
+)
+from ..utils.ttl_cache import TTLCache
 
 logger = logging.getLogger(__name__)
 
+# L1 (인메모리) 답변 캐시 설정 - 동일한 정규화 질문은 임베딩/ChromaDB 없이 응답
+ANSWER_L1_CACHE_SIZE = int(os.getenv("ANSWER_L1_CACHE_SIZE", "1000"))
+ANSWER_L1_CACHE_TTL_SECONDS = float(os.getenv("ANSWER_L1_CACHE_TTL_SECONDS", "3600"))
+
+# ChromaDB 이웃 후보 수 - 유사도/Keyword 임계값을 통과한 후보 중 하이브리드 점수로 재정렬
+CACHE_RERANK_TOP_K = int(os.getenv("CACHE_RERANK_TOP_K", "3"))
+# 하이브리드 점수 = 유사도 x (1 - w) + Keyword 점수 x w
+CACHE_KEYWORD_WEIGHT = float(os.getenv("CACHE_KEYWORD_WEIGHT", "0.3"))
+
+# 초기화 실패 시 재시도 간격 (실패할 때마다 2배, 최대값까지)
+CACHE_SERVICE_RETRY_SECONDS = float(os.getenv("CACHE_SERVICE_RETRY_SECONDS", "5"))
+CACHE_SERVICE_RETRY_MAX_SECONDS = float(os.getenv("CACHE_SERVICE_RETRY_MAX_SECONDS", "300"))
+
 
 class CacheService:
     """
@@ -21,20 +45,45 @@ class CacheService:
     def __init__(self):
         """
         캐시 서비스 초기화
+
+        Raises:
+            ChromaDB를 열지 못하면 그 예외 (캐시 없는 인스턴스를 싱글톤으로 남기지 않도록)
         """
         self.rag_service = None
         self.cache_rag = None
         self._db = None
+        # L1 답변 캐시 (key: md5(정규화 질문) - cache_answer의 doc_id와 동일)
+        self.answer_l1 = TTLCache(
+            maxsize=ANSWER_L1_CACHE_SIZE, ttl_seconds=ANSWER_L1_CACHE_TTL_SECONDS
+        )
         
         try:
-            self.rag_service = RAGService(persist_directory="chroma_db")
-            self.cache_rag = RAGService(persist_directory="chroma_db_cache")
+            self.rag_service = get_rag_service(persist_directory="chroma_db")
+            self.cache_rag = get_rag_service(persist_directory="chroma_db_cache")
+            self._migrate_legacy_answers()
             logger.info("✅ CacheService 초기화 완료")
         except Exception as e:
-            logger.warning(f"⚠️ ChromaDB 초기화 실패 (캐시 기능 비활성화): {e}")
+            logger.warning(f"⚠️ ChromaDB 초기화 실패: {e}")
             logger.warning("💡 해결 방법: ChromaDB 데이터베이스를 삭제하고 재생성하세요.")
             logger.warning("   rm -rf chroma_db chroma_db_cache")
-            # ChromaDB 실패해도 서비스는 계속 실행 (캐시 없이)
+            # get_cache_service가 캐시 없이 동작하다가 백오프 후 다시 생성
+            raise
+
+    def _migrate_legacy_answers(self) -> None:
+        """
+        기존 답변 캐시 이전 (1회)
+
+        예전 RAGService는 collection_name을 무시해서 답변이 LangChain 기본 컬렉션("langchain")에
+        저장됐다. 지금은 "cached_answers"만 검색하므로 남아 있는 답변을 옮겨 둔다.
+        """
+        try:
+            moved = self.cache_rag.migrate_collection(
+                source=self.cache_rag.DEFAULT_COLLECTION, target="cached_answers"
+            )
+            if moved:
+                logger.info(f"✅ 기존 답변 캐시 {moved}개를 cached_answers로 이전")
+        except Exception as e:
+            logger.warning(f"⚠️ 기존 답변 캐시 이전 실패 (다음 시작 시 재시도): {e}")
 
     @property
     def db(self):
@@ -79,14 +128,20 @@ class CacheService:
             >>> if cached:
             ...     print(cached["answer"])
         """
+        normalized = self._normalize_query(query)
+        query_hash = self._hash_query(normalized)
+
+        # L1: 정규화 질문이 완전히 같으면 임베딩/벡터 검색 없이 바로 응답
+        l1_entry = self.answer_l1.get(query_hash)
+        if l1_entry is not None:
+            return self._answer_from_l1(query, l1_entry)
+
         if not self.cache_rag:
             return None
             
         try:
-            normalized = self._normalize_query(query)
-
             results = self.cache_rag.search(
-                collection_name="cached_answers", query=normalized, top_k=1
+                collection_name="cached_answers", query=normalized, top_k=CACHE_RERANK_TOP_K
             )
 
             logger.info(f"🔍 캐시 검색 결과: {len(results.get('ids', []))}개 발견")
@@ -95,76 +150,72 @@ class CacheService:
             if not results["ids"] or len(results["ids"]) == 0:
                 logger.debug(f"⚠️ 캐시 미스: {query[:50]}")
                 return None
-            ...
-
-            # 유사도 계산 (거리 → 유사도)
-            distance = results["distances"][0]
-            similarity = 1 - distance
 
             # 유사도 임계값 (설정 가능)
             # 0.85: 엄격한 기준 (제안된 값)
             # 0.7~0.75: 균형잡힌 기준 (권장)
             SIMILARITY_THRESHOLD = float(os.getenv("CACHE_SIMILARITY_THRESHOLD", "0.75"))
-            
-            # 유사도 임계값 이상: 캐시 후보 (Judge 노드에서 최종 판단)
-            if similarity >= SIMILARITY_THRESHOLD:
-                # TTL 체크: 만료된 캐시는 무시
-                metadata = results["metadatas"][0] if results.get("metadatas") else {}
-                created_at_str = metadata.get("created_at")
-                
-                if created_at_str:
-                    try:
-                        # ISO 포맷 파싱 (타임존 제거)
-                        created_at_str_clean = created_at_str.split('+')[0].split('Z')[0]
-                        created_at = datetime.fromisoformat(created_at_str_clean)
-                        # 타임존 제거 (naive datetime으로 통일)
-                        if created_at.tzinfo:
-                            created_at = created_at.replace(tzinfo=None)
-                        
-                        now = datetime.now()
-                        age_days = (now - created_at).days
-                        
-                        if age_days > self.LLM_CACHE_TTL_DAYS:
-                            logger.info(
-                                f"⏰ 캐시 만료: '{query[:50]}...' ({age_days}일 경과, TTL: {self.LLM_CACHE_TTL_DAYS}일)"
-                            )
-                            return None
-                        else:
-                            logger.debug(f"✅ 캐시 유효: {age_days}일 경과 (TTL: {self.LLM_CACHE_TTL_DAYS}일)")
-                    except (ValueError, AttributeError, TypeError) as e:
-                        logger.debug(f"⚠️ 캐시 날짜 파싱 실패: {e}, 캐시 사용 계속")
-
-                # ============================================
-                # 🆕 Keyword 검색 추가 (제민의 제안 2: 하이브리드 검색)
-                # ============================================
-                cached_answer_text = results["documents"][0]
-                keyword_score = calculate_keyword_match(query, cached_answer_text)
-                
-                # Keyword 점수가 너무 낮으면 Judge 스킵, API 호출
-                KEYWORD_THRESHOLD = float(os.getenv("KEYWORD_MATCH_THRESHOLD", "0.5"))
-                if should_skip_judge_by_keyword(keyword_score, KEYWORD_THRESHOLD):
-                    logger.info(
-                        f"🔍 Keyword 점수 낮음 ({keyword_score:.2f} < {KEYWORD_THRESHOLD}) "
-                        f"→ 캐시 무시, API 호출"
-                    )
-                    return None
-                
+
+            # 유사도 임계값 이상 + 만료되지 않은 후보 (Judge 노드에서 최종 판단)
+            candidates = []
+            metadatas = results.get("metadatas") or [{}] * len(results["ids"])
+            for document, metadata, distance in zip(results["documents"], metadatas, results["distances"]):
+                similarity = 1 - distance  # 거리 → 유사도
+                if similarity < SIMILARITY_THRESHOLD:
+                    logger.debug(f"⚠️ 유사도 부족: {similarity:.2f} < {SIMILARITY_THRESHOLD}")
+                    continue
+                metadata = metadata or {}
+                if self._is_expired(metadata, query):
+                    continue
+                candidates.append((document, metadata, similarity))
+
+            if not candidates:
+                return None
+
+            # ============================================
+            # 🆕 Keyword 검색 추가 (제민의 제안 2: 하이브리드 검색)
+            # 답변 키워드는 저장 시 추출해 둔 집합 사용 (질문 키워드만 1회 추출)
+            # ============================================
+            keyword_scores = score_keyword_candidates(
+                query, [self._answer_keywords(document, metadata) for document, metadata, _ in candidates]
+            )
+
+            # Keyword 점수가 너무 낮은 후보는 제외 (남은 후보가 없으면 API 호출)
+            KEYWORD_THRESHOLD = float(os.getenv("KEYWORD_MATCH_THRESHOLD", "0.5"))
+            scored = [
+                (similarity * (1 - CACHE_KEYWORD_WEIGHT) + keyword_score * CACHE_KEYWORD_WEIGHT,
+                 document, metadata, similarity, keyword_score)
+                for (document, metadata, similarity), keyword_score in zip(candidates, keyword_scores)
+                if not should_skip_judge_by_keyword(keyword_score, KEYWORD_THRESHOLD)
+            ]
+            if not scored:
                 logger.info(
-                    f"🎯 ChromaDB 캐시 히트: '{query[:50]}...' "
-                    f"(유사도 {similarity:.2f}, Keyword {keyword_score:.2f})"
+                    f"🔍 Keyword 점수 낮음 (최고 {max(keyword_scores):.2f} < {KEYWORD_THRESHOLD}) "
+                    f"→ 캐시 무시, API 호출"
                 )
-
-                return {
-                    "answer": cached_answer_text,
-                    "confidence": similarity,
-                    "similarity": similarity,
-                    "keyword_score": keyword_score,  # 🆕 Keyword 점수 추가
-                    "source": "chromadb_cache",
-                }
-            else:
-                logger.debug(f"⚠️ 유사도 부족: {similarity:.2f} < {SIMILARITY_THRESHOLD}")
                 return None
 
+            _, cached_answer_text, metadata, similarity, keyword_score = max(scored, key=lambda item: item[0])
+            logger.info(
+                f"🎯 ChromaDB 캐시 히트: '{query[:50]}...' "
+                f"(유사도 {similarity:.2f}, Keyword {keyword_score:.2f}, 후보 {len(scored)}/{len(results['ids'])})"
+            )
+
+            # 같은 정규화 질문이면 L1에 올려둠 (재시작 후 워밍업)
+            if metadata.get("normalized_query") == normalized:
+                self.answer_l1.set(
+                    query_hash,
+                    {"answer": cached_answer_text, "keyword_score": keyword_score},
+                )
+
+            return {
+                "answer": cached_answer_text,
+                "confidence": similarity,
+                "similarity": similarity,
+                "keyword_score": keyword_score,  # 🆕 Keyword 점수 추가
+                "source": "chromadb_cache",
+            }
+
         except Exception as e:
             logger.warning(f"⚠️ ChromaDB 캐시 검색 실패: {e}")
             return None
@@ -193,15 +244,26 @@ class CacheService:
             ...     metadata={"model": "gpt-4o-mini", "tokens": 350}
             ... )
         """
+        normalized = self._normalize_query(query)
+
+        # 고유 ID 생성 (쿼리 해시) - L1 키와 ChromaDB doc_id 공용
+        query_hash = self._hash_query(normalized)
+        doc_id = f"answer_{query_hash}"
+
+        # 키워드는 저장 시 1회만 추출 (조회 시에는 저장된 집합으로 점수 계산)
+        query_keywords = extract_keywords(query)
+        answer_keywords = extract_keywords(answer)
+
+        # L1 캐시 저장 (Keyword 점수는 질문/답변이 고정이므로 미리 계산)
+        self.answer_l1.set(
+            query_hash,
+            {"answer": answer, "keyword_score": score_keywords(query_keywords, answer_keywords)},
+        )
+
         if not self.cache_rag:
             return False
             
         try:
-            normalized = self._normalize_query(query)
-
-            # 고유 ID 생성 (쿼리 해시)
-            query_hash = hashlib.md5(normalized.encode()).hexdigest()
-            doc_id = f"answer_{query_hash}"
 
             # metadata에서 리스트 값 필터링 (추가!)
             filtered_metadata = {}
@@ -226,6 +288,10 @@ class CacheService:
                         "created_at": datetime.now().isoformat(),
                         "tokens_saved": 500,  # 예상 절감 토큰
                         **filtered_metadata,
+                        # Keyword 매칭용 (ChromaDB metadata는 리스트 불가 → JSON 문자열)
+                        "answer_keywords": dump_keywords(answer_keywords),
+                        "query_keywords": dump_keywords(query_keywords),
+                        "keyword_version": KEYWORD_EXTRACTOR_VERSION,
                     }
                 ],
                 ids=[doc_id],
@@ -387,6 +453,64 @@ class CacheService:
         """
         return query.strip().lower()[:300]
 
+    @staticmethod
+    def _hash_query(normalized: str) -> str:
+        """정규화된 질문의 md5 (L1 키 / ChromaDB doc_id)"""
+        return hashlib.md5(normalized.encode()).hexdigest()
+
+    def _is_expired(self, metadata: dict, query: str) -> bool:
+        """답변 캐시 TTL 체크 (created_at 파싱 실패 시 유효로 간주)"""
+        created_at_str = metadata.get("created_at")
+        if not created_at_str:
+            return False
+        try:
+            # ISO 포맷 파싱 (타임존 제거 → naive datetime으로 통일)
+            created_at_str_clean = created_at_str.split('+')[0].split('Z')[0]
+            created_at = datetime.fromisoformat(created_at_str_clean)
+            if created_at.tzinfo:
+                created_at = created_at.replace(tzinfo=None)
+        except (ValueError, AttributeError, TypeError) as e:
+            logger.debug(f"⚠️ 캐시 날짜 파싱 실패: {e}, 캐시 사용 계속")
+            return False
+
+        age_days = (datetime.now() - created_at).days
+        if age_days > self.LLM_CACHE_TTL_DAYS:
+            logger.info(
+                f"⏰ 캐시 만료: '{query[:50]}...' ({age_days}일 경과, TTL: {self.LLM_CACHE_TTL_DAYS}일)"
+            )
+            return True
+        logger.debug(f"✅ 캐시 유효: {age_days}일 경과 (TTL: {self.LLM_CACHE_TTL_DAYS}일)")
+        return False
+
+    @staticmethod
+    def _answer_keywords(document: str, metadata: dict) -> set:
+        """저장된 답변 키워드 (이전 버전으로 저장된 항목은 답변에서 다시 추출)"""
+        if metadata.get("keyword_version") == KEYWORD_EXTRACTOR_VERSION:
+            keywords = load_keywords(metadata.get("answer_keywords"))
+            if keywords is not None:
+                return keywords
+        return extract_keywords(document)
+
+    def _answer_from_l1(self, query: str, entry: dict) -> Optional[dict]:
+        """L1 히트 결과를 get_cached_answer 응답 형식으로 변환"""
+        keyword_score = entry["keyword_score"]
+        KEYWORD_THRESHOLD = float(os.getenv("KEYWORD_MATCH_THRESHOLD", "0.5"))
+        if should_skip_judge_by_keyword(keyword_score, KEYWORD_THRESHOLD):
+            logger.info(
+                f"🔍 L1 히트지만 Keyword 점수 낮음 ({keyword_score:.2f} < {KEYWORD_THRESHOLD}) "
+                f"→ 캐시 무시, API 호출"
+            )
+            return None
+
+        logger.info(f"⚡ L1 캐시 히트: '{query[:50]}...' (임베딩/ChromaDB 스킵)")
+        return {
+            "answer": entry["answer"],
+            "confidence": 1.0,
+            "similarity": 1.0,
+            "keyword_score": keyword_score,
+            "source": "memory_cache",
+        }
+
     @staticmethod
     def _generate_cache_key(api_type: str, params: dict) -> str:
         """
@@ -423,7 +547,8 @@ class CacheService:
             {
                 "chromadb_answers": 150,
                 "firestore_cache": 45,
-                "estimated_cost_saved": 12.50
+                "estimated_cost_saved": 12.50,
+                "l1_answers": {"size": 12, "hits": 340, "misses": 95, ...}
             }
         """
         try:
@@ -431,11 +556,12 @@ class CacheService:
                 "chromadb_answers": 0,
                 "firestore_cache": 0,
                 "estimated_cost_saved": 0.0,
+                "l1_answers": self.answer_l1.get_stats(),
             }
 
             # ChromaDB 통계
             try:
-                answer_stats = self.rag_service.get_collection_stats("cached_answers")
+                answer_stats = self.cache_rag.get_collection_stats("cached_answers")
                 stats["chromadb_answers"] = answer_stats.get("count", 0)
             except:
                 pass
@@ -459,3 +585,40 @@ class CacheService:
         except Exception as e:
             logger.error(f"❌ 캐시 통계 조회 실패: {e}")
             return {}
+
+
+# ============================================
+# 싱글톤 인스턴스
+# ============================================
+_cache_service: Optional[CacheService] = None
+_cache_service_lock = threading.Lock()
+_cache_service_failures = 0
+_cache_service_retry_at = 0.0
+
+
+def get_cache_service() -> Optional[CacheService]:
+    """
+    공용 CacheService 반환 (지연 생성, 실패 시 None → 캐시 없이 동작)
+
+    chat/agent 라우터와 weather/youtube Tool이 같은 인스턴스(L1 캐시 포함)를 공유한다.
+    executor 스레드에서도 호출되므로 생성은 lock 안에서 한 번만,
+    초기화에 실패하면 영구 비활성화 대신 지수 백오프 후 다시 시도한다.
+    """
+    global _cache_service, _cache_service_failures, _cache_service_retry_at
+    if _cache_service is not None or time.monotonic() < _cache_service_retry_at:
+        return _cache_service
+
+    with _cache_service_lock:
+        if _cache_service is None and time.monotonic() >= _cache_service_retry_at:
+            try:
+                _cache_service = CacheService()
+                _cache_service_failures = 0
+            except Exception as e:
+                _cache_service_failures += 1
+                delay = min(
+                    CACHE_SERVICE_RETRY_SECONDS * 2 ** (_cache_service_failures - 1),
+                    CACHE_SERVICE_RETRY_MAX_SECONDS,
+                )
+                _cache_service_retry_at = time.monotonic() + delay
+                logger.warning(f"⚠️ CacheService 초기화 실패 (캐시 없이 동작, {delay:.0f}초 후 재시도): {e}")
+    return _cache_service
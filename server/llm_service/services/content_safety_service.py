@@ -8,18 +8,50 @@ Content Safety Service
 3. 커스텀 블랙리스트 지원
 4. LLM 기반 정교한 감지 및 카테고리 분류
 5. 향후 GCP Content Safety API 통합 가능
+
+규칙은 초기화 시 한 번 컴파일:
+- 유해/스팸 패턴 → 우선순위 순 컴파일된 규칙 + 마스킹용 alternation 하나
+- 커스텀 블랙리스트(고정 문자열) → Aho-Corasick 오토마톤
+
+LLM 검사 (async 핸들러용 *_async 메서드):
+- AsyncOpenAI + 동시 호출 수 제한 → 이벤트 루프를 막지 않음
+- 판정 캐시 (정규화 텍스트 해시) + 같은 텍스트 동시 검사는 호출 하나로 합침
+- optimistic 모드: begin_check()가 규칙 검사만 끝내고 LLM 검사는 백그라운드로 진행,
+  핸들러는 RAG 검색/답변 생성과 겹쳐서 진행하다가 응답 직전에 결과 확인
 """
 
+import asyncio
+import hashlib
 import re
 import logging
 import json
 import os
+import unicodedata
 from typing import Dict, List, Optional, Tuple
 from enum import Enum
-from openai import OpenAI
+from openai import OpenAI, AsyncOpenAI
+
+from .openai_service import OPENAI_MAX_RETRIES, get_shared_http_client
+from ..utils.aho_corasick import AhoCorasick
+from ..utils.single_flight import SingleFlight
+from ..utils.ttl_cache import TTLCache
 
 logger = logging.getLogger(__name__)
 
+# 커스텀 블랙리스트 (쉼표 구분, 대소문자 무시)
+CONTENT_SAFETY_BLACKLIST = os.getenv("CONTENT_SAFETY_BLACKLIST", "")
+
+# LLM 판정 캐시 (같은 질문/게시글 재검사 방지)
+CONTENT_SAFETY_CACHE_SIZE = int(os.getenv("CONTENT_SAFETY_CACHE_SIZE", "2048"))
+CONTENT_SAFETY_CACHE_TTL_SECONDS = float(os.getenv("CONTENT_SAFETY_CACHE_TTL_SECONDS", "3600"))
+# 동시 LLM 검사 수 상한 (답변 생성 호출이 쓸 커넥션을 남겨 둠)
+CONTENT_SAFETY_LLM_CONCURRENCY = int(os.getenv("CONTENT_SAFETY_LLM_CONCURRENCY", "4"))
+CONTENT_SAFETY_LLM_TIMEOUT_SECONDS = float(os.getenv("CONTENT_SAFETY_LLM_TIMEOUT_SECONDS", "10"))
+# optimistic 모드: LLM 검사를 본 처리와 동시에 실행하고 응답 직전에 확인
+CONTENT_SAFETY_OPTIMISTIC = os.getenv("CONTENT_SAFETY_OPTIMISTIC", "false").lower() == "true"
+
+VALID_POST_CATEGORIES = ["축구분석", "자유게시판", "질문", "정보공유", "후기", "general"]
+
 
 class ContentCategory(str, Enum):
     """콘텐츠 카테고리"""
@@ -54,10 +86,71 @@ class ContentSafetyResult:
         }
 
 
+SAFE_RESULT = ContentSafetyResult(is_safe=True, reason="안전한 콘텐츠")
+
+
+def _cache_key(kind: str, text: str) -> str:
+    """판정 캐시 키 (유니코드 정규화 + 소문자 + 공백 정리 후 해시)"""
+    normalized = " ".join(unicodedata.normalize("NFKC", text).lower().split())
+    return f"{kind}:{hashlib.sha256(normalized.encode('utf-8')).hexdigest()}"
+
+
+class PendingSafetyCheck:
+    """
+    진행 중인 입력 검사 (ContentSafetyService.begin_check 반환값)
+
+    - current: 지금까지 확정된 판정 (규칙 검사, LLM 검사가 끝났다면 그 결과까지)
+    - result(): LLM 검사까지 끝난 최종 판정 (응답 반환 직전에 await)
+    """
+
+    def __init__(self, current: ContentSafetyResult, task: Optional[asyncio.Task] = None):
+        self.current = current
+        self._task = task
+
+    @property
+    def pending(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    async def result(self) -> ContentSafetyResult:
+        if self._task is not None:
+            llm_result = await self._task
+            self._task = None
+            if not llm_result.is_safe:
+                self.current = llm_result
+        return self.current
+
+
+# 패턴 앞뒤의 "[...]*" / ".*" (0번 이상 반복): 있어도 없어도 search 결과(매칭 여부)는 같음
+_OPTIONAL_PREFIX = re.compile(r"^(?:\[(?:\\.|[^\\\]])+\]|\.)[*?]")
+_OPTIONAL_SUFFIX = re.compile(r"(?<!\\)(?:\[(?:\\.|[^\\\]])+\]|\.)[*?]$")
+
+
+def _search_core(compiled: "re.Pattern") -> "re.Pattern":
+    """
+    매칭 여부 판정용 패턴
+
+    "[가-힣]*판매"는 모든 위치에서 한글 구간을 끝까지 읽고 되돌아가느라 느리지만
+    매칭 여부는 "판매"와 같음 → 앞뒤 선택적 반복을 떼어 내면 리터럴 검색으로 빨라짐
+    (감지 문구는 원래 패턴으로 수집)
+    """
+    pattern = compiled.pattern
+    while True:
+        stripped = _OPTIONAL_SUFFIX.sub("", _OPTIONAL_PREFIX.sub("", pattern))
+        if stripped == pattern:
+            break
+        pattern = stripped
+    if not pattern or pattern == compiled.pattern:
+        return compiled
+    try:
+        return re.compile(pattern, compiled.flags)
+    except re.error:
+        return compiled
+
+
 class ContentSafetyService:
     """콘텐츠 안전성 검사 서비스"""
     
-    def __init__(self, use_llm: bool = True):
+    def __init__(self, use_llm: bool = True, optimistic: bool = CONTENT_SAFETY_OPTIMISTIC):
         """초기화: 블랙리스트 및 패턴 로드"""
         # 커스텀 블랙리스트 (프로젝트 고유 규칙)
         self.custom_blacklist = self._load_custom_blacklist()
@@ -67,17 +160,35 @@ class ContentSafetyService:
         
         # 스팸 패턴
         self.spam_patterns = self._load_spam_patterns()
+
+        # 위 규칙들을 한 번만 컴파일
+        self._compile_rules()
         
         # LLM 기반 감지 활성화 여부
         self.use_llm = use_llm
+        self.optimistic = optimistic
         self.llm_client = None
+        self._llm_api_key: Optional[str] = None
+        self._async_llm_client = None
+        self._async_llm_pool = None
+        self.llm_model = os.getenv("OPENAI_CHAT_MODEL", "gpt-4o-mini")
+
+        # LLM 판정 캐시 / 같은 텍스트 동시 검사 합치기 / 동시 호출 제한
+        self.verdict_cache = TTLCache(
+            maxsize=CONTENT_SAFETY_CACHE_SIZE, ttl_seconds=CONTENT_SAFETY_CACHE_TTL_SECONDS
+        )
+        self.llm_flights = SingleFlight()
+        self._llm_semaphore: Optional[asyncio.Semaphore] = None
+        self._llm_semaphore_loop: Optional[asyncio.AbstractEventLoop] = None
+        self.llm_calls = 0
         
         if self.use_llm:
             try:
                 api_key = os.getenv("OPENAI_API_KEY")
                 if api_key:
                     self.llm_client = OpenAI(api_key=api_key)
-                    self.llm_model = os.getenv("OPENAI_CHAT_MODEL", "gpt-4o-mini")
+                    # async 핸들러용: 공용 커넥션 풀 사용 (async_llm_client에서 지연 생성)
+                    self._llm_api_key = api_key
                     logger.info("✅ LLM 기반 콘텐츠 감지 활성화")
                 else:
                     logger.warning("⚠️ OPENAI_API_KEY가 없어 LLM 기반 감지 비활성화")
@@ -93,12 +204,8 @@ class ContentSafetyService:
         커스텀 블랙리스트 로드
         프로젝트 고유의 금지어 목록 (예: 특정 고객사 이름, 기밀 정보 등)
         """
-        # TODO: 환경변수나 설정 파일에서 로드 가능
-        return [
-            # 예시: 프로젝트 특정 금지어
-            # "기밀정보",
-            # "내부문서",
-        ]
+        # 예시: CONTENT_SAFETY_BLACKLIST="기밀정보,내부문서"
+        return [word.strip() for word in CONTENT_SAFETY_BLACKLIST.split(",") if word.strip()]
 
     def _load_harmful_patterns(self) -> Dict[ContentCategory, List[str]]:
         """유해 콘텐츠 패턴 로드"""
@@ -149,17 +256,52 @@ class ContentSafetyService:
             r"카톡|카카오톡|문의|연락",  # 연락처 요청
         ]
 
-    def check_input(self, text: str, use_llm_fallback: bool = True) -> ContentSafetyResult:
+    def _compile_rules(self) -> None:
         """
-        입력 게이트웨이: 사용자 쿼리 필터링
-        
-        Args:
-            text: 사용자 입력 텍스트
-            use_llm_fallback: 정규식에서 감지되지 않았을 때 LLM 체크 수행 여부
-            
+        패턴/블랙리스트 컴파일 (초기화 시 호출, 규칙을 바꿨다면 다시 호출)
+
+        - _rules: (카테고리, 검사용 패턴, 원래 패턴) - 우선순위 순
+          (harmful_patterns 카테고리 순서 → 패턴 순서 → spam_patterns, 기존 순차 검사와 같은 결과)
+        - _masker: 전체 패턴 alternation → filter_text에서 한 번의 re.sub로 마스킹
+        - _blacklist: 커스텀 블랙리스트 Aho-Corasick 오토마톤
+        - max_pattern_length: 가장 긴 블랙리스트 단어 길이 (스트리밍 필터가 끝에서 남겨 둘 길이,
+          정규식 규칙은 단어 단위라 공백 경계로 처리)
+        """
+        rules = []
+        sources = [*self.harmful_patterns.items(), (ContentCategory.SPAM, self.spam_patterns)]
+        for category, patterns in sources:
+            for pattern in patterns:
+                try:
+                    compiled = re.compile(pattern, re.IGNORECASE)
+                except re.error as e:
+                    logger.warning(f"⚠️ 정규식 패턴 오류 (무시): {pattern} - {e}")
+                    continue
+                rules.append((category, _search_core(compiled), compiled))
+        self._rules = rules
+
+        self._masker = None
+        if rules:
+            self._masker = re.compile("|".join(f"(?:{compiled.pattern})" for _, _, compiled in rules), re.IGNORECASE)
+
+        self._blacklist = AhoCorasick(self.custom_blacklist)
+        self.max_pattern_length = max((len(word) for word in self.custom_blacklist), default=1)
+
+    def _match_rule(self, text: str) -> Optional[Tuple[ContentCategory, List[str]]]:
+        """
+        우선순위 순으로 처음 걸리는 규칙 찾기
+
         Returns:
-            ContentSafetyResult: 검사 결과
+            (카테고리, 감지된 문구) 또는 None
         """
+        for category, core, compiled in self._rules:
+            if core.search(text):
+                # 감지 문구는 원래 패턴으로 수집 (차단되는 경우에만 실행)
+                detected = list(dict.fromkeys(m.group(0) for m in compiled.finditer(text)))
+                return category, detected
+        return None
+
+    def _check_rules(self, text: str) -> Optional[ContentSafetyResult]:
+        """규칙 검사 (빈 입력이거나 걸리면 결과, 통과하면 None)"""
         if not text or not text.strip():
             return ContentSafetyResult(
                 is_safe=True,
@@ -167,51 +309,44 @@ class ContentSafetyService:
             )
 
         text_lower = text.lower()
-        detected_words = []
-
-        # 1. 커스텀 블랙리스트 체크
-        for word in self.custom_blacklist:
-            if word.lower() in text_lower:
-                detected_words.append(word)
-                return ContentSafetyResult(
-                    is_safe=False,
-                    category=ContentCategory.HARMFUL,
-                    detected_words=[word],
-                    reason=f"커스텀 블랙리스트에 포함된 단어 감지: {word}"
-                )
 
-        # 2. 유해 콘텐츠 패턴 체크
-        for category, patterns in self.harmful_patterns.items():
-            for pattern in patterns:
-                try:
-                    matches = re.findall(pattern, text_lower, re.IGNORECASE)
-                    if matches:
-                        detected_words.extend(matches)
-                        return ContentSafetyResult(
-                            is_safe=False,
-                            category=category,
-                            detected_words=list(set(matches)),
-                            reason=f"{category.value} 패턴 감지"
-                        )
-                except re.error as e:
-                    logger.warning(f"⚠️ 정규식 패턴 오류 (무시): {pattern} - {e}")
-                    continue
+        # 1. 커스텀 블랙리스트 체크 (목록 순서상 먼저 나온 단어)
+        found = self._blacklist.search(text_lower)
+        if found:
+            word = self.custom_blacklist[found[0]]
+            return ContentSafetyResult(
+                is_safe=False,
+                category=ContentCategory.HARMFUL,
+                detected_words=[word],
+                reason=f"커스텀 블랙리스트에 포함된 단어 감지: {word}"
+            )
 
-        # 3. 스팸 패턴 체크
-        for pattern in self.spam_patterns:
-            try:
-                matches = re.findall(pattern, text_lower, re.IGNORECASE)
-                if matches:
-                    detected_words.extend(matches)
-                    return ContentSafetyResult(
-                        is_safe=False,
-                        category=ContentCategory.SPAM,
-                        detected_words=list(set(matches)),
-                        reason="스팸 패턴 감지"
-                    )
-            except re.error as e:
-                logger.warning(f"⚠️ 정규식 패턴 오류 (무시): {pattern} - {e}")
-                continue
+        # 2~3. 유해 콘텐츠 / 스팸 패턴 체크 (컴파일된 규칙)
+        matched = self._match_rule(text_lower)
+        if matched:
+            category, detected_words = matched
+            return ContentSafetyResult(
+                is_safe=False,
+                category=category,
+                detected_words=detected_words,
+                reason="스팸 패턴 감지" if category == ContentCategory.SPAM else f"{category.value} 패턴 감지"
+            )
+        return None
+
+    def check_input(self, text: str, use_llm_fallback: bool = True) -> ContentSafetyResult:
+        """
+        입력 게이트웨이: 사용자 쿼리 필터링 (동기 - async 핸들러에서는 check_input_async 사용)
+        
+        Args:
+            text: 사용자 입력 텍스트
+            use_llm_fallback: 정규식에서 감지되지 않았을 때 LLM 체크 수행 여부
+            
+        Returns:
+            ContentSafetyResult: 검사 결과
+        """
+        decided = self._check_rules(text)
+        if decided:
+            return decided
 
         # 4. LLM 기반 정교한 감지 (정규식에서 감지되지 않은 경우)
         if self.use_llm and use_llm_fallback and self.llm_client:
@@ -224,26 +359,88 @@ class ContentSafetyService:
                 logger.warning(f"⚠️ LLM 기반 감지 실패 (정규식 결과 사용): {e}")
 
         # 안전한 콘텐츠
-        return ContentSafetyResult(
-            is_safe=True,
-            reason="안전한 콘텐츠"
-        )
-    
-    def _check_with_llm(self, text: str) -> ContentSafetyResult:
+        return SAFE_RESULT
+
+    async def check_input_async(self, text: str, use_llm_fallback: bool = True) -> ContentSafetyResult:
+        """check_input의 비동기 버전 (LLM 검사 중에도 이벤트 루프를 막지 않음)"""
+        decided = self._check_rules(text)
+        if decided:
+            return decided
+
+        if self.use_llm and use_llm_fallback and self.async_llm_client:
+            llm_result = await self.check_with_llm_async(text)
+            if not llm_result.is_safe:
+                logger.info(f"🤖 LLM 기반 유해 콘텐츠 감지: {llm_result.category}")
+                return llm_result
+
+        return SAFE_RESULT
+
+    async def begin_check(self, text: str, optimistic: Optional[bool] = None) -> PendingSafetyCheck:
         """
-        LLM을 사용한 정교한 콘텐츠 안전성 검사
-        
-        Args:
-            text: 검사할 텍스트
-            
-        Returns:
-            ContentSafetyResult: 검사 결과
+        입력 검사 시작
+
+        - 규칙 검사는 바로 (current에 반영)
+        - LLM 검사: 캐시에 있으면 바로 반영, 없으면
+          - 기본 모드: 끝날 때까지 기다린 뒤 반환
+          - optimistic 모드: 백그라운드 Task로 실행하고 바로 반환 → 호출자가 응답 직전에 result() 확인
+
+        Example:
+            >>> check = await service.begin_check(query)
+            >>> if not check.current.is_safe: ...   # 규칙 위반은 즉시 차단
+            >>> # RAG 검색 / 답변 생성 ...
+            >>> if not (await check.result()).is_safe: ...
         """
-        if not self.llm_client:
-            return ContentSafetyResult(is_safe=True, reason="LLM 비활성화")
-        
-        try:
-            prompt = f"""다음 텍스트가 부적절한 내용을 포함하고 있는지 분석해주세요.
+        decided = self._check_rules(text)
+        if decided:
+            return PendingSafetyCheck(decided)
+        if not (self.use_llm and self.async_llm_client):
+            return PendingSafetyCheck(SAFE_RESULT)
+
+        cached = self.verdict_cache.get(_cache_key("moderation", text))
+        if cached is not None:
+            return PendingSafetyCheck(cached if not cached.is_safe else SAFE_RESULT)
+
+        optimistic = self.optimistic if optimistic is None else optimistic
+        if not optimistic:
+            llm_result = await self.check_with_llm_async(text)
+            return PendingSafetyCheck(llm_result if not llm_result.is_safe else SAFE_RESULT)
+        return PendingSafetyCheck(SAFE_RESULT, asyncio.ensure_future(self.check_with_llm_async(text)))
+
+    @property
+    def async_llm_client(self) -> Optional[AsyncOpenAI]:
+        """
+        공용 커넥션 풀을 쓰는 AsyncOpenAI (풀이 닫혔다가 다시 만들어지면 클라이언트도 다시 생성)
+
+        직접 지정한 클라이언트(테스트/벤치마크 대역)는 그대로 사용
+        """
+        if self._llm_api_key and (self._async_llm_client is None or self._async_llm_pool is not None):
+            pool = get_shared_http_client()
+            if self._async_llm_pool is not pool:
+                self._async_llm_client = AsyncOpenAI(
+                    api_key=self._llm_api_key,
+                    http_client=pool,
+                    timeout=CONTENT_SAFETY_LLM_TIMEOUT_SECONDS,
+                    max_retries=OPENAI_MAX_RETRIES,
+                )
+                self._async_llm_pool = pool
+        return self._async_llm_client
+
+    @async_llm_client.setter
+    def async_llm_client(self, client) -> None:
+        self._async_llm_client = client
+        self._async_llm_pool = None
+
+    @property
+    def llm_semaphore(self) -> asyncio.Semaphore:
+        """동시 LLM 검사 제한 세마포어 (이벤트 루프별로 지연 생성)"""
+        loop = asyncio.get_running_loop()
+        if self._llm_semaphore is None or self._llm_semaphore_loop is not loop:
+            self._llm_semaphore = asyncio.Semaphore(CONTENT_SAFETY_LLM_CONCURRENCY)
+            self._llm_semaphore_loop = loop
+        return self._llm_semaphore
+
+    def _moderation_messages(self, text: str) -> List[Dict[str, str]]:
+        prompt = f"""다음 텍스트가 부적절한 내용을 포함하고 있는지 분석해주세요.
 
 텍스트: "{text}"
 
@@ -263,63 +460,85 @@ JSON 형식으로 응답해주세요:
     "reason": "감지 이유 (한국어)",
     "detected_phrases": ["감지된 구문1", "감지된 구문2"]
 }}"""
+        return [
+            {"role": "system", "content": "당신은 콘텐츠 안전성 검사 전문가입니다. 정확하고 객관적으로 분석해주세요."},
+            {"role": "user", "content": prompt}
+        ]
+
+    def _parse_moderation(self, response_text: str) -> ContentSafetyResult:
+        """LLM 응답(JSON) → 판정 (파싱 실패 시 json.JSONDecodeError)"""
+        # JSON 코드 블록 제거
+        if "```json" in response_text:
+            response_text = response_text.split("```json")[1].split("```")[0].strip()
+        elif "```" in response_text:
+            response_text = response_text.split("```")[1].split("```")[0].strip()
+        
+        result_dict = json.loads(response_text)
+        
+        is_safe = result_dict.get("is_safe", True)
+        category_str = result_dict.get("category", "safe")
+        reason = result_dict.get("reason", "")
+        detected_phrases = result_dict.get("detected_phrases", [])
+        
+        if category_str == "safe" or is_safe:
+            return ContentSafetyResult(
+                is_safe=True,
+                reason=reason or "LLM 검사 결과 안전"
+            )
+        
+        # 카테고리 매핑
+        try:
+            category = ContentCategory(category_str)
+        except ValueError:
+            # 매핑되지 않은 카테고리는 INAPPROPRIATE로 처리
+            category = ContentCategory.INAPPROPRIATE
+        
+        return ContentSafetyResult(
+            is_safe=False,
+            category=category,
+            detected_words=detected_phrases,
+            reason=reason or f"LLM 기반 {category_str} 감지"
+        )
 
+    def _check_with_llm(self, text: str) -> ContentSafetyResult:
+        """
+        LLM을 사용한 정교한 콘텐츠 안전성 검사 (동기, 판정 캐시 공유)
+        
+        Args:
+            text: 검사할 텍스트
+            
+        Returns:
+            ContentSafetyResult: 검사 결과
+        """
+        if not self.llm_client:
+            return ContentSafetyResult(is_safe=True, reason="LLM 비활성화")
+
+        key = _cache_key("moderation", text)
+        cached = self.verdict_cache.get(key)
+        if cached is not None:
+            return cached
+        
+        response_text = ""
+        try:
+            self.llm_calls += 1
             response = self.llm_client.chat.completions.create(
                 model=self.llm_model,
-                messages=[
-                    {"role": "system", "content": "당신은 콘텐츠 안전성 검사 전문가입니다. 정확하고 객관적으로 분석해주세요."},
-                    {"role": "user", "content": prompt}
-                ],
+                messages=self._moderation_messages(text),
                 temperature=0.3,
                 max_tokens=200,
             )
-            
             response_text = response.choices[0].message.content.strip()
-            
-            # JSON 파싱 시도
-            try:
-                # JSON 코드 블록 제거
-                if "```json" in response_text:
-                    response_text = response_text.split("```json")[1].split("```")[0].strip()
-                elif "```" in response_text:
-                    response_text = response_text.split("```")[1].split("```")[0].strip()
-                
-                result_dict = json.loads(response_text)
-                
-                is_safe = result_dict.get("is_safe", True)
-                category_str = result_dict.get("category", "safe")
-                reason = result_dict.get("reason", "")
-                detected_phrases = result_dict.get("detected_phrases", [])
-                
-                if category_str == "safe" or is_safe:
-                    return ContentSafetyResult(
-                        is_safe=True,
-                        reason=reason or "LLM 검사 결과 안전"
-                    )
-                
-                # 카테고리 매핑
-                category = None
-                try:
-                    category = ContentCategory(category_str)
-                except ValueError:
-                    # 매핑되지 않은 카테고리는 INAPPROPRIATE로 처리
-                    category = ContentCategory.INAPPROPRIATE
-                
-                return ContentSafetyResult(
-                    is_safe=False,
-                    category=category,
-                    detected_words=detected_phrases,
-                    reason=reason or f"LLM 기반 {category_str} 감지"
-                )
-                
-            except json.JSONDecodeError as e:
-                logger.warning(f"⚠️ LLM 응답 JSON 파싱 실패: {response_text}, 오류: {e}")
-                # JSON 파싱 실패 시 안전한 것으로 간주
-                return ContentSafetyResult(
-                    is_safe=True,
-                    reason="LLM 응답 파싱 실패"
-                )
-                
+            result = self._parse_moderation(response_text)
+            self.verdict_cache.set(key, result)
+            return result
+
+        except json.JSONDecodeError as e:
+            logger.warning(f"⚠️ LLM 응답 JSON 파싱 실패: {response_text}, 오류: {e}")
+            # JSON 파싱 실패 시 안전한 것으로 간주
+            return ContentSafetyResult(
+                is_safe=True,
+                reason="LLM 응답 파싱 실패"
+            )
         except Exception as e:
             logger.error(f"❌ LLM 기반 감지 오류: {e}", exc_info=True)
             # 오류 발생 시 안전한 것으로 간주 (페일-세이프)
@@ -328,6 +547,48 @@ JSON 형식으로 응답해주세요:
                 reason=f"LLM 검사 오류: {str(e)}"
             )
 
+    async def check_with_llm_async(self, text: str) -> ContentSafetyResult:
+        """
+        _check_with_llm의 비동기 버전
+
+        - 판정 캐시 히트면 LLM 호출 없음
+        - 같은 텍스트 동시 검사는 호출 하나의 결과를 공유
+        - 오류/파싱 실패는 안전으로 간주 (캐시하지 않음)
+        """
+        if not self.async_llm_client:
+            return ContentSafetyResult(is_safe=True, reason="LLM 비활성화")
+
+        key = _cache_key("moderation", text)
+        cached = self.verdict_cache.get(key)
+        if cached is not None:
+            return cached
+
+        result, _ = await self.llm_flights.do(key, lambda: self._moderate_async(key, text))
+        return result
+
+    async def _moderate_async(self, key: str, text: str) -> ContentSafetyResult:
+        response_text = ""
+        try:
+            async with self.llm_semaphore:
+                self.llm_calls += 1
+                response = await self.async_llm_client.chat.completions.create(
+                    model=self.llm_model,
+                    messages=self._moderation_messages(text),
+                    temperature=0.3,
+                    max_tokens=200,
+                )
+            response_text = response.choices[0].message.content.strip()
+            result = self._parse_moderation(response_text)
+            self.verdict_cache.set(key, result)
+            return result
+
+        except json.JSONDecodeError as e:
+            logger.warning(f"⚠️ LLM 응답 JSON 파싱 실패: {response_text}, 오류: {e}")
+            return ContentSafetyResult(is_safe=True, reason="LLM 응답 파싱 실패")
+        except Exception as e:
+            logger.error(f"❌ LLM 기반 감지 오류: {e}", exc_info=True)
+            return ContentSafetyResult(is_safe=True, reason=f"LLM 검사 오류: {str(e)}")
+
     def check_output(self, text: str) -> ContentSafetyResult:
         """
         출력 필터: LLM 응답 필터링
@@ -342,6 +603,10 @@ JSON 형식으로 응답해주세요:
         # (향후 출력 전용 규칙 추가 가능)
         return self.check_input(text)
 
+    async def check_output_async(self, text: str) -> ContentSafetyResult:
+        """check_output의 비동기 버전"""
+        return await self.check_input_async(text)
+
     def filter_text(self, text: str, replacement: str = "***") -> str:
         """
         텍스트에서 금지어를 마스킹
@@ -353,50 +618,63 @@ JSON 형식으로 응답해주세요:
         Returns:
             필터링된 텍스트
         """
+        # 유해/스팸 패턴: 걸리는 규칙이 있을 때만 한 번의 re.sub (겹치는 매칭은 하나로 마스킹)
         result = text
-        detected_words = []
-
-        # 모든 패턴을 찾아서 마스킹
-        all_patterns = []
-        for patterns in self.harmful_patterns.values():
-            all_patterns.extend(patterns)
-        all_patterns.extend(self.spam_patterns)
-
-        for pattern in all_patterns:
-            matches = re.findall(pattern, result, re.IGNORECASE)
-            if matches:
-                detected_words.extend(matches)
-                # 패턴을 대체 문자로 변경
-                result = re.sub(pattern, replacement, result, flags=re.IGNORECASE)
+        if self._masker and any(core.search(text) for _, core, _ in self._rules):
+            result = self._masker.sub(replacement, text)
 
         # 커스텀 블랙리스트도 마스킹
-        for word in self.custom_blacklist:
-            if word.lower() in result.lower():
-                result = re.sub(
-                    re.escape(word),
-                    replacement,
-                    result,
-                    flags=re.IGNORECASE
-                )
+        if self._blacklist:
+            result = self._mask_blacklist(result, replacement)
 
         return result
-    
-    def classify_category(self, title: str, content: str) -> str:
+
+    def mask_boundary(self, text: str, cut: int) -> int:
         """
-        게시글 카테고리 자동 분류 (LLM 활용)
-        
-        Args:
-            title: 게시글 제목
-            content: 게시글 내용
-            
-        Returns:
-            str: 카테고리명 (예: "축구분석", "자유게시판", "질문", "정보공유" 등)
+        text[:cut]만 따로 마스킹해도 되도록 cut 조정 (스트리밍 출력 필터용)
+
+        cut에 걸쳐 있는 패턴/블랙리스트 매칭이 있으면 그 매칭 시작 위치로 당긴다.
         """
-        if not self.llm_client:
-            return "general"  # LLM 비활성화 시 기본값
-        
-        try:
-            prompt = f"""다음 게시글의 카테고리를 자동으로 분류해주세요.
+        spans = []
+        if self._masker and any(core.search(text) for _, core, _ in self._rules):
+            spans.extend(m.span() for m in self._masker.finditer(text))
+        if self._blacklist and len(text.lower()) == len(text):
+            spans.extend((start, end) for start, end, _ in self._blacklist.finditer(text))
+        for start, end in sorted(spans, reverse=True):
+            if start < cut < end:
+                cut = start
+        return cut
+
+    def _mask_blacklist(self, text: str, replacement: str) -> str:
+        """블랙리스트 단어 등장 구간 마스킹 (겹치는 구간은 합쳐서 한 번)"""
+        if len(text.lower()) != len(text):
+            # 소문자 변환으로 길이가 바뀌는 문자(İ 등)가 있으면 위치를 쓸 수 없음 → 단어별 치환
+            for word in self.custom_blacklist:
+                if word:
+                    text = re.sub(re.escape(word), replacement, text, flags=re.IGNORECASE)
+            return text
+
+        spans = sorted((start, end) for start, end, _ in self._blacklist.finditer(text))
+        if not spans:
+            return text
+        parts = []
+        last = 0
+        span_start, span_end = spans[0]
+        for start, end in spans[1:]:
+            if start < span_end:
+                span_end = max(span_end, end)
+                continue
+            parts.append(text[last:span_start])
+            parts.append(replacement)
+            last = span_end
+            span_start, span_end = start, end
+        parts.append(text[last:span_start])
+        parts.append(replacement)
+        parts.append(text[span_end:])
+        return "".join(parts)
+    
+    def _category_messages(self, title: str, content: str) -> List[Dict[str, str]]:
+        prompt = f"""다음 게시글의 카테고리를 자동으로 분류해주세요.
 
 제목: "{title}"
 내용: "{content[:500]}"  # 내용이 길면 500자까지만
@@ -410,33 +688,112 @@ JSON 형식으로 응답해주세요:
 - general: 기타
 
 카테고리명만 반환해주세요 (예: "축구분석", "자유게시판" 등)."""
+        return [
+            {"role": "system", "content": "당신은 게시글 카테고리 분류 전문가입니다. 정확하게 카테고리를 분류해주세요."},
+            {"role": "user", "content": prompt}
+        ]
+
+    def _parse_category(self, response_text: str) -> str:
+        # 따옴표 제거
+        category = response_text.strip().strip('"\'')
+        
+        # 유효한 카테고리 확인
+        if category not in VALID_POST_CATEGORIES:
+            logger.warning(f"⚠️ 유효하지 않은 카테고리: {category}, 기본값 사용")
+            return "general"
+        
+        logger.info(f"📂 카테고리 자동 분류: {category}")
+        return category
 
+    def classify_category(self, title: str, content: str) -> str:
+        """
+        게시글 카테고리 자동 분류 (LLM 활용, 동기 - async 핸들러에서는 classify_category_async 사용)
+        
+        Args:
+            title: 게시글 제목
+            content: 게시글 내용
+            
+        Returns:
+            str: 카테고리명 (예: "축구분석", "자유게시판", "질문", "정보공유" 등)
+        """
+        if not self.llm_client:
+            return "general"  # LLM 비활성화 시 기본값
+
+        key = _cache_key("category", f"{title}\n{content[:500]}")
+        cached = self.verdict_cache.get(key)
+        if cached is not None:
+            return cached
+        
+        try:
+            self.llm_calls += 1
             response = self.llm_client.chat.completions.create(
                 model=self.llm_model,
-                messages=[
-                    {"role": "system", "content": "당신은 게시글 카테고리 분류 전문가입니다. 정확하게 카테고리를 분류해주세요."},
-                    {"role": "user", "content": prompt}
-                ],
+                messages=self._category_messages(title, content),
                 temperature=0.3,
                 max_tokens=50,
             )
-            
-            category = response.choices[0].message.content.strip()
-            
-            # 따옴표 제거
-            category = category.strip('"\'')
-            
-            # 유효한 카테고리 확인
-            valid_categories = ["축구분석", "자유게시판", "질문", "정보공유", "후기", "general"]
-            if category not in valid_categories:
-                logger.warning(f"⚠️ 유효하지 않은 카테고리: {category}, 기본값 사용")
-                return "general"
-            
-            logger.info(f"📂 카테고리 자동 분류: {category}")
+            category = self._parse_category(response.choices[0].message.content)
+            self.verdict_cache.set(key, category)
             return category
             
         except Exception as e:
             logger.warning(f"⚠️ 카테고리 자동 분류 실패: {e}, 기본값 사용")
             return "general"
 
+    async def classify_category_async(self, title: str, content: str) -> str:
+        """classify_category의 비동기 버전 (판정 캐시 공유, 동시 호출 제한)"""
+        if not self.async_llm_client:
+            return "general"
+
+        key = _cache_key("category", f"{title}\n{content[:500]}")
+        cached = self.verdict_cache.get(key)
+        if cached is not None:
+            return cached
 
+        async def classify() -> str:
+            try:
+                async with self.llm_semaphore:
+                    self.llm_calls += 1
+                    response = await self.async_llm_client.chat.completions.create(
+                        model=self.llm_model,
+                        messages=self._category_messages(title, content),
+                        temperature=0.3,
+                        max_tokens=50,
+                    )
+                category = self._parse_category(response.choices[0].message.content)
+                self.verdict_cache.set(key, category)
+                return category
+            except Exception as e:
+                logger.warning(f"⚠️ 카테고리 자동 분류 실패: {e}, 기본값 사용")
+                return "general"
+
+        category, _ = await self.llm_flights.do(key, classify)
+        return category
+
+    def get_stats(self) -> Dict:
+        return {
+            "llm_enabled": bool(self.use_llm and self.async_llm_client),
+            "optimistic": self.optimistic,
+            "llm_calls": self.llm_calls,
+            "verdict_cache": self.verdict_cache.get_stats(),
+            "flights": self.llm_flights.get_stats(),
+        }
+
+
+# ============================================
+# 싱글톤 인스턴스 (첫 사용 시 생성)
+# ============================================
+_content_safety_service: Optional[ContentSafetyService] = None
+_content_safety_failed = False
+
+
+def get_content_safety_service() -> Optional[ContentSafetyService]:
+    """공용 ContentSafetyService 반환 (초기화 실패 시 None, 재시도하지 않음)"""
+    global _content_safety_service, _content_safety_failed
+    if _content_safety_service is None and not _content_safety_failed:
+        try:
+            _content_safety_service = ContentSafetyService()
+        except Exception as e:
+            _content_safety_failed = True
+            logger.warning(f"⚠️ ContentSafetyService 초기화 실패: {e}")
+    return _content_safety_service
@@ -27,8 +27,8 @@ class DataIngestionService:
         self.openai_service = openai_service
         logger.info("✅ DataIngestionService 초기화")
     
-    def format_match_document(self, match: Dict[str, Any]) -> Dict[str, Any]:
-        """경기 정보를 문서 형식으로 변환"""
+    def format_match_document(self, match: Dict[str, Any], competition: Optional[str] = None) -> Dict[str, Any]:
+        """경기 정보를 문서 형식으로 변환 (competition: 리그 코드, 없으면 경기의 대회 코드)"""
         try:
             match_id = match.get("id")
             home_team = match.get("homeTeam", {})
@@ -71,6 +71,7 @@ class DataIngestionService:
                 "date": date_str,
                 "status": status,
                 "type": "match",
+                "competition": competition or match.get("competition", {}).get("code", ""),
                 "timestamp": datetime.now().isoformat()
             }
             
@@ -141,8 +142,8 @@ class DataIngestionService:
             logger.error(f"❌ 순위표 문서 변환 실패: {e}")
             return []
     
-    def format_team_document(self, team: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-        """팀 정보를 문서 형식으로 변환"""
+    def format_team_document(self, team: Dict[str, Any], competition: str = "") -> Optional[Dict[str, Any]]:
+        """팀 정보를 문서 형식으로 변환 (competition: 수집한 리그 코드)"""
         try:
             team_id = team.get("id")
             team_name = team.get("name", "Unknown")
@@ -165,6 +166,7 @@ class DataIngestionService:
                 "founded": founded,
                 "venue": venue,
                 "type": "team",
+                "competition": competition,
                 "timestamp": datetime.now().isoformat()
             }
             
@@ -202,7 +204,7 @@ class DataIngestionService:
             # 문서 변환
             documents = []
             for match in matches:
-                doc = self.format_match_document(match)
+                doc = self.format_match_document(match, competition)
                 if doc:
                     documents.append(doc)
             
@@ -266,7 +268,7 @@ class DataIngestionService:
             
             documents = []
             for team in teams_data:
-                doc = self.format_team_document(team)
+                doc = self.format_team_document(team, competition)
                 if doc:
                     documents.append(doc)
             
@@ -0,0 +1,143 @@
+"""
+공용 임베딩 서비스
+한 요청 안에서 같은 질문을 여러 번 임베딩하지 않도록 프로세스 공용 LRU로 재사용
+
+한 번의 /api/llm/agent 요청은 같은 질문을 최대 3번 임베딩했다.
+- is_complex_question → chroma_db_classification 검색
+- get_cached_answer   → chroma_db_cache 검색
+- rag_service.search  → chroma_db 검색
+모든 RAGService가 get_embeddings()의 CachedEmbeddings를 공유하므로
+정규화된 텍스트 기준으로 첫 번째 호출만 API를 사용한다.
+
+요청별 카운터:
+    stats = begin_embedding_request_stats()   # 미들웨어에서 요청 시작 시
+    ...                                       # 요청 처리
+    stats["api_calls"]                        # 이 요청에서 발생한 임베딩 API 호출 수
+"""
+import logging
+import os
+import threading
+from array import array
+from contextvars import ContextVar
+from typing import Dict, List, Optional
+
+from langchain_core.embeddings import Embeddings
+from langchain_openai import OpenAIEmbeddings
+
+from ..utils.ttl_cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+EMBEDDING_CACHE_SIZE = int(os.getenv("EMBEDDING_CACHE_SIZE", "1024"))
+EMBEDDING_CACHE_TTL_SECONDS = float(os.getenv("EMBEDDING_CACHE_TTL_SECONDS", "86400"))
+
+# 요청 단위 카운터 (미들웨어에서 begin_embedding_request_stats로 시작)
+_request_stats: ContextVar[Optional[Dict[str, int]]] = ContextVar(
+    "embedding_request_stats", default=None
+)
+
+
+def begin_embedding_request_stats() -> Dict[str, int]:
+    """현재 요청의 임베딩 카운터 시작 (반환된 dict가 요청 동안 갱신됨)"""
+    stats = {"api_calls": 0, "texts_embedded": 0, "cache_hits": 0}
+    _request_stats.set(stats)
+    return stats
+
+
+def get_embedding_request_stats() -> Optional[Dict[str, int]]:
+    """현재 요청의 임베딩 카운터 (요청 컨텍스트 밖이면 None)"""
+    return _request_stats.get()
+
+
+def normalize_embedding_text(text: str) -> str:
+    """임베딩 캐시 키 정규화 (공백 정리 + 소문자)"""
+    return " ".join(text.split()).lower()
+
+
+class CachedEmbeddings(Embeddings):
+    """
+    LRU 캐시가 적용된 임베딩 래퍼
+
+    - 키: 정규화된 텍스트 (대소문자/공백만 다른 텍스트는 먼저 임베딩한 벡터를 공유)
+      API에는 원문을 보냄 → 저장되는 문서 벡터는 캐시 도입 전과 같음
+    - 값: float32 array (리스트 대비 메모리 약 1/5)
+    - embed_documents는 캐시 미스만 모아서 한 번에 API 호출
+    """
+
+    def __init__(self, base: Embeddings, maxsize: int = EMBEDDING_CACHE_SIZE, ttl_seconds: float = EMBEDDING_CACHE_TTL_SECONDS):
+        self.base = base
+        self.cache = TTLCache(maxsize=maxsize, ttl_seconds=ttl_seconds)
+        self._lock = threading.Lock()
+        self.api_calls = 0
+        self.texts_embedded = 0
+
+    def _record(self, api_calls: int, texts: int, hits: int) -> None:
+        with self._lock:
+            self.api_calls += api_calls
+            self.texts_embedded += texts
+        stats = _request_stats.get()
+        if stats is not None:
+            stats["api_calls"] += api_calls
+            stats["texts_embedded"] += texts
+            stats["cache_hits"] += hits
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        keys = [normalize_embedding_text(t) for t in texts]
+        vectors: List[Optional[List[float]]] = []
+        missing: Dict[str, List[int]] = {}
+
+        for i, key in enumerate(keys):
+            cached = self.cache.get(key)
+            if cached is not None:
+                vectors.append(list(cached))
+            else:
+                vectors.append(None)
+                missing.setdefault(key, []).append(i)
+
+        if missing:
+            miss_keys = list(missing)
+            embedded = self.base.embed_documents([texts[missing[key][0]] for key in miss_keys])
+            for key, vector in zip(miss_keys, embedded):
+                self.cache.set(key, array("f", vector))
+                for i in missing[key]:
+                    vectors[i] = vector
+
+        hits = len(texts) - sum(len(idx) for idx in missing.values())
+        self._record(1 if missing else 0, len(missing), hits)
+        return vectors
+
+    def embed_query(self, text: str) -> List[float]:
+        key = normalize_embedding_text(text)
+        cached = self.cache.get(key)
+        if cached is not None:
+            self._record(0, 0, 1)
+            return list(cached)
+
+        vector = self.base.embed_query(text)
+        self.cache.set(key, array("f", vector))
+        self._record(1, 1, 0)
+        return vector
+
+    def get_stats(self) -> Dict[str, object]:
+        return {
+            "api_calls": self.api_calls,
+            "texts_embedded": self.texts_embedded,
+            "cache": self.cache.get_stats(),
+        }
+
+
+# ============================================
+# 싱글톤 인스턴스
+# ============================================
+_embeddings: Optional[CachedEmbeddings] = None
+_embeddings_lock = threading.Lock()
+
+
+def get_embeddings() -> CachedEmbeddings:
+    """프로세스 공용 임베딩 인스턴스 반환 (모든 RAGService가 공유)"""
+    global _embeddings
+    if _embeddings is None:
+        with _embeddings_lock:
+            if _embeddings is None:
+                _embeddings = CachedEmbeddings(OpenAIEmbeddings())
+    return _embeddings
@@ -1,22 +1,72 @@
 import os
-from typing import List, Dict, Any
-from openai import OpenAI
+import asyncio
+import logging
+from typing import List, Dict, Any, Optional
+import httpx
+from openai import OpenAI, AsyncOpenAI
 from dotenv import load_dotenv
 from .prompt_service import PromptService
-import google.generativeai as genai
-from PIL import Image
 import io
 
 load_dotenv()
-client = OpenAI()
 
-# Gemini API 초기화 (Vision 대체용)
-gemini_api_key = os.getenv("GOOGLE_AI_API_KEY")
-if gemini_api_key:
-    genai.configure(api_key=gemini_api_key)
-    gemini_model = genai.GenerativeModel('gemini-1.5-flash')  # 비용 효율적인 모델
-else:
-    gemini_model = None
+# Gemini 모델 (Vision 대체용) - google.generativeai는 import 비용이 커서 첫 사용 시 로드
+_gemini_model = None
+_gemini_loaded = False
+
+
+def get_gemini_model():
+    """Gemini 모델 반환 (GOOGLE_AI_API_KEY 없으면 None)"""
+    global _gemini_model, _gemini_loaded
+    if not _gemini_loaded:
+        _gemini_loaded = True
+        gemini_api_key = os.getenv("GOOGLE_AI_API_KEY")
+        if gemini_api_key:
+            import google.generativeai as genai
+
+            genai.configure(api_key=gemini_api_key)
+            _gemini_model = genai.GenerativeModel('gemini-1.5-flash')  # 비용 효율적인 모델
+    return _gemini_model
+
+
+def _open_image(image_data: bytes):
+    """이미지 바이트를 PIL Image로 변환 (PIL 지연 로드)"""
+    from PIL import Image
+
+    return Image.open(io.BytesIO(image_data))
+
+logger = logging.getLogger(__name__)
+
+# ============================================
+# 비동기 클라이언트 설정 (이벤트 루프 블로킹 방지)
+# ============================================
+# 동시 LLM 호출 수 상한 (초과 요청은 대기)
+OPENAI_MAX_CONCURRENCY = int(os.getenv("OPENAI_MAX_CONCURRENCY", "16"))
+# 공유 HTTP 커넥션 풀 크기
+OPENAI_MAX_CONNECTIONS = int(os.getenv("OPENAI_MAX_CONNECTIONS", "32"))
+OPENAI_MAX_KEEPALIVE = int(os.getenv("OPENAI_MAX_KEEPALIVE", "16"))
+# 호출별 기본 타임아웃 (초) - 메서드 인자로 개별 지정 가능
+OPENAI_TIMEOUT_SECONDS = float(os.getenv("OPENAI_TIMEOUT_SECONDS", "30"))
+OPENAI_CONNECT_TIMEOUT_SECONDS = float(os.getenv("OPENAI_CONNECT_TIMEOUT_SECONDS", "5"))
+OPENAI_MAX_RETRIES = int(os.getenv("OPENAI_MAX_RETRIES", "2"))
+
+_shared_http_client: Optional[httpx.AsyncClient] = None
+
+
+def get_shared_http_client() -> httpx.AsyncClient:
+    """프로세스 공용 httpx.AsyncClient (bounded 커넥션 풀) 반환"""
+    global _shared_http_client
+    if _shared_http_client is None or _shared_http_client.is_closed:
+        _shared_http_client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=OPENAI_MAX_CONNECTIONS,
+                max_keepalive_connections=OPENAI_MAX_KEEPALIVE,
+            ),
+            timeout=httpx.Timeout(
+                OPENAI_TIMEOUT_SECONDS, connect=OPENAI_CONNECT_TIMEOUT_SECONDS
+            ),
+        )
+    return _shared_http_client
 
 
 class OpenAIService:
@@ -25,47 +75,94 @@ class OpenAIService:
         if not api_key:
             raise ValueError("OPENAI_API_KEY 환경변수가 설정되지 않았습니다.")
 
+        self.api_key = api_key
         self.client = OpenAI(api_key=api_key)
+        # 비동기 클라이언트: 공용 커넥션 풀을 사용해 async 핸들러에서 루프를 막지 않음 (async_client에서 지연 생성)
+        self._async_client: Optional[AsyncOpenAI] = None
+        self._async_client_pool: Optional[httpx.AsyncClient] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._semaphore_loop: Optional[asyncio.AbstractEventLoop] = None
         self.chat_model = os.getenv("OPENAI_CHAT_MODEL", "gpt-4o-mini")
         self.embedding_model = os.getenv(
             "OPENAI_EMBEDDING_MODEL", "text-embedding-3-small"
         )
         self.prompt_service = PromptService()
 
-    async def generate_chat_response(self, messages: List[Dict[str, str]]) -> str:
-        """채팅 응답 생성"""
-        try:
-            response = self.client.chat.completions.create(
-                model=self.chat_model,
-                messages=messages,
-                temperature=0.7,
-                max_tokens=1000,
+    @property
+    def async_client(self) -> AsyncOpenAI:
+        """
+        공용 커넥션 풀을 쓰는 AsyncOpenAI
+
+        shutdown(close_openai_clients)으로 풀이 닫힌 뒤 다시 시작하면(테스트의 TestClient 재사용 등)
+        새 풀로 클라이언트를 다시 만든다.
+        """
+        pool = get_shared_http_client()
+        if self._async_client is None or self._async_client_pool is not pool:
+            self._async_client = AsyncOpenAI(
+                api_key=self.api_key,
+                http_client=pool,
+                timeout=OPENAI_TIMEOUT_SECONDS,
+                max_retries=OPENAI_MAX_RETRIES,
             )
+            self._async_client_pool = pool
+        return self._async_client
+
+    @property
+    def semaphore(self) -> asyncio.Semaphore:
+        """동시 호출 제한 세마포어 (이벤트 루프별로 지연 생성)"""
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(OPENAI_MAX_CONCURRENCY)
+            self._semaphore_loop = loop
+        return self._semaphore
+
+    async def generate_chat_response(
+        self,
+        messages: List[Dict[str, str]],
+        timeout: Optional[float] = None,
+        temperature: float = 0.7,
+        max_tokens: int = 1000,
+    ) -> str:
+        """채팅 응답 생성 (비동기 클라이언트, 동시성 제한 적용)"""
+        try:
+            async with self.semaphore:
+                response = await self.async_client.chat.completions.create(
+                    model=self.chat_model,
+                    messages=messages,
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                    timeout=timeout or OPENAI_TIMEOUT_SECONDS,
+                )
             return response.choices[0].message.content
 
         except Exception as e:
             print(f"OpenAI 채팅 응답 생성 오류: {e}")
             return "죄송합니다. 응답을 생성하는 중 오류가 발생했습니다."
 
-    async def generate_embeddings(self, texts: List[str]) -> List[List[float]]:
+    async def generate_embeddings(
+        self, texts: List[str], timeout: Optional[float] = None
+    ) -> List[List[float]]:
         """텍스트 임베딩 생성"""
         try:
-            response = self.client.embeddings.create(
-                model=self.embedding_model, input=texts
-            )
+            async with self.semaphore:
+                response = await self.async_client.embeddings.create(
+                    model=self.embedding_model,
+                    input=texts,
+                    timeout=timeout or OPENAI_TIMEOUT_SECONDS,
+                )
             return [data.embedding for data in response.data]
 
         except Exception as e:
             print(f"OpenAI 임베딩 생성 오류: {e}")
             return []
 
-    async def generate_single_embedding(self, text: str) -> List[float]:
+    async def generate_single_embedding(
+        self, text: str, timeout: Optional[float] = None
+    ) -> List[float]:
         """단일 텍스트 임베딩 생성"""
         try:
-            response = self.client.embeddings.create(
-                model=self.embedding_model, input=[text]
-            )
-            return response.data[0].embedding
+            embeddings = await self.generate_embeddings([text], timeout=timeout)
+            return embeddings[0] if embeddings else []
 
         except Exception as e:
             print(f"OpenAI 단일 임베딩 생성 오류: {e}")
@@ -80,12 +177,13 @@ class OpenAIService:
             )
             emergency_prompt = emergency_prompt_template.format(situation=message)
 
-            response = self.client.chat.completions.create(
-                model=self.chat_model,
-                messages=[{"role": "user", "content": emergency_prompt}],
-                temperature=0.3,  # 응급 상황이므로 창의성보다 정확성 중시
-                max_tokens=500,
-            )
+            async with self.semaphore:
+                response = await self.async_client.chat.completions.create(
+                    model=self.chat_model,
+                    messages=[{"role": "user", "content": emergency_prompt}],
+                    temperature=0.3,  # 응급 상황이므로 창의성보다 정확성 중시
+                    max_tokens=500,
+                )
             return response.choices[0].message.content
 
         except Exception as e:
@@ -95,11 +193,12 @@ class OpenAIService:
     async def analyze_image_emergency(self, image_data: bytes, context: str) -> str:
         """응급 상황 이미지 분석 (Gemini Vision) - 비용 절감"""
         try:
+            gemini_model = get_gemini_model()
             if not gemini_model:
                 return "Gemini API 키가 설정되지 않았습니다."
 
             # 이미지를 PIL Image로 변환
-            image = Image.open(io.BytesIO(image_data))
+            image = _open_image(image_data)
 
             prompt_text = f"응급 상황 이미지를 분석해주세요. 상황: {context}\n\n이미지에서 보이는 증상을 분석하고 응급도를 판단해주세요."
 
@@ -113,11 +212,12 @@ class OpenAIService:
     async def analyze_match_chart(self, image_data: bytes, user_question: str = "경기 차트를 분석해주세요") -> str:
         """경기 차트 이미지 분석 (Gemini Vision) - 비용 절감"""
         try:
+            gemini_model = get_gemini_model()
             if not gemini_model:
                 return "Gemini API 키가 설정되지 않았습니다. GOOGLE_AI_API_KEY 환경변수를 확인해주세요."
 
             # 이미지를 PIL Image로 변환
-            image = Image.open(io.BytesIO(image_data))
+            image = _open_image(image_data)
 
             # PromptService에서 동적 프롬프트 가져오기
             prompt_text = self.prompt_service.manager.format_prompt(
@@ -137,11 +237,12 @@ class OpenAIService:
     async def analyze_injury_photo(self, image_data: bytes) -> str:
         """부상 사진 분석 (Gemini Vision) - 비용 절감"""
         try:
+            gemini_model = get_gemini_model()
             if not gemini_model:
                 return "Gemini API 키가 설정되지 않았습니다."
 
             # 이미지를 PIL Image로 변환
-            image = Image.open(io.BytesIO(image_data))
+            image = _open_image(image_data)
 
             prompt_text = self.prompt_service.manager.get_prompt(
                 'vision_analysis',
@@ -158,11 +259,12 @@ class OpenAIService:
     async def analyze_tactical_board(self, image_data: bytes) -> str:
         """전술 보드 분석 (Gemini Vision) - 비용 절감"""
         try:
+            gemini_model = get_gemini_model()
             if not gemini_model:
                 return "Gemini API 키가 설정되지 않았습니다."
 
             # 이미지를 PIL Image로 변환
-            image = Image.open(io.BytesIO(image_data))
+            image = _open_image(image_data)
 
             prompt_text = self.prompt_service.manager.get_prompt(
                 'vision_analysis',
@@ -179,11 +281,12 @@ class OpenAIService:
     async def analyze_player_comparison(self, image_data: bytes) -> str:
         """선수 비교 차트 분석 (Gemini Vision) - 비용 절감"""
         try:
+            gemini_model = get_gemini_model()
             if not gemini_model:
                 return "Gemini API 키가 설정되지 않았습니다."
 
             # 이미지를 PIL Image로 변환
-            image = Image.open(io.BytesIO(image_data))
+            image = _open_image(image_data)
 
             prompt_text = self.prompt_service.manager.get_prompt(
                 'vision_analysis',
@@ -197,10 +300,39 @@ class OpenAIService:
             print(f"선수 비교 분석 오류: {e}")
             return "선수 비교 분석 중 오류가 발생했습니다."
 
-    async def chat(self, messages: List[Dict[str, str]]) -> str:
+    async def chat(
+        self, messages: List[Dict[str, str]], timeout: Optional[float] = None
+    ) -> str:
         """비동기 chat 메서드 (chat.py 호환용)"""
-        return await self.generate_chat_response(messages)
+        return await self.generate_chat_response(messages, timeout=timeout)
 
     def count_tokens(self, text: str) -> int:
         """토큰 수 계산 (대략적)"""
         return len(text) // 4
+
+
+# ============================================
+# 싱글톤 인스턴스
+# ============================================
+_openai_service: Optional[OpenAIService] = None
+
+
+def get_openai_service() -> OpenAIService:
+    """공용 OpenAIService 인스턴스 반환 (호출마다 클라이언트를 새로 만들지 않음)"""
+    global _openai_service
+    if _openai_service is None:
+        _openai_service = OpenAIService()
+    return _openai_service
+
+
+async def close_openai_clients() -> None:
+    """
+    공용 HTTP 커넥션 풀 종료 (서버 shutdown 시 호출)
+
+    서비스 인스턴스는 남겨 두고, 다음 호출 때 새 풀로 비동기 클라이언트를 다시 만든다.
+    """
+    global _shared_http_client
+    if _shared_http_client is not None and not _shared_http_client.is_closed:
+        await _shared_http_client.aclose()
+        logger.info("✅ OpenAI 공용 HTTP 커넥션 풀 종료")
+    _shared_http_client = None
@@ -0,0 +1,171 @@
+"""
+선수 통계 저장소 (espn_player_ids.json 메모리 상주)
+
+요청마다 JSON을 다시 읽고 정렬/선형 탐색하던 것을 한 번 로드해서 인덱스로 조회
+- 리그별 득점/어시스트 순위 미리 정렬 → top-N은 슬라이스
+- 이름 인덱스 (소문자 name / ko_name → 선수) → O(1) 조회
+- 파일 mtime이 바뀌면 다시 로드 (스크래퍼가 파일을 갱신해도 재시작 불필요)
+
+Example:
+    >>> store = get_player_stats_store()
+    >>> store.top_scorers("프리미어리그", limit=10)
+    >>> store.find_player("손흥민")
+"""
+import json
+import logging
+import os
+import threading
+import time
+from typing import Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+PLAYER_STATS_PATH = os.getenv(
+    "PLAYER_STATS_PATH",
+    os.path.join(os.path.dirname(__file__), "../data/espn_player_ids.json"),
+)
+
+# mtime 확인 간격 (초): 요청마다 stat 하지 않도록
+RELOAD_CHECK_SECONDS = float(os.getenv("PLAYER_STATS_RELOAD_CHECK_SECONDS", "1.0"))
+
+
+class _Snapshot:
+    """로드 시점의 불변 인덱스 (교체는 참조 한 번으로, 읽기는 락 없음)"""
+
+    def __init__(self, data: Dict[str, List[Dict]], version: tuple):
+        self.version = version
+        self.leagues = list(data.keys())
+        self.players = data
+        # 기존 sorted(..., reverse=True)와 같은 순서 (동점자는 파일 순서 유지)
+        self.by_goals = {
+            league: sorted(players, key=lambda x: x.get("goals", 0), reverse=True)
+            for league, players in data.items()
+        }
+        self.by_assists = {
+            league: sorted(players, key=lambda x: x.get("assists", 0), reverse=True)
+            for league, players in data.items()
+        }
+        # 리그 순서 → 선수 순서로 처음 나온 선수가 우선 (기존 선형 탐색과 같은 결과)
+        self.names: Dict[str, Dict] = {}
+        for players in data.values():
+            for player in players:
+                for key in (player.get("name", ""), player.get("ko_name", "")):
+                    key = key.lower()
+                    if key and key not in self.names:
+                        self.names[key] = player
+        self.player_count = sum(len(players) for players in data.values())
+
+
+class PlayerStatsStore:
+    """
+    espn_player_ids.json 인덱스
+
+    Args:
+        path: JSON 파일 경로
+        reload_check_seconds: mtime 확인 간격 (0이면 매 조회마다 확인)
+    """
+
+    def __init__(self, path: str = PLAYER_STATS_PATH, reload_check_seconds: float = RELOAD_CHECK_SECONDS):
+        self.path = path
+        self.reload_check_seconds = reload_check_seconds
+        self._snapshot: Optional[_Snapshot] = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+        self.loads = 0
+
+    # ============================================
+    # 로드 / 핫 리로드
+    # ============================================
+
+    def _file_version(self) -> tuple:
+        stat = os.stat(self.path)
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def _current(self) -> _Snapshot:
+        """최신 스냅샷 반환 (필요하면 다시 로드, 파일이 없으면 FileNotFoundError)"""
+        snapshot = self._snapshot
+        now = time.monotonic()
+        if snapshot is not None and now - self._checked_at < self.reload_check_seconds:
+            return snapshot
+
+        with self._lock:
+            snapshot = self._snapshot
+            self._checked_at = now
+            try:
+                version = self._file_version()
+            except FileNotFoundError:
+                if snapshot is not None:
+                    logger.warning(f"⚠️ 선수 통계 파일 없음, 이전 데이터 사용: {self.path}")
+                    return snapshot
+                raise
+
+            if snapshot is not None and snapshot.version == version:
+                return snapshot
+
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+            except (OSError, ValueError) as e:
+                # 스크래퍼가 쓰는 중이거나 깨진 파일 → 이전 스냅샷 유지
+                if snapshot is not None:
+                    logger.warning(f"⚠️ 선수 통계 다시 로드 실패, 이전 데이터 사용: {e}")
+                    return snapshot
+                raise
+
+            self._snapshot = _Snapshot(data, version)
+            self.loads += 1
+            logger.info(
+                f"✅ 선수 통계 로드: 리그 {len(self._snapshot.leagues)}개, 선수 {self._snapshot.player_count}명"
+            )
+            return self._snapshot
+
+    # ============================================
+    # 조회
+    # ============================================
+
+    def leagues(self) -> List[str]:
+        return list(self._current().leagues)
+
+    def top_scorers(self, league: str, limit: int = 20) -> List[Dict]:
+        return self._current().by_goals.get(league, [])[:limit]
+
+    def top_assists(self, league: str, limit: int = 20) -> List[Dict]:
+        return self._current().by_assists.get(league, [])[:limit]
+
+    def find_player(self, player_name: str) -> Optional[Dict]:
+        """영문/한글 이름으로 선수 조회 (대소문자 무시)"""
+        return self._current().names.get(player_name.lower())
+
+    def version(self) -> tuple:
+        """현재 파일 버전 (mtime, size) - 파생 인덱스 재생성 판단용"""
+        return self._current().version
+
+    def iter_players(self) -> Iterator[Tuple[str, Dict]]:
+        """(리그, 선수) 파일 순서대로"""
+        snapshot = self._current()
+        for league in snapshot.leagues:
+            for player in snapshot.players[league]:
+                yield league, player
+
+    def get_stats(self) -> Dict:
+        snapshot = self._snapshot
+        return {
+            "path": self.path,
+            "loads": self.loads,
+            "leagues": len(snapshot.leagues) if snapshot else 0,
+            "players": snapshot.player_count if snapshot else 0,
+        }
+
+
+# ============================================
+# 싱글톤 인스턴스 (첫 사용 시 생성)
+# ============================================
+_player_stats_store: Optional[PlayerStatsStore] = None
+
+
+def get_player_stats_store() -> PlayerStatsStore:
+    """공용 PlayerStatsStore 반환 (파일은 첫 조회 시 로드)"""
+    global _player_stats_store
+    if _player_stats_store is None:
+        _player_stats_store = PlayerStatsStore()
+    return _player_stats_store
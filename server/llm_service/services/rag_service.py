@@ -1,3 +1,8 @@
+import hashlib
+import logging
+import threading
+from typing import Any, Dict, List, Optional
+
 from langchain_openai import OpenAI
 from langchain.chains import RetrievalQA
 try:
@@ -5,36 +10,227 @@ try:
 except ImportError:
     # Fallback to deprecated import if langchain-chroma not installed
     from langchain_community.vectorstores import Chroma
-from langchain_openai import OpenAIEmbeddings
+from .embedding_service import get_embeddings
+
+logger = logging.getLogger(__name__)
+
+# 리그 코드 메타데이터 키 (initialize_rag.py → DataIngestionService가 경기/순위/팀 문서에 저장)
+LEAGUE_METADATA_KEY = "competition"
+
+
+def league_where(league: Optional[str]) -> Optional[Dict[str, Any]]:
+    """리그 코드 → search/search_batch의 where 조건 (없으면 전체 검색)"""
+    return {LEAGUE_METADATA_KEY: league} if league else None
 
 
 class RAGService:
+    """
+    ChromaDB 기반 RAG 서비스
+
+    - collection_name별로 실제 Chroma 컬렉션을 사용 (새 컬렉션은 cosine 거리)
+    - search 결과의 distances는 코사인 거리 (0 = 동일, similarity = 1 - distance)
+    - "default"는 기본 지식 컬렉션들(기존 LangChain 기본 컬렉션 + 초기화 스크립트 컬렉션)을 함께 검색
+    """
+
+    # LangChain Chroma 기본 컬렉션 (기존에 collection_name 없이 저장된 데이터)
+    DEFAULT_COLLECTION = "langchain"
+
+    # 검색용 별칭 → 실제 컬렉션 목록 (initialize_rag.py가 matches/standings/teams에 저장)
+    COLLECTION_ALIASES = {
+        "default": [DEFAULT_COLLECTION, "matches", "standings", "teams"],
+    }
+
     def __init__(self, persist_directory: str = "chroma_db"):
-        self.embeddings = OpenAIEmbeddings()
+        self.persist_directory = persist_directory
+        # 공용 임베딩 (정규화 텍스트 LRU 공유 → 요청 내 같은 질문은 1회만 임베딩)
+        self.embeddings = get_embeddings()
         self.vector_store = Chroma(
             persist_directory=persist_directory, embedding_function=self.embeddings
         )
-        self.llm = OpenAI(model="gpt-4o-mini")
-        self.qa_chain = RetrievalQA.from_chain_type(
-            llm=self.llm, chain_type="stuff", retriever=self.vector_store.as_retriever()
-        )
+        self._client = self.vector_store._client
+        self._stores: Dict[str, Chroma] = {self.DEFAULT_COLLECTION: self.vector_store}
+        self._qa_chain = None
+
+    @property
+    def qa_chain(self):
+        """RetrievalQA 체인 (query() 사용 시에만 지연 생성)"""
+        if self._qa_chain is None:
+            self._qa_chain = RetrievalQA.from_chain_type(
+                llm=OpenAI(model="gpt-4o-mini"),
+                chain_type="stuff",
+                retriever=self.vector_store.as_retriever(),
+            )
+        return self._qa_chain
+
+    @property
+    def persist_dir(self) -> str:
+        """initialize_rag.py 호환용"""
+        return self.persist_directory
 
     def query(self, question: str) -> str:
         return self.qa_chain.run(question)
 
-    def search(self, collection_name: str, query: str, top_k: int = 5):
-        # collection_name은 무시하고 기본 vector_store 사용
-        # (LangChain Chroma는 단일 collection만 지원)
-        retriever = self.vector_store.as_retriever(search_kwargs={"k": top_k})
-        docs = retriever.get_relevant_documents(query)
-        ...
+    # ============================================
+    # 컬렉션 관리
+    # ============================================
+
+    def _resolve_collections(self, collection_name: str) -> List[str]:
+        """검색 대상 컬렉션 목록 (별칭 해석)"""
+        return self.COLLECTION_ALIASES.get(collection_name, [collection_name])
+
+    def _resolve_write_collection(self, collection_name: str) -> str:
+        """저장 대상 컬렉션 (별칭이면 첫 번째 컬렉션)"""
+        return self._resolve_collections(collection_name)[0]
+
+    def _get_store(self, collection_name: str, create: bool = False) -> Optional[Chroma]:
+        """
+        컬렉션별 Chroma 스토어 반환
+
+        Args:
+            collection_name: 컬렉션 이름
+            create: 없으면 생성할지 여부 (검색 시에는 False → 빈 컬렉션 생성 방지)
+        """
+        store = self._stores.get(collection_name)
+        if store is not None:
+            return store
+
+        if not create:
+            try:
+                self._client.get_collection(collection_name)
+            except Exception:
+                return None
+
+        store = Chroma(
+            collection_name=collection_name,
+            embedding_function=self.embeddings,
+            client=self._client,
+            collection_metadata={"hnsw:space": "cosine"},
+        )
+        self._stores[collection_name] = store
+        return store
+
+    @staticmethod
+    def _to_cosine_distance(distance: float, space: str) -> float:
+        """
+        Chroma 거리 → 코사인 거리 변환
+
+        OpenAI 임베딩은 정규화 벡터이므로
+        - l2 (제곱 거리) = 2 - 2cos → 코사인 거리 = d / 2
+        - cosine / ip   = 1 - cos  → 그대로 사용
+        """
+        if space == "l2":
+            return distance / 2
+        return distance
+
+    def get_collection_stats(self, collection_name: str) -> Dict[str, Any]:
+        """컬렉션 문서 수 조회"""
+        count = 0
+        for name in self._resolve_collections(collection_name):
+            store = self._get_store(name)
+            if store is not None:
+                count += store._collection.count()
+        return {"name": collection_name, "count": count}
+
+    # ============================================
+    # 검색
+    # ============================================
+
+    def search(
+        self,
+        collection_name: str,
+        query: str,
+        top_k: int = 5,
+        where: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, List[Any]]:
+        """
+        유사 문서 검색
+
+        Args:
+            collection_name: 컬렉션 이름 ("default"는 기본 지식 컬렉션 전체)
+            query: 검색 질의
+            top_k: 반환 개수
+            where: Chroma 메타데이터 필터 (예: {"type": "standing"})
+
+        Returns:
+            {"ids": [...], "documents": [...], "metadatas": [...], "distances": [...]}
+            distances는 코사인 거리 (오름차순)
+        """
+        return self.search_batch(collection_name, [query], top_k=top_k, where=where)[0]
 
-        return {
-            "ids": [doc.metadata.get("id", f"doc_{i}") for i, doc in enumerate(docs)],
-            "documents": [doc.page_content for doc in docs],
-            "metadatas": [doc.metadata for doc in docs],
-            "distances": [0.5] * len(docs),
-        }
+    def search_batch(
+        self,
+        collection_name: str,
+        queries: List[str],
+        top_k: int = 5,
+        where: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, List[Any]]]:
+        """
+        여러 질의를 한 번에 검색 (임베딩 API 1회 + 컬렉션별 쿼리 1회)
+
+        Returns:
+            질의 순서대로 search()와 같은 형식의 결과 리스트
+        """
+        empty = [{"ids": [], "documents": [], "metadatas": [], "distances": []} for _ in queries]
+        if not queries:
+            return empty
+
+        stores = [
+            store
+            for store in (self._get_store(name) for name in self._resolve_collections(collection_name))
+            if store is not None
+        ]
+        if not stores:
+            return empty
+
+        query_embeddings = self._embed_queries(queries)
+
+        # 질의별 (거리, id, 문서, 메타데이터) 후보 수집
+        candidates: List[List[tuple]] = [[] for _ in queries]
+        for store in stores:
+            collection = store._collection
+            count = collection.count()
+            if count == 0:
+                continue
+
+            space = (collection.metadata or {}).get("hnsw:space", "l2")
+            result = collection.query(
+                query_embeddings=query_embeddings,
+                n_results=min(top_k, count),
+                where=where or None,
+                include=["documents", "metadatas", "distances"],
+            )
+            for qi in range(len(queries)):
+                for doc_id, doc, meta, dist in zip(
+                    result["ids"][qi],
+                    result["documents"][qi],
+                    result["metadatas"][qi],
+                    result["distances"][qi],
+                ):
+                    candidates[qi].append(
+                        (self._to_cosine_distance(dist, space), doc_id, doc, meta or {})
+                    )
+
+        results = []
+        for items in candidates:
+            items.sort(key=lambda item: item[0])
+            items = items[:top_k]
+            results.append({
+                "ids": [item[1] for item in items],
+                "documents": [item[2] for item in items],
+                "metadatas": [item[3] for item in items],
+                "distances": [item[0] for item in items],
+            })
+        return results
+
+    def _embed_queries(self, queries: List[str]) -> List[List[float]]:
+        """질의 임베딩 (배치)"""
+        if len(queries) == 1:
+            return [self.embeddings.embed_query(queries[0])]
+        return self.embeddings.embed_documents(queries)
+
+    # ============================================
+    # 저장
+    # ============================================
 
     def add_documents(
         self,
@@ -43,17 +239,112 @@ class RAGService:
         metadatas: list = None,
         ids: list = None,
     ):
-        """ChromaDB에 문서 추가 (캐싱용)"""
-        if metadatas is None:
-            metadatas = [{}] * len(documents)
+        """ChromaDB에 문서 추가 (같은 ID는 덮어씀)"""
+        if not documents:
+            return
 
         if ids is None:
-            import hashlib
-
             ids = [hashlib.md5(doc.encode()).hexdigest() for doc in documents]
 
-        # metadata에 ID 추가! (추가된 부분)
-        for i, metadata in enumerate(metadatas):
-            metadata["id"] = ids[i]
+        # metadata에 ID 추가 (원본 dict는 변경하지 않음, None 값은 Chroma가 거부하므로 제외)
+        clean_metadatas = []
+        for i in range(len(documents)):
+            metadata = (metadatas[i] if metadatas else None) or {}
+            clean = {k: v for k, v in metadata.items() if v is not None}
+            clean["id"] = ids[i]
+            clean_metadatas.append(clean)
+
+        store = self._get_store(self._resolve_write_collection(collection_name), create=True)
+        store._collection.upsert(
+            ids=ids,
+            embeddings=self.embeddings.embed_documents(documents),
+            documents=documents,
+            metadatas=clean_metadatas,
+        )
+
+    def migrate_collection(self, source: str, target: str, batch_size: int = 500) -> int:
+        """
+        source 컬렉션 문서를 target 컬렉션으로 옮김 (저장된 임베딩 그대로, 재임베딩 없음)
+
+        옮긴 문서는 source에서 삭제하므로 다시 호출해도 중복되지 않는다.
+
+        Returns:
+            옮긴 문서 수 (source가 없거나 비어 있으면 0)
+        """
+        source_store = self._get_store(source)
+        if source_store is None or source_store._collection.count() == 0:
+            return 0
+
+        target_collection = self._get_store(target, create=True)._collection
+        moved = 0
+        while True:
+            batch = source_store._collection.get(
+                limit=batch_size, include=["embeddings", "documents", "metadatas"]
+            )
+            if not batch["ids"]:
+                break
+            target_collection.upsert(
+                ids=batch["ids"],
+                embeddings=batch["embeddings"],
+                documents=batch["documents"],
+                metadatas=batch["metadatas"],
+            )
+            source_store._collection.delete(ids=batch["ids"])
+            moved += len(batch["ids"])
+
+        logger.info(f"✅ 컬렉션 이전: {source} → {target} ({moved}개, {self.persist_directory})")
+        return moved
+
+    def close(self) -> None:
+        """Chroma 클라이언트 종료 (서버 shutdown 시)"""
+        try:
+            self._client._system.stop()
+        except Exception as e:
+            logger.debug(f"⚠️ Chroma 클라이언트 종료 실패 ({self.persist_directory}): {e}")
+        self._stores.clear()
+
+
+# ============================================
+# 서비스 레지스트리 (persist_directory별 싱글톤)
+# ============================================
+# 같은 디렉토리에 Chroma(SQLite) 핸들을 여러 개 열지 않도록 프로세스 전체에서 공유
+_rag_registry: Dict[str, RAGService] = {}
+_registry_lock = threading.Lock()
+
+
+def get_rag_service(persist_directory: str = "chroma_db") -> RAGService:
+    """
+    persist_directory별 RAGService 싱글톤 반환 (지연 생성)
+
+    컬렉션은 RAGService 안에서 이름별로 캐시되므로
+    (persist_directory, collection) 단위로 한 번만 열린다.
+    """
+    service = _rag_registry.get(persist_directory)
+    if service is not None:
+        return service
+
+    with _registry_lock:
+        service = _rag_registry.get(persist_directory)
+        if service is None:
+            service = RAGService(persist_directory=persist_directory)
+            _rag_registry[persist_directory] = service
+            logger.info(f"✅ RAGService 생성: {persist_directory}")
+    return service
+
+
+def close_rag_services() -> None:
+    """등록된 모든 RAGService 종료 (lifespan shutdown에서 호출)"""
+    with _registry_lock:
+        for service in _rag_registry.values():
+            service.close()
+        count = len(_rag_registry)
+        _rag_registry.clear()
+
+    try:
+        from chromadb.api.client import SharedSystemClient
 
-        self.vector_store.add_texts(texts=documents, metadatas=metadatas, ids=ids)
+        SharedSystemClient.clear_system_cache()
+    except Exception:
+        pass
+    if count:
+        logger.info(f"✅ RAGService {count}개 종료")
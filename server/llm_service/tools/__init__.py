@@ -7,8 +7,13 @@ from .rag_tool import RAGSearchTool
 from .match_analysis_tool import MatchAnalysisTool
 from .player_compare_tool import PlayerCompareTool
 from .posts_search_tool import PostsSearchTool
-from .fan_preference_tool import FanPreferenceTool, create_fan_preference_tool
-from .calendar_tool import CalendarTool
+from .fan_preference_tool import (
+    FanPreferenceTool,
+    PersonalizedFanPreferenceTool,
+    create_fan_preference_tool,
+)
+from .calendar_tool import CalendarTool, PersonalizedCalendarTool
+from .user_context import bind_user_id, get_current_user_id
 from .youtube_tool import YouTubeHighlightTool
 from .weather_tool import WeatherTool
 
@@ -18,8 +23,12 @@ __all__ = [
     "PlayerCompareTool",
     "PostsSearchTool",
     "FanPreferenceTool",
+    "PersonalizedFanPreferenceTool",
     "create_fan_preference_tool",
     "CalendarTool",
+    "PersonalizedCalendarTool",
+    "bind_user_id",
+    "get_current_user_id",
     "YouTubeHighlightTool",
     "WeatherTool",
 ]
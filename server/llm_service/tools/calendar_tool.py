@@ -8,21 +8,21 @@ import logging
 from datetime import datetime, timedelta
 import re
 
-from ..external_apis.football_data import FootballDataClient
+from ..external_apis.football_data import (  # 라우터/다른 Tool과 공유하는 싱글톤
+    call_football_api,
+    get_football_cache,
+    matches_cache_key,
+)
+from ..external_apis.rate_limiter import RateLimitExceeded
 from firebase_admin import firestore
+from .user_context import get_current_user_id
+from ..utils.entity_resolver import get_entity_resolver
 
 logger = logging.getLogger(__name__)
 
-# FootballDataClient 인스턴스 (싱글톤)
-_football_client: Optional[FootballDataClient] = None
-
-
-def get_football_client() -> FootballDataClient:
-    """FootballDataClient 싱글톤 인스턴스 반환"""
-    global _football_client
-    if _football_client is None:
-        _football_client = FootballDataClient()
-    return _football_client
+# 예정 경기 캐시 (백그라운드 갱신기와 같은 키: 리그별 SCHEDULED 100경기)
+SCHEDULED_MATCHES_LIMIT = 100
+SCHEDULED_CACHE_MINUTES = 10  # football_data 라우터 LIVE_CACHE_MINUTES와 동일
 
 
 def parse_date(date_str: str) -> Optional[str]:
@@ -89,6 +89,41 @@ def parse_date(date_str: str) -> Optional[str]:
         return None
 
 
+def get_scheduled_matches(competition: str) -> List[Dict]:
+    """
+    리그 예정 경기 조회 (공용 캐시 우선)
+
+    백그라운드 갱신기가 채운 메모리 캐시를 먼저 읽고 (stale 항목도 사용, 갱신은 갱신기 몫),
+    없을 때만 서버 루프에서 공용 캐시의 get_or_fetch로 조회
+    - 라우터/갱신기와 같은 호출 한도 버킷 (비동기 클라이언트)
+    - 같은 키의 동시 미스(여러 Agent 질의, 진행 중인 갱신기 작업)는 SingleFlight로 API 1회
+    """
+    cache = get_football_cache()
+    cache_key = matches_cache_key(competition, "SCHEDULED", SCHEDULED_MATCHES_LIMIT)
+
+    matches = cache.peek(cache_key)
+    if matches is not None:
+        logger.info(f"✅ 예정 경기 캐시 히트: {cache_key}")
+        return matches
+
+    try:
+        matches, _ = call_football_api(
+            lambda client: cache.get_or_fetch(
+                cache_key,
+                lambda: client.get_matches(
+                    competition=competition,
+                    status="SCHEDULED",
+                    limit=SCHEDULED_MATCHES_LIMIT,
+                ),
+                ttl_seconds=SCHEDULED_CACHE_MINUTES * 60,
+            )
+        )
+    except RateLimitExceeded as e:
+        logger.warning(f"⚠️ 예정 경기 조회 보류 (호출 한도): {e}")
+        return []
+    return matches or []
+
+
 def get_user_favorite_teams(user_id: Optional[str] = None) -> List[str]:
     """
     사용자가 좋아하는 팀 목록을 조회합니다.
@@ -121,25 +156,39 @@ def get_user_favorite_teams(user_id: Optional[str] = None) -> List[str]:
         return []
 
 
+def team_search_names(team_name: str) -> Set[str]:
+    """
+    팀 이름 → 경기 데이터에서 찾을 이름들 (소문자)
+
+    한글/약칭/오타도 팀 사전으로 정식 영문명과 별칭까지 확장 (예: "토트넘" → "tottenham hotspur", "spurs")
+    """
+    names = {team_name.lower()}
+    match = get_entity_resolver().best(team_name, kind="team")
+    if match:
+        names.add(match.entity.name.lower())
+        names.update(alias.lower() for alias in match.entity.aliases)
+    return names
+
+
 def filter_matches_by_team(matches: List[Dict], team_name: str) -> List[Dict]:
     """
     경기 목록에서 특정 팀이 포함된 경기만 필터링합니다.
     
     Args:
         matches: 경기 목록
-        team_name: 팀 이름 (부분 일치 가능)
+        team_name: 팀 이름 (부분 일치 가능, 한글/약칭 가능)
     
     Returns:
         필터링된 경기 목록
     """
-    team_name_lower = team_name.lower()
+    search_names = team_search_names(team_name)
     filtered = []
     
     for match in matches:
         home_team = match.get("homeTeam", {}).get("name", "").lower()
         away_team = match.get("awayTeam", {}).get("name", "").lower()
         
-        if team_name_lower in home_team or team_name_lower in away_team:
+        if any(name in home_team or name in away_team for name in search_names):
             filtered.append(match)
     
     return filtered
@@ -189,13 +238,8 @@ def get_matches_by_date(date_str: str, competition: str = "PL", team_filter: Opt
         if not parsed_date:
             return f"날짜를 파싱할 수 없습니다: '{date_str}'. '오늘', '내일', '2025-12-25', '12월 25일' 형식을 사용해주세요."
         
-        # Football-Data API에서 경기 조회
-        football_client = get_football_client()
-        matches = football_client.get_matches(
-            competition=competition,
-            status="SCHEDULED",  # 예정된 경기만 조회
-            limit=100
-        )
+        # 예정된 경기 조회 (공용 캐시 → Football-Data API)
+        matches = get_scheduled_matches(competition)
         
         if not matches:
             return f"{parsed_date}에 예정된 {competition} 리그 경기가 없습니다."
@@ -276,12 +320,7 @@ def get_weekly_summary(competition: str = "PL", user_id: Optional[str] = None) -
         week_start = today - timedelta(days=today.weekday())
         week_end = week_start + timedelta(days=6)
         
-        football_client = get_football_client()
-        matches = football_client.get_matches(
-            competition=competition,
-            status="SCHEDULED",
-            limit=100
-        )
+        matches = get_scheduled_matches(competition)
         
         if not matches:
             return f"이번 주({week_start.strftime('%Y-%m-%d')} ~ {week_end.strftime('%Y-%m-%d')})에 예정된 {competition} 리그 경기가 없습니다."
@@ -370,12 +409,7 @@ def get_monthly_summary(competition: str = "PL", user_id: Optional[str] = None)
         else:
             month_end = today.replace(month=today.month + 1, day=1) - timedelta(days=1)
         
-        football_client = get_football_client()
-        matches = football_client.get_matches(
-            competition=competition,
-            status="SCHEDULED",
-            limit=200
-        )
+        matches = get_scheduled_matches(competition)
         
         if not matches:
             return f"이번 달({month_start.strftime('%Y-%m-%d')} ~ {month_end.strftime('%Y-%m-%d')})에 예정된 {competition} 리그 경기가 없습니다."
@@ -481,13 +515,11 @@ def calendar_query(query: str, user_id: Optional[str] = None) -> str:
             competition = "BL"
         return get_monthly_summary(competition, user_id)
     
-    # 특정 팀 필터링
+    # 특정 팀 필터링 (팀 사전 매칭: 별칭/오타/조사 포함 "토트넘에서", "맨유")
     team_filter = None
-    common_teams = ["토트넘", "맨유", "맨시티", "리버풀", "첼시", "아스날", "바르셀로나", "레알마드리드", "바이에른", "도르트문트"]
-    for team in common_teams:
-        if team in query_lower:
-            team_filter = team
-            break
+    team_match = get_entity_resolver().find_best_in_text(query, kind="team")
+    if team_match:
+        team_filter = team_match.alias
     
     # 사용자 선호 팀 필터링
     use_favorite = False
@@ -524,3 +556,11 @@ CalendarTool = Tool(
     func=lambda query: calendar_query(query.strip())
 )
 
+
+
+# 개인화 Tool (Agent 재사용용) - user_id는 실행 시점 컨텍스트에서 읽음
+PersonalizedCalendarTool = Tool(
+    name="calendar",
+    description="경기 일정을 조회하는 도구입니다. 지원 기능: 1) 특정 날짜 경기 ('오늘 경기', '내일 경기', '12월 25일 경기 일정'), 2) 특정 팀 경기 ('토트넘 경기', '맨유 경기'), 3) 사용자 선호 팀 경기 ('내가 좋아하는 팀 경기', '내 팀 경기'), 4) 주간 요약 ('이번 주 경기', '주간 일정'), 5) 월간 요약 ('이번 달 경기', '월간 일정'). 날짜 형식: '오늘', '내일', '2025-12-25', '12월 25일' 등.",
+    func=lambda query: calendar_query(query.strip(), user_id=get_current_user_id())
+)
@@ -8,6 +8,8 @@ import logging
 
 from firebase_admin import firestore
 
+from .user_context import get_current_user_id
+
 logger = logging.getLogger(__name__)
 
 
@@ -99,3 +101,10 @@ FanPreferenceTool = Tool(
     func=lambda query: get_user_favorites(query.strip())
 )
 
+
+# 개인화 Tool (Agent 재사용용) - user_id는 실행 시점 컨텍스트에서 읽음
+PersonalizedFanPreferenceTool = Tool(
+    name="fan_preference",
+    description="사용자가 좋아하는 팀/선수 목록을 조회하는 도구입니다. 사용자의 개인 선호도, 즐겨찾기, 관심 팀/선수와 관련된 질문에 사용합니다. 이 도구는 현재 로그인한 사용자의 선호도를 자동으로 조회합니다.",
+    func=lambda query: get_user_favorites(get_current_user_id())
+)
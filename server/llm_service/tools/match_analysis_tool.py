@@ -3,29 +3,15 @@
 기존 match_analysis 로직을 LangChain Tool로 래핑
 """
 from langchain.tools import Tool
-from typing import Optional
 import logging
 import json
 
-from ..services.rag_service import RAGService
-from ..external_apis.football_data import FootballDataClient
+from ..services.rag_service import get_rag_service, league_where
+from ..external_apis.football_data import call_football_api
+from ..external_apis.rate_limiter import RateLimitExceeded
 
 logger = logging.getLogger(__name__)
 
-# 서비스 인스턴스 (싱글톤)
-_rag_service: Optional[RAGService] = None
-_football_client: Optional[FootballDataClient] = None
-
-
-def get_services():
-    """서비스 인스턴스 반환"""
-    global _rag_service, _football_client
-    if _rag_service is None:
-        _rag_service = RAGService()
-    if _football_client is None:
-        _football_client = FootballDataClient()
-    return _rag_service, _football_client
-
 
 def analyze_match(match_id: str) -> str:
     """
@@ -39,24 +25,22 @@ def analyze_match(match_id: str) -> str:
     """
     try:
         match_id_int = int(match_id)
-        rag_service, football_client = get_services()
+        rag_service = get_rag_service()
         
-        # 1. 경기 정보 조회
-        match_info = football_client.get_match(match_id_int)
+        # 1. 경기 정보 조회 (공용 비동기 클라이언트 → 호출 한도 버킷 공유)
+        match_info = call_football_api(lambda client: client.get_match_details(match_id_int))
+        if not match_info:
+            return f"경기 정보를 찾을 수 없습니다: {match_id}"
         home_team = match_info.get("homeTeam", {}).get("name", "Unknown")
         away_team = match_info.get("awayTeam", {}).get("name", "Unknown")
+        league = match_info.get("competition", {}).get("code")
         
-        # 2. RAG 검색
-        home_results = rag_service.search(
-            collection_name="default",
-            query=f"{home_team} 최근 경기 전적",
-            top_k=3
-        )
-        
-        away_results = rag_service.search(
+        # 2. RAG 검색 (두 팀 한 번에, 임베딩 1회 배치, 경기가 속한 리그 문서만)
+        home_results, away_results = rag_service.search_batch(
             collection_name="default",
-            query=f"{away_team} 최근 경기 전적",
-            top_k=3
+            queries=[f"{home_team} 최근 경기 전적", f"{away_team} 최근 경기 전적"],
+            top_k=3,
+            where=league_where(league),
         )
         
         # 3. 결과 포맷팅
@@ -71,6 +55,9 @@ def analyze_match(match_id: str) -> str:
         
     except ValueError:
         return f"잘못된 경기 ID입니다: {match_id}"
+    except RateLimitExceeded as e:
+        logger.warning(f"⚠️ 경기 분석 보류 (호출 한도): {e}")
+        return f"경기 데이터 조회 한도를 초과했습니다. {e.retry_after:.0f}초 후 다시 시도해주세요."
     except Exception as e:
         logger.error(f"❌ 경기 분석 오류: {str(e)}")
         return f"경기 분석 중 오류가 발생했습니다: {str(e)}"
@@ -3,25 +3,13 @@
 기존 player_compare 로직을 LangChain Tool로 래핑
 """
 from langchain.tools import Tool
-from typing import Optional
 import logging
 
-from ..services.rag_service import RAGService
+from ..services.rag_service import get_rag_service
+from ..utils.entity_resolver import player_search_name
 
 logger = logging.getLogger(__name__)
 
-# 서비스 인스턴스 (싱글톤)
-_rag_service: Optional[RAGService] = None
-
-
-def get_rag_service() -> RAGService:
-    """RAGService 싱글톤 인스턴스 반환"""
-    global _rag_service
-    if _rag_service is None:
-        _rag_service = RAGService()
-    return _rag_service
-
-
 def compare_players(player_names: str) -> str:
     """
     두 명 이상의 선수를 비교 분석합니다.
@@ -43,9 +31,10 @@ def compare_players(player_names: str) -> str:
         
         # 각 선수별로 RAG 검색
         for player_name in names:
+            # 오타/한글 표기도 정식 이름을 함께 검색 ("홀란드" → "홀란드 (Erling Haaland)")
             rag_results = rag_service.search(
                 collection_name="default",
-                query=f"{player_name} 통계 시즌 골 어시스트",
+                query=f"{player_search_name(player_name)} 통계 시즌 골 어시스트",
                 top_k=3
             )
             
@@ -1,12 +1,12 @@
 """
 커뮤니티 게시글 검색 Tool
-Firestore community 컬렉션에서 키워드 기반으로 게시글을 검색합니다.
+Supabase posts 전체를 인덱싱한 검색 인덱스(한글 2-gram + BM25)에서 점수순으로 게시글을 검색합니다.
 """
 from langchain.tools import Tool
 from typing import List
 import logging
 
-from firebase_admin import firestore
+from llm_service.utils.post_search_index import get_post_search_index
 
 logger = logging.getLogger(__name__)
 
@@ -22,46 +22,57 @@ def search_posts(keyword: str) -> str:
         검색된 게시글 요약 문자열
     """
     try:
-        db = firestore.client()
-        # 최근 글 위주로 최대 50개 조회 후 파이썬에서 필터링
-        query = (
-            db.collection("posts")
-            .order_by("created_at", direction=firestore.Query.DESCENDING)
-            .limit(50)
-        )
-
-        docs = list(query.stream())
-        if not docs:
+        from backend.supabase_config import get_supabase_client
+
+        db = get_supabase_client()
+        index = get_post_search_index()
+        # 적재는 앱 시작 시 백그라운드에서 (Agent 응답이 전체 적재를 기다리지 않게)
+        index.ensure_loaded(db, wait=False)
+        if not index.ready:
+            return "게시글 검색 인덱스를 준비 중입니다. 잠시 후 다시 시도해주세요."
+
+        if not index.get_stats()["posts"]:
             return "커뮤니티에 아직 게시글이 없습니다."
 
-        keyword_lower = keyword.lower()
-        matched = []
-        for doc in docs:
-            data = doc.to_dict()
-            title = (data.get("title") or "")
-            content = (data.get("content") or "")
-            combined = f"{title}\n{content}".lower()
-            if keyword_lower in combined:
-                matched.append(data)
+        hits, total = index.search(keyword, limit=10)
+
+        # 좋아요/댓글 수는 DB의 최신 값, 다른 인스턴스/관리자 처리로 삭제된 글은 제외 (조회 실패 시 인덱스 값 그대로)
+        counts = None
+        if hits:
+            try:
+                result = (
+                    db.table("posts").select("post_id,likes,comment_count")
+                    .in_("post_id", [hit.post_id for hit in hits])
+                    .eq("is_deleted", False)
+                    .execute()
+                )
+                counts = {row["post_id"]: row for row in result.data or []}
+            except Exception as e:
+                logger.warning(f"⚠️ 게시글 좋아요/댓글 수 조회 실패: {e}")
+        if counts is None:
+            matched = [hit.post for hit in hits]
+        else:
+            total -= sum(1 for hit in hits if hit.post_id not in counts)
+            matched = [{**hit.post, **counts[hit.post_id]} for hit in hits if hit.post_id in counts]
 
         if not matched:
             return f"'{keyword}'와(과) 관련된 게시글을 찾지 못했습니다."
 
         lines: List[str] = [
-            f"'{keyword}'와(과) 관련된 커뮤니티 게시글 {len(matched)}개를 찾았습니다:",
+            f"'{keyword}'와(과) 관련된 커뮤니티 게시글 {total}개를 찾았습니다:",
             "",
         ]
 
-        for i, post in enumerate(matched[:10]):  # 최대 10개만 노출
+        for i, post in enumerate(matched):  # 점수 상위 10개만 노출
             lines.append(
                 f"[{i+1}] {post.get('title', '제목 없음')}"
                 f"  (작성자: {post.get('author_username', '익명')}, "
                 f"좋아요: {post.get('likes', 0)}, 댓글: {post.get('comment_count', 0)})"
             )
 
-        if len(matched) > 10:
+        if total > len(matched):
             lines.append("")
-            lines.append(f"※ 총 {len(matched)}개 중 상위 10개만 표시했습니다.")
+            lines.append(f"※ 총 {total}개 중 관련도 상위 {len(matched)}개만 표시했습니다.")
 
         return "\n".join(lines)
 
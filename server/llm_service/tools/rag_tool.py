@@ -3,25 +3,12 @@ RAG 검색 Tool
 기존 RAGService를 LangChain Tool로 래핑
 """
 from langchain.tools import Tool
-from typing import Optional
 import logging
 
-from ..services.rag_service import RAGService
+from ..services.rag_service import get_rag_service
 
 logger = logging.getLogger(__name__)
 
-# RAGService 인스턴스 (싱글톤)
-_rag_service: Optional[RAGService] = None
-
-
-def get_rag_service() -> RAGService:
-    """RAGService 싱글톤 인스턴스 반환"""
-    global _rag_service
-    if _rag_service is None:
-        _rag_service = RAGService()
-    return _rag_service
-
-
 def rag_search(query: str, top_k: int = 5) -> str:
     """
     축구 관련 정보를 RAG로 검색합니다.
@@ -0,0 +1,32 @@
+"""
+Agent 실행 컨텍스트 (요청별 사용자 정보)
+
+Agent는 Tool 구성(shape)별로 한 번만 만들어 재사용하고,
+user_id 같은 요청별 값은 ContextVar로 실행 시점에 바인딩한다.
+개인화 Tool(fan_preference, calendar)은 실행 시 get_current_user_id()로 값을 읽는다.
+"""
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+_current_user_id: ContextVar[Optional[str]] = ContextVar("agent_user_id", default=None)
+
+
+def get_current_user_id() -> Optional[str]:
+    """현재 Agent 실행에 바인딩된 user_id 반환 (없으면 None)"""
+    return _current_user_id.get()
+
+
+@contextmanager
+def bind_user_id(user_id: Optional[str]) -> Iterator[None]:
+    """
+    user_id를 현재 컨텍스트에 바인딩
+
+    ⚠️ loop.run_in_executor는 컨텍스트를 복사하지 않으므로
+    executor 스레드 안(agent.run 호출 직전)에서 바인딩해야 한다.
+    """
+    token = _current_user_id.set(user_id)
+    try:
+        yield
+    finally:
+        _current_user_id.reset(token)
@@ -115,9 +115,11 @@ def get_cache_service():
     global _cache_service
     if _cache_service is None:
         try:
-            from ..services.cache_service import CacheService
-            _cache_service = CacheService()
-            logger.info("✅ Weather Tool용 CacheService 연결")
+            # 공용 CacheService 재사용 (Chroma 핸들을 새로 열지 않음)
+            from ..services.cache_service import get_cache_service as get_shared_cache_service
+            _cache_service = get_shared_cache_service()
+            if _cache_service:
+                logger.info("✅ Weather Tool용 CacheService 연결")
         except Exception as e:
             logger.warning(f"⚠️ CacheService 연결 실패 (메모리 캐시만 사용): {e}")
     return _cache_service
@@ -221,11 +223,25 @@ def _save_to_firestore_cache(location: str, days: int, data: Dict):
 
 
 def _find_location_from_team(query: str) -> Optional[str]:
-    """팀명에서 도시 찾기"""
+    """팀명에서 도시 찾기 (정확한 팀명 → 팀 사전 퍼지 매칭 순)"""
     query_lower = query.lower()
     for team, city in STADIUM_LOCATIONS.items():
         if team in query_lower:
             return city
+
+    # 오타/다른 표기 ("토트넘 홋스퍼", "Tottenham Hotspur FC", "맨체스터시티")
+    try:
+        from ..utils.entity_resolver import get_entity_resolver
+
+        match = get_entity_resolver().find_best_in_text(query, kind="team")
+    except Exception as e:
+        logger.warning(f"⚠️ 팀 이름 매칭 실패: {e}")
+        return None
+    if match:
+        for alias in [match.entity.name, *match.entity.aliases]:
+            city = STADIUM_LOCATIONS.get(alias.lower())
+            if city:
+                return city
     return None
 
 
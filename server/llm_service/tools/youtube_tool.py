@@ -33,9 +33,11 @@ def get_cache_service():
     global _cache_service
     if _cache_service is None:
         try:
-            from ..services.cache_service import CacheService
-            _cache_service = CacheService()
-            logger.info("✅ YouTube Tool용 CacheService 연결")
+            # 공용 CacheService 재사용 (Chroma 핸들을 새로 열지 않음)
+            from ..services.cache_service import get_cache_service as get_shared_cache_service
+            _cache_service = get_shared_cache_service()
+            if _cache_service:
+                logger.info("✅ YouTube Tool용 CacheService 연결")
         except Exception as e:
             logger.warning(f"⚠️ CacheService 연결 실패 (메모리 캐시만 사용): {e}")
     return _cache_service
@@ -0,0 +1,99 @@
+"""
+Agent 팩토리
+Tool 구성(shape)별로 AgentExecutor를 한 번만 만들어 재사용
+
+기존에는 user_id가 있을 때마다 Tool 리스트를 새로 만들고 initialize_agent()를 호출했지만,
+개인화 Tool은 실행 시점에 ContextVar(bind_user_id)로 user_id를 읽으므로
+Agent 자체는 (개인화 여부, 스트리밍 여부) 조합별로 캐시할 수 있다.
+"""
+import logging
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+from langchain.agents import initialize_agent, AgentType
+
+from ..tools.user_context import bind_user_id
+
+logger = logging.getLogger(__name__)
+
+
+class AgentFactory:
+    """
+    (personalized, streaming) 조합별 AgentExecutor 캐시
+
+    Args:
+        base_tools: 기본 Tool 리스트
+        personalized_tools: 개인화 Tool 리스트 (같은 이름의 기본 Tool을 대체)
+        llm: 일반 LLM
+        streaming_llm: 스트리밍 LLM (없으면 llm 사용)
+        agent_kwargs: initialize_agent 추가 인자
+    """
+
+    def __init__(
+        self,
+        base_tools: List[Any],
+        personalized_tools: List[Any],
+        llm: Any,
+        streaming_llm: Optional[Any] = None,
+        **agent_kwargs: Any,
+    ):
+        self.base_tools = list(base_tools)
+        self.personalized_tools = list(personalized_tools)
+        self.llm = llm
+        self.streaming_llm = streaming_llm or llm
+        self.agent_kwargs = {
+            "agent": AgentType.ZERO_SHOT_REACT_DESCRIPTION,
+            "verbose": True,
+            "handle_parsing_errors": True,
+            "max_iterations": 10,  # 최대 반복 횟수 제한
+            "max_execution_time": 60,  # 최대 실행 시간 60초
+            **agent_kwargs,
+        }
+        self._agents: Dict[Tuple[bool, bool], Any] = {}
+        self._lock = threading.Lock()
+        self.build_count = 0
+
+    def get_tools(self, personalized: bool = False) -> List[Any]:
+        """Tool 구성 반환 (개인화 Tool은 같은 이름의 기본 Tool을 대체해 뒤에 추가)"""
+        if not personalized:
+            return list(self.base_tools)
+        names = {tool.name for tool in self.personalized_tools}
+        return [t for t in self.base_tools if t.name not in names] + self.personalized_tools
+
+    def get_agent(self, personalized: bool = False, streaming: bool = False) -> Any:
+        """캐시된 AgentExecutor 반환 (없으면 생성)"""
+        key = (personalized, streaming)
+        agent = self._agents.get(key)
+        if agent is not None:
+            return agent
+
+        with self._lock:
+            agent = self._agents.get(key)
+            if agent is None:
+                agent = initialize_agent(
+                    tools=self.get_tools(personalized),
+                    llm=self.streaming_llm if streaming else self.llm,
+                    **self.agent_kwargs,
+                )
+                self._agents[key] = agent
+                self.build_count += 1
+                logger.info(
+                    f"✅ Agent 생성 (personalized={personalized}, streaming={streaming})"
+                )
+        return agent
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "cached_agents": len(self._agents),
+            "build_count": self.build_count,
+        }
+
+
+def run_agent(agent: Any, prompt: str, user_id: Optional[str] = None, callbacks: Optional[list] = None) -> str:
+    """
+    user_id를 바인딩한 상태로 Agent 실행 (동기, executor 스레드에서 호출)
+
+    run_in_executor는 ContextVar를 복사하지 않으므로 여기서 바인딩한다.
+    """
+    with bind_user_id(user_id):
+        return agent.run(prompt, callbacks=callbacks)
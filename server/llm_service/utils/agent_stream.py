@@ -0,0 +1,212 @@
+"""
+Agent 스트리밍 콜백
+LangChain 콜백 이벤트(Tool 시작/종료, LLM 토큰)를 asyncio 큐로 전달
+
+Agent는 동기 함수(agent.run)라 executor 스레드에서 실행되므로,
+콜백에서 loop.call_soon_threadsafe로 이벤트 루프 쪽 큐에 이벤트를 넣고
+SSE 제너레이터가 큐를 소비하면서 즉시 클라이언트로 전송한다.
+
+이벤트 형식 (dict):
+- {"type": "tool_start", "tool": 이름, "input": 입력}
+- {"type": "tool_end", "tool": 이름}
+- {"type": "tool_error", "tool": 이름, "error": 메시지}
+- {"type": "token", "content": 최종 답변 토큰}
+"""
+import asyncio
+import logging
+from typing import Any, Callable, Dict, List, Optional
+from uuid import UUID
+
+from langchain_core.callbacks import BaseCallbackHandler
+
+logger = logging.getLogger(__name__)
+
+# ReAct 출력에서 최종 답변이 시작되는 지점
+FINAL_ANSWER_PREFIX = "Final Answer:"
+
+# Tool별 상태 메시지 (SSE status 이벤트용)
+TOOL_STATUS_MESSAGES = {
+    "calendar": "경기 일정을 조회하는 중...",
+    "match_analysis": "경기 데이터를 분석하는 중...",
+    "player_compare": "선수 정보를 비교하는 중...",
+    "posts_search": "커뮤니티 게시글을 검색하는 중...",
+    "fan_preference": "사용자 선호도를 확인하는 중...",
+    "rag_search": "관련 정보를 검색하는 중...",
+    "weather": "경기장 날씨를 확인하는 중...",
+    "youtube_highlight": "하이라이트 영상을 찾는 중...",
+}
+
+
+class ToolUsageCallbackHandler(BaseCallbackHandler):
+    """
+    Agent가 실제로 호출한 Tool 이름 기록 (호출 순서, 중복 없이)
+
+    비스트리밍 Agent 응답의 tools_used도 질문 키워드 추정 대신 이 기록을 사용한다.
+    """
+
+    def __init__(self):
+        self.tools_used: List[str] = []
+        self._tool_runs: Dict[UUID, str] = {}
+
+    def on_tool_start(
+        self,
+        serialized: Dict[str, Any],
+        input_str: str,
+        *,
+        run_id: UUID,
+        **kwargs: Any,
+    ) -> None:
+        tool_name = (serialized or {}).get("name") or kwargs.get("name") or "tool"
+        self._tool_runs[run_id] = tool_name
+        if tool_name not in self.tools_used:
+            self.tools_used.append(tool_name)
+
+    def on_tool_end(self, output: Any, *, run_id: UUID, **kwargs: Any) -> None:
+        self._tool_runs.pop(run_id, None)
+
+    def on_tool_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any) -> None:
+        tool_name = self._tool_runs.pop(run_id, "tool")
+        logger.warning(f"⚠️ Tool 실행 오류 ({tool_name}): {error}")
+
+
+class AgentStreamCallbackHandler(ToolUsageCallbackHandler):
+    """
+    Agent 실행 이벤트를 asyncio.Queue로 전달하는 콜백 핸들러
+
+    - LLM 토큰은 "Final Answer:" 이후 부분만 전달 (중간 Thought/Action은 숨김)
+      접두어가 여러 토큰에 걸쳐 나와도 감지하고, 접두어 뒤 공백은 보내지 않음
+    - Tool 시작/종료는 실제 호출된 Tool 이름으로 전달
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, queue: asyncio.Queue):
+        super().__init__()
+        self.loop = loop
+        self.queue = queue
+        self.streamed_answer = False
+        self._buffer = ""
+        self._in_final_answer = False
+
+    def _emit(self, event: Dict[str, Any]) -> None:
+        """executor 스레드 → 이벤트 루프 큐로 안전하게 전달"""
+        self.loop.call_soon_threadsafe(self.queue.put_nowait, event)
+
+    # ============================================
+    # LLM 토큰
+    # ============================================
+
+    def on_llm_start(self, serialized: Dict[str, Any], prompts: List[str], **kwargs: Any) -> None:
+        self._buffer = ""
+        self._in_final_answer = False
+
+    def on_chat_model_start(self, serialized: Dict[str, Any], messages: List[List[Any]], **kwargs: Any) -> None:
+        self._buffer = ""
+        self._in_final_answer = False
+
+    def _emit_answer(self, text: str) -> None:
+        # 답변 첫 글자 전까지는 접두어 뒤 공백/줄바꿈을 버림 ("Final Answer:" / " 토트넘"처럼 나뉘는 경우)
+        if not self.streamed_answer:
+            text = text.lstrip()
+        if text:
+            self.streamed_answer = True
+            self._emit({"type": "token", "content": text})
+
+    def on_llm_new_token(self, token: str, **kwargs: Any) -> None:
+        if self._in_final_answer:
+            self._emit_answer(token)
+            return
+
+        self._buffer += token
+        idx = self._buffer.find(FINAL_ANSWER_PREFIX)
+        if idx == -1:
+            # 접두어가 다음 토큰에 걸쳐 나올 수 있으므로 끝부분만 남김
+            self._buffer = self._buffer[-(len(FINAL_ANSWER_PREFIX) - 1):]
+            return
+
+        # 최종 답변 시작: 접두어 이후 텍스트부터 전송
+        self._in_final_answer = True
+        self._emit_answer(self._buffer[idx + len(FINAL_ANSWER_PREFIX):])
+
+    # ============================================
+    # Tool 시작/종료
+    # ============================================
+
+    def on_tool_start(
+        self,
+        serialized: Dict[str, Any],
+        input_str: str,
+        *,
+        run_id: UUID,
+        **kwargs: Any,
+    ) -> None:
+        super().on_tool_start(serialized, input_str, run_id=run_id, **kwargs)
+        self._emit({"type": "tool_start", "tool": self._tool_runs[run_id], "input": input_str[:200]})
+
+    def on_tool_end(self, output: Any, *, run_id: UUID, **kwargs: Any) -> None:
+        tool_name = self._tool_runs.get(run_id, "tool")
+        super().on_tool_end(output, run_id=run_id, **kwargs)
+        self._emit({"type": "tool_end", "tool": tool_name})
+
+    def on_tool_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any) -> None:
+        tool_name = self._tool_runs.get(run_id, "tool")
+        super().on_tool_error(error, run_id=run_id, **kwargs)
+        self._emit({"type": "tool_error", "tool": tool_name, "error": str(error)[:200]})
+
+
+class StreamTextFilter:
+    """
+    스트리밍 텍스트 출력 필터
+
+    토큰 단위로 필터링하면 단어가 잘려 패턴이 안 걸리므로 앞부분만 내보내고
+    나머지는 다음 토큰과 합쳐서 검사한다. 내보내는 경계(cut)는
+    - 마지막 (holdback)글자는 남김: 가장 긴 금지어(여러 단어 포함)가 아직 다 안 들어왔을 수 있음
+    - 그 앞의 마지막 공백/줄바꿈 뒤 (정규식 규칙은 단어 단위)
+    - boundary_fn으로 이미 완성된 매칭 구간 안이면 매칭 시작 전으로 당김
+
+    Args:
+        filter_fn: 마스킹 함수 (없으면 그대로 통과)
+        holdback: 끝에서 남겨 둘 글자 수 (가장 긴 패턴 길이 - 1)
+        boundary_fn: (텍스트, cut) → 매칭 구간을 자르지 않는 cut
+    """
+
+    def __init__(
+        self,
+        filter_fn: Optional[Callable[[str], str]] = None,
+        holdback: int = 0,
+        boundary_fn: Optional[Callable[[str, int], int]] = None,
+    ):
+        self.filter_fn = filter_fn
+        self.holdback = max(holdback, 0)
+        self.boundary_fn = boundary_fn
+        self._pending = ""
+
+    @classmethod
+    def for_service(cls, content_safety_service: Any) -> "StreamTextFilter":
+        """ContentSafetyService 규칙 기준 필터 (서비스가 없으면 필터링 안 함)"""
+        if content_safety_service is None:
+            return cls()
+        return cls(
+            content_safety_service.filter_text,
+            holdback=content_safety_service.max_pattern_length - 1,
+            boundary_fn=content_safety_service.mask_boundary,
+        )
+
+    def feed(self, text: str) -> str:
+        if not self.filter_fn:
+            return text
+        self._pending += text
+        limit = len(self._pending) - self.holdback
+        if limit <= 0:
+            return ""
+        cut = max(self._pending.rfind(" ", 0, limit), self._pending.rfind("\n", 0, limit)) + 1
+        if cut and self.boundary_fn:
+            cut = self.boundary_fn(self._pending, cut)
+        if cut <= 0:
+            return ""
+        ready, self._pending = self._pending[:cut], self._pending[cut:]
+        return self.filter_fn(ready)
+
+    def flush(self) -> str:
+        if not self._pending:
+            return ""
+        text, self._pending = self._pending, ""
+        return self.filter_fn(text) if self.filter_fn else text
@@ -0,0 +1,89 @@
+"""
+Aho-Corasick 다중 문자열 검색
+
+금지어 목록처럼 고정 문자열이 많을 때 텍스트를 한 번만 훑어서 모든 등장 위치를 찾음
+- 단어마다 `word in text` / re.sub 반복: O(텍스트 길이 x 단어 수)
+- 오토마톤: O(텍스트 길이 + 매칭 수), 단어 수와 무관
+
+대소문자 무시 (단어와 텍스트 모두 소문자로 비교)
+
+Example:
+    >>> automaton = AhoCorasick(["기밀정보", "내부문서"])
+    >>> list(automaton.finditer("이건 내부문서입니다"))
+    [(3, 7, 1)]
+"""
+from collections import deque
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+
+class AhoCorasick:
+    """
+    고정 문자열 집합 검색 오토마톤 (생성 후 읽기 전용, 스레드 안전)
+
+    Args:
+        words: 검색할 문자열 목록 (빈 문자열은 무시, 순서 = 단어 번호)
+    """
+
+    def __init__(self, words: Iterable[str]):
+        self.words: List[str] = list(words)
+        # 상태별 전이 / 실패 링크 / 이 상태에서 끝나는 (단어 번호, 길이)
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[Tuple[int, int]]] = [[]]
+
+        for index, word in enumerate(self.words):
+            word = word.lower()
+            if not word:
+                continue
+            state = 0
+            for ch in word:
+                next_state = self._goto[state].get(ch)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][ch] = next_state
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append([])
+                state = next_state
+            self._output[state].append((index, len(word)))
+
+        # BFS로 실패 링크 계산 (접미사 단어의 출력도 합쳐 둠)
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail = self._fail[state]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                target = self._goto[fail].get(ch, 0)
+                self._fail[next_state] = target if target != next_state else 0
+                self._output[next_state] = self._output[next_state] + self._output[self._fail[next_state]]
+
+    def __bool__(self) -> bool:
+        return len(self._goto) > 1
+
+    def finditer(self, text: str) -> Iterator[Tuple[int, int, int]]:
+        """
+        모든 등장 위치 (겹치는 것 포함)
+
+        Args:
+            text: 검색 대상 (내부에서 소문자 변환)
+
+        Yields:
+            (시작, 끝, 단어 번호) - 끝 위치 순, 위치는 text.lower() 기준
+        """
+        if len(self._goto) == 1:
+            return
+        goto, fail, output = self._goto, self._fail, self._output
+        state = 0
+        for i, ch in enumerate(text.lower()):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            for index, length in output[state]:
+                yield i + 1 - length, i + 1, index
+
+    def search(self, text: str) -> List[int]:
+        """등장한 단어 번호 (중복 없이, 단어 목록 순서)"""
+        return sorted({index for _, _, index in self.finditer(text)})
@@ -11,10 +11,13 @@ import logging
 from typing import Literal, Optional
 import os
 
-from ..services.openai_service import OpenAIService
+from ..services.openai_service import get_openai_service
 
 logger = logging.getLogger(__name__)
 
+# Judge LLM 호출 타임아웃 (초) - 초과 시 UNCERTAIN으로 처리되어 API 호출로 넘어감
+JUDGE_TIMEOUT_SECONDS = float(os.getenv("CACHE_JUDGE_TIMEOUT_SECONDS", "10"))
+
 # Judge 프롬프트 (강화 버전: 유사도 정보 포함, CALL_API 추가)
 JUDGE_PROMPT = """당신은 캐시 데이터 검증 전문가입니다.
 
@@ -64,7 +67,8 @@ class CacheJudge:
     """
     
     def __init__(self):
-        self.openai_service = OpenAIService()
+        # 공용 OpenAIService 재사용 (비동기 클라이언트 + 공유 커넥션 풀)
+        self.openai_service = get_openai_service()
     
     async def judge(
         self, 
@@ -107,7 +111,9 @@ class CacheJudge:
             ]
             
             # LLM 호출 (비용: 약 $0.0001~0.0005)
-            response = await self.openai_service.chat(messages=messages)
+            response = await self.openai_service.chat(
+                messages=messages, timeout=JUDGE_TIMEOUT_SECONDS
+            )
             
             # 응답 파싱
             result, reason = self._parse_judge_response(response)
@@ -153,3 +159,22 @@ class CacheJudge:
         
         return result, reason
 
+
+
+# ============================================
+# 싱글톤 인스턴스 (첫 사용 시 생성)
+# ============================================
+_cache_judge: Optional[CacheJudge] = None
+_cache_judge_failed = False
+
+
+def get_cache_judge() -> Optional[CacheJudge]:
+    """공용 CacheJudge 반환 (초기화 실패 시 None, 재시도하지 않음)"""
+    global _cache_judge, _cache_judge_failed
+    if _cache_judge is None and not _cache_judge_failed:
+        try:
+            _cache_judge = CacheJudge()
+        except Exception as e:
+            _cache_judge_failed = True
+            logger.warning(f"⚠️ CacheJudge 초기화 실패: {e}")
+    return _cache_judge
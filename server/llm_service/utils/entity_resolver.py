@@ -0,0 +1,430 @@
+"""
+선수/팀 이름 퍼지 매칭 (한글/영문)
+
+오타나 부분 이름("홀란", "haland", "Son")을 RAG/LLM 호출 전에 정확한 엔티티로 연결
+- 이름 정규화: 소문자, 악센트 제거(Mbappé → mbappe), 구두점/공백 제거
+- 한글은 자모로 분해해서 비교 (홀란드 ↔ 할란드 처럼 한 글자 오타도 대부분의 n-gram이 겹침)
+- 문자 3-gram 역색인 → 후보만 Dice 유사도로 점수 계산 (전체 선형 탐색 없음)
+- 토큰/접두어 일치 보너스 ("son" → "Son Heung-Min", "홀란" → "홀란드")
+
+데이터 출처:
+- espn_player_ids.json (PlayerStatsStore, name/ko_name/team/ko_team)
+- 한국 선수/팀 한글 매핑 (scrapers.add_ko_names)
+- 아래 TEAM_ALIASES / PLAYER_ALIASES (주요 팀 별칭, 해외 선수 한글 표기)
+
+Example:
+    >>> resolver = get_entity_resolver()
+    >>> resolver.best("홀란", kind="player").entity.name
+    'Erling Haaland'
+    >>> resolver.find_best_in_text("토트넘에서 다음 경기 언제야?", kind="team").entity.name
+    'Tottenham Hotspur'
+"""
+import logging
+import re
+import threading
+import unicodedata
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from itertools import chain
+from operator import itemgetter
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+NGRAM_SIZE = 3
+
+# 점수 계산할 최대 후보 수 (공유 n-gram 많은 순): 흔한 n-gram이 수천 개 별칭에 걸려도 질의 비용 일정
+MAX_CANDIDATES = 64
+# 후보가 되려면 질의 n-gram 중 이 비율 이상 공유
+MIN_SHARED_RATIO = 0.3
+
+# 텍스트 스캔 시 떼어 낼 조사 (긴 것부터)
+KOREAN_PARTICLES = ("에서", "에게", "한테", "보다", "이랑", "은", "는", "이", "가", "을", "를", "의", "와", "과", "랑", "도", "만")
+
+# 주요 팀 별칭 (정식 영문명 → 한글/약칭)
+TEAM_ALIASES: Dict[str, List[str]] = {
+    # 프리미어리그
+    "Tottenham Hotspur": ["토트넘", "토트넘 홋스퍼", "tottenham", "spurs"],
+    "Arsenal": ["아스날", "아스널"],
+    "Chelsea": ["첼시"],
+    "West Ham United": ["웨스트햄", "west ham"],
+    "Manchester United": ["맨유", "맨체스터 유나이티드", "man utd", "man united"],
+    "Manchester City": ["맨시티", "맨체스터 시티", "man city"],
+    "Liverpool": ["리버풀"],
+    "Everton": ["에버튼", "에버턴"],
+    "Newcastle United": ["뉴캐슬", "newcastle"],
+    "Brighton & Hove Albion": ["브라이튼", "brighton"],
+    "Aston Villa": ["아스톤빌라", "아스톤 빌라"],
+    "Leicester City": ["레스터", "leicester"],
+    "Wolverhampton Wanderers": ["울버햄튼", "울브스", "wolves"],
+    "AFC Bournemouth": ["본머스", "bournemouth"],
+    "Nottingham Forest": ["노팅엄", "노팅엄 포레스트"],
+    "Fulham": ["풀럼"],
+    "Crystal Palace": ["크리스탈 팰리스"],
+    "Brentford": ["브렌트포드"],
+    "Ipswich Town": ["입스위치", "ipswich"],
+    "Southampton": ["사우샘프턴"],
+    # 라리가
+    "Barcelona": ["바르셀로나", "바르사", "barca"],
+    "Real Madrid": ["레알마드리드", "레알 마드리드", "레알"],
+    "Atletico Madrid": ["아틀레티코", "아틀레티코 마드리드"],
+    # 분데스리가
+    "Bayern Munich": ["바이에른", "바이에른 뮌헨", "bayern", "뮌헨"],
+    "Borussia Dortmund": ["도르트문트", "dortmund", "돌문"],
+    "RB Leipzig": ["라이프치히", "leipzig"],
+    # 세리에A
+    "Juventus": ["유벤투스", "유베"],
+    "Inter Milan": ["인터밀란", "인테르", "inter"],
+    "AC Milan": ["ac밀란", "ac 밀란"],
+    "Napoli": ["나폴리"],
+    "AS Roma": ["로마", "roma"],
+    # 리그앙
+    "Paris Saint-Germain": ["파리생제르망", "파리 생제르맹", "psg"],
+}
+
+# 해외 주요 선수 한글 표기 (JSON ko_name은 한국 선수 위주)
+PLAYER_ALIASES: Dict[str, List[str]] = {
+    "Erling Haaland": ["홀란", "홀란드", "엘링 홀란"],
+    "Mohamed Salah": ["살라", "살라흐", "모하메드 살라"],
+    "Kylian Mbappé": ["음바페", "킬리안 음바페"],
+    "Harry Kane": ["케인", "해리 케인"],
+    "Jude Bellingham": ["벨링엄", "주드 벨링엄"],
+    "Kevin De Bruyne": ["더브라위너", "데 브라이너", "케빈 더브라위너"],
+    "Vinícius Júnior": ["비니시우스", "비니시우스 주니오르"],
+}
+
+
+# ============================================
+# 정규화 / n-gram
+# ============================================
+
+def _decompose_hangul(text: str) -> str:
+    """한글 음절 → 자모 (초성/중성/종성), 그 외 문자는 그대로"""
+    out = []
+    for ch in text:
+        code = ord(ch) - 0xAC00
+        if 0 <= code < 11172:
+            out.append(chr(0x1100 + code // 588))
+            out.append(chr(0x1161 + (code % 588) // 28))
+            if code % 28:
+                out.append(chr(0x11A7 + code % 28))
+        else:
+            out.append(ch)
+    return "".join(out)
+
+
+def normalize_tokens(text: str) -> List[str]:
+    """소문자 + 악센트 제거 + 구두점 기준 토큰화"""
+    text = unicodedata.normalize("NFKD", text.lower())
+    text = "".join(ch for ch in text if not unicodedata.combining(ch))
+    # NFKD가 분해한 한글 음절 다시 합치기 (자모 분해는 _decompose_hangul에서 일관되게)
+    text = unicodedata.normalize("NFC", text)
+    return re.findall(r"[0-9a-z가-힣]+", text)
+
+
+def name_key(text: str) -> str:
+    """비교용 키 (공백 없는 정규화 문자열, 한글은 자모)"""
+    return _decompose_hangul("".join(normalize_tokens(text)))
+
+
+def ngrams(key: str, n: int = NGRAM_SIZE) -> set:
+    padded = f"^{key}$"
+    if len(padded) <= n:
+        return {padded}
+    return {padded[i:i + n] for i in range(len(padded) - n + 1)}
+
+
+# ============================================
+# 엔티티 / 결과
+# ============================================
+
+@dataclass
+class Entity:
+    """선수 또는 팀"""
+
+    kind: str  # "player" | "team"
+    name: str  # 정식 이름 (영문)
+    aliases: List[str] = field(default_factory=list)
+    data: Dict[str, Any] = field(default_factory=dict)
+    weight: float = 0.0  # 동점일 때 우선순위 (예: 득점 + 도움)
+
+
+@dataclass
+class EntityMatch:
+    entity: Entity
+    score: float
+    alias: str
+
+
+class EntityResolver:
+    """
+    n-gram 역색인 기반 이름 → 엔티티 매칭 (생성 후 읽기 전용, 스레드 안전)
+
+    Args:
+        entities: 선수/팀 엔티티 목록
+    """
+
+    def __init__(self, entities: Iterable[Entity]):
+        self.entities: List[Entity] = []
+        # 별칭 단위 색인: (엔티티 번호, 원래 별칭, 키, 토큰 키들, n-gram 수, 토큰별 n-gram)
+        self._aliases: List[Tuple[int, str, str, Tuple[str, ...], int, Tuple[set, ...]]] = []
+        self._exact: Dict[str, List[int]] = defaultdict(list)
+        self._postings: Dict[str, List[int]] = defaultdict(list)
+
+        for entity in entities:
+            entity_id = len(self.entities)
+            self.entities.append(entity)
+            seen = set()
+            for alias in [entity.name, *entity.aliases]:
+                key = name_key(alias)
+                if not key or key in seen:
+                    continue
+                seen.add(key)
+                alias_id = len(self._aliases)
+                grams = ngrams(key)
+                token_keys = tuple(_decompose_hangul(t) for t in normalize_tokens(alias))
+                token_grams = tuple(ngrams(t) for t in token_keys) if len(token_keys) > 1 else ()
+                self._aliases.append((entity_id, alias, key, token_keys, len(grams), token_grams))
+                self._exact[key].append(alias_id)
+                for gram in grams:
+                    self._postings[gram].append(alias_id)
+
+    def __len__(self) -> int:
+        return len(self.entities)
+
+    def _score(self, query_key: str, query_grams: set, shared: int, alias_id: int) -> float:
+        _, _, key, token_keys, size, token_grams = self._aliases[alias_id]
+        if key == query_key:
+            return 1.0
+        score = 2 * shared / (len(query_grams) + size)
+        # 여러 단어 이름은 단어별로도 비교 ("haland" ↔ "haaland", 성/이름 한쪽만 입력한 오타)
+        for grams in token_grams:
+            token_score = 0.9 * 2 * len(query_grams & grams) / (len(query_grams) + len(grams))
+            score = max(score, token_score)
+        # 부분 이름: 토큰과 일치하거나 별칭의 앞부분 ("son" → "son heung min", "홀란" → "홀란드")
+        # 한 글자("주" → "주드 벨링엄")는 제외
+        if len(query_key) >= 3 and (query_key in token_keys or key.startswith(query_key)):
+            score = max(score, 0.75 + 0.2 * len(query_key) / len(key))
+        return score
+
+    def resolve(
+        self,
+        query: str,
+        kind: Optional[str] = None,
+        limit: int = 5,
+        min_score: float = 0.35,
+    ) -> List[EntityMatch]:
+        """
+        이름 후보 순위
+
+        Args:
+            query: 이름 (오타/부분 이름/한글/영문)
+            kind: "player" | "team" | None (전체)
+            limit: 최대 후보 수
+            min_score: 최소 점수 (0~1)
+
+        Returns:
+            점수 높은 순 EntityMatch 목록 (엔티티당 하나)
+        """
+        query_key = name_key(query)
+        if len(query_key) < 2:
+            return []
+
+        grams = ngrams(query_key)
+        shared = Counter(chain.from_iterable(self._postings.get(gram, ()) for gram in grams))
+        for alias_id in self._exact.get(query_key, ()):
+            shared.setdefault(alias_id, len(grams))
+
+        # n-gram 하나둘만 겹치는 별칭(대부분의 후보)은 점수 계산 전에 제외
+        min_shared = max(1, int(len(grams) * MIN_SHARED_RATIO))
+        candidates = [(alias_id, count) for alias_id, count in shared.items() if count >= min_shared]
+        if kind:
+            candidates = [
+                (alias_id, count) for alias_id, count in candidates
+                if self.entities[self._aliases[alias_id][0]].kind == kind
+            ]
+        if len(candidates) > MAX_CANDIDATES:
+            candidates.sort(key=itemgetter(1), reverse=True)
+            del candidates[MAX_CANDIDATES:]
+
+        best: Dict[int, EntityMatch] = {}
+        for alias_id, count in candidates:
+            entity_id, alias = self._aliases[alias_id][:2]
+            entity = self.entities[entity_id]
+            score = self._score(query_key, grams, count, alias_id)
+            if score < min_score:
+                continue
+            current = best.get(entity_id)
+            if current is None or score > current.score:
+                best[entity_id] = EntityMatch(entity, score, alias)
+
+        ranked = sorted(best.values(), key=lambda m: (m.score, m.entity.weight), reverse=True)
+        return ranked[:limit]
+
+    def best(self, query: str, kind: Optional[str] = None, min_score: float = 0.6) -> Optional[EntityMatch]:
+        """가장 가까운 엔티티 하나 (min_score 미만이면 None)"""
+        matches = self.resolve(query, kind=kind, limit=1, min_score=min_score)
+        return matches[0] if matches else None
+
+    def find_best_in_text(
+        self, text: str, kind: Optional[str] = None, min_score: float = 0.65
+    ) -> Optional[EntityMatch]:
+        """
+        문장에서 엔티티 찾기 (단어 1~3개 묶음 + 조사 제거 후 매칭)
+
+        예: "이번 시즌 홀란드 득점" → Erling Haaland
+        """
+        words = re.findall(r"[0-9A-Za-z가-힣À-ÿ'\-]+", text)
+        candidates = []
+        for size in (3, 2, 1):
+            for i in range(len(words) - size + 1):
+                phrase = " ".join(words[i:i + size])
+                candidates.append(phrase)
+                stripped = _strip_particle(phrase)
+                if stripped != phrase:
+                    candidates.append(stripped)
+
+        found: Optional[EntityMatch] = None
+        for phrase in candidates:
+            match = self.best(phrase, kind=kind, min_score=min_score)
+            if match and (found is None or match.score > found.score):
+                found = match
+                if match.score >= 1.0:
+                    break
+        return found
+
+
+def _strip_particle(phrase: str) -> str:
+    for particle in KOREAN_PARTICLES:
+        if phrase.endswith(particle) and len(phrase) - len(particle) >= 2:
+            return phrase[: -len(particle)]
+    return phrase
+
+
+# ============================================
+# 기본 데이터로 생성
+# ============================================
+
+def _reversed_name(name: str) -> Optional[str]:
+    """'Son Heung-Min' → 'Heung-Min Son'"""
+    parts = name.split()
+    if len(parts) == 2:
+        return f"{parts[1]} {parts[0]}"
+    return None
+
+
+def build_entities(players: Iterable[Tuple[str, Dict]]) -> List[Entity]:
+    """(리그, 선수 dict) 목록 + 내장 별칭 → 엔티티"""
+    from ..scrapers.add_ko_names import KNOWN_KOREAN_PLAYERS, KNOWN_TEAMS_KO
+
+    entities: List[Entity] = []
+    player_by_key: Dict[str, Entity] = {}
+    team_by_key: Dict[str, Entity] = {}
+
+    def add_team(name: str, aliases: Iterable[str]) -> Entity:
+        key = name_key(name)
+        team = team_by_key.get(key)
+        if team is None:
+            team = Entity(kind="team", name=name)
+            entities.append(team)
+            team_by_key[key] = team
+        for alias in aliases:
+            if alias and alias not in team.aliases:
+                team.aliases.append(alias)
+                team_by_key.setdefault(name_key(alias), team)
+        return team
+
+    def add_player(name: str, aliases: Iterable[str], data: Dict, weight: float = 0.0) -> None:
+        key = name_key(name)
+        player = player_by_key.get(key)
+        if player is None:
+            player = Entity(kind="player", name=name, data=data, weight=weight)
+            entities.append(player)
+            player_by_key[key] = player
+        for alias in aliases:
+            if alias and alias not in player.aliases:
+                player.aliases.append(alias)
+
+    for name, aliases in TEAM_ALIASES.items():
+        add_team(name, aliases)
+    for english, korean in KNOWN_TEAMS_KO.items():
+        team = team_by_key.get(name_key(english)) or team_by_key.get(name_key(korean))
+        add_team(team.name if team else english, [english, korean])
+
+    # 같은 이름이 여러 리그에 있으면 먼저 나온 선수 (PlayerStatsStore.find_player와 동일)
+    for league, player in players:
+        name = player.get("name")
+        if not name:
+            continue
+        add_player(
+            name,
+            [player.get("ko_name", ""), _reversed_name(name)],
+            {**player, "league": league},
+            weight=player.get("goals", 0) + player.get("assists", 0),
+        )
+        team_name = player.get("team")
+        if team_name:
+            team = team_by_key.get(name_key(team_name))
+            add_team(team.name if team else team_name, [team_name, player.get("ko_team", "")])
+
+    for english, korean in KNOWN_KOREAN_PLAYERS.items():
+        existing = player_by_key.get(name_key(english))
+        if existing is None:
+            # "Heung-Min Son" 같은 변형은 원래 이름 엔티티에 별칭으로
+            for other in player_by_key.values():
+                if korean in other.aliases:
+                    existing = other
+                    break
+        if existing is not None:
+            add_player(existing.name, [english, korean], existing.data)
+        else:
+            add_player(english, [korean, _reversed_name(english)], {"name": english, "ko_name": korean})
+
+    for name, aliases in PLAYER_ALIASES.items():
+        existing = player_by_key.get(name_key(name))
+        add_player(existing.name if existing else name, aliases, existing.data if existing else {"name": name})
+
+    return entities
+
+
+# ============================================
+# 싱글톤 (선수 통계 파일이 바뀌면 다시 생성)
+# ============================================
+_resolver: Optional[EntityResolver] = None
+_resolver_version: Any = None
+_resolver_lock = threading.Lock()
+
+
+def get_entity_resolver() -> EntityResolver:
+    """공용 EntityResolver 반환 (espn_player_ids.json 버전이 바뀌면 다시 생성)"""
+    global _resolver, _resolver_version
+    from ..services.player_stats_store import get_player_stats_store
+
+    store = get_player_stats_store()
+    try:
+        version = store.version()
+    except (OSError, ValueError):
+        version = None  # 파일이 없으면 내장 별칭만 사용
+
+    if _resolver is not None and version == _resolver_version:
+        return _resolver
+
+    with _resolver_lock:
+        if _resolver is None or version != _resolver_version:
+            players = list(store.iter_players()) if version is not None else []
+            _resolver = EntityResolver(build_entities(players))
+            _resolver_version = version
+            logger.info(f"✅ EntityResolver 생성: 엔티티 {len(_resolver)}개")
+    return _resolver
+
+
+def player_search_name(name: str, min_score: float = 0.6) -> str:
+    """
+    RAG 검색용 선수 이름 (매칭되면 입력 + 정식 영문명, 아니면 입력 그대로)
+
+    예: "홀란드" → "홀란드 (Erling Haaland)"
+    """
+    match = get_entity_resolver().best(name, kind="player", min_score=min_score)
+    if match is None or name_key(match.entity.name) == name_key(name):
+        return name
+    return f"{name} ({match.entity.name})"
@@ -6,12 +6,54 @@ Keyword 매칭 유틸리티
 - Vector 유사도만으로는 고유명사/날짜 정확 매칭 어려움
 - Keyword 매칭으로 문맥이 비슷하다고 속아 넘어가는 것 방지
 """
+import json
 import re
 import logging
-from typing import Set, List, Tuple
+from typing import Iterable, List, Optional, Sequence, Set
+
+from .aho_corasick import AhoCorasick
 
 logger = logging.getLogger(__name__)
 
+# 추출 규칙이 바뀌면 올림 (저장된 키워드 집합과 버전이 다르면 답변에서 다시 추출)
+KEYWORD_EXTRACTOR_VERSION = 1
+
+# ==================== 추출 규칙 (모듈 로드 시 1회 컴파일) ====================
+_PROPER_NOUN_EN_RE = re.compile(r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)+\b')
+_KOREAN_NAME_RE = re.compile(r'[가-힣]{2,4}')
+_DATE_RE = re.compile(r'\d{4}[-년]|\d{1,2}월|\d{1,2}일|오늘|내일|어제|작년|올해|내년')
+_YEAR_RE = re.compile(r'\b(19|20)\d{2}\b')
+_ENGLISH_WORD_RE = re.compile(r'\b[a-z]{3,}\b')
+_KOREAN_WORD_RE = re.compile(r'[가-힣]{2,}')
+
+# 핵심 키워드 판별 (한글 이름 / 영문 이름 / 연도)
+_CORE_KOREAN_RE = re.compile(r'[가-힣]{2,4}')
+_CORE_ENGLISH_RE = re.compile(r'[a-z]+(?:\s+[a-z]+)+')
+_CORE_YEAR_RE = re.compile(r'\d{4}')
+
+# 일반 조사/어미 (한글 이름 후보에서 제외)
+PARTICLES = frozenset(["에서", "은", "는", "이", "가", "의", "을", "를", "와", "과", "도", "만"])
+
+STOPWORDS = frozenset([
+    "the", "a", "an", "and", "or", "but", "in", "on", "at", "to", "for", "of", "with",
+    "은", "는", "이", "가", "을", "를", "의", "와", "과", "에서", "에게", "로", "으로",
+])
+
+# 팀명/리그명 키워드 (축구 관련, 부분 문자열 매칭)
+TEAM_KEYWORDS = [
+    "토트넘", "아스널", "맨시티", "리버풀", "첼시", "맨유", "바르셀로나", "레알마드리드",
+    "tottenham", "arsenal", "manchester", "city", "liverpool", "chelsea", "barcelona", "real madrid",
+    "프리미어리그", "라리가", "세리에", "분데스리가", "리그앙",
+    "premier league", "la liga", "serie a", "bundesliga", "ligue 1",
+]
+_team_automaton = AhoCorasick(TEAM_KEYWORDS)
+
+# 핵심 키워드로 취급하는 팀명
+CORE_TEAM_KEYWORDS = frozenset([
+    "토트넘", "아스널", "맨시티", "리버풀", "첼시", "맨유", "바르셀로나", "레알마드리드",
+    "tottenham", "arsenal", "manchester", "city", "liverpool", "chelsea",
+])
+
 
 def extract_keywords(text: str) -> Set[str]:
     """
@@ -38,66 +80,76 @@ def extract_keywords(text: str) -> Set[str]:
     
     # 1. 영문 고유명사 (대문자 시작, 2단어 이상)
     # 예: "Son Heung-min", "Premier League", "Arsenal"
-    proper_nouns_en = re.findall(r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)+\b', text)
-    for noun in proper_nouns_en:
-        keywords.add(noun.lower())
+    keywords.update(noun.lower() for noun in _PROPER_NOUN_EN_RE.findall(text))
     
-    # 2. 한글 이름/팀명 (2-4글자 한글)
+    # 2. 한글 이름/팀명 (2-4글자 한글, 일반 조사/어미 제외)
     # 예: "손흥민", "토트넘", "프리미어리그"
-    korean_names = re.findall(r'[가-힣]{2,4}', text)
-    for name in korean_names:
-        # 일반 조사/어미 제외 (예: "에서", "은", "의")
-        if name not in ["에서", "은", "는", "이", "가", "의", "을", "를", "와", "과", "도", "만"]:
-            keywords.add(name)
+    keywords.update(name for name in _KOREAN_NAME_RE.findall(text) if name not in PARTICLES)
     
     # 3. 날짜 표현
     # 예: "2024년", "2024-01-01", "1월", "오늘", "내일"
-    dates = re.findall(r'\d{4}[-년]|\d{1,2}월|\d{1,2}일|오늘|내일|어제|작년|올해|내년', text)
-    for date in dates:
-        keywords.add(date.lower())
+    keywords.update(date.lower() for date in _DATE_RE.findall(text))
     
     # 4. 연도 (4자리 숫자)
-    years = re.findall(r'\b(19|20)\d{2}\b', text)
-    for year in years:
-        keywords.add(year)
-    
-    # 5. 팀명/리그명 키워드 (축구 관련)
-    team_keywords = [
-        "토트넘", "아스널", "맨시티", "리버풀", "첼시", "맨유", "바르셀로나", "레알마드리드",
-        "tottenham", "arsenal", "manchester", "city", "liverpool", "chelsea", "barcelona", "real madrid",
-        "프리미어리그", "라리가", "세리에", "분데스리가", "리그앙",
-        "premier league", "la liga", "serie a", "bundesliga", "ligue 1"
-    ]
-    for keyword in team_keywords:
-        if keyword.lower() in text_lower:
-            keywords.add(keyword.lower())
-    
-    # 6. 선수 이름 패턴 (영문: First Last, 한글: 2-3글자)
-    # 영문 이름은 이미 proper_nouns_en에서 처리됨
-    # 한글 이름은 korean_names에서 처리됨
-    
-    # 7. 중요한 명사 (3글자 이상 영문 단어, 2글자 이상 한글 단어)
-    # 단, 일반적인 조사/접속사 제외
-    stopwords = {
-        "the", "a", "an", "and", "or", "but", "in", "on", "at", "to", "for", "of", "with",
-        "은", "는", "이", "가", "을", "를", "의", "와", "과", "에서", "에게", "로", "으로"
-    }
-    
-    # 영문 단어 (3글자 이상)
-    english_words = re.findall(r'\b[a-z]{3,}\b', text_lower)
-    for word in english_words:
-        if word not in stopwords:
-            keywords.add(word)
-    
-    # 한글 단어 (2글자 이상, 조사 제외)
-    korean_words = re.findall(r'[가-힣]{2,}', text)
-    for word in korean_words:
-        if word not in stopwords:
-            keywords.add(word)
+    keywords.update(_YEAR_RE.findall(text))
+    
+    # 5. 팀명/리그명 키워드 (오토마톤으로 한 번에 검색)
+    keywords.update(TEAM_KEYWORDS[index] for index in _team_automaton.search(text))
+    
+    # 6. 중요한 명사 (3글자 이상 영문 단어, 2글자 이상 한글 단어, 조사/접속사 제외)
+    keywords.update(word for word in _ENGLISH_WORD_RE.findall(text_lower) if word not in STOPWORDS)
+    keywords.update(word for word in _KOREAN_WORD_RE.findall(text) if word not in STOPWORDS)
     
     return keywords
 
 
+def _is_core_keyword(keyword: str) -> bool:
+    """핵심 키워드 여부 (한글 이름, 영문 이름, 연도, 주요 팀명)"""
+    return bool(
+        _CORE_KOREAN_RE.fullmatch(keyword)
+        or _CORE_ENGLISH_RE.fullmatch(keyword)
+        or _CORE_YEAR_RE.match(keyword)
+        or keyword in CORE_TEAM_KEYWORDS
+    )
+
+
+def score_keywords(query_keywords: Set[str], answer_keywords: Set[str]) -> float:
+    """
+    미리 추출한 키워드 집합으로 매칭 점수 계산 (calculate_keyword_match와 같은 점수)
+
+    Args:
+        query_keywords: 질문 키워드 (extract_keywords 결과)
+        answer_keywords: 답변 키워드 (캐시 저장 시 추출해 둔 집합)
+
+    Returns:
+        Keyword 매칭 점수 (0.0 ~ 1.0, 질문 키워드가 없으면 0.5)
+    """
+    if not query_keywords:
+        # 질문에 핵심 키워드가 없으면 중립 (0.5)
+        logger.debug("🔍 질문에 핵심 키워드 없음 → 중립 점수 (0.5)")
+        return 0.5
+    
+    # 매칭 비율 계산
+    matched_keywords = query_keywords & answer_keywords
+    match_ratio = len(matched_keywords) / len(query_keywords)
+    
+    # 가중치 적용: 핵심 키워드(고유명사, 날짜)에 더 높은 가중치
+    core_keywords_query = {kw for kw in query_keywords if _is_core_keyword(kw)}
+    core_matched = core_keywords_query & answer_keywords
+    core_ratio = len(core_matched) / len(core_keywords_query) if core_keywords_query else 0
+    
+    # 최종 점수: 일반 매칭 비율 + 핵심 키워드 가중치
+    final_score = (match_ratio * 0.6) + (core_ratio * 0.4)
+    
+    logger.debug(
+        f"🔍 Keyword 매칭: {len(matched_keywords)}/{len(query_keywords)} "
+        f"(핵심: {len(core_matched)}/{len(core_keywords_query)}) "
+        f"→ 점수: {final_score:.2f}"
+    )
+    
+    return final_score
+
+
 def calculate_keyword_match(query: str, cached_answer: str) -> float:
     """
     Query와 Cached Answer 간 Keyword 매칭 점수 계산
@@ -106,6 +158,8 @@ def calculate_keyword_match(query: str, cached_answer: str) -> float:
     - 핵심 키워드가 없으면 Judge 없이 바로 API 호출
     - Keyword 점수 < 0.5면 Judge 스킵
     
+    ⚡ 캐시 조회 경로에서는 저장해 둔 답변 키워드로 score_keyword_candidates() 사용
+    
     Args:
         query: 사용자 질문
         cached_answer: 캐시된 답변
@@ -121,56 +175,48 @@ def calculate_keyword_match(query: str, cached_answer: str) -> float:
         0.8  # "손흥민" 키워드 일치
     """
     try:
-        query_keywords = extract_keywords(query)
-        answer_keywords = extract_keywords(cached_answer)
-        
-        if not query_keywords:
-            # 질문에 핵심 키워드가 없으면 중립 (0.5)
-            logger.debug("🔍 질문에 핵심 키워드 없음 → 중립 점수 (0.5)")
-            return 0.5
-        
-        # 교집합 계산
-        matched_keywords = query_keywords & answer_keywords
-        total_query_keywords = len(query_keywords)
-        
-        if total_query_keywords == 0:
-            return 0.5
-        
-        # 매칭 비율 계산
-        match_ratio = len(matched_keywords) / total_query_keywords
-        
-        # 가중치 적용: 핵심 키워드(고유명사, 날짜)에 더 높은 가중치
-        core_keywords_query = {
-            kw for kw in query_keywords 
-            if any([
-                re.match(r'^[가-힣]{2,4}$', kw),  # 한글 이름
-                re.match(r'^[a-z]+(?:\s+[a-z]+)+$', kw),  # 영문 이름
-                re.match(r'\d{4}', kw),  # 연도
-                kw in ["토트넘", "아스널", "맨시티", "리버풀", "첼시", "맨유", "바르셀로나", "레알마드리드",
-                      "tottenham", "arsenal", "manchester", "city", "liverpool", "chelsea"]
-            ])
-        }
-        
-        core_matched = core_keywords_query & answer_keywords
-        core_ratio = len(core_matched) / len(core_keywords_query) if core_keywords_query else 0
-        
-        # 최종 점수: 일반 매칭 비율 + 핵심 키워드 가중치
-        final_score = (match_ratio * 0.6) + (core_ratio * 0.4)
-        
-        logger.debug(
-            f"🔍 Keyword 매칭: {len(matched_keywords)}/{total_query_keywords} "
-            f"(핵심: {len(core_matched)}/{len(core_keywords_query)}) "
-            f"→ 점수: {final_score:.2f}"
-        )
-        
-        return final_score
-        
+        return score_keywords(extract_keywords(query), extract_keywords(cached_answer))
     except Exception as e:
         logger.warning(f"⚠️ Keyword 매칭 계산 실패: {e}")
         # 오류 시 중립 점수 반환
         return 0.5
 
 
+def score_keyword_candidates(query: str, candidate_keywords: Sequence[Set[str]]) -> List[float]:
+    """
+    여러 캐시 후보를 한 번에 점수 계산 (질문 키워드는 1회만 추출)
+
+    Args:
+        query: 사용자 질문
+        candidate_keywords: 후보별 답변 키워드 집합 (캐시 metadata에서 읽은 값)
+
+    Returns:
+        후보 순서대로 Keyword 매칭 점수 (오류 시 해당 후보는 0.5)
+    """
+    try:
+        query_keywords = extract_keywords(query)
+    except Exception as e:
+        logger.warning(f"⚠️ Keyword 매칭 계산 실패: {e}")
+        return [0.5] * len(candidate_keywords)
+    return [score_keywords(query_keywords, keywords) for keywords in candidate_keywords]
+
+
+def dump_keywords(keywords: Iterable[str]) -> str:
+    """키워드 집합 → 캐시 metadata 저장용 문자열 (ChromaDB metadata는 리스트 불가)"""
+    return json.dumps(sorted(keywords), ensure_ascii=False)
+
+
+def load_keywords(value: Optional[str]) -> Optional[Set[str]]:
+    """dump_keywords 문자열 → 키워드 집합 (없거나 깨졌으면 None)"""
+    if not value:
+        return None
+    try:
+        keywords = json.loads(value)
+    except (TypeError, ValueError):
+        return None
+    return set(keywords) if isinstance(keywords, list) else None
+
+
 def should_skip_judge_by_keyword(keyword_score: float, threshold: float = 0.5) -> bool:
     """
     Keyword 점수 기반 Judge 호출 스킵 여부 판단
@@ -0,0 +1,494 @@
+"""
+커뮤니티 게시글 전문 검색 인덱스 (한글 2-gram + BM25)
+
+기존 posts_search: 검색마다 Firestore 최근 글 50개를 읽어서 부분 문자열 비교
+→ 오래된 글은 검색되지 않고, 순위 없음
+
+- 토큰: 한글은 음절 2-gram ("손흥민" → "손흥", "흥민"), 영문/숫자는 소문자 단어
+  (형태소 분석기 없이 조사/어미가 붙어도 매칭: "손흥민이" → "손흥", "흥민", "민이")
+- 점수: BM25 (제목 등장은 POST_SEARCH_TITLE_WEIGHT배)
+- 역색인: 단어별 (문서 번호 array, 빈도 array) → 10만 글에서도 수십 MB
+- 점수 계산: numpy로 단어별 문서 목록을 한 번에 누적 (흔한 2-gram도 ms 단위), numpy 없으면 파이썬 루프
+- Supabase posts에서 한 번 적재 (post_id 키셋으로 페이지 단위), 이후 게시글 생성/수정/삭제 시 갱신
+- 수정/삭제는 이전 문서를 지움 표시만 하고 검색 시 건너뜀, 지운 문서가 많아지면 백그라운드 스레드에서 압축
+  (압축본을 잠금 밖에서 만들고 적재와 같은 방식으로 교체 → 갱신/검색 요청은 압축을 기다리지 않음)
+- POST_SEARCH_REFRESH_SECONDS마다 백그라운드로 다시 적재 (다른 인스턴스에서 쓴 글 반영)
+
+Example:
+    >>> index = get_post_search_index()
+    >>> index.ensure_loaded(db)  # 요청 경로에서는 ensure_loaded(db, wait=False) 후 index.ready 확인
+    >>> hits, total = index.search("손흥민 골", limit=10)
+"""
+import heapq
+import logging
+import math
+import os
+import re
+import threading
+import time
+from array import array
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # numpy 없으면 파이썬 루프로 점수 계산 (결과 동일, 느림)
+    np = None
+
+logger = logging.getLogger(__name__)
+
+POST_SEARCH_TITLE_WEIGHT = int(os.getenv("POST_SEARCH_TITLE_WEIGHT", "2"))
+POST_SEARCH_REFRESH_SECONDS = float(os.getenv("POST_SEARCH_REFRESH_SECONDS", "600"))
+POST_SEARCH_PAGE_SIZE = int(os.getenv("POST_SEARCH_PAGE_SIZE", "1000"))
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# 인덱스에 보관하는 게시글 필드 (본문은 토큰만 보관)
+POST_META_FIELDS = ("post_id", "author_id", "author_username", "title", "category", "created_at")
+POST_INDEX_COLUMNS = ",".join(POST_META_FIELDS + ("content",))
+
+_TOKEN_RE = re.compile(r"[가-힣]+|[a-z0-9]+")
+_MAX_TF = 65535
+
+
+def _is_hangul(ch: str) -> bool:
+    return "가" <= ch <= "힣"
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """텍스트 → 검색 토큰 (한글 음절 2-gram, 한 글자 한글은 그대로, 영문/숫자 단어)"""
+    tokens: List[str] = []
+    for run in _TOKEN_RE.findall((text or "").lower()):
+        if _is_hangul(run[0]) and len(run) > 1:
+            tokens.extend(run[i:i + 2] for i in range(len(run) - 1))
+        else:
+            tokens.append(run)
+    return tokens
+
+
+@dataclass
+class SearchHit:
+    post_id: str
+    score: float
+    post: Dict[str, Any]
+
+
+class _IndexState:
+    """역색인 한 벌 (재적재 시 새로 만들어서 교체)"""
+
+    def __init__(self, title_weight: int):
+        self.title_weight = title_weight
+        self.slots: Dict[str, int] = {}
+        self.metas: List[Optional[dict]] = []
+        # 문서 번호별 길이 / 살아 있는지 / 카테고리 번호 (numpy로 한 번에 계산하려고 array로 보관)
+        self.lengths = array("f")
+        self.alive = bytearray()
+        self.category_codes = array("H")
+        self.category_ids: Dict[Optional[str], int] = {}
+        self.doc_lists: Dict[str, array] = {}
+        self.tf_lists: Dict[str, array] = {}
+        # 한 글자 한글 검색어 → 그 글자로 시작하는 2-gram
+        self.by_first: Dict[str, Set[str]] = {}
+        self.total_length = 0.0
+        self.dead = 0
+
+    @property
+    def live(self) -> int:
+        return len(self.slots)
+
+    def _category_id(self, category: Optional[str]) -> int:
+        code = self.category_ids.get(category)
+        if code is None:
+            code = self.category_ids[category] = len(self.category_ids)
+        return code
+
+    def _append_slot(self, meta: dict, length: float) -> int:
+        slot = len(self.metas)
+        self.slots[meta["post_id"]] = slot
+        self.metas.append(meta)
+        self.lengths.append(length)
+        self.alive.append(1)
+        self.category_codes.append(self._category_id(meta.get("category")))
+        self.total_length += length
+        return slot
+
+    def add(self, row: dict) -> None:
+        """게시글 추가 (같은 post_id가 있으면 교체)"""
+        post_id = row.get("post_id")
+        if not post_id:
+            return
+        self.remove(post_id)
+
+        counts = Counter(tokenize(row.get("content")))
+        for token in tokenize(row.get("title")):
+            counts[token] += self.title_weight
+
+        slot = self._append_slot({field: row.get(field) for field in POST_META_FIELDS}, sum(counts.values()))
+        for term, tf in counts.items():
+            docs = self.doc_lists.get(term)
+            if docs is None:
+                docs = self.doc_lists[term] = array("I")
+                self.tf_lists[term] = array("H")
+                if len(term) == 2 and _is_hangul(term[0]):
+                    self.by_first.setdefault(term[0], set()).add(term)
+            docs.append(slot)
+            self.tf_lists[term].append(min(tf, _MAX_TF))
+
+    def remove(self, post_id: str) -> bool:
+        """지움 표시 (역색인 항목은 압축 때 정리)"""
+        slot = self.slots.pop(post_id, None)
+        if slot is None:
+            return False
+        self.metas[slot] = None
+        self.alive[slot] = 0
+        self.total_length -= self.lengths[slot]
+        self.dead += 1
+        return True
+
+    def needs_compaction(self) -> bool:
+        return self.dead > max(1000, self.live // 4)
+
+    def compacted(self, limit: int) -> "_IndexState":
+        """
+        지운 문서를 빼고 문서 번호를 다시 매긴 새 인덱스 (앞쪽 limit개 문서만)
+
+        잠금 없이 백그라운드 스레드에서 호출 (다른 스레드가 add/remove 중이어도 됨):
+        add는 limit 뒤에만 덧붙이고 remove는 표시만 바꾸므로, 그 사이 갱신은 호출한 쪽이 새 인덱스에 다시 적용
+        """
+        state = _IndexState(self.title_weight)
+        remap = array("i", [-1]) * limit
+        metas, lengths = self.metas, self.lengths
+        for old in range(limit):
+            meta = metas[old]
+            if meta is not None:
+                remap[old] = state._append_slot(meta, lengths[old])
+
+        tf_lists = self.tf_lists
+        for term, old_docs in list(self.doc_lists.items()):
+            old_tfs = tf_lists.get(term)
+            if old_tfs is None:  # limit 뒤에 막 추가된 단어
+                continue
+            docs, tfs = array("I"), array("H")
+            # 문서 번호는 오름차순으로 덧붙이므로 limit 이상이 나오면 끝
+            for doc, tf in zip(old_docs, old_tfs):
+                if doc >= limit:
+                    break
+                new = remap[doc]
+                if new >= 0:
+                    docs.append(new)
+                    tfs.append(tf)
+            if docs:
+                state.doc_lists[term], state.tf_lists[term] = docs, tfs
+                if len(term) == 2 and _is_hangul(term[0]):
+                    state.by_first.setdefault(term[0], set()).add(term)
+        return state
+
+    def _query_terms(self, query: str) -> Counter:
+        terms = Counter()
+        for token in tokenize(query):
+            if len(token) == 1 and _is_hangul(token):
+                # 한 글자 검색어 ("골") → 그 글자로 시작하는 2-gram ("골을", "골대", ...)
+                for term in self.by_first.get(token, ()):
+                    terms[term] += 1
+            terms[token] += 1
+        return terms
+
+    def _weighted_terms(self, query: str) -> List[Tuple[str, float]]:
+        """(검색어 단어, idf x 검색어 내 빈도) - 지운 문서도 포함된 df (압축 전까지의 근사치)"""
+        n_docs = self.live
+        weighted = []
+        for term, query_tf in self._query_terms(query).items():
+            docs = self.doc_lists.get(term)
+            if docs:
+                df = len(docs)
+                weighted.append((term, math.log(1 + (n_docs - df + 0.5) / (df + 0.5)) * query_tf))
+        return weighted
+
+    def _top(self, candidates, scores, limit: int) -> List[SearchHit]:
+        """점수 → 최신 글 순으로 상위 limit개"""
+        metas = self.metas
+        top = heapq.nlargest(
+            limit, candidates,
+            key=lambda doc: (scores[doc], metas[doc].get("created_at") or ""),
+        )
+        return [SearchHit(post_id=metas[doc]["post_id"], score=round(float(scores[doc]), 4), post=dict(metas[doc])) for doc in top]
+
+    def _search_numpy(self, terms, avg_length: float, limit: int, category: Optional[str]):
+        k1, b = BM25_K1, BM25_B
+        norm = k1 * (1 - b + b * np.array(self.lengths, dtype=np.float32) / avg_length)
+        scores = np.zeros(len(self.metas), dtype=np.float32)
+        for term, idf in terms:
+            # 단어별 문서 번호는 중복 없음 → 인덱스 += 로 누적
+            docs = np.array(self.doc_lists[term], dtype=np.uint32)
+            tfs = np.array(self.tf_lists[term], dtype=np.float32)
+            scores[docs] += idf * tfs * (k1 + 1) / (tfs + norm[docs])
+
+        mask = np.array(self.alive, dtype=bool) & (scores > 0)
+        if category:
+            code = self.category_ids.get(category)
+            if code is None:
+                return [], 0
+            mask &= np.array(self.category_codes, dtype=np.uint16) == code
+        candidates = np.flatnonzero(mask)
+        total = len(candidates)
+        if total > limit * 4:
+            # 점수 상위만 남기고 (같은 점수 최신순 정렬용 여유분 포함) 정렬
+            keep = np.argpartition(-scores[candidates], limit * 4)[:limit * 4]
+            candidates = candidates[keep]
+        return self._top(candidates.tolist(), scores, limit), total
+
+    def _search_python(self, terms, avg_length: float, limit: int, category: Optional[str]):
+        k1, b = BM25_K1, BM25_B
+        metas, lengths = self.metas, self.lengths
+        scores: Dict[int, float] = {}
+        for term, idf in terms:
+            for doc, tf in zip(self.doc_lists[term], self.tf_lists[term]):
+                if metas[doc] is None:
+                    continue
+                norm = k1 * (1 - b + b * lengths[doc] / avg_length)
+                scores[doc] = scores.get(doc, 0.0) + idf * tf * (k1 + 1) / (tf + norm)
+        if category:
+            scores = {doc: score for doc, score in scores.items() if metas[doc].get("category") == category}
+        return self._top(scores, scores, limit), len(scores)
+
+    def search(self, query: str, limit: int, category: Optional[str] = None) -> Tuple[List[SearchHit], int]:
+        if not self.live:
+            return [], 0
+        terms = self._weighted_terms(query)
+        if not terms:
+            return [], 0
+        avg_length = max(self.total_length / self.live, 1.0)
+        if np is not None:
+            return self._search_numpy(terms, avg_length, limit, category)
+        return self._search_python(terms, avg_length, limit, category)
+
+
+class PostSearchIndex:
+    """
+    게시글 검색 인덱스 (검색/갱신 스레드 안전)
+
+    Args:
+        title_weight: 제목 토큰 가중치
+        refresh_seconds: 전체 재적재 주기 (0이면 처음 한 번만)
+        page_size: 적재 시 Supabase 페이지 크기
+    """
+
+    def __init__(
+        self,
+        title_weight: int = POST_SEARCH_TITLE_WEIGHT,
+        refresh_seconds: float = POST_SEARCH_REFRESH_SECONDS,
+        page_size: int = POST_SEARCH_PAGE_SIZE,
+    ):
+        self.title_weight = title_weight
+        self.refresh_seconds = refresh_seconds
+        self.page_size = page_size
+        self._state = _IndexState(title_weight)
+        self._lock = threading.Lock()
+        self._load_lock = threading.Lock()
+        # 적재 중 들어온 생성/수정/삭제 (적재가 끝나면 새 인덱스에 다시 적용)
+        self._pending: Optional[List[Tuple[str, Any]]] = None
+        self._loaded_at: Optional[float] = None
+        self._compacting = False
+        self.loads = 0
+        self.last_load_seconds: Optional[float] = None
+        self.updates = 0
+        self.searches = 0
+        self.compactions = 0
+        self.last_compaction_seconds: Optional[float] = None
+
+    # ============================================
+    # 적재
+    # ============================================
+
+    @property
+    def ready(self) -> bool:
+        return self._loaded_at is not None
+
+    def is_stale(self) -> bool:
+        if self._loaded_at is None:
+            return True
+        return self.refresh_seconds > 0 and time.monotonic() - self._loaded_at > self.refresh_seconds
+
+    def build(self, rows) -> None:
+        """게시글 행 목록으로 인덱스 교체 (테스트/벤치마크, DB 없이)"""
+        state = _IndexState(self.title_weight)
+        for row in rows:
+            state.add(row)
+        with self._lock:
+            self._state = state
+            self._loaded_at = time.monotonic()
+
+    def load(self, db) -> int:
+        """
+        Supabase posts 전체 적재 (동기, 스레드 풀/백그라운드 스레드에서 호출)
+
+        Returns:
+            적재한 게시글 수 (다른 호출이 이미 최신으로 적재했으면 0)
+        """
+        with self._load_lock:
+            if not self.is_stale():
+                return 0
+            started = time.perf_counter()
+            with self._lock:
+                self._pending = []
+            try:
+                state = _IndexState(self.title_weight)
+                last_id = None
+                while True:
+                    query = db.table("posts").select(POST_INDEX_COLUMNS).eq("is_deleted", False)
+                    if last_id is not None:
+                        query = query.gt("post_id", last_id)
+                    rows = query.order("post_id").limit(self.page_size).execute().data or []
+                    for row in rows:
+                        state.add(row)
+                    if len(rows) < self.page_size:
+                        break
+                    last_id = rows[-1]["post_id"]
+            except Exception:
+                with self._lock:
+                    self._pending = None
+                raise
+
+            self._swap_in(state)
+            with self._lock:
+                self._loaded_at = time.monotonic()
+
+            self.loads += 1
+            self.last_load_seconds = round(time.perf_counter() - started, 3)
+            logger.info(f"✅ 게시글 검색 인덱스 적재: {state.live}개 ({self.last_load_seconds}s)")
+            return state.live
+
+    def _swap_in(self, state: _IndexState) -> None:
+        """새로 만든 인덱스로 교체 (만드는 동안 들어온 생성/수정/삭제를 다시 적용)"""
+        with self._lock:
+            for op, value in self._pending:
+                if op == "upsert":
+                    state.add(value)
+                else:
+                    state.remove(value)
+            self._pending = None
+            self._state = state
+
+    def ensure_loaded(self, db, wait: bool = True) -> None:
+        """
+        처음이면 적재, 오래됐으면 백그라운드 재적재 후 기존 인덱스로 바로 검색
+
+        Args:
+            wait: False면 처음 적재도 백그라운드로 시작하고 바로 반환 (ready로 완료 확인, 요청 경로용)
+        """
+        if not self.ready and wait:
+            self.load(db)
+        elif self.is_stale() and not self._load_lock.locked():
+            threading.Thread(target=self._refresh, args=(db,), name="post-search-refresh", daemon=True).start()
+
+    def _refresh(self, db) -> None:
+        try:
+            self.load(db)
+        except Exception as e:
+            logger.warning(f"⚠️ 게시글 검색 인덱스 적재 실패 (기존 인덱스 유지): {e}")
+
+    # ============================================
+    # 갱신 (게시글 생성/수정/삭제 후 호출)
+    # ============================================
+
+    def upsert(self, row: dict) -> None:
+        """게시글 생성/수정 후 호출 (title, content 포함 전체 행)"""
+        with self._lock:
+            self._state.add(row)
+            if self._pending is not None:
+                self._pending.append(("upsert", dict(row)))
+            self._maybe_compact()
+            self.updates += 1
+
+    def remove(self, post_id: str) -> None:
+        """게시글 삭제 후 호출"""
+        with self._lock:
+            self._state.remove(post_id)
+            if self._pending is not None:
+                self._pending.append(("remove", post_id))
+            self._maybe_compact()
+            self.updates += 1
+
+    def _maybe_compact(self) -> None:
+        """지운 문서가 많으면 백그라운드 압축 시작 (self._lock 안에서 호출, 갱신 요청은 기다리지 않음)"""
+        if self._compacting or self._pending is not None or not self._state.needs_compaction():
+            return
+        self._compacting = True
+        threading.Thread(target=self._compact, name="post-search-compact", daemon=True).start()
+
+    def _compact(self) -> None:
+        """압축한 인덱스를 잠금 밖에서 만들고 load()처럼 교체 (적재 중이면 건너뜀, 새 인덱스에는 지운 문서 없음)"""
+        try:
+            if not self._load_lock.acquire(blocking=False):
+                return
+            try:
+                started = time.perf_counter()
+                with self._lock:
+                    state = self._state
+                    limit = len(state.metas)
+                    self._pending = []
+                try:
+                    compacted = state.compacted(limit)
+                except Exception:
+                    with self._lock:
+                        self._pending = None
+                    raise
+                self._swap_in(compacted)
+                self.compactions += 1
+                self.last_compaction_seconds = round(time.perf_counter() - started, 3)
+            finally:
+                self._load_lock.release()
+        except Exception as e:
+            logger.warning(f"⚠️ 게시글 검색 인덱스 압축 실패 (기존 인덱스 유지): {e}")
+        finally:
+            with self._lock:
+                self._compacting = False
+
+    # ============================================
+    # 검색
+    # ============================================
+
+    def search(self, query: str, limit: int = 10, category: Optional[str] = None) -> Tuple[List[SearchHit], int]:
+        """
+        BM25 순위 검색
+
+        Returns:
+            (상위 limit개 SearchHit, 매칭된 전체 게시글 수)
+        """
+        with self._lock:
+            self.searches += 1
+            return self._state.search(query, limit, category)
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            state = self._state
+            return {
+                "ready": self.ready,
+                "posts": state.live,
+                "deleted_slots": state.dead,
+                "terms": len(state.doc_lists),
+                "loads": self.loads,
+                "last_load_seconds": self.last_load_seconds,
+                "age_seconds": round(time.monotonic() - self._loaded_at, 1) if self._loaded_at is not None else None,
+                "updates": self.updates,
+                "searches": self.searches,
+                "compactions": self.compactions,
+                "compacting": self._compacting,
+                "last_compaction_seconds": self.last_compaction_seconds,
+            }
+
+
+# ============================================
+# 싱글톤
+# ============================================
+_post_search_index: Optional[PostSearchIndex] = None
+
+
+def get_post_search_index() -> PostSearchIndex:
+    """공용 게시글 검색 인덱스 (처음 호출 시 생성, 적재는 ensure_loaded에서)"""
+    global _post_search_index
+    if _post_search_index is None:
+        _post_search_index = PostSearchIndex()
+    return _post_search_index
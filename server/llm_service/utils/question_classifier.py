@@ -12,22 +12,40 @@
 - 유사도가 높으면 그 분류 결과 재사용
 - 유사도가 낮으면 정규식/LLM fallback
 - 하드코딩 없이 실제 사용자 질문들이 누적되어 학습됨
+
+규칙 엔진:
+- 모든 키워드 목록을 모듈 로드 시 Aho-Corasick 오토마톤 하나로 컴파일
+  → 질문을 한 번만 훑어서 어떤 키워드 그룹이 등장했는지 수집
+- 정규식은 미리 컴파일, 규칙은 기존과 같은 우선순위로 평가
+- match_rules()가 어떤 규칙으로 판정했는지 반환 (규칙별 적중 수 집계)
 """
 import re
 import logging
-from typing import Optional, Literal
+from collections import Counter
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, List, Optional
 import hashlib
 import os
 
+from .aho_corasick import AhoCorasick
+from .ttl_cache import TTLCache
+
 logger = logging.getLogger(__name__)
 
-# 질문 분류 결과 캐시 (메모리 기반, 간단하게)
-_question_classification_cache: dict[str, tuple[bool, float]] = {}
+# 질문 분류 결과 캐시 (메모리 LRU + TTL, 크기 제한)
 CACHE_TTL_SECONDS = 86400  # 24시간
+CLASSIFIER_CACHE_SIZE = int(os.getenv("CLASSIFIER_CACHE_SIZE", "10000"))
+_question_classification_cache = TTLCache(maxsize=CLASSIFIER_CACHE_SIZE, ttl_seconds=CACHE_TTL_SECONDS)
+
+# LLM fallback 분류 타임아웃 (초) - 분류는 짧게 끊고 기본값(단순)으로 처리
+CLASSIFIER_LLM_TIMEOUT_SECONDS = float(os.getenv("CLASSIFIER_LLM_TIMEOUT_SECONDS", "5"))
 
 # ChromaDB RAG 서비스 (질문 분류용)
 _classification_rag = None
 
+# 판정 경로별 집계 (규칙 이름 / "similar" / "llm" / "default")
+_decision_counts: Counter = Counter()
+
 
 def _get_cache_key(query: str) -> str:
     """질문을 정규화해서 캐시 키 생성"""
@@ -36,27 +54,16 @@ def _get_cache_key(query: str) -> str:
 
 
 def _get_cached_result(query: str) -> Optional[bool]:
-    """캐시에서 결과 조회"""
-    import time
-    cache_key = _get_cache_key(query)
-    
-    if cache_key in _question_classification_cache:
-        result, cached_at = _question_classification_cache[cache_key]
-        if time.time() - cached_at < CACHE_TTL_SECONDS:
-            logger.debug(f"✅ 질문 분류 캐시 히트: {query[:50]}")
-            return result
-        else:
-            # 캐시 만료
-            del _question_classification_cache[cache_key]
-    
-    return None
+    """캐시에서 결과 조회 (만료 항목은 TTLCache가 조회 시 제거)"""
+    result = _question_classification_cache.get(_get_cache_key(query))
+    if result is not None:
+        logger.debug(f"✅ 질문 분류 캐시 히트: {query[:50]}")
+    return result
 
 
 def _cache_result(query: str, result: bool):
     """결과를 메모리 캐시에 저장"""
-    import time
-    cache_key = _get_cache_key(query)
-    _question_classification_cache[cache_key] = (result, time.time())
+    _question_classification_cache.set(_get_cache_key(query), result)
     logger.debug(f"💾 질문 분류 결과 메모리 캐시 저장: {query[:50]}")
 
 
@@ -66,13 +73,21 @@ async def _cache_and_save_result(query: str, result: bool):
     await _save_classified_question(query, result)
 
 
+def get_classifier_stats() -> Dict[str, object]:
+    """분류 캐시 통계 + 판정 경로별 횟수"""
+    return {
+        "cache": _question_classification_cache.get_stats(),
+        "decisions": dict(_decision_counts),
+    }
+
+
 def _get_classification_rag():
     """ChromaDB RAG 서비스 초기화 (질문 분류용)"""
     global _classification_rag
     if _classification_rag is None:
         try:
-            from ..services.rag_service import RAGService
-            _classification_rag = RAGService(persist_directory="chroma_db_classification")
+            from ..services.rag_service import get_rag_service
+            _classification_rag = get_rag_service(persist_directory="chroma_db_classification")
             logger.info("✅ 질문 분류용 ChromaDB 초기화 완료")
         except Exception as e:
             logger.warning(f"⚠️ 질문 분류용 ChromaDB 초기화 실패: {e}")
@@ -147,6 +162,198 @@ async def _save_classified_question(query: str, is_complex: bool):
         logger.warning(f"⚠️ 분류된 질문 저장 실패: {e}")
 
 
+# ==================== 규칙 엔진 ====================
+
+# 키워드 그룹 (질문 소문자 기준 부분 문자열 매칭, 그룹 간 중복 허용)
+KEYWORD_GROUPS: Dict[str, List[str]] = {
+    # 여러 작업 요청
+    "multi_action": ["그리고", "또한", "또", "그리고도", "동시에", "and", "also", "plus"],
+    # "알려주고 ~도" 같은 동사 + 접속사
+    "verb": ["알려주고", "보여주고", "알려줘", "보여줘", "알려주면서", "보여주면서"],
+    "connector": ["도", "또", "그리고", "또한"],
+    # 키워드 없이 비교 의도 표현
+    "comparison_intent": [
+        "누가 더", "어느 쪽이", "어느 게", "어느 것이", "어느 팀이",
+        "누가 나아요", "누가 좋아요", "누가 더 나아요", "누가 더 좋아요",
+        "어느 게 나아요", "어느 게 좋아요", "어느 쪽이 나아요", "어느 쪽이 좋아요",
+    ],
+    # 질문 형식 (있으면 축약형 비교가 아님)
+    "question_marker": ['?', '는', '은', '이', '가', '을', '를', '의', '에', '에서', '에게', '에게서'],
+    # 명시적 비교 표현 (있으면 축약형 비교 검사 생략)
+    "explicit_comparison": ["vs", "대", "비교", "compare", "versus", "와", "과", "누가", "어느"],
+    "comparison": ["vs", "대", "비교", "compare", "versus"],
+    # 복합 작업
+    "complex_action": [
+        "분석하고", "분석 후", "분석해서",
+        "보여주고", "보여주면서", "보여줘 그리고",
+        "알려주고", "알려주면서", "알려줘 그리고",
+        "비교하고", "비교 후", "비교해서",
+        "analyze and", "compare and", "show and",
+    ],
+    "video": ["영상", "비디오", "video", "youtube", "유튜브", "클립"],
+    "community": ["커뮤니티", "게시판", "게시글", "글", "포스트", "community", "post", "posts"],
+    # 경기 결과 조회 (일정이 아님 → 단순)
+    "match_result": ["경기 결과", "경기 점수", "경기 스코어", "경기 승부", "match result", "score"],
+    "calendar": [
+        "경기 일정", "일정", "스케줄", "schedule", "calendar",
+        "오늘 경기", "내일 경기", "이번 주", "이번 달", "주간", "월간",
+        "경기표", "fixture", "matches",
+    ],
+    "preference": ["내가 좋아하는", "내 팀", "내 선호도", "fanpicker", "선호"],
+}
+
+# 축약형 비교 검사에서 제외할 일반 단어 (단어 단위, 소문자)
+EXCLUDE_WORDS: FrozenSet[str] = frozenset([
+    '최근', '폼', '정보', '순위', '결과', '점수', '경기', '일정', '스케줄',
+    '전적', '통계', '득점', '어시스트', '나이', '소속', '팀', '리그',
+    '우승', '감독', '홈구장', '팬', '횟수', '시즌', '시작일', '날짜',
+    'recent', 'form', 'info', 'rank', 'result', 'score', 'match', 'schedule',
+])
+
+# 정규식 (매칭 여부만 보므로 캡처 그룹/앞뒤 선택 부분은 뺀 동등한 형태)
+_CHAINED_ACTION_RE = re.compile(r'(?:하고|해주고|해줘).*?(?:도|또|그리고)')
+_MATCH_ID_RE = re.compile(r'\b\d{6,}\b')  # 6자리 이상 숫자 (경기 ID)
+_ENTITY_RE = re.compile(r'[가-힣]{2,6}(?:리그)?|[A-Z][a-z]+(?:\s+[A-Z][a-z]+){0,2}')
+_ENTITY_WORD_RE = re.compile(r'[가-힣]{2,4}|[A-Z][a-z]+')  # 단어 전체 (fullmatch)
+_COMPARISON_RE = re.compile(r'.\s+(?:vs|대|와|과)\s+.', re.IGNORECASE)
+_MULTI_ACTION_RE = re.compile(
+    r'.(?:하고|해주고|해줘|후|후에).*?(?:도|또|그리고).*?(?:보여줘|알려줘|보여주고|알려주고|분석|비교|통계)'
+)
+
+
+@dataclass(frozen=True)
+class RuleMatch:
+    """규칙 판정 결과"""
+    rule: str  # 판정한 규칙 이름
+    is_complex: bool
+    reason: str  # 로그용 설명
+    persist: bool = False  # ChromaDB에도 저장할지
+
+
+RULES: Dict[str, RuleMatch] = {rule.rule: rule for rule in [
+    RuleMatch("multi_action", True, "여러 작업 요청", persist=True),
+    RuleMatch("verb_connector", True, "동사+접속사 패턴 (여러 작업 요청)", persist=True),
+    RuleMatch("chained_action", True, "~하고 ~도 패턴", persist=True),
+    RuleMatch("match_id", True, "경기 ID 포함"),
+    RuleMatch("comparison_intent", True, "비교 의도 표현 발견"),
+    RuleMatch("abbreviated_comparison", True, "축약형 비교 질문 (A B 형식)"),
+    RuleMatch("comparison_pattern", True, "비교 질문 (비교 패턴 발견)"),
+    RuleMatch("comparison_entities", True, "비교 질문 (비교 대상 2개 이상)"),
+    RuleMatch("comparison_without_targets", False, "비교 키워드 있지만 비교 대상 부족"),
+    RuleMatch("complex_action", True, "복합 작업 키워드"),
+    RuleMatch("multi_action_pattern", True, "여러 작업 요청 패턴"),
+    RuleMatch("video", True, "영상 요청"),
+    RuleMatch("community", True, "커뮤니티/게시판 요청"),
+    RuleMatch("match_result", False, "경기 결과 조회"),
+    RuleMatch("calendar", True, "경기 일정/캘린더 요청"),
+    RuleMatch("preference", True, "사용자 선호도 요청"),
+]}
+
+
+def _build_keyword_automaton():
+    """모든 키워드 그룹을 오토마톤 하나로 (단어 번호 → 속한 그룹들)"""
+    word_groups: Dict[str, set] = {}
+    for group, keywords in KEYWORD_GROUPS.items():
+        for keyword in keywords:
+            word_groups.setdefault(keyword.lower(), set()).add(group)
+    words = list(word_groups)
+    return AhoCorasick(words), [frozenset(word_groups[word]) for word in words]
+
+
+_keyword_automaton, _keyword_word_groups = _build_keyword_automaton()
+
+
+def _keyword_hits(query: str) -> set:
+    """질문에 등장한 키워드 그룹 (한 번 스캔)"""
+    hits = set()
+    for _, _, index in _keyword_automaton.finditer(query):
+        hits |= _keyword_word_groups[index]
+    return hits
+
+
+def _entity_matches(query: str) -> List[str]:
+    """고유명사/팀명/리그 후보 (2자 이상)"""
+    return [m.strip() for m in _ENTITY_RE.findall(query) if len(m.strip()) >= 2]
+
+
+def _is_abbreviated_comparison(query: str) -> bool:
+    """연속된 두 단어가 모두 고유명사/팀명인지 ("맨유 토트넘", "손흥민 홀란드")"""
+    words = query.split()
+    for word1, word2 in zip(words, words[1:]):
+        if word1.lower() in EXCLUDE_WORDS or word2.lower() in EXCLUDE_WORDS:
+            continue
+        if _ENTITY_WORD_RE.fullmatch(word1) and _ENTITY_WORD_RE.fullmatch(word2):
+            return True
+    return False
+
+
+def match_rules(query: str) -> Optional[RuleMatch]:
+    """
+    규칙 기반 분류 (비용 $0)
+
+    키워드는 한 번 스캔한 결과로 판단하고, 규칙은 우선순위 순서대로 평가
+
+    Returns:
+        RuleMatch: 처음 적용된 규칙 (None이면 규칙으로 판단 불가 → LLM/기본값)
+    """
+    hits = _keyword_hits(query)
+    query_lower = query.lower()
+
+    # 1. 여러 작업 요청 키워드
+    if "multi_action" in hits:
+        return RULES["multi_action"]
+    # 1-1. "알려주고/보여주고" + "도/또/그리고" 조합 (순서 무관)
+    if "verb" in hits and "connector" in hits:
+        return RULES["verb_connector"]
+    # 1-2. "~하고 ~도" 패턴 (예: "분석하고 통계도")
+    if _CHAINED_ACTION_RE.search(query_lower):
+        return RULES["chained_action"]
+
+    # 2. 경기 ID 패턴
+    if _MATCH_ID_RE.search(query):
+        return RULES["match_id"]
+
+    # 3-1. 비교 의도 표현 + 비교 대상 2개 이상
+    entities = None
+    if "comparison_intent" in hits:
+        entities = _entity_matches(query)
+        if len(set(entities)) >= 2:
+            return RULES["comparison_intent"]
+
+    # 3-2. 축약형 비교 ("A B" 형식) - 질문 형식/명시적 비교 표현이 없을 때만
+    if (
+        "question_marker" not in hits
+        and "explicit_comparison" not in hits
+        and _is_abbreviated_comparison(query)
+    ):
+        return RULES["abbreviated_comparison"]
+
+    # 3-3. 비교 키워드
+    if "comparison" in hits:
+        if _COMPARISON_RE.search(query):
+            return RULES["comparison_pattern"]
+        if entities is None:
+            entities = _entity_matches(query)
+        if len(set(entities)) >= 2:
+            return RULES["comparison_entities"]
+        # "비교"만 있고 비교 대상이 없으면 단순 질문
+        if "비교" in query_lower and len(entities) < 2:
+            return RULES["comparison_without_targets"]
+
+    # 4. 복합 작업 키워드 / "~하고 ~도 ~보여줘" 패턴
+    if "complex_action" in hits:
+        return RULES["complex_action"]
+    if _MULTI_ACTION_RE.search(query_lower):
+        return RULES["multi_action_pattern"]
+
+    # 5~8. 단일 Tool이 필요한 요청 (경기 결과 조회는 일정보다 먼저 → 단순)
+    for rule in ("video", "community", "match_result", "calendar", "preference"):
+        if rule in hits:
+            return RULES[rule]
+
+    return None
+
+
 async def is_complex_question(query: str, use_llm_fallback: bool = True) -> bool:
     """
     복잡한 질문인지 판단 (하이브리드 방식)
@@ -172,207 +379,29 @@ async def is_complex_question(query: str, use_llm_fallback: bool = True) -> bool
     # 2단계: ChromaDB에서 유사한 분류된 질문 검색 (비용 $0, 임베딩 검색)
     similar_result = await _search_similar_classified_question(query)
     if similar_result is not None:
+        _decision_counts["similar"] += 1
         _cache_result(query, similar_result)
         return similar_result
     
-    query_lower = query.lower()
-    
-    # 2단계: 정규식 기반 빠른 판단 (비용 $0)
-    # 1. 여러 작업 요청 키워드
-    multi_action_keywords = [
-        "그리고", "또한", "또", "그리고도", "동시에",
-        "and", "also", "plus", "또한"
-    ]
-    if any(keyword in query_lower for keyword in multi_action_keywords):
-        logger.debug("🔍 복잡한 질문 감지: 여러 작업 요청")
-        result = True
-        _cache_result(query, result)
-        await _save_classified_question(query, result)
-        return result
-    
-    # 1-1. 동사+접속사 패턴 감지 (강화 버전) ⭐
-    # "알려주고 ~도", "보여주고 ~도" 같은 실제 소비자 질문 패턴
-    # 예: "손흥민 정보 알려주고 최근 경기도 보여줘"
-    verb_connector_keywords = ["알려주고", "보여주고", "알려줘", "보여줘", "알려주면서", "보여주면서"]
-    connector_keywords = ["도", "또", "그리고", "또한"]
-    
-    # "알려주고/보여주고" + "도/또/그리고" 조합 감지
-    has_verb_connector = any(keyword in query_lower for keyword in verb_connector_keywords)
-    has_connector = any(keyword in query_lower for keyword in connector_keywords)
-    
-    if has_verb_connector and has_connector:
-        # "알려주고" 뒤에 "도"가 있는지 확인 (순서 무관)
-        # 예: "정보 알려주고 경기도" 또는 "경기도 알려주고"
-        logger.debug("🔍 복잡한 질문 감지: 동사+접속사 패턴 (여러 작업 요청)")
-        result = True
-        _cache_result(query, result)
-        await _save_classified_question(query, result)
-        return result
-    
-    # 추가: "~하고 ~도" 패턴 (더 포괄적으로)
-    # 예: "분석하고 통계도", "비교하고 경기도"
-    if re.search(r'(하고|해주고|해줘).*?(도|또|그리고)', query_lower):
-        logger.debug("🔍 복잡한 질문 감지: ~하고 ~도 패턴")
-        result = True
-        _cache_result(query, result)
-        await _save_classified_question(query, result)
-        return result
-    
-    # 2. 경기 ID 패턴 (숫자로만 이루어진 경기 ID)
-    match_id_pattern = r'\b\d{6,}\b'  # 6자리 이상 숫자
-    if re.search(match_id_pattern, query):
-        logger.debug("🔍 복잡한 질문 감지: 경기 ID 포함")
-        _cache_result(query, True)
-        return True
-    
-    # 3. 비교 질문 감지 (선수/팀/리그 등 모든 비교)
-    # 3-1. 비교 의도 표현 감지 (키워드 없이도 비교 의도 표현)
-    comparison_intent_keywords = [
-        "누가 더", "어느 쪽이", "어느 게", "어느 것이", "어느 팀이",
-        "누가 나아요", "누가 좋아요", "누가 더 나아요", "누가 더 좋아요",
-        "어느 게 나아요", "어느 게 좋아요", "어느 쪽이 나아요", "어느 쪽이 좋아요"
-    ]
-    if any(keyword in query_lower for keyword in comparison_intent_keywords):
-        # 비교 의도 표현이 있고, 두 개 이상의 고유명사/팀명이 있으면 비교 질문
-        entity_pattern = r'[가-힣]{2,6}(?:리그)?|[A-Z][a-z]+(?:\s+[A-Z][a-z]+){0,2}'
-        matches = re.findall(entity_pattern, query)
-        unique_matches = [m.strip() for m in matches if m.strip() and len(m.strip()) >= 2]
-        
-        if len(set(unique_matches)) >= 2:
-            logger.debug("🔍 복잡한 질문 감지: 비교 의도 표현 발견")
-            _cache_result(query, True)
-            return True
-    
-    # 3-2. 축약형 비교 질문 감지 ("A B" 형식, vs 키워드 없음)
-    # 예: "맨유 토트넘", "손흥민 홀란드"
-    # ⚠️ 주의: 질문 형식(?, 는, 은 등)이 있으면 비교가 아님
-    # ⚠️ 주의: 일반 단어(최근, 폼, 정보 등)가 있으면 비교가 아님
-    
-    # 질문 형식 감지 (질문 형식이 있으면 비교가 아님)
-    question_markers = ['?', '는', '은', '이', '가', '을', '를', '의', '에', '에서', '에게', '에게서']
-    has_question_marker = any(marker in query for marker in question_markers)
-    
-    # 일반 단어 제외 목록 (비교 질문으로 오인하면 안 되는 단어들)
-    exclude_words = [
-        '최근', '폼', '정보', '순위', '결과', '점수', '경기', '일정', '스케줄',
-        '전적', '통계', '득점', '어시스트', '나이', '소속', '팀', '리그',
-        '우승', '감독', '홈구장', '팬', '횟수', '시즌', '시작일', '날짜',
-        'recent', 'form', 'info', 'rank', 'result', 'score', 'match', 'schedule'
-    ]
-    
-    # 질문 형식이 없고, 일반 단어도 없을 때만 축약형 비교 감지
-    if not has_question_marker:
-        words = query.split()
-        
-        # 연속된 두 단어가 모두 고유명사/팀명인지 확인
-        for i in range(len(words) - 1):
-            word1, word2 = words[i], words[i + 1]
-            
-            # 일반 단어 제외
-            if word1.lower() in exclude_words or word2.lower() in exclude_words:
-                continue
-            
-            # 고유명사/팀명 패턴 (한글 2-4자 또는 영문 대문자 시작)
-            is_entity1 = re.match(r'^[가-힣]{2,4}$', word1) or re.match(r'^[A-Z][a-z]+$', word1)
-            is_entity2 = re.match(r'^[가-힣]{2,4}$', word2) or re.match(r'^[A-Z][a-z]+$', word2)
-            
-            # 두 단어가 모두 고유명사/팀명이고, 비교 키워드가 없으면 축약형 비교 질문
-            if is_entity1 and is_entity2:
-                if not any(kw in query_lower for kw in ["vs", "대", "비교", "compare", "versus", "와", "과", "누가", "어느"]):
-                    logger.debug("🔍 복잡한 질문 감지: 축약형 비교 질문 (A B 형식)")
-                    _cache_result(query, True)
-                    return True
-    
-    comparison_keywords = ["vs", "대", "비교", "compare", "versus"]
-    if any(keyword in query_lower for keyword in comparison_keywords):
-        # 1단계: 비교 패턴 체크 ("A vs B" 형식)
-        comparison_pattern = r'(.+?)\s+(?:vs|대|와|과)\s+(.+?)(?:\s+비교)?'
-        if re.search(comparison_pattern, query, re.IGNORECASE):
-            logger.debug("🔍 복잡한 질문 감지: 비교 질문 (비교 패턴 발견)")
-            _cache_result(query, True)
-            return True
-        
-        # 2단계: 비교 대상 체크 (정규식 패턴으로 선수/팀/리그 모두 감지)
-        entity_pattern = r'[가-힣]{2,6}(?:리그)?|[A-Z][a-z]+(?:\s+[A-Z][a-z]+){0,2}'
-        matches = re.findall(entity_pattern, query)
-        unique_matches = [m.strip() for m in matches if m.strip() and len(m.strip()) >= 2]
-        
-        if len(set(unique_matches)) >= 2:
-            logger.debug(f"🔍 복잡한 질문 감지: 비교 질문 (비교 대상 {len(set(unique_matches))}개)")
-            _cache_result(query, True)
-            return True
-        
-        # "비교"만 있고 비교 대상이 없으면 단순 질문일 수 있음
-        if "비교" in query_lower and len(unique_matches) < 2:
-            logger.debug("🔍 비교 키워드 있지만 비교 대상 부족 → 단순 질문으로 처리")
-            _cache_result(query, False)
-            return False
-    
-    # 4. 복합 작업 키워드
-    complex_keywords = [
-        "분석하고", "분석 후", "분석해서",
-        "보여주고", "보여주면서", "보여줘 그리고",
-        "알려주고", "알려주면서", "알려줘 그리고",  # 추가
-        "비교하고", "비교 후", "비교해서",
-        "analyze and", "compare and", "show and"
-    ]
-    if any(keyword in query_lower for keyword in complex_keywords):
-        logger.debug("🔍 복잡한 질문 감지: 복합 작업 키워드")
-        _cache_result(query, True)
-        return True
-    
-    # 4-1. "~하고 ~도" 패턴 감지 (정규식으로 더 정교하게)
-    # 예: "정보 알려주고 경기도 보여줘", "분석하고 통계도 알려줘"
-    multi_action_pattern = r'(.+?)(하고|해주고|해줘|후|후에).*?(도|또|그리고).*?(보여줘|알려줘|보여주고|알려주고|분석|비교|통계)'
-    if re.search(multi_action_pattern, query_lower):
-        logger.debug("🔍 복잡한 질문 감지: 여러 작업 요청 패턴")
-        _cache_result(query, True)
-        return True
-    
-    # 5. 영상/비디오 요청
-    video_keywords = ["영상", "비디오", "video", "youtube", "유튜브", "클립"]
-    if any(keyword in query_lower for keyword in video_keywords):
-        logger.debug("🔍 복잡한 질문 감지: 영상 요청")
-        _cache_result(query, True)
-        return True
-    
-    # 6. 커뮤니티/게시판 관련 질문
-    community_keywords = ["커뮤니티", "게시판", "게시글", "글", "포스트", "community", "post", "posts"]
-    if any(keyword in query_lower for keyword in community_keywords):
-        logger.debug("🔍 복잡한 질문 감지: 커뮤니티/게시판 요청")
-        _cache_result(query, True)
-        return True
-    
-    # 7. 경기 일정/캘린더 관련 질문
-    # 단, "경기 결과", "경기 점수" 같은 키워드가 있으면 단순 질문 (일정이 아닌 결과 조회)
-    result_keywords = ["경기 결과", "경기 점수", "경기 스코어", "경기 승부", "match result", "score"]
-    if any(keyword in query_lower for keyword in result_keywords):
-        logger.debug("✅ 경기 결과 조회 → 단순 질문으로 처리")
-        _cache_result(query, False)
-        return False
-    
-    calendar_keywords = [
-        "경기 일정", "일정", "스케줄", "schedule", "calendar",
-        "오늘 경기", "내일 경기", "이번 주", "이번 달", "주간", "월간",
-        "경기표", "fixture", "matches"
-    ]
-    if any(keyword in query_lower for keyword in calendar_keywords):
-        logger.debug("🔍 복잡한 질문 감지: 경기 일정/캘린더 요청")
-        _cache_result(query, True)
-        return True
-    
-    # 8. 사용자 선호도 관련 질문
-    preference_keywords = ["내가 좋아하는", "내 팀", "내 선호도", "fanpicker", "선호"]
-    if any(keyword in query_lower for keyword in preference_keywords):
-        logger.debug("🔍 복잡한 질문 감지: 사용자 선호도 요청")
-        _cache_result(query, True)
-        return True
+    # 3단계: 규칙 기반 빠른 판단 (비용 $0)
+    matched = match_rules(query)
+    if matched is not None:
+        _decision_counts[matched.rule] += 1
+        if matched.is_complex:
+            logger.debug(f"🔍 복잡한 질문 감지: {matched.reason}")
+        else:
+            logger.debug(f"✅ {matched.reason} → 단순 질문으로 처리")
+        if matched.persist:
+            await _cache_and_save_result(query, matched.is_complex)
+        else:
+            _cache_result(query, matched.is_complex)
+        return matched.is_complex
     
-    # 3단계: 애매한 경우 LLM 호출 (선택적, 비용 발생)
+    # 4단계: 애매한 경우 LLM 호출 (선택적, 비용 발생)
     if use_llm_fallback:
         try:
-            from ..services.openai_service import OpenAIService
-            openai_service = OpenAIService()
+            from ..services.openai_service import get_openai_service
+            openai_service = get_openai_service()
             
             # 간단한 프롬프트로 질문 분류
             classification_prompt = """다음 질문이 복잡한 질문인지 단순한 질문인지 판단하세요.
@@ -394,8 +423,11 @@ async def is_complex_question(query: str, use_llm_fallback: bool = True) -> bool
                 {"role": "user", "content": classification_prompt}
             ]
             
-            response = await openai_service.chat(messages=messages)
+            response = await openai_service.chat(
+                messages=messages, timeout=CLASSIFIER_LLM_TIMEOUT_SECONDS
+            )
             is_complex = "COMPLEX" in response.upper()
+            _decision_counts["llm"] += 1
             
             logger.info(f"🤖 LLM 질문 분류: {query[:50]} → {'복잡' if is_complex else '단순'}")
             _cache_result(query, is_complex)
@@ -407,11 +439,13 @@ async def is_complex_question(query: str, use_llm_fallback: bool = True) -> bool
             
         except Exception as e:
             logger.warning(f"⚠️ LLM 질문 분류 실패: {e}, 기본값(단순) 사용")
+            _decision_counts["llm_error"] += 1
             _cache_result(query, False)
             return False
     
     # 기본값: 단순 질문
     logger.debug("✅ 단순 질문으로 판단")
+    _decision_counts["default"] += 1
     result = False
     _cache_result(query, result)
     
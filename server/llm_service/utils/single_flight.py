@@ -0,0 +1,68 @@
+"""
+요청 합치기 (single-flight)
+같은 키로 동시에 들어온 요청은 진행 중인 호출 하나의 결과를 함께 기다림
+
+Example:
+    >>> flights = SingleFlight()
+    >>> data, shared = await flights.do("standings_PL", fetch_standings)
+"""
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class SingleFlight:
+    """
+    키별 진행 중 호출 공유
+
+    - 호출은 별도 Task로 실행되므로 먼저 온 요청이 취소(클라이언트 끊김)돼도
+      나머지 대기자는 결과를 받는다
+    - 예외도 모든 대기자에게 그대로 전달
+    - 완료되면 키를 지워서 다음 요청은 새로 호출 (결과 캐시는 호출자 책임)
+    """
+
+    def __init__(self):
+        self._inflight: Dict[Hashable, asyncio.Task] = {}
+        self.calls = 0
+        self.shared = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Tuple[Any, bool]:
+        """
+        key로 fn 실행 (이미 진행 중이면 그 결과를 기다림)
+
+        Returns:
+            (결과, 다른 요청의 호출을 공유했는지 여부)
+        """
+        task = self._inflight.get(key)
+        shared = task is not None
+        if shared:
+            self.shared += 1
+        else:
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+            self.calls += 1
+            task.add_done_callback(lambda t, k=key: self._finish(k, t))
+
+        return await asyncio.shield(task), shared
+
+    def _finish(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # 대기자가 모두 취소된 경우에도 "exception was never retrieved" 경고가 나지 않게 소비
+        if not task.cancelled() and task.exception() is not None:
+            logger.debug(f"⚠️ single-flight 호출 실패 ({key}): {task.exception()}")
+
+    def is_in_flight(self, key: Hashable) -> bool:
+        return key in self._inflight
+
+    def in_flight(self) -> int:
+        return len(self._inflight)
+
+    def get_stats(self) -> Dict[str, int]:
+        return {
+            "in_flight": len(self._inflight),
+            "calls": self.calls,
+            "shared": self.shared,
+        }
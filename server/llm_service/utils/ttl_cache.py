@@ -0,0 +1,90 @@
+"""
+인메모리 LRU + TTL 캐시
+프로세스 내 L1 캐시 용도 (스레드 안전, 히트/미스 카운터 포함)
+
+Example:
+    >>> cache = TTLCache(maxsize=1000, ttl_seconds=3600)
+    >>> cache.set("key", {"answer": "..."})
+    >>> cache.get("key")
+    {'answer': '...'}
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional
+
+
+class TTLCache:
+    """
+    LRU + TTL 캐시
+
+    - maxsize 초과 시 가장 오래 사용되지 않은 항목부터 제거
+    - 항목별 만료 시간 (set 시 ttl_seconds로 개별 지정 가능)
+    - 만료된 항목은 조회 시점에 제거 (미스로 집계)
+    """
+
+    def __init__(self, maxsize: int = 1000, ttl_seconds: float = 3600):
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._data: "OrderedDict[Hashable, tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """캐시 조회 (없거나 만료되면 default)"""
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                self.misses += 1
+                return default
+
+            expires_at, value = item
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                self.misses += 1
+                return default
+
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl_seconds: Optional[float] = None) -> None:
+        """캐시 저장 (ttl_seconds 미지정 시 기본 TTL)"""
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        with self._lock:
+            self._data[key] = (time.monotonic() + ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, key: Hashable) -> bool:
+        """항목 삭제 (존재했으면 True)"""
+        with self._lock:
+            return self._data.pop(key, None) is not None
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            item = self._data.get(key)
+            return item is not None and item[0] > time.monotonic()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """히트/미스 통계"""
+        total = self.hits + self.misses
+        return {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hits / total, 4) if total else 0.0,
+        }
@@ -0,0 +1,195 @@
+"""
+2단 캐시 (인메모리 L1 + 외부 저장소 L2) + stale-while-revalidate
+
+- L1: 프로세스 내 LRU (TTLCache), 히트 시 네트워크 왕복 없음
+- L2: Firestore 등 외부 저장소 (CacheStore 프로토콜), 인스턴스 간 공유
+- 신선 기간(ttl)이 지난 항목은 stale 기간 동안 즉시 반환하고
+  백그라운드 태스크 하나가 갱신 (같은 키 갱신/미스는 SingleFlight로 합침)
+
+Example:
+    >>> cache = TwoTierCache(maxsize=512)
+    >>> data, source = await cache.get_or_fetch(
+    ...     "standings_PL", fetch_standings, ttl_seconds=3600, store=FirestoreCacheStore(db)
+    ... )
+    >>> source  # "memory" | "store" | "stale" | "api"
+"""
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Protocol, Set, Tuple, Union
+
+from .single_flight import SingleFlight
+from .ttl_cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+
+class CacheStore(Protocol):
+    """L2 저장소 인터페이스 (동기 함수, 스레드에서 호출됨)"""
+
+    def get(self, key: str) -> Optional[Tuple[Any, float]]:
+        """(값, 저장 시각 epoch 초) 또는 None"""
+
+    def set(self, key: str, value: Any, metadata: Optional[dict] = None) -> None:
+        """값 저장"""
+
+
+class TwoTierCache:
+    """
+    L1(메모리) + L2(CacheStore) 캐시
+
+    Args:
+        maxsize: L1 최대 항목 수
+        flights: 업스트림 호출 합치기 (없으면 새로 생성)
+    """
+
+    def __init__(self, maxsize: int = 512, flights: Optional[SingleFlight] = None):
+        # L1 항목: (값, 저장 시각 epoch 초, 신선 기간 초) / 만료는 ttl + stale 기간
+        self.l1 = TTLCache(maxsize=maxsize, ttl_seconds=3600)
+        self.flights = flights or SingleFlight()
+        self._refreshing: Set[asyncio.Task] = set()
+        self.stats = {"memory": 0, "store": 0, "stale": 0, "api": 0, "refresh_errors": 0}
+
+    # ============================================
+    # 내부 처리
+    # ============================================
+
+    def _remember(self, key: Hashable, value: Any, stored_at: float, ttl_seconds: float, stale_seconds: float) -> None:
+        remaining = stored_at + ttl_seconds + stale_seconds - time.time()
+        if remaining > 0:
+            self.l1.set(key, (value, stored_at, ttl_seconds), ttl_seconds=remaining)
+
+    async def _fetch_and_store(
+        self,
+        key: str,
+        fetch: Callable[[], Awaitable[Any]],
+        ttl_for: Callable[[Any], float],
+        stale_seconds: Optional[float],
+        store: Optional[CacheStore],
+        metadata: Optional[Callable[[Any], dict]],
+    ) -> Any:
+        """업스트림 호출 → L1/L2 저장 (빈 결과는 저장하지 않음)"""
+        value = await fetch()
+        if value:
+            ttl = ttl_for(value)
+            self._remember(key, value, time.time(), ttl, ttl if stale_seconds is None else stale_seconds)
+            if store is not None:
+                meta = metadata(value) if metadata else None
+                await asyncio.to_thread(store.set, key, value, meta)
+        return value
+
+    def _refresh_in_background(self, key: str, run: Callable[[], Awaitable[Any]]) -> None:
+        """stale 항목 백그라운드 갱신 (같은 키는 SingleFlight로 1개만)"""
+        if self.flights.is_in_flight(key):
+            return
+
+        async def refresh():
+            try:
+                await self.flights.do(key, run)
+                logger.info(f"🔄 백그라운드 캐시 갱신 완료: {key}")
+            except Exception as e:
+                self.stats["refresh_errors"] += 1
+                logger.warning(f"⚠️ 백그라운드 캐시 갱신 실패 ({key}): {e}")
+
+        task = asyncio.create_task(refresh())
+        self._refreshing.add(task)
+        task.add_done_callback(self._refreshing.discard)
+
+    # ============================================
+    # 공개 API
+    # ============================================
+
+    async def get_or_fetch(
+        self,
+        key: str,
+        fetch: Callable[[], Awaitable[Any]],
+        ttl_seconds: Union[float, Callable[[Any], float]],
+        stale_seconds: Optional[float] = None,
+        store: Optional[CacheStore] = None,
+        metadata: Optional[Callable[[Any], dict]] = None,
+        force_refresh: bool = False,
+    ) -> Tuple[Any, str]:
+        """
+        캐시 조회, 없으면 업스트림 호출
+
+        Args:
+            key: 캐시 키 (SingleFlight 키로도 사용)
+            fetch: 업스트림 호출 코루틴 함수
+            ttl_seconds: 신선 기간 (초) 또는 결과 → 초 함수 (예: 경기 상태별 TTL)
+            stale_seconds: 신선 기간이 지난 뒤 stale로 반환할 기간 (None이면 ttl과 같음)
+            store: L2 저장소 (None이면 L1만 사용)
+            metadata: L2 저장 시 메타데이터 (결과 → dict)
+            force_refresh: 캐시 무시하고 업스트림 호출
+
+        Returns:
+            (값, 출처) - 출처: "memory" | "store" | "stale" | "api"
+        """
+        ttl_for = ttl_seconds if callable(ttl_seconds) else (lambda _: ttl_seconds)
+
+        async def run():
+            return await self._fetch_and_store(key, fetch, ttl_for, stale_seconds, store, metadata)
+
+        if not force_refresh:
+            entry = self.l1.get(key)
+            source = "memory"
+
+            if entry is None and store is not None:
+                # 동시 L1 미스의 L2 조회도 한 번으로 합침
+                stored, _ = await self.flights.do(
+                    ("store", key), lambda: asyncio.to_thread(store.get, key)
+                )
+                if stored is not None:
+                    value, stored_at = stored
+                    ttl = ttl_for(value)
+                    entry = (value, stored_at, ttl)
+                    self._remember(key, value, stored_at, ttl, ttl if stale_seconds is None else stale_seconds)
+                    source = "store"
+
+            if entry is not None:
+                value, stored_at, ttl = entry
+                stale_window = ttl if stale_seconds is None else stale_seconds
+                age = time.time() - stored_at
+                if age <= ttl:
+                    self.stats[source] += 1
+                    return value, source
+                if age <= ttl + stale_window:
+                    self.stats["stale"] += 1
+                    self._refresh_in_background(key, run)
+                    return value, "stale"
+
+        value, _ = await self.flights.do(key, run)
+        self.stats["api"] += 1
+        return value, "api"
+
+    def peek(self, key: Hashable) -> Optional[Any]:
+        """
+        L1만 동기 조회 (스레드에서 도는 Agent Tool용, 저장소/업스트림 호출 없음)
+
+        stale 기간 안의 항목도 반환 (갱신은 백그라운드 갱신기/다음 async 요청 몫)
+        """
+        entry = self.l1.get(key)
+        if entry is None:
+            return None
+        value, stored_at, ttl = entry
+        self.stats["memory" if time.time() - stored_at <= ttl else "stale"] += 1
+        return value
+
+    def put(self, key: Hashable, value: Any, ttl_seconds: float, stale_seconds: Optional[float] = None) -> None:
+        """L1에 직접 저장 (동기, 스레드 안전)"""
+        self._remember(key, value, time.time(), ttl_seconds, ttl_seconds if stale_seconds is None else stale_seconds)
+
+    def invalidate(self, key: Hashable) -> bool:
+        """L1 항목 삭제 (L2는 호출자가 정리)"""
+        return self.l1.delete(key)
+
+    async def wait_refreshes(self) -> None:
+        """진행 중인 백그라운드 갱신 대기 (테스트/종료용)"""
+        if self._refreshing:
+            await asyncio.gather(*list(self._refreshing), return_exceptions=True)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **self.stats,
+            "refreshing": len(self._refreshing),
+            "l1": self.l1.get_stats(),
+        }
@@ -1,8 +1,12 @@
 # Supabase 마이그레이션 완료 - 2026.01.21
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from contextlib import asynccontextmanager
 from dotenv import load_dotenv
+import asyncio
+import importlib
 import os
+import time
 import json
 import logging
 import firebase_admin
@@ -50,33 +54,145 @@ try:
 except Exception as e:
     logger.error(f"⚠️ Firebase Admin SDK 초기화 실패: {e}")
 
-# Backend 라우터들 import
-try:
-    from backend.routers.auth import router as auth_router
-    from backend.routers.posts import router as posts_router
-    from backend.routers.users import router as users_router
-    from backend.routers.football_data import router as football_router
-    from backend.routers.reports import router as reports_router  # 🆕 신고 시스템
+# 무거운 서비스(OpenAI/ChromaDB/LangChain Agent)는 첫 요청 시 생성
+# WARMUP_ON_STARTUP=true면 서버가 뜬 뒤 백그라운드에서 미리 생성 (헬스 체크는 막지 않음)
+WARMUP_ON_STARTUP = os.getenv("WARMUP_ON_STARTUP", "false").lower() == "true"
 
-    logger.info("✅ Backend 라우터들 import 및 등록 성공")
-except Exception as e:
-    logger.error(f"❌ Backend 라우터 import 실패: {e}")
-    # Backend 라우터 실패는 치명적이므로 종료하지 않고 계속 진행
-    auth_router = posts_router = users_router = football_router = reports_router = None
+
+def _import_router(module_path: str):
+    """라우터 모듈 import (실패해도 해당 라우터만 비활성화하고 계속 진행)"""
+    try:
+        module = importlib.import_module(module_path)
+        return module.router
+    except Exception as e:
+        logger.error(f"❌ 라우터 import 실패 ({module_path}): {e}", exc_info=True)
+        return None
+
+
+# Backend 라우터들 import
+auth_router = _import_router("backend.routers.auth")
+posts_router = _import_router("backend.routers.posts")
+users_router = _import_router("backend.routers.users")
+football_router = _import_router("backend.routers.football_data")
+reports_router = _import_router("backend.routers.reports")  # 🆕 신고 시스템
 
 # LLM Service 라우터들 import
-try:
-    from llm_service.routers.chat import router as chat_router
-    from llm_service.routers.match_analysis import router as analysis_router
-    from llm_service.routers.player_compare import router as compare_router
-    from llm_service.routers.stats import router as stats_router
-    from llm_service.routers.agent import router as agent_router  # ← 🆕 Agent 라우터 추가
+chat_router = _import_router("llm_service.routers.chat")
+analysis_router = _import_router("llm_service.routers.match_analysis")
+compare_router = _import_router("llm_service.routers.player_compare")
+stats_router = _import_router("llm_service.routers.stats")
+agent_router = _import_router("llm_service.routers.agent")  # ← 🆕 Agent 라우터 추가
+
+
+def _warmup_services() -> None:
+    """공용 서비스 미리 생성 (스레드에서 실행, 실패해도 첫 요청 시 다시 시도)"""
+    started = time.perf_counter()
+    try:
+        from llm_service.services.openai_service import get_openai_service
+        from llm_service.services.cache_service import get_cache_service
+        from llm_service.services.rag_service import get_rag_service
+
+        get_openai_service()
+        get_rag_service()
+        get_cache_service()
+        if agent_router:
+            from llm_service.routers.agent import get_agent_factory
+
+            get_agent_factory().get_agent()
+        logger.info(f"🔥 서비스 워밍업 완료 ({time.perf_counter() - started:.2f}s)")
+    except Exception as e:
+        logger.warning(f"⚠️ 서비스 워밍업 실패 (첫 요청 시 생성): {e}")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """앱 수명주기: (선택) 시작 후 워밍업, 검색 인덱스 적재, Football 캐시 갱신기/카운터 반영기 시작/종료, 공용 클라이언트/Chroma 핸들 정리"""
+    warmup_task = None
+    if WARMUP_ON_STARTUP:
+        warmup_task = asyncio.create_task(asyncio.to_thread(_warmup_services))
+
+    # Football-Data 호출 한도 버킷을 서버 루프에 바인딩 (Agent Tool 스레드도 이 루프의 버킷에서 대기)
+    try:
+        from llm_service.external_apis.football_data import get_football_rate_limiter
+
+        get_football_rate_limiter().bind_loop(asyncio.get_running_loop())
+    except Exception as e:
+        logger.warning(f"⚠️ Football 호출 한도 버킷 바인딩 실패: {e}")
+
+    # 라이브 경기/예정 경기/순위표를 주기적으로 공용 캐시에 채움 (FOOTBALL_REFRESH_MODE=off로 끔)
+    if football_router:
+        try:
+            from backend.football_refresher import start_football_refresher
+
+            start_football_refresher()
+        except Exception as e:
+            logger.warning(f"⚠️ Football 갱신기 시작 실패: {e}")
+
+    # 게시글 검색 인덱스 백그라운드 적재 (끝나기 전 검색은 503, 실패하면 다음 검색 때 다시 시도)
+    try:
+        from backend.supabase_config import get_supabase_client
+        from llm_service.utils.post_search_index import get_post_search_index
+
+        get_post_search_index().ensure_loaded(get_supabase_client(), wait=False)
+    except Exception as e:
+        logger.warning(f"⚠️ 게시글 검색 인덱스 적재 시작 실패: {e}")
+
+    # 조회수/좋아요 증가분 주기 반영
+    try:
+        from backend.counter_buffer import start_counter_flusher
+
+        start_counter_flusher()
+    except Exception as e:
+        logger.warning(f"⚠️ 카운터 반영기 시작 실패: {e}")
+
+    yield
+
+    if warmup_task and not warmup_task.done():
+        warmup_task.cancel()
+
+    # 버퍼에 남은 조회수/좋아요 반영 (DB 클라이언트 정리 전에)
+    try:
+        from backend.counter_buffer import stop_counter_flusher
+
+        await stop_counter_flusher()
+    except Exception as e:
+        logger.warning(f"⚠️ 카운터 반영기 종료 실패: {e}")
+
+    try:
+        from backend.db_executor import close_db_executor
+
+        close_db_executor()
+    except Exception as e:
+        logger.warning(f"⚠️ DB 실행기 종료 실패: {e}")
+
+    try:
+        from backend.football_refresher import stop_football_refresher
+
+        await stop_football_refresher()
+    except Exception as e:
+        logger.warning(f"⚠️ Football 갱신기 종료 실패: {e}")
+
+    try:
+        from llm_service.services.openai_service import close_openai_clients
+
+        await close_openai_clients()
+    except Exception as e:
+        logger.warning(f"⚠️ OpenAI 클라이언트 종료 실패: {e}")
+
+    try:
+        from llm_service.external_apis.football_data import close_football_clients
+
+        await close_football_clients()
+    except Exception as e:
+        logger.warning(f"⚠️ Football-Data 클라이언트 종료 실패: {e}")
+
+    try:
+        from llm_service.services.rag_service import close_rag_services
+
+        close_rag_services()
+    except Exception as e:
+        logger.warning(f"⚠️ RAGService 종료 실패: {e}")
 
-    logger.info("✅ LLM Service 라우터들 import 및 등록 성공")
-except Exception as e:
-    logger.error(f"⚠️ LLM Service 라우터 import 실패: {e}")
-    # LLM 라우터 실패해도 계속 진행
-    chat_router = analysis_router = compare_router = stats_router = agent_router = None
 
 # FastAPI 앱 초기화
 app = FastAPI(
@@ -85,6 +201,7 @@ app = FastAPI(
     description="Full of Soccer Fun - AI-powered Soccer Analysis Platform",
     docs_url="/docs",
     redoc_url="/redoc",
+    lifespan=lifespan,
 )
 
 logger.info("🏗️ FastAPI 앱 초기화 완료")
@@ -102,6 +219,42 @@ app.add_middleware(
 
 logger.info("🔐 CORS 미들웨어 등록 완료")
 
+
+@app.middleware("http")
+async def embedding_stats_middleware(request: Request, call_next):
+    """
+    LLM 요청별 임베딩 API 호출 수 집계 (X-Embedding-API-Calls 헤더)
+
+    스트리밍 응답(SSE)은 헤더가 본문보다 먼저 나가므로 헤더를 붙이지 않고,
+    스트림이 끝난 뒤 로그로만 남긴다.
+    """
+    if not request.url.path.startswith("/api/llm"):
+        return await call_next(request)
+
+    try:
+        from llm_service.services.embedding_service import begin_embedding_request_stats
+
+        stats = begin_embedding_request_stats()
+    except Exception:
+        return await call_next(request)
+
+    response = await call_next(request)
+    if response.headers.get("content-type", "").startswith("text/event-stream"):
+        body = response.body_iterator
+
+        async def body_with_stats():
+            async for chunk in body:
+                yield chunk
+            logger.debug(f"🔢 임베딩 통계 {request.url.path} (스트리밍): {stats}")
+
+        response.body_iterator = body_with_stats()
+        return response
+
+    response.headers["X-Embedding-API-Calls"] = str(stats["api_calls"])
+    logger.debug(f"🔢 임베딩 통계 {request.url.path}: {stats}")
+    return response
+
+
 # Backend 라우터 등록
 if auth_router:
     app.include_router(auth_router, prefix="/api/auth", tags=["Authentication"])
@@ -5,10 +5,13 @@ Supabase 테스트용 설정
 """
 
 import os
+import re
 import pytest
 from unittest.mock import MagicMock, AsyncMock
 from datetime import datetime
 
+from postgrest.exceptions import APIError
+
 # 환경변수 설정 (테스트용)
 os.environ.setdefault("SUPABASE_URL", "https://test.supabase.co")
 os.environ.setdefault("SUPABASE_KEY", "test-key")
@@ -78,6 +81,208 @@ def mock_supabase():
     return MockSupabaseClient()
 
 
+# ============================================
+# 필터 가능한 Supabase 대역 (라우터/서비스 테스트 공용)
+# ============================================
+
+_KEYSET_OR_RE = re.compile(
+    r'^created_at\.(lt|gt)\."([^"]+)",and\(created_at\.eq\."([^"]+)",(\w+)\.(lt|gt)\.([\w\-.:]+)\)$'
+)
+
+
+def _comparable(a, b):
+    """타임스탬프 문자열끼리는 timestamptz처럼 비교 (naive 값은 로컬 시각), 그 외는 그대로"""
+    if isinstance(a, str) and isinstance(b, str):
+        try:
+            parsed = [datetime.fromisoformat(v.replace("Z", "+00:00")) for v in (a, b)]
+        except ValueError:
+            return a, b
+        return tuple(p.astimezone().replace(tzinfo=None) if p.tzinfo else p for p in parsed)
+    return a, b
+
+
+def _less(a, b) -> bool:
+    a, b = _comparable(a, b)
+    return a < b
+
+
+class FakeQuery:
+    """PostgREST 쿼리 빌더 대역 (select/insert/update/delete + eq/neq/gt/gte/lt/lte/in_/is_/or_/order/limit/range)"""
+
+    def __init__(self, db: "FakeSupabaseClient", table: str):
+        self.db = db
+        self.table = table
+        self.action = "select"
+        self.columns = "*"
+        self.count = None
+        self.values = None
+        self.eqs = {}
+        self.filters = []
+        self.orders = []
+        self.window = None
+
+    # 동작
+    def select(self, columns="*", count=None):
+        self.columns, self.count = columns, count
+        return self
+
+    def insert(self, values):
+        self.action, self.values = "insert", values
+        return self
+
+    def update(self, values):
+        self.action, self.values = "update", values
+        return self
+
+    def delete(self):
+        self.action = "delete"
+        return self
+
+    # 필터
+    def eq(self, field, value):
+        self.eqs[field] = value
+        self.filters.append(lambda r: r.get(field) == value)
+        return self
+
+    def neq(self, field, value):
+        self.filters.append(lambda r: r.get(field) != value)
+        return self
+
+    def gt(self, field, value):
+        self.filters.append(lambda r: r.get(field) is not None and _less(value, r.get(field)))
+        return self
+
+    def gte(self, field, value):
+        self.filters.append(lambda r: r.get(field) is not None and not _less(r.get(field), value))
+        return self
+
+    def lt(self, field, value):
+        self.filters.append(lambda r: r.get(field) is not None and _less(r.get(field), value))
+        return self
+
+    def lte(self, field, value):
+        self.filters.append(lambda r: r.get(field) is not None and not _less(value, r.get(field)))
+        return self
+
+    def in_(self, field, values):
+        values = list(values)
+        self.filters.append(lambda r: r.get(field) in values)
+        return self
+
+    def is_(self, field, value):
+        assert value == "null"
+        self.filters.append(lambda r: r.get(field) is None)
+        return self
+
+    def or_(self, filters):
+        """pagination.apply_keyset이 만드는 (created_at, id) 키셋 조건만"""
+        op, created_at, same_created_at, column, id_op, row_id = _KEYSET_OR_RE.match(filters).groups()
+        assert created_at == same_created_at and op == id_op
+
+        def after(r):
+            if r["created_at"] == created_at:
+                return r[column] > row_id if op == "gt" else r[column] < row_id
+            return _less(created_at, r["created_at"]) if op == "gt" else _less(r["created_at"], created_at)
+
+        self.filters.append(after)
+        return self
+
+    # 정렬 / 범위
+    def order(self, field, desc=False):
+        self.orders.append((field, desc))
+        return self
+
+    def limit(self, n):
+        self.window = (0, n)
+        return self
+
+    def range(self, start, end):
+        self.window = (start, end - start + 1)
+        return self
+
+    def execute(self):
+        return self.db._execute(self)
+
+
+class FakeSupabaseClient:
+    """
+    메모리 테이블로 동작하는 Supabase 클라이언트 대역
+
+    - tables: {테이블: [행 dict]} (insert/update/delete가 이 목록을 바꿈)
+    - defaults: {테이블: {컬럼: 기본값}} insert 시 빠진 컬럼 (DB 컬럼 default 흉내)
+    - rpcs: {함수명: handler(params) → data}, 등록되지 않은 함수는 PGRST202 (RPC 미배포)
+    - rpc_errors: {함수명: 예외} 등록된 동안 그 RPC 호출은 실행 전에 예외
+    - queries / rpc_calls: 실행한 쿼리(FakeQuery) / 성공한 RPC 호출 기록
+    - on_read: 조회 쿼리 실행 직후 호출 (테이블명) - 조회 도중 다른 요청 흉내
+    """
+
+    def __init__(self, tables=None, rpcs=None, defaults=None):
+        self.tables = {name: [dict(row) for row in rows] for name, rows in (tables or {}).items()}
+        self.defaults = dict(defaults or {})
+        self.rpcs = dict(rpcs or {})
+        self.rpc_errors = {}
+        self.queries = []
+        self.rpc_calls = []
+        self.on_read = None
+
+    def table(self, name):
+        return FakeQuery(self, name)
+
+    def rpc(self, name, params=None):
+        db = self
+
+        class _Call:
+            def execute(self):
+                error = db.rpc_errors.get(name)
+                if error is not None:
+                    raise error
+                handler = db.rpcs.get(name)
+                if handler is None:
+                    raise APIError({"code": "PGRST202", "message": f"Could not find the function public.{name}"})
+                data = handler(params)
+                db.rpc_calls.append((name, params))
+                return MockSupabaseResponse(data=data)
+
+        return _Call()
+
+    def selects(self, table=None):
+        """실행한 조회 쿼리 (table을 주면 그 테이블만)"""
+        return [q for q in self.queries if q.action == "select" and (table is None or q.table == table)]
+
+    def _execute(self, query: FakeQuery):
+        self.queries.append(query)
+        rows = self.tables.setdefault(query.table, [])
+        if query.action == "insert":
+            values = query.values if isinstance(query.values, list) else [query.values]
+            inserted = [{**self.defaults.get(query.table, {}), **v} for v in values]
+            rows.extend(inserted)
+            return MockSupabaseResponse(data=[dict(r) for r in inserted])
+
+        matched = [r for r in rows if all(f(r) for f in query.filters)]
+        if query.action == "update":
+            for row in matched:
+                row.update(query.values)
+            return MockSupabaseResponse(data=[dict(r) for r in matched])
+        if query.action == "delete":
+            self.tables[query.table] = [r for r in rows if r not in matched]
+            return MockSupabaseResponse(data=[dict(r) for r in matched])
+
+        for field, desc in reversed(query.orders):
+            matched = sorted(matched, key=lambda r: (r.get(field) is None, r.get(field)), reverse=desc)
+        total = len(matched)
+        if query.window:
+            start, size = query.window
+            matched = matched[start:start + size]
+        if query.columns != "*":
+            columns = [c.strip() for c in query.columns.split(",")]
+            matched = [{c: r.get(c) for c in columns} for r in matched]
+        else:
+            matched = [dict(r) for r in matched]
+        if self.on_read:
+            self.on_read(query.table)
+        return MockSupabaseResponse(data=matched, count=total if query.count else None)
+
+
 @pytest.fixture
 def mock_user():
     """테스트용 유저 데이터"""
@@ -37,8 +37,28 @@ FSF 플랫폼 부하 테스트 (Locust)
     locust -f tests/locustfile.py --host=http://localhost:8080 \
            --users 300 --spawn-rate 30 --run-time 2m --headless \
            --csv=load_test_300users
+
+    # 🔹 페이지네이션 비교 (offset vs cursor, 깊은 페이지까지 순서대로 넘김)
+    #    기본 실행(위 시나리오)에는 포함되지 않음 - 환경변수 + 유저 클래스 지정
+    LOCUST_PAGINATION_COMPARE=1 locust -f tests/locustfile.py --host=http://localhost:8080 \
+           --users 100 --spawn-rate 10 --run-time 2m --headless \
+           OffsetPaginationUser CursorPaginationUser
+
+    # 🔹 인기 게시글 조회 집중 (조회수 DB 쓰기가 반영 주기당 RPC 1회로 줄었는지)
+    #    종료 후 GET /api/posts/health → counters.rpc_calls / flushes 확인
+    LOCUST_COUNTER_HOTSPOT=1 LOCUST_HOT_POST_IDS=<게시글 id,...> locust -f tests/locustfile.py \
+           --host=http://localhost:8080 --users 200 --spawn-rate 20 --run-time 1m --headless \
+           HotPostViewerUser
+
+    # 🔹 Supabase 호출 실행 방식 비교 (이벤트 루프에서 바로 vs 스레드 풀), /api/posts p95 비교
+    SUPABASE_EXECUTION=inline uvicorn main:app --port 8080   # before
+    SUPABASE_EXECUTION=thread uvicorn main:app --port 8080   # after (기본값)
+    LOCUST_DB_COMPARE=1 locust -f tests/locustfile.py --host=http://localhost:8080 \
+           --users 300 --spawn-rate 30 --run-time 2m --headless --csv=db_<inline|thread> \
+           DBReadUser
 """
 
+import os
 import random
 import string
 from locust import HttpUser, task, between, events
@@ -169,6 +189,126 @@ class ChatbotUser(HttpUser):
             response.success()
 
 
+# ============================================
+# 4. 페이지네이션 비교 (offset vs cursor)
+# ============================================
+
+# 기본 부하 테스트 비율(60/30/10)을 바꾸지 않도록 환경변수로만 활성화
+PAGINATION_COMPARE = os.getenv("LOCUST_PAGINATION_COMPARE") == "1"
+PAGINATION_DEPTH = int(os.getenv("LOCUST_PAGINATION_DEPTH", "30"))  # 넘겨볼 페이지 수
+PAGINATION_PAGE_SIZE = 20
+
+
+def _depth_bucket(page):
+    """통계 이름용 페이지 구간 (1-10, 11-20, ...)"""
+    start = (page - 1) // 10 * 10 + 1
+    return f"p{start}-{start + 9}"
+
+
+class OffsetPaginationUser(HttpUser):
+    """
+    게시글 목록을 page=1부터 깊은 페이지까지 넘김 (기존 offset + count=exact)
+    깊어질수록 앞 페이지 행을 모두 읽고 버림 → 구간별 응답시간 증가
+    """
+    abstract = not PAGINATION_COMPARE
+    wait_time = between(0.5, 1.5)
+
+    def on_start(self):
+        self.page = 1
+
+    @task
+    def next_page(self):
+        name = f"/api/posts [offset {_depth_bucket(self.page)}]"
+        response = self.client.get(
+            f"/api/posts?page={self.page}&page_size={PAGINATION_PAGE_SIZE}",
+            name=name
+        )
+        has_more = response.status_code == 200 and len(response.json().get("posts", [])) == PAGINATION_PAGE_SIZE
+        self.page = self.page + 1 if has_more and self.page < PAGINATION_DEPTH else 1
+
+
+class CursorPaginationUser(HttpUser):
+    """
+    같은 목록을 next_cursor로 넘김 (키셋 + 본문 제외 + 개수 생략)
+    페이지 깊이와 무관하게 인덱스 범위 스캔 → 구간별 응답시간 일정
+    """
+    abstract = not PAGINATION_COMPARE
+    wait_time = between(0.5, 1.5)
+
+    def on_start(self):
+        self.page = 1
+        self.cursor = None
+
+    @task
+    def next_page(self):
+        url = f"/api/posts?pagination=cursor&page_size={PAGINATION_PAGE_SIZE}"
+        if self.cursor:
+            url += f"&cursor={self.cursor}"
+        response = self.client.get(url, name=f"/api/posts [cursor {_depth_bucket(self.page)}]")
+        self.cursor = response.json().get("next_cursor") if response.status_code == 200 else None
+        if self.cursor and self.page < PAGINATION_DEPTH:
+            self.page += 1
+        else:
+            self.page, self.cursor = 1, None
+
+
+# ============================================
+# 5. 인기 게시글 조회 집중 (조회수 write-behind 확인)
+# ============================================
+
+# 기본 부하 테스트 비율에 포함되지 않도록 환경변수로만 활성화
+COUNTER_HOTSPOT = os.getenv("LOCUST_COUNTER_HOTSPOT") == "1"
+HOT_POST_IDS = [p for p in os.getenv("LOCUST_HOT_POST_IDS", "").split(",") if p] or [f"test-{i}" for i in range(1, 4)]
+
+
+class HotPostViewerUser(HttpUser):
+    """
+    게시글 몇 개에 상세 조회를 몰아서 보냄 (조회수 증가가 같은 행에 집중)
+    /api/posts/health의 counters.rpc_calls가 반영 주기당 1회씩만 늘어야 함
+    """
+    abstract = not COUNTER_HOTSPOT
+    wait_time = between(0.1, 0.5)
+
+    @task(10)
+    def view_hot_post(self):
+        self.client.get(f"/api/posts/{random.choice(HOT_POST_IDS)}", name="/api/posts/[hot id]")
+
+    @task(1)
+    def counter_stats(self):
+        self.client.get("/api/posts/health", name="/api/posts/health [counters]")
+
+
+# ============================================
+# 6. DB 읽기 집중 (Supabase 호출 실행 방식 비교)
+# ============================================
+
+DB_COMPARE = os.getenv("LOCUST_DB_COMPARE") == "1"
+
+
+class DBReadUser(HttpUser):
+    """
+    게시글 목록/상세를 대기 시간 짧게 반복 (요청마다 Supabase 왕복)
+    서버를 SUPABASE_EXECUTION=inline / thread로 각각 띄워서 /api/posts p95 비교
+    /api/posts/health의 db_pool로 스레드 풀 포화(saturation_rate, wait_ms_p95) 확인
+    """
+    abstract = not DB_COMPARE
+    wait_time = between(0.1, 0.3)
+
+    @task(5)
+    def list_posts(self):
+        self.client.get("/api/posts?page=1&page_size=20", name="/api/posts [db]")
+
+    @task(2)
+    def post_detail(self):
+        with self.client.get(
+            f"/api/posts/test-{random.randint(1, 50)}",
+            name="/api/posts/[id] [db]",
+            catch_response=True
+        ) as response:
+            if response.status_code in [200, 404]:
+                response.success()
+
+
 # ============================================
 # 이벤트 훅 (결과 출력)
 # ============================================
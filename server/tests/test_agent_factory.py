@@ -0,0 +1,157 @@
+"""
+Agent 팩토리 + 스트리밍 엔드포인트 테스트 (OpenAI 없이)
+
+- Tool 구성(shape)별로 AgentExecutor를 한 번만 생성, 개인화 Tool은 같은 이름의 기본 Tool을 대체
+- run_agent: user_id는 실행 시점에 바인딩 (executor 스레드 안)
+- POST /agent/stream 복잡 질문 경로: 가짜 스트리밍 LLM + 실제 AgentExecutor로 SSE 이벤트 끝까지 확인
+"""
+
+import asyncio
+import json
+from typing import Any, List, Optional
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from langchain.tools import Tool
+from langchain_core.language_models.llms import LLM
+
+from llm_service.routers import agent as agent_router
+from llm_service.tools import get_current_user_id
+from llm_service.utils.agent_factory import AgentFactory, run_agent
+
+
+class FakeStreamingLLM(LLM):
+    """
+    ReAct 출력을 4글자씩 토큰 콜백으로 흘려보내는 LLM 대역
+
+    scratchpad(프롬프트)에 Tool 호출이 없으면 Tool 호출, 있으면 최종 답변 (동시 실행해도 순서 무관)
+    """
+
+    responses: List[str]
+
+    @property
+    def _llm_type(self) -> str:
+        return "fake-streaming"
+
+    def _call(self, prompt: str, stop: Optional[List[str]] = None, run_manager: Any = None, **kwargs: Any) -> str:
+        text = self.responses[1 if self.responses[0] in prompt else 0]
+        if run_manager:
+            for i in range(0, len(text), 4):
+                run_manager.on_llm_new_token(text[i:i + 4])
+        return text
+
+
+REACT_RESPONSES = [
+    "Thought: 사용자 선호 팀을 확인해야 합니다.\nAction: fan_preference\nAction Input: 내 팀",
+    "Thought: 이제 답할 수 있습니다.\nFinal Answer: 토트넘 다음 경기는 토요일입니다.",
+]
+
+
+def _tools():
+    seen_users = []
+
+    def preference(query):
+        seen_users.append(get_current_user_id())
+        return "선호 팀: 토트넘"
+
+    base = [
+        Tool(name="rag_search", func=lambda q: "검색 결과 없음", description="RAG 검색"),
+        Tool(name="fan_preference", func=lambda q: "user_id 필요", description="사용자 선호 팀 조회"),
+    ]
+    personalized = [Tool(name="fan_preference", func=preference, description="사용자 선호 팀 조회")]
+    return base, personalized, seen_users
+
+
+@pytest.fixture
+def factory_and_users():
+    base, personalized, seen_users = _tools()
+    llm = FakeStreamingLLM(responses=REACT_RESPONSES)
+    factory = AgentFactory(base_tools=base, personalized_tools=personalized, llm=llm, verbose=False)
+    return factory, seen_users
+
+
+class TestAgentFactory:
+    """AgentFactory"""
+
+    def test_agent_cached_per_shape(self, factory_and_users):
+        factory, _ = factory_and_users
+
+        assert factory.get_agent() is factory.get_agent()
+        assert factory.get_agent(personalized=True) is factory.get_agent(personalized=True)
+        assert factory.get_agent(personalized=True, streaming=True) is not factory.get_agent(personalized=True)
+        assert factory.get_stats() == {"cached_agents": 3, "build_count": 3}
+
+    def test_personalized_tools_replace_base(self, factory_and_users):
+        factory, _ = factory_and_users
+        names = [tool.name for tool in factory.get_tools(personalized=True)]
+
+        assert names == ["rag_search", "fan_preference"]
+        assert factory.get_tools(personalized=True)[1] is factory.personalized_tools[0]
+
+    def test_run_agent_binds_user_id(self, factory_and_users):
+        factory, seen_users = factory_and_users
+        agent = factory.get_agent(personalized=True)
+
+        async def scenario():
+            loop = asyncio.get_running_loop()
+            return await asyncio.gather(*(
+                loop.run_in_executor(None, lambda uid=uid: run_agent(agent, "내 팀 경기?", user_id=uid))
+                for uid in ("u1", "u2")
+            ))
+
+        answers = asyncio.run(scenario())
+
+        assert answers == ["토트넘 다음 경기는 토요일입니다."] * 2
+        assert sorted(seen_users) == ["u1", "u2"]
+        assert get_current_user_id() is None
+
+
+class TestAgentStreamEndpoint:
+    """POST /agent/stream 복잡 질문 경로"""
+
+    @pytest.fixture
+    def app(self, monkeypatch, factory_and_users):
+        factory, _ = factory_and_users
+
+        async def complex_question(query, use_llm_fallback=True):
+            return True
+
+        monkeypatch.setattr(agent_router, "is_complex_question", complex_question)
+        monkeypatch.setattr(agent_router, "get_content_safety_service", lambda: None)
+        monkeypatch.setattr(agent_router, "get_agent_factory", lambda: factory)
+        app = FastAPI()
+        app.include_router(agent_router.router)
+        return app
+
+    def _events(self, app, body):
+        async def scenario():
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                response = await client.post("/agent/stream", json=body)
+                assert response.status_code == 200
+                return [
+                    json.loads(line[len("data: "):])
+                    for line in response.text.splitlines()
+                    if line.startswith("data: ")
+                ]
+
+        return asyncio.run(scenario())
+
+    def test_complex_query_streams_tools_and_answer(self, app, factory_and_users):
+        _, seen_users = factory_and_users
+
+        events = self._events(app, {"query": "내 팀의 다음 경기와 상대 전력을 비교 분석해줘", "user_id": "u1"})
+        types = [event["type"] for event in events]
+
+        assert "error" not in types, events
+        assert types[-2:] == ["answer_complete", "done"]
+        assert {"type": "tool_start", "tool": "fan_preference", "input": "내 팀"} in events
+        assert {"type": "tool_end", "tool": "fan_preference"} in events
+        answer_start = next(event for event in events if event["type"] == "answer_start")
+        assert answer_start["tools_used"] == ["fan_preference"]
+        answer = "".join(event["content"] for event in events if event["type"] == "answer_chunk")
+        assert answer == "토트넘 다음 경기는 토요일입니다."
+        # Thought/Action 토큰은 전송되지 않음
+        assert "Thought" not in answer and "Action" not in answer
+        assert seen_users == ["u1"]
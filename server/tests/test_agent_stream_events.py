@@ -0,0 +1,160 @@
+"""
+Agent 스트리밍 콜백 / 출력 필터 테스트
+
+- "Final Answer:" 접두어가 여러 토큰에 걸쳐 나와도 감지, Thought/Action 토큰은 숨김
+- StreamTextFilter: 토큰을 어떻게 나눠 보내도 전체 텍스트를 한 번에 마스킹한 결과와 같음
+  (여러 단어로 된 블랙리스트 포함)
+- 비스트리밍 Agent 응답의 tools_used는 실제 호출된 Tool (질문 키워드 추정 X)
+"""
+
+import asyncio
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+
+from llm_service.models import AgentRequest
+from llm_service.routers import agent as agent_router
+from llm_service.services.content_safety_service import ContentSafetyService
+from llm_service.utils.agent_stream import AgentStreamCallbackHandler, StreamTextFilter
+
+
+def _stream(tokens):
+    """콜백에 토큰을 흘려보내고 큐에 쌓인 이벤트 반환"""
+
+    async def scenario():
+        loop = asyncio.get_running_loop()
+        queue = asyncio.Queue()
+        handler = AgentStreamCallbackHandler(loop, queue)
+        handler.on_llm_start({}, ["prompt"])
+        for token in tokens:
+            handler.on_llm_new_token(token)
+        await asyncio.sleep(0)
+        return handler, _drain(queue)
+
+    return asyncio.run(scenario())
+
+
+def _drain(queue):
+    events = []
+    while not queue.empty():
+        events.append(queue.get_nowait())
+    return events
+
+
+class TestFinalAnswerDetection:
+    """최종 답변 토큰 감지"""
+
+    @pytest.mark.parametrize("tokens", [
+        ["Thought: 답할 수 있음\n", "Final Answer: ", "토트넘", "이 이겼습니다."],
+        ["Thought: 답할 수 있음\nFin", "al Ans", "wer", ":", " ", "토트넘이", " 이겼습니다."],
+        ["Thought: 답할 수 있음\nFinal Answer:\n토트넘이 이겼", "습니다."],
+        [c for c in "Thought: 답할 수 있음\nFinal Answer: 토트넘이 이겼습니다."],
+    ])
+    def test_prefix_split_across_tokens(self, tokens):
+        handler, events = _stream(tokens)
+
+        assert {event["type"] for event in events} == {"token"}
+        assert "".join(event["content"] for event in events) == "토트넘이 이겼습니다."
+        assert handler.streamed_answer
+
+    def test_intermediate_steps_hidden(self):
+        _, events = _stream(["Thought: 일정 조회\nAction: calendar\n", "Action Input: 토트넘"])
+
+        assert events == []
+
+    def test_tools_recorded_in_call_order(self):
+        async def scenario():
+            handler = AgentStreamCallbackHandler(asyncio.get_running_loop(), asyncio.Queue())
+            for name in ("calendar", "rag_search", "calendar"):
+                run_id = uuid4()
+                handler.on_tool_start({"name": name}, "입력", run_id=run_id)
+                handler.on_tool_end("결과", run_id=run_id)
+            await asyncio.sleep(0)
+            return handler
+
+        handler = asyncio.run(scenario())
+
+        assert handler.tools_used == ["calendar", "rag_search"]
+        assert [event["type"] for event in _drain(handler.queue)] == ["tool_start", "tool_end"] * 3
+
+
+@pytest.fixture
+def safety():
+    service = ContentSafetyService(use_llm=False)
+    service.custom_blacklist = ["내부 기밀 문서", "비공개 전술"]
+    service._compile_rules()
+    return service
+
+
+TEXT = (
+    "이번 경기는 내부 기밀 문서에 따르면 비공개 전술을 썼고 "
+    "관련 문의는 https://spam.example.com/buy 로 하라는 광고가 붙었습니다.\n"
+    "결과는 2대1 승리입니다."
+)
+
+
+class TestStreamTextFilter:
+    """스트리밍 출력 필터"""
+
+    @pytest.mark.parametrize("size", [1, 2, 3, 5, 8])
+    def test_chunked_equals_whole_text(self, safety, size):
+        text_filter = StreamTextFilter.for_service(safety)
+        out = [text_filter.feed(TEXT[i:i + size]) for i in range(0, len(TEXT), size)]
+        out.append(text_filter.flush())
+
+        assert "".join(out) == safety.filter_text(TEXT)
+        assert "기밀" not in "".join(out) and "비공개" not in "".join(out)
+
+    def test_whitespace_cut_alone_leaks_multi_word_pattern(self, safety):
+        """공백 경계만 쓰면 여러 단어 금지어가 나뉘어 마스킹되지 않음 (holdback 필요한 이유)"""
+        text_filter = StreamTextFilter(safety.filter_text)
+        out = "".join(text_filter.feed(token) for token in ["자료는 내부 ", "기밀 ", "문서 입니다"]) + text_filter.flush()
+
+        assert "기밀" in out
+
+    def test_holds_back_longest_pattern(self, safety):
+        text_filter = StreamTextFilter.for_service(safety)
+
+        assert text_filter.holdback == len("내부 기밀 문서") - 1
+        assert text_filter.feed("안녕하세요 ") == ""
+        assert text_filter.feed("오늘 경기는 ") == "안녕하세요 "
+
+    def test_no_service_passthrough(self):
+        text_filter = StreamTextFilter.for_service(None)
+
+        assert text_filter.feed("그대로 ") == "그대로 "
+        assert text_filter.flush() == ""
+
+
+class FakeAgent:
+    """Tool 두 개를 호출한 것처럼 콜백만 부르는 Agent 대역"""
+
+    def run(self, prompt, callbacks=None):
+        for name in ("calendar", "weather"):
+            run_id = uuid4()
+            for callback in callbacks or []:
+                callback.on_tool_start({"name": name}, "입력", run_id=run_id)
+                callback.on_tool_end("결과", run_id=run_id)
+        return "토요일 경기, 맑음"
+
+
+class TestAgentChatToolsUsed:
+    """POST /agent tools_used"""
+
+    def test_tools_used_from_callback(self, monkeypatch):
+        async def complex_question(query, use_llm_fallback=True):
+            return True
+
+        factory = SimpleNamespace(get_agent=lambda personalized=False, streaming=False: FakeAgent())
+        monkeypatch.setattr(agent_router, "is_complex_question", complex_question)
+        monkeypatch.setattr(agent_router, "get_agent_factory", lambda: factory)
+        monkeypatch.setattr(agent_router, "get_content_safety_service", lambda: None)
+        monkeypatch.setattr(agent_router, "get_cache_service", lambda: None)
+        monkeypatch.setattr(agent_router, "get_openai_service", lambda: SimpleNamespace(count_tokens=len))
+
+        # 키워드 추정이었다면 "게시글"/"비교"로 posts_search, player_compare가 들어감
+        response = asyncio.run(agent_router.agent_chat(AgentRequest(query="게시글 말고 두 팀 경기 날씨 비교해줘")))
+
+        assert response.tools_used == ["calendar", "weather"]
+        assert response.answer == "토요일 경기, 맑음"
@@ -0,0 +1,87 @@
+"""
+앱 시작 테스트 (지연 import / 라우터 격리)
+
+- llm_service, llm_service.services: 패키지 import만으로 LangChain/Chroma를 로드하지 않고,
+  export는 첫 접근 시 실제 객체로 해석
+- main: 라우터 하나의 import가 실패해도 나머지 라우터는 등록
+  (llm_service.routers 패키지도 지연 export, 새 인터프리터에서 실행 → 이 프로세스에 영향 없음)
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+SERVER_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _run(code: str) -> dict:
+    """새 인터프리터에서 code 실행 후 마지막 줄의 JSON 반환"""
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=SERVER_DIR,
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    assert result.returncode == 0, result.stderr[-2000:]
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+class TestLazyExports:
+    """패키지 __getattr__ 지연 export"""
+
+    def test_package_import_does_not_load_heavy_modules(self):
+        result = _run(
+            "import json, sys\n"
+            "import llm_service, llm_service.services\n"
+            "print(json.dumps({name: name in sys.modules for name in "
+            "['langchain', 'chromadb', 'llm_service.services.rag_service']}))"
+        )
+
+        assert result == {"langchain": False, "chromadb": False, "llm_service.services.rag_service": False}
+
+    @pytest.mark.parametrize("package, name, module", [
+        ("llm_service", "RAGService", "llm_service.services.rag_service"),
+        ("llm_service", "OpenAIService", "llm_service.services.openai_service"),
+        ("llm_service.services", "get_cache_service", "llm_service.services.cache_service"),
+        ("llm_service.services", "get_player_stats_store", "llm_service.services.player_stats_store"),
+    ])
+    def test_exports_resolve(self, package, name, module):
+        import importlib
+
+        assert getattr(importlib.import_module(package), name) is getattr(importlib.import_module(module), name)
+
+    def test_router_exports_resolve(self):
+        from llm_service import routers
+        from llm_service.routers import chat
+
+        assert routers.chat_router is chat.router
+
+    def test_all_exports_listed(self):
+        import llm_service.services as services
+
+        assert sorted(services.__all__) == sorted(services._LAZY_EXPORTS)
+        with pytest.raises(AttributeError):
+            services.NotAService
+
+
+class TestRouterIsolation:
+    """main._import_router"""
+
+    def test_other_routers_mount_when_one_import_fails(self):
+        # sys.modules에 None을 넣으면 해당 모듈 import가 ImportError
+        result = _run(
+            "import json, sys\n"
+            "sys.modules['llm_service.routers.player_compare'] = None\n"
+            "import main\n"
+            "paths = {route.path for route in main.app.routes}\n"
+            "print(json.dumps({'compare_router': main.compare_router, 'paths': sorted(paths)}))"
+        )
+
+        assert result["compare_router"] is None
+        assert not any(path.startswith("/api/llm/player") for path in result["paths"])
+        for path in ("/api/llm/chat", "/api/llm/match/health", "/api/llm/agent", "/api/stats/leagues", "/api/posts"):
+            assert path in result["paths"]
@@ -0,0 +1,337 @@
+"""
+스레드형 댓글 로더 테스트 (Supabase 없이)
+
+- 스레드 조립: 최상위/답글 순서 무관, 답글 N개 + 전체 답글 수 + 나머지 답글 커서
+- 커서로 끝까지 넘기면 기존 전체 조회의 최상위 댓글 순서와 같음 (RPC 1번 / 쿼리 2개)
+- 첫 페이지 캐시: 댓글 쓰기 시 무효화 (좋아요는 버퍼가 DB에 반영한 뒤에), 동시 미스 합치기, 조회 중 무효화
+- posts.comment_count 원자적 증감 (동시 작성, 대댓글 포함 삭제, 중복 삭제, RPC 오류 시 중복 적용 없음)
+- RPC가 없을 때(PGRST202)만 대체 경로로 전환
+"""
+
+import asyncio
+
+import pytest
+
+from backend import comment_threads as comment_threads_module
+from backend.comment_threads import CommentThreadLoader, assemble_threads
+from backend.counter_buffer import CounterBuffer
+from backend.models import CommentCreate, UserResponse
+from backend.routers import posts as posts_router
+from tests.conftest import FakeSupabaseClient
+
+
+def _comments_db(comments, rpc=True):
+    """posts/comments 테이블 + comment_threads / adjust_comment_count RPC 대역"""
+    db = FakeSupabaseClient(
+        {"posts": [{"post_id": "p1", "comment_count": len(comments)}], "comments": comments},
+        rpcs={"increment_comment_count": lambda params: None},
+        defaults={"comments": {"is_deleted": False}},
+    )
+
+    def adjust_comment_count(params):
+        post = next(p for p in db.tables["posts"] if p["post_id"] == params["p_post_id"])
+        post["comment_count"] = max(post["comment_count"] + params["p_delta"], 0)
+        return post["comment_count"]
+
+    def comment_threads(params):
+        live = sorted(
+            (c for c in db.tables["comments"] if c["post_id"] == params["p_post_id"] and not c["is_deleted"]),
+            key=lambda c: (c["created_at"], c["comment_id"]),
+        )
+        after = (params["p_after_created_at"], params["p_after_id"])
+        top = [c for c in live if c["parent_comment_id"] is None and (after[0] is None or (c["created_at"], c["comment_id"]) > after)]
+        top = top[:params["p_limit"] + 1]
+        rows = []
+        for parent in top:
+            replies = [c for c in live if c["parent_comment_id"] == parent["comment_id"]]
+            rows.append({**parent, "reply_count": len(replies)})
+        for parent in top:
+            rows += [c for c in live if c["parent_comment_id"] == parent["comment_id"]][:params["p_replies"]]
+        return [dict(r) for r in rows]
+
+    if rpc:
+        db.rpcs.update(adjust_comment_count=adjust_comment_count, comment_threads=comment_threads)
+    return db
+
+
+def _fail_next(db, name, error, applied=False):
+    """다음 한 번의 RPC 호출을 오류로 (applied=True: DB는 반영했지만 응답을 못 받음)"""
+    handler = db.rpcs[name]
+
+    def fail(params):
+        db.rpcs[name] = handler
+        if applied:
+            handler(params)
+        raise error
+
+    db.rpcs[name] = fail
+
+
+def _reads(db):
+    """댓글 조회 횟수 (comments 조회 + comment_threads RPC)"""
+    return len(db.selects("comments")) + sum(name == "comment_threads" for name, _ in db.rpc_calls)
+
+
+def _comments(n_top, replies_of=lambda i: i % 5):
+    comments = []
+    for i in range(n_top):
+        # created_at이 같은 최상위 댓글이 섞이도록 (2개씩 같은 시각)
+        comments.append(_comment(f"c{i:03d}", f"2025-01-01T10:{i // 2:02d}:00"))
+        for j in range(replies_of(i)):
+            comments.append(_comment(f"c{i:03d}-r{j}", f"2025-01-01T11:{i:02d}:{j:02d}", parent=f"c{i:03d}"))
+    return comments
+
+
+def _comment(comment_id, created_at, parent=None):
+    return {
+        "comment_id": comment_id, "post_id": "p1", "author_id": "u1", "author_username": "tester",
+        "content": f"댓글 {comment_id}", "likes": 0, "parent_comment_id": parent,
+        "created_at": created_at, "updated_at": None, "is_deleted": False,
+    }
+
+
+USER = UserResponse(uid="u1", email="u1@example.com", username="tester", created_at="2025-01-01T00:00:00")
+
+
+@pytest.fixture
+def loader(monkeypatch):
+    loader = CommentThreadLoader(maxsize=100, ttl_seconds=60)
+    monkeypatch.setattr(comment_threads_module, "_comment_thread_loader", loader)
+    monkeypatch.setattr(posts_router, "get_content_safety_service", lambda: None)
+    return loader
+
+
+def _threads(db, limit=10, replies=2, cursor=None):
+    return asyncio.run(posts_router.get_comment_threads("p1", limit=limit, replies=replies, cursor=cursor, db=db))
+
+
+def _add(db, content="새 댓글입니다", parent=None):
+    return posts_router.add_comment("p1", CommentCreate(content=content, parent_comment_id=parent), current_user=USER, db=db)
+
+
+class TestAssemble:
+    """스레드 조립"""
+
+    def test_single_pass_any_order(self):
+        rows = _comments(3, replies_of=lambda i: [4, 0, 1][i])
+        # 답글이 부모보다 먼저 와도, 부모 없는 답글이 섞여도 됨
+        rows = [r for r in rows if r["parent_comment_id"]] + [r for r in rows if not r["parent_comment_id"]]
+        rows.append(_comment("orphan", "2025-01-01T12:00:00", parent="gone"))
+
+        threads = assemble_threads(rows, replies_per_thread=2)
+
+        assert [t["comment"]["comment_id"] for t in threads] == ["c000", "c001", "c002"]
+        assert [[r["comment_id"] for r in t["replies"]] for t in threads] == [["c000-r0", "c000-r1"], [], ["c002-r0"]]
+        assert [t["reply_count"] for t in threads] == [4, 0, 1]
+        assert [t["next_reply_cursor"] is not None for t in threads] == [True, False, False]
+
+
+class TestThreadRoutes:
+    """GET /{post_id}/comments/threads, /replies"""
+
+    @pytest.mark.parametrize("rpc", [True, False])
+    def test_cursor_walk_matches_full_listing(self, loader, rpc):
+        db = _comments_db(_comments(45), rpc=rpc)
+        legacy = asyncio.run(posts_router.get_comments("p1", limit=None, cursor=None, count="none", db=db))
+        expected_top = [c.comment_id for c in legacy.comments if c.parent_comment_id is None]
+        reads = _reads(db)
+
+        seen, cursor, pages = [], None, 0
+        while True:
+            response = _threads(db, limit=10, replies=2, cursor=cursor)
+            pages += 1
+            for thread in response.threads:
+                seen.append(thread.comment.comment_id)
+                i = int(thread.comment.comment_id[1:])
+                assert thread.reply_count == i % 5
+                assert [r.comment_id for r in thread.replies] == [f"c{i:03d}-r{j}" for j in range(min(i % 5, 2))]
+            cursor = response.next_cursor
+            if not cursor:
+                break
+
+        assert seen == expected_top
+        assert pages == 5
+        assert _reads(db) - reads == pages * (1 if rpc else 2)
+        assert loader.get_stats()["loads"] == ({"rpc": 5, "queries": 0} if rpc else {"rpc": 0, "queries": 5})
+
+    def test_remaining_replies_via_reply_cursor(self, loader):
+        db = _comments_db(_comments(5, replies_of=lambda i: 7 if i == 0 else 0))
+        thread = _threads(db, replies=3).threads[0]
+
+        replies, cursor = [r.comment_id for r in thread.replies], thread.next_reply_cursor
+        while cursor:
+            page = asyncio.run(posts_router.get_comment_replies("p1", "c000", limit=2, cursor=cursor, db=db))
+            replies += [r.comment_id for r in page.comments]
+            cursor = page.next_cursor
+
+        assert replies == [f"c000-r{j}" for j in range(7)]
+
+
+class TestFirstPageCache:
+    """첫 페이지 캐시"""
+
+    def test_cached_until_comment_write(self, loader):
+        db = _comments_db(_comments(5))
+
+        def loads():
+            return loader.get_stats()["loads"]["rpc"]
+
+        for _ in range(3):
+            _threads(db)
+        assert loads() == 1
+
+        asyncio.run(_add(db, parent="c000"))
+        first = _threads(db).threads[0]
+        assert loads() == 2
+        assert first.reply_count == 1 and first.replies[0].content == "새 댓글입니다"
+
+        # 다음 페이지는 캐시하지 않음
+        cursor = _threads(db, limit=2).next_cursor
+        _threads(db, limit=2, cursor=cursor)
+        _threads(db, limit=2, cursor=cursor)
+        assert loads() == 5
+
+    def test_like_invalidates_after_counter_flush(self, loader, monkeypatch):
+        db = _comments_db(_comments(5))
+
+        def increment_counters(params):
+            for update in params["updates"]:
+                row = next(c for c in db.tables["comments"] if c["comment_id"] == update["id"])
+                row["likes"] += update["deltas"]["likes"]
+
+        db.rpcs["increment_counters"] = increment_counters
+        counters = CounterBuffer(db_getter=lambda: db)
+        counters.add_flush_listener(loader.counters_flushed)
+        monkeypatch.setattr(posts_router, "get_counter_buffer", lambda: counters)
+
+        def likes():
+            return [t.comment.likes for t in _threads(db).threads[:2]]
+
+        def loads():
+            return loader.get_stats()["loads"]["rpc"]
+
+        assert likes() == [0, 0]
+        for _ in range(3):
+            asyncio.run(posts_router.like_comment("p1", "c001", current_user=USER, db=db))
+            assert likes()[1] == counters.buffered("comments", "c001", "likes")
+        assert loads() == 1  # 좋아요마다 다시 조회하지 않음 (버퍼 증가분을 얹어서 응답)
+
+        asyncio.run(counters.flush())
+
+        # 반영 직후 무효화 → DB 값으로 다시 조회, 값이 뒤로 가지 않음
+        assert likes() == [0, 3]
+        assert loads() == 2
+        assert loader.get_stats()["liked_comments"] == 0
+
+    def test_concurrent_misses_coalesced(self, loader):
+        db = _comments_db(_comments(5))
+
+        async def run():
+            return await asyncio.gather(*(
+                posts_router.get_comment_threads("p1", limit=10, replies=2, cursor=None, db=db) for _ in range(10)
+            ))
+
+        responses = asyncio.run(run())
+
+        assert {len(r.threads) for r in responses} == {5}
+        assert _reads(db) == 1
+        assert loader.get_stats()["coalesced"] == 9
+
+    def test_invalidate_during_load_skips_store(self, loader):
+        db = _comments_db(_comments(3))
+        comment_threads = db.rpcs["comment_threads"]
+
+        def invalidating(params):
+            loader.invalidate("p1")  # 조회 도중 댓글 작성
+            return comment_threads(params)
+
+        db.rpcs["comment_threads"] = invalidating
+        _threads(db)
+        _threads(db)
+
+        assert loader.get_stats()["loads"]["rpc"] == 2
+
+    def test_invalidation_state_not_kept_per_post(self, loader):
+        db = _comments_db(_comments(3))
+        _threads(db)
+        for i in range(100):
+            loader.invalidate(f"p{i}")
+
+        assert loader._loading == {}
+        assert loader.get_stats()["first_pages"]["size"] == 0
+        _threads(db)
+        _threads(db)
+        assert loader.get_stats()["loads"]["rpc"] == 2
+
+
+class TestCommentCount:
+    """posts.comment_count"""
+
+    def test_concurrent_adds_all_counted(self, loader):
+        db = _comments_db([])
+
+        async def run():
+            await asyncio.gather(*(_add(db, content=f"동시 댓글 {i}") for i in range(20)))
+
+        asyncio.run(run())
+
+        assert db.tables["posts"][0]["comment_count"] == 20
+
+    def test_delete_counts_replies_once(self, loader):
+        db = _comments_db(_comments(3, replies_of=lambda i: 2))
+        assert db.tables["posts"][0]["comment_count"] == 9
+
+        for _ in range(2):
+            asyncio.run(posts_router.delete_comment("p1", "c000", current_user=USER, db=db))
+
+        assert db.tables["posts"][0]["comment_count"] == 6
+        assert [t.comment.comment_id for t in _threads(db).threads] == ["c001", "c002"]
+
+    def test_rpc_error_after_commit_not_reapplied(self, loader):
+        db = _comments_db([])
+        _fail_next(db, "adjust_comment_count", TimeoutError("read timeout"), applied=True)
+
+        asyncio.run(_add(db))
+        asyncio.run(_add(db))
+
+        # 타임아웃 난 호출을 읽고 쓰기로 다시 적용하지 않고, 다음 호출도 RPC 사용
+        assert db.tables["posts"][0]["comment_count"] == 2
+        stats = loader.get_stats()
+        assert stats["count_rpc_available"] is True
+        assert stats["rpc_errors"] == 1
+
+    def test_missing_rpc_falls_back_to_read_write(self, loader):
+        db = _comments_db([], rpc=False)
+
+        asyncio.run(_add(db))
+        asyncio.run(_add(db))
+
+        assert db.tables["posts"][0]["comment_count"] == 2
+        assert loader.get_stats()["count_rpc_available"] is False
+
+
+class TestThreadsRpcErrors:
+    """comment_threads RPC 오류"""
+
+    def test_transient_error_keeps_rpc(self, loader):
+        db = _comments_db(_comments(3))
+        _fail_next(db, "comment_threads", ConnectionError("connection reset"))
+
+        assert len(_threads(db).threads) == 3  # 이번 조회만 쿼리 2개로
+        loader.invalidate("p1")
+        _threads(db)
+
+        stats = loader.get_stats()
+        assert stats["rpc_available"] is True
+        assert stats["loads"] == {"rpc": 1, "queries": 1}
+
+    def test_missing_rpc_downgrades(self, loader):
+        db = _comments_db(_comments(3), rpc=False)
+
+        _threads(db)
+        loader.invalidate("p1")
+        _threads(db)
+
+        stats = loader.get_stats()
+        assert stats["rpc_available"] is False
+        assert stats["loads"] == {"rpc": 0, "queries": 2}
@@ -0,0 +1,228 @@
+"""
+ContentSafetyService 비동기 LLM 검사 테스트 (가짜 AsyncOpenAI 클라이언트)
+
+- 판정 캐시 (정규화 텍스트 해시), 동시 같은 텍스트 합치기, 동시 호출 수 제한
+- begin_check: 기본 모드는 LLM까지 확인, optimistic 모드는 백그라운드로 진행
+"""
+
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from llm_service.services import content_safety_service as safety_module
+from llm_service.services.content_safety_service import ContentCategory, ContentSafetyService
+
+
+class FakeCompletions:
+    """chat.completions.create 대역 (지연 + 동시 실행 수 기록)"""
+
+    def __init__(self, delay: float = 0.05, unsafe_words=("나쁜말",), fail: bool = False):
+        self.delay = delay
+        self.unsafe_words = unsafe_words
+        self.fail = fail
+        self.calls = 0
+        self.active = 0
+        self.max_active = 0
+
+    async def create(self, **kwargs):
+        self.calls += 1
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(self.delay)
+            if self.fail:
+                raise RuntimeError("upstream down")
+        finally:
+            self.active -= 1
+
+        prompt = kwargs["messages"][-1]["content"]
+        if "카테고리를 자동으로 분류" in prompt:
+            content = '"축구분석"'
+        elif any(word in prompt for word in self.unsafe_words):
+            content = json.dumps({"is_safe": False, "category": "profanity", "reason": "욕설", "detected_phrases": ["나쁜말"]})
+        else:
+            content = '```json\n{"is_safe": true, "category": "safe", "reason": "안전"}\n```'
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+
+def _service(fake: FakeCompletions, optimistic: bool = False) -> ContentSafetyService:
+    service = ContentSafetyService(use_llm=False, optimistic=optimistic)
+    service.use_llm = True
+    service.async_llm_client = SimpleNamespace(chat=SimpleNamespace(completions=fake))
+    return service
+
+
+class TestCheckInputAsync:
+    """판정 캐시 / 합치기 / 동시 호출 제한"""
+
+    def test_unsafe_verdict(self):
+        fake = FakeCompletions()
+        service = _service(fake)
+
+        result = asyncio.run(service.check_input_async("이 나쁜말 좀 봐"))
+
+        assert not result.is_safe
+        assert result.category == ContentCategory.PROFANITY
+
+    def test_verdict_cached_by_normalized_text(self):
+        fake = FakeCompletions()
+        service = _service(fake)
+
+        async def run():
+            first = await service.check_input_async("손흥민 최근 폼은?")
+            second = await service.check_input_async("  손흥민   최근 폼은?  ")
+            return first, second
+
+        first, second = asyncio.run(run())
+
+        assert first.is_safe and second.is_safe
+        assert fake.calls == 1
+
+    def test_concurrent_same_text_shares_one_call(self):
+        fake = FakeCompletions()
+        service = _service(fake)
+
+        async def run():
+            return await asyncio.gather(*(service.check_input_async("토트넘 다음 경기") for _ in range(10)))
+
+        results = asyncio.run(run())
+
+        assert all(r.is_safe for r in results)
+        assert fake.calls == 1
+
+    def test_bounded_concurrency(self, monkeypatch):
+        monkeypatch.setattr(safety_module, "CONTENT_SAFETY_LLM_CONCURRENCY", 2)
+        fake = FakeCompletions(delay=0.02)
+        service = _service(fake)
+
+        async def run():
+            await asyncio.gather(*(service.check_input_async(f"질문 {i}") for i in range(8)))
+
+        asyncio.run(run())
+
+        assert fake.calls == 8
+        assert fake.max_active == 2
+
+    def test_rule_hit_skips_llm(self):
+        fake = FakeCompletions()
+        service = _service(fake)
+
+        result = asyncio.run(service.check_input_async("시발 이게 뭐야"))
+
+        assert result.category == ContentCategory.PROFANITY
+        assert fake.calls == 0
+
+    def test_errors_fail_open_and_are_not_cached(self):
+        fake = FakeCompletions(fail=True)
+        service = _service(fake)
+
+        async def run():
+            first = await service.check_input_async("아스널 전술")
+            second = await service.check_input_async("아스널 전술")
+            return first, second
+
+        first, second = asyncio.run(run())
+
+        assert first.is_safe and second.is_safe
+        assert fake.calls == 2
+
+    def test_does_not_block_event_loop(self):
+        """LLM 검사 중에도 다른 코루틴이 진행"""
+        fake = FakeCompletions(delay=0.1)
+        service = _service(fake)
+
+        async def run():
+            ticks = 0
+
+            async def ticker():
+                nonlocal ticks
+                while True:
+                    await asyncio.sleep(0.01)
+                    ticks += 1
+
+            task = asyncio.ensure_future(ticker())
+            await service.check_input_async("리버풀 경기 결과")
+            task.cancel()
+            return ticks
+
+        assert asyncio.run(run()) >= 5
+
+
+class TestBeginCheck:
+    """기본 / optimistic 모드"""
+
+    def test_default_mode_waits_for_llm(self):
+        fake = FakeCompletions()
+        service = _service(fake)
+
+        async def run():
+            check = await service.begin_check("이 나쁜말 좀 봐")
+            return check.pending, check.current
+
+        pending, current = asyncio.run(run())
+
+        assert not pending
+        assert not current.is_safe
+
+    def test_optimistic_mode_returns_before_llm(self):
+        fake = FakeCompletions(delay=0.05)
+        service = _service(fake, optimistic=True)
+
+        async def run():
+            check = await service.begin_check("이 나쁜말 좀 봐")
+            before = (check.pending, check.current.is_safe)
+            final = await check.result()
+            return before, final, check.current
+
+        (pending, safe_before), final, current = asyncio.run(run())
+
+        assert pending and safe_before
+        assert not final.is_safe
+        assert current is final
+
+    def test_optimistic_mode_uses_cached_verdict(self):
+        fake = FakeCompletions()
+        service = _service(fake, optimistic=True)
+
+        async def run():
+            await service.check_input_async("이 나쁜말 좀 봐")
+            check = await service.begin_check("이 나쁜말 좀 봐")
+            return check.pending, check.current
+
+        pending, current = asyncio.run(run())
+
+        assert not pending
+        assert not current.is_safe
+        assert fake.calls == 1
+
+    def test_rule_hit_is_immediate(self):
+        fake = FakeCompletions()
+        service = _service(fake, optimistic=True)
+
+        check = asyncio.run(service.begin_check("카톡 주세요"))
+
+        assert check.current.category == ContentCategory.SPAM
+        assert fake.calls == 0
+
+
+class TestClassifyCategoryAsync:
+    """게시글 카테고리 분류"""
+
+    def test_classify_cached(self):
+        fake = FakeCompletions()
+        service = _service(fake)
+
+        async def run():
+            first = await service.classify_category_async("아스널 전술", "4-3-3 분석")
+            second = await service.classify_category_async("아스널 전술", "4-3-3 분석")
+            return first, second
+
+        assert asyncio.run(run()) == ("축구분석", "축구분석")
+        assert fake.calls == 1
+
+    def test_without_llm(self):
+        service = ContentSafetyService(use_llm=False)
+
+        assert asyncio.run(service.classify_category_async("제목", "내용")) == "general"
@@ -0,0 +1,156 @@
+"""
+ContentSafetyService 규칙 매칭 테스트 (LLM 없이)
+
+- 컴파일된 규칙이 기존 순차 검사와 같은 우선순위로 카테고리 판정
+- 커스텀 블랙리스트 Aho-Corasick 검색/마스킹
+"""
+
+import logging
+import re
+
+import pytest
+
+from llm_service.services.content_safety_service import (
+    ContentCategory,
+    ContentSafetyService,
+    _search_core,
+)
+from llm_service.utils.aho_corasick import AhoCorasick
+
+
+@pytest.fixture
+def service():
+    return ContentSafetyService(use_llm=False)
+
+
+def _with_blacklist(service, words):
+    service.custom_blacklist = words
+    service._compile_rules()
+    return service
+
+
+class TestAhoCorasick:
+    """다중 문자열 검색"""
+
+    def test_overlapping_matches(self):
+        automaton = AhoCorasick(["he", "she", "hers", "his"])
+
+        found = {(start, end, automaton.words[i]) for start, end, i in automaton.finditer("ushers")}
+
+        assert found == {(1, 4, "she"), (2, 4, "he"), (2, 6, "hers")}
+
+    def test_case_insensitive_and_korean(self):
+        automaton = AhoCorasick(["내부문서", "SECRET"])
+
+        assert automaton.search("이건 내부문서, Secret 자료") == [0, 1]
+        assert automaton.search("공개 자료") == []
+
+    def test_empty(self):
+        automaton = AhoCorasick(["", ""])
+
+        assert not automaton
+        assert list(automaton.finditer("아무 글")) == []
+
+
+class TestSearchCore:
+    """매칭 여부 판정용 패턴"""
+
+    def test_strips_optional_repeats(self):
+        assert _search_core(re.compile(r"[가-힣]*판매.*[가-힣]*")).pattern == "판매"
+
+    def test_keeps_required_parts(self):
+        for pattern in [r"(시|씨)발", r"[0-9]{3,}-[0-9]{3,}-[0-9]{4,}", r"abc\.*", r".*"]:
+            assert _search_core(re.compile(pattern)).pattern == pattern
+
+
+class TestCheckInput:
+    """카테고리 판정"""
+
+    @pytest.mark.parametrize("text, category", [
+        ("시발 심판 판정 진짜", ContentCategory.PROFANITY),
+        ("What the FUCK was that", ContentCategory.PROFANITY),
+        ("일본놈 어쩌고", ContentCategory.HATE_SPEECH),
+        ("이건 자살골이다", ContentCategory.HARMFUL),
+        ("중고판매합니다 카톡 주세요", ContentCategory.SPAM),
+        ("연락처 010-1234-5678", ContentCategory.SPAM),
+    ])
+    def test_categories(self, service, text, category):
+        result = service.check_input(text, use_llm_fallback=False)
+
+        assert not result.is_safe
+        assert result.category == category
+
+    def test_safe_text(self, service):
+        result = service.check_input("손흥민의 최근 폼이 어떤가요?", use_llm_fallback=False)
+
+        assert result.is_safe
+        assert result.category is None
+
+    def test_rule_priority_not_position(self, service):
+        """텍스트 앞쪽의 스팸보다 뒤쪽의 욕설이 우선 (기존 순차 검사와 동일)"""
+        result = service.check_input("광고 문의 주세요 시발", use_llm_fallback=False)
+
+        assert result.category == ContentCategory.PROFANITY
+        assert result.reason == "profanity 패턴 감지"
+
+    def test_overlapping_spam_does_not_hide_harmful(self, service):
+        """'[가-힣]*만남'이 덮는 구간 안의 '자살'도 감지"""
+        result = service.check_input("하자살인만남", use_llm_fallback=False)
+
+        assert result.category == ContentCategory.HARMFUL
+
+    def test_detected_words_are_full_matches(self, service):
+        result = service.check_input("씨발 시발", use_llm_fallback=False)
+
+        assert result.detected_words == ["씨발", "시발"]
+
+    def test_spam_reason(self, service):
+        result = service.check_input("중고판매", use_llm_fallback=False)
+
+        assert result.reason == "스팸 패턴 감지"
+        assert result.detected_words == ["중고판매"]
+
+    def test_blacklist_first_in_list_order(self, service):
+        _with_blacklist(service, ["내부문서", "기밀정보"])
+
+        result = service.check_input("기밀정보가 담긴 내부문서", use_llm_fallback=False)
+
+        assert result.category == ContentCategory.HARMFUL
+        assert result.detected_words == ["내부문서"]
+
+    def test_blacklist_from_env(self, monkeypatch):
+        from llm_service.services import content_safety_service
+
+        monkeypatch.setattr(content_safety_service, "CONTENT_SAFETY_BLACKLIST", "기밀정보, 내부문서 ,")
+        service = ContentSafetyService(use_llm=False)
+
+        assert service.custom_blacklist == ["기밀정보", "내부문서"]
+        assert not service.check_input("기밀정보 유출", use_llm_fallback=False).is_safe
+
+    def test_invalid_pattern_is_skipped(self, service, caplog):
+        service.spam_patterns = service.spam_patterns + ["([잘못된"]
+
+        with caplog.at_level(logging.WARNING):
+            service._compile_rules()
+
+        assert "정규식 패턴 오류" in caplog.text
+        assert service.check_input("중고판매", use_llm_fallback=False).category == ContentCategory.SPAM
+
+
+class TestFilterText:
+    """마스킹"""
+
+    def test_clean_text_unchanged(self, service):
+        text = "오늘 토트넘 경기 정말 재미있었습니다."
+
+        assert service.filter_text(text) == text
+
+    def test_masks_patterns(self, service):
+        assert service.filter_text("와 시발 진짜") == "와 *** 진짜"
+        assert service.filter_text("연락 010-1234-5678") == "*** ***"
+
+    def test_masks_overlapping_blacklist_once(self, service):
+        _with_blacklist(service, ["기밀정보", "정보유출", "SECRET"])
+
+        assert service.filter_text("이건 기밀정보유출 건") == "이건 *** 건"
+        assert service.filter_text("Top Secret 자료") == "Top *** 자료"
@@ -0,0 +1,278 @@
+"""
+조회수/좋아요 write-behind 카운터 버퍼 테스트 (Supabase 없이)
+
+- 증가분은 메모리에서 합산, 반영은 RPC 한 번 (행별 delta)
+- 읽기 경로는 반영 전/반영 중 증가분 포함
+- 반영 실패 시 증가분 보존 → 다음 반영에서 재시도, 종료 시 남은 증가분 반영
+- 응답을 못 받은 배치(읽기 타임아웃)는 반영된 것으로 보고 재시도하지 않음 (중복 반영 없음)
+- RPC 미배포(PGRST202)면 행별 update로 반영, 일시 오류로는 RPC를 포기하지 않음, 버퍼 행 수 상한
+- get_post / like_comment는 update 없이 버퍼만 사용
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import httpx
+import pytest
+from postgrest.exceptions import APIError
+
+from backend.counter_buffer import CounterBuffer
+from backend.db_executor import is_unconfirmed_write_error
+from backend.routers import posts as posts_router
+from tests.conftest import FakeSupabaseClient
+
+
+def _rpc_db():
+    """increment_counters가 배포된 DB (성공한 호출은 db.rpc_calls에 기록)"""
+    return FakeSupabaseClient(rpcs={"increment_counters": lambda params: None})
+
+
+def _fail_rpc(db):
+    db.rpc_errors["increment_counters"] = RuntimeError("rpc down")
+
+
+def _updates(db):
+    return [q for q in db.queries if q.action == "update"]
+
+
+class TestCounterBuffer:
+    """버퍼 합산 / 반영"""
+
+    def test_increments_aggregate_into_one_rpc(self):
+        db = _rpc_db()
+        buffer = CounterBuffer(db_getter=lambda: db)
+
+        for _ in range(100):
+            buffer.increment("posts", "p1", "views")
+        buffer.increment("posts", "p2", "views", 3)
+        buffer.increment("comments", "c1", "likes")
+
+        assert asyncio.run(buffer.flush()) == 3
+        assert len(db.rpc_calls) == 1
+        name, params = db.rpc_calls[0]
+        assert name == "increment_counters"
+        assert params["updates"] == [
+            {"table": "comments", "id": "c1", "deltas": {"likes": 1}},
+            {"table": "posts", "id": "p1", "deltas": {"views": 100}},
+            {"table": "posts", "id": "p2", "deltas": {"views": 3}},
+        ]
+        assert buffer.buffered("posts", "p1", "views") == 0
+        assert buffer.get_stats()["increments"] == 102
+
+    def test_read_path_includes_buffered_value(self):
+        buffer = CounterBuffer(db_getter=lambda: None)
+
+        assert buffer.increment("posts", "p1", "views") == 1
+        assert buffer.increment("posts", "p1", "views") == 2
+
+        row = buffer.apply("posts", {"post_id": "p1", "views": 10, "likes": 4}, "post_id")
+        assert row == {"post_id": "p1", "views": 12, "likes": 4}
+
+    def test_inflight_deltas_stay_visible(self):
+        """반영 RPC가 끝나기 전에 읽어도 값이 뒤로 가지 않음"""
+        seen = []
+        db = FakeSupabaseClient(rpcs={
+            "increment_counters": lambda params: seen.append(buffer.buffered("posts", "p1", "views")),
+        })
+        buffer = CounterBuffer(db_getter=lambda: db)
+        buffer.increment("posts", "p1", "views", 5)
+        asyncio.run(buffer.flush())
+
+        assert seen == [5]
+        assert buffer.buffered("posts", "p1", "views") == 0
+
+    def test_failed_flush_requeues(self):
+        db = _rpc_db()
+        _fail_rpc(db)
+        buffer = CounterBuffer(db_getter=lambda: db)
+        buffer.increment("posts", "p1", "views", 2)
+
+        assert asyncio.run(buffer.flush()) == 0
+        buffer.increment("posts", "p1", "views")
+        assert buffer.buffered("posts", "p1", "views") == 3
+
+        db.rpc_errors.clear()
+        asyncio.run(buffer.flush())
+        assert db.rpc_calls[0][1]["updates"] == [{"table": "posts", "id": "p1", "deltas": {"views": 3}}]
+        assert buffer.get_stats()["flush_errors"] == 1
+
+    def test_timed_out_batch_not_resent(self):
+        """응답만 못 받은 배치는 DB에 이미 더해졌을 수 있음 → 다시 보내지 않고, 보내지 않은 배치만 재시도"""
+        sent = []
+
+        def increment_counters(params):
+            sent.append([u["id"] for u in params["updates"]])
+            if len(sent) == 2:
+                raise httpx.ReadTimeout("read timeout")  # DB는 반영했지만 응답 전에 끊김
+
+        db = FakeSupabaseClient(rpcs={"increment_counters": increment_counters})
+        buffer = CounterBuffer(db_getter=lambda: db, batch_size=2)
+        for i in range(5):
+            buffer.increment("posts", f"p{i}", "views")
+
+        assert asyncio.run(buffer.flush()) == 4
+        assert [buffer.buffered("posts", f"p{i}", "views") for i in range(5)] == [0, 0, 0, 0, 1]
+
+        asyncio.run(buffer.flush())
+        assert sent == [["p0", "p1"], ["p2", "p3"], ["p4"]]
+        stats = buffer.get_stats()
+        assert stats["unconfirmed_rows"] == 2
+        assert stats["flush_errors"] == 1 and stats["pending_rows"] == 0
+
+    @pytest.mark.parametrize("error, unconfirmed", [
+        (httpx.ReadTimeout("read timeout"), True),
+        (httpx.RemoteProtocolError("server disconnected"), True),
+        (TimeoutError("timed out"), True),
+        (httpx.ConnectError("connection refused"), False),
+        (httpx.ConnectTimeout("connect timeout"), False),
+        (APIError({"code": "57014", "message": "canceling statement due to statement timeout"}), False),
+    ])
+    def test_unconfirmed_error_classification(self, error, unconfirmed):
+        assert is_unconfirmed_write_error(error) is unconfirmed
+
+    def test_batches_split_by_size(self):
+        db = _rpc_db()
+        buffer = CounterBuffer(db_getter=lambda: db, batch_size=2)
+        for i in range(5):
+            buffer.increment("posts", f"p{i}", "views")
+
+        assert asyncio.run(buffer.flush()) == 5
+        assert [len(params["updates"]) for _, params in db.rpc_calls] == [2, 2, 1]
+
+    def test_stop_flushes_remaining(self):
+        db = _rpc_db()
+        buffer = CounterBuffer(db_getter=lambda: db, interval_seconds=60)
+
+        async def run():
+            buffer.start()
+            buffer.increment("posts", "p1", "views")
+            await buffer.stop()
+
+        asyncio.run(run())
+
+        # 시작 시 RPC 확인 (빈 배열) + 종료 시 남은 증가분
+        assert [params["updates"] for _, params in db.rpc_calls] == [
+            [], [{"table": "posts", "id": "p1", "deltas": {"views": 1}}],
+        ]
+        assert buffer.get_stats()["running"] is False
+        assert buffer.rpc_available is True
+
+    def test_unknown_counter_rejected(self):
+        with pytest.raises(ValueError):
+            CounterBuffer(db_getter=lambda: None).increment("posts", "p1", "title")
+
+
+MISSING_RPC = APIError({
+    "code": "PGRST202",
+    "message": "Could not find the function public.increment_counters(updates) in the schema cache",
+})
+
+
+def _missing_rpc_db(tables):
+    """increment_counters가 없는 DB (RPC 시도 횟수는 db.rpc_attempts)"""
+    db = FakeSupabaseClient(tables)
+    db.rpc_attempts = 0
+
+    def missing(params):
+        db.rpc_attempts += 1
+        raise MISSING_RPC
+
+    db.rpcs["increment_counters"] = missing
+    return db
+
+
+class TestMissingRpc:
+    """RPC 미배포 / 일시 오류 / 버퍼 상한"""
+
+    def test_missing_rpc_falls_back_to_row_updates(self):
+        db = _missing_rpc_db({
+            "posts": [{"post_id": "p1", "views": 10, "likes": 1}],
+            "comments": [{"comment_id": "c1", "likes": 0}],
+        })
+        buffer = CounterBuffer(db_getter=lambda: db)
+        buffer.increment("posts", "p1", "views", 5)
+        buffer.increment("comments", "c1", "likes")
+        buffer.increment("posts", "gone", "views")  # 삭제된 행
+
+        assert asyncio.run(buffer.flush()) == 3
+        assert db.tables == {
+            "posts": [{"post_id": "p1", "views": 15, "likes": 1}],
+            "comments": [{"comment_id": "c1", "likes": 1}],
+        }
+        assert buffer.get_stats()["pending_rows"] == 0
+        assert buffer.rpc_available is False
+
+        # 다음 반영부터는 RPC를 다시 시도하지 않음
+        buffer.increment("posts", "p1", "views")
+        asyncio.run(buffer.flush())
+        assert db.rpc_attempts == 1
+        assert db.tables["posts"][0]["views"] == 16
+
+    def test_startup_check_detects_missing_rpc(self, caplog):
+        db = _missing_rpc_db({})
+        buffer = CounterBuffer(db_getter=lambda: db)
+
+        assert asyncio.run(buffer.check_rpc()) is False
+        assert "increment_counters RPC가 배포되지 않음" in caplog.text
+
+    def test_transient_error_keeps_rpc(self):
+        db = _rpc_db()
+        _fail_rpc(db)
+        buffer = CounterBuffer(db_getter=lambda: db)
+        buffer.increment("posts", "p1", "views")
+
+        assert asyncio.run(buffer.check_rpc()) is None
+        asyncio.run(buffer.flush())
+        assert buffer.rpc_available is None
+
+        db.rpc_errors.clear()
+        asyncio.run(buffer.flush())
+        assert db.rpc_calls == [("increment_counters", {"updates": [{"table": "posts", "id": "p1", "deltas": {"views": 1}}]})]
+
+    def test_backlog_capped_while_flush_fails(self):
+        db = _rpc_db()
+        _fail_rpc(db)
+        buffer = CounterBuffer(db_getter=lambda: db, max_backlog=3)
+        for i in range(5):
+            buffer.increment("posts", f"p{i}", "views")
+        buffer.increment("posts", "p0", "views")  # 이미 있는 행은 계속 합산
+
+        asyncio.run(buffer.flush())
+        buffer.increment("posts", "p9", "views")
+
+        stats = buffer.get_stats()
+        assert stats["pending_rows"] == 3
+        assert stats["dropped"] == 3
+        assert buffer.buffered("posts", "p0", "views") == 2
+
+
+class TestCounterRoutes:
+    """라우터: 조회/좋아요 시 DB update 없음"""
+
+    @pytest.fixture
+    def buffer(self, monkeypatch):
+        buffer = CounterBuffer(db_getter=lambda: None)
+        monkeypatch.setattr(posts_router, "get_counter_buffer", lambda: buffer)
+        return buffer
+
+    def test_get_post_views(self, buffer, mock_post):
+        db = FakeSupabaseClient({"posts": [mock_post]})
+
+        first = asyncio.run(posts_router.get_post(mock_post["post_id"], db=db))
+        second = asyncio.run(posts_router.get_post(mock_post["post_id"], db=db))
+
+        assert (first.views, second.views) == (mock_post["views"] + 1, mock_post["views"] + 2)
+        assert buffer.buffered("posts", mock_post["post_id"], "views") == 2
+        assert _updates(db) == []
+
+    def test_like_comment(self, buffer, mock_comment):
+        db = FakeSupabaseClient({"comments": [mock_comment]})
+        user = SimpleNamespace(uid="u1")
+
+        response = asyncio.run(posts_router.like_comment(
+            mock_comment["post_id"], mock_comment["comment_id"], current_user=user, db=db
+        ))
+
+        assert response.likes == mock_comment["likes"] + 1
+        assert buffer.buffered("comments", mock_comment["comment_id"], "likes") == 1
+        assert _updates(db) == []
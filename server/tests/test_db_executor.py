@@ -0,0 +1,120 @@
+"""
+Supabase 쿼리 실행기 테스트
+
+- thread 모드: 느린 쿼리 여러 개가 동시에 실행되고 그동안 이벤트 루프가 멈추지 않음
+- inline 모드: 기존처럼 이벤트 루프에서 실행 (비교 기준)
+- 풀 포화 통계 / 예외 전달, 큐에서 기다리다 취소된 호출은 대기 수에서 빠짐
+"""
+
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from backend.db_executor import DBExecutor
+
+
+class SlowQuery:
+    """execute()가 delay초 걸리는 쿼리 빌더 대역"""
+
+    def __init__(self, delay=0.05, error=None):
+        self.delay = delay
+        self.error = error
+
+    def execute(self):
+        time.sleep(self.delay)
+        if self.error:
+            raise self.error
+        return SimpleNamespace(data=[{"ok": True}])
+
+
+async def _run_with_ticker(executor, queries):
+    """쿼리를 동시에 실행하면서 10ms 간격 ticker가 몇 번 돌았는지 셈 (이벤트 루프 응답성)"""
+    ticks = 0
+    done = asyncio.Event()
+
+    async def ticker():
+        nonlocal ticks
+        while not done.is_set():
+            ticks += 1
+            await asyncio.sleep(0.01)
+
+    ticker_task = asyncio.create_task(ticker())
+    started = time.perf_counter()
+    results = await asyncio.gather(*(executor.run(q.execute) for q in queries))
+    elapsed = time.perf_counter() - started
+    done.set()
+    await ticker_task
+    return results, elapsed, ticks
+
+
+class TestDBExecutor:
+    """실행 모드 / 통계"""
+
+    def test_thread_mode_runs_in_parallel_without_blocking_loop(self):
+        executor = DBExecutor(max_workers=8, mode="thread")
+
+        results, elapsed, ticks = asyncio.run(_run_with_ticker(executor, [SlowQuery() for _ in range(8)]))
+        executor.shutdown()
+
+        assert all(r.data == [{"ok": True}] for r in results)
+        assert elapsed < 0.3  # 순차 실행이면 0.4초
+        assert ticks >= 3
+
+    def test_inline_mode_blocks_loop(self):
+        executor = DBExecutor(mode="inline")
+
+        _, elapsed, ticks = asyncio.run(_run_with_ticker(executor, [SlowQuery() for _ in range(4)]))
+
+        assert elapsed >= 0.2
+        assert ticks <= 1
+
+    def test_saturation_stats(self):
+        executor = DBExecutor(max_workers=2, mode="thread")
+
+        asyncio.run(_run_with_ticker(executor, [SlowQuery(0.03) for _ in range(6)]))
+        executor.shutdown()
+
+        stats = executor.get_stats()
+        assert stats["calls"] == 6
+        assert stats["max_active"] == 2
+        assert stats["saturated_calls"] == 4
+        assert stats["max_queued"] >= 4
+        assert stats["active"] == 0 and stats["queued"] == 0
+        assert stats["wait_ms_p95"] >= 25
+
+    def test_error_propagates(self):
+        executor = DBExecutor(max_workers=2, mode="thread")
+
+        with pytest.raises(RuntimeError):
+            asyncio.run(executor.run(SlowQuery(0, error=RuntimeError("db down")).execute))
+        executor.shutdown()
+
+        assert executor.get_stats()["errors"] == 1
+
+    def test_cancelled_while_queued_not_counted(self):
+        executor = DBExecutor(max_workers=1, mode="thread")
+        release = threading.Event()
+        ran = []
+
+        async def run():
+            running = asyncio.create_task(executor.run(lambda: release.wait(5)))
+            queued = [asyncio.create_task(executor.run(lambda: ran.append(True))) for _ in range(3)]
+            await asyncio.sleep(0.05)
+            assert executor.get_stats()["queued"] == 3
+
+            for task in queued:
+                task.cancel()
+            await asyncio.gather(*queued, return_exceptions=True)
+            release.set()
+            await running
+
+        asyncio.run(run())
+        executor.shutdown()
+
+        stats = executor.get_stats()
+        assert ran == []
+        assert stats["active"] == 0 and stats["queued"] == 0
+        assert stats["calls"] == 4 and stats["errors"] == 0
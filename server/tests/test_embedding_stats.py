@@ -0,0 +1,173 @@
+"""
+요청별 임베딩 호출 수 테스트 (main.app, OpenAI 없이 가짜 base 임베딩)
+
+- POST /api/llm/chat: 캐시 검색 → RAG 검색이 같은 질문을 API 1회로 처리
+  (공용 CachedEmbeddings 없이 각자 임베딩하면 2회 + 답변 저장), X-Embedding-API-Calls 헤더로 확인
+- API에는 원문을 보내고 정규화 텍스트는 캐시 키로만 사용
+- POST /api/llm/agent: executor 스레드(Agent Tool)에서 일어난 임베딩도 요청 카운터에 집계
+- POST /api/llm/agent/stream: 헤더가 본문보다 먼저 나가므로 헤더 없음
+"""
+
+import asyncio
+import hashlib
+import math
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+import main
+from llm_service.routers import agent as agent_router
+from llm_service.routers import chat as chat_router
+from llm_service.services import cache_service as cache_service_module
+from llm_service.services import embedding_service
+from llm_service.services.cache_service import CacheService
+from llm_service.services.embedding_service import CachedEmbeddings, get_embeddings
+from llm_service.services.rag_service import RAGService
+
+DIM = 16
+QUERY = "아스날  압박 전술을 설명해줘"
+ANSWER = "아스날 압박 전술은 높은 라인에서 강하게 압박하는 방식입니다."
+
+
+class FakeBaseEmbeddings:
+    """OpenAIEmbeddings 대역 (API로 보낸 텍스트 기록)"""
+
+    def __init__(self):
+        self.sent = []
+
+    @staticmethod
+    def vector(text):
+        values = [0.0] * DIM
+        for word in text.lower().split():
+            values[int(hashlib.md5(word.encode()).hexdigest(), 16) % DIM] += 1.0
+        norm = math.sqrt(sum(v * v for v in values)) or 1.0
+        return [v / norm for v in values]
+
+    def embed_documents(self, texts):
+        self.sent.append(list(texts))
+        return [self.vector(text) for text in texts]
+
+    def embed_query(self, text):
+        self.sent.append([text])
+        return self.vector(text)
+
+
+class FakeOpenAIService:
+    async def chat(self, messages, **kwargs):
+        return ANSWER
+
+    def count_tokens(self, text):
+        return len(text)
+
+
+@pytest.fixture
+def base(monkeypatch):
+    base = FakeBaseEmbeddings()
+    monkeypatch.setattr(embedding_service, "_embeddings", CachedEmbeddings(base))
+    return base
+
+
+@pytest.fixture
+def chat_services(tmp_path, base, monkeypatch):
+    knowledge = RAGService(persist_directory=str(tmp_path / "chroma_db"))
+    knowledge.add_documents("matches", ["arsenal pressing high line", "tottenham counter attack"])
+    cache_rag = RAGService(persist_directory=str(tmp_path / "chroma_db_cache"))
+    monkeypatch.setattr(cache_service_module, "get_rag_service", lambda persist_directory: cache_rag)
+    cache_service = CacheService()
+    base.sent.clear()
+
+    monkeypatch.setattr(chat_router, "get_openai_service", lambda: FakeOpenAIService())
+    monkeypatch.setattr(chat_router, "get_cache_service", lambda: cache_service)
+    monkeypatch.setattr(chat_router, "get_content_safety_service", lambda: None)
+    monkeypatch.setattr(chat_router, "get_cache_judge", lambda: None)
+    monkeypatch.setattr(chat_router, "get_rag_service", lambda: knowledge)
+    yield cache_rag
+    knowledge.close()
+    cache_rag.close()
+
+
+def _post(path, body):
+    async def scenario():
+        transport = httpx.ASGITransport(app=main.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await client.post(path, json=body)
+
+    return asyncio.run(scenario())
+
+
+class TestChatEmbeddings:
+    """POST /api/llm/chat"""
+
+    def test_query_embedded_once_per_request(self, chat_services, base):
+        response = _post("/api/llm/chat", {"query": QUERY})
+
+        assert response.status_code == 200, response.text
+        assert response.json()["cache_hit"] is False
+        # 질문은 캐시 검색 / RAG 검색에서 쓰지만 API는 첫 번째 1회만, 나머지 1회는 답변 저장
+        assert base.sent == [[QUERY], [ANSWER]]
+        assert response.headers["X-Embedding-API-Calls"] == "2"
+        assert chat_services.get_collection_stats("cached_answers")["count"] == 1
+
+    def test_counter_is_per_request(self, chat_services, base):
+        _post("/api/llm/chat", {"query": QUERY})
+
+        # 두 번째 요청은 L1 답변 캐시 → 임베딩 없음
+        response = _post("/api/llm/chat", {"query": QUERY})
+
+        assert response.json()["cache_hit"] is True
+        assert response.headers["X-Embedding-API-Calls"] == "0"
+        assert len(base.sent) == 2
+
+
+class TestCachedEmbeddings:
+    """원문 임베딩 + 정규화 키"""
+
+    def test_original_text_sent_normalized_key_shared(self, base):
+        embeddings = get_embeddings()
+
+        first = embeddings.embed_documents(["Arsenal  Pressing", "arsenal pressing", "Son Goal"])
+        query = embeddings.embed_query("ARSENAL pressing")
+
+        assert base.sent == [["Arsenal  Pressing", "Son Goal"]]
+        assert first[0] == first[1] and query == pytest.approx(first[0])
+
+
+class FakeToolAgent:
+    """Tool 안에서 임베딩하는 Agent 대역 (executor 스레드에서 실행됨)"""
+
+    def run(self, prompt, callbacks=None):
+        get_embeddings().embed_query("tottenham counter attack")
+        return "토트넘은 역습이 빠릅니다."
+
+
+@pytest.fixture
+def agent_app(base, monkeypatch):
+    async def complex_question(query, use_llm_fallback=True):
+        return True
+
+    factory = SimpleNamespace(get_agent=lambda personalized=False, streaming=False: FakeToolAgent())
+    monkeypatch.setattr(agent_router, "is_complex_question", complex_question)
+    monkeypatch.setattr(agent_router, "get_agent_factory", lambda: factory)
+    monkeypatch.setattr(agent_router, "get_content_safety_service", lambda: None)
+    monkeypatch.setattr(agent_router, "get_cache_service", lambda: None)
+    monkeypatch.setattr(agent_router, "get_openai_service", lambda: SimpleNamespace(count_tokens=len))
+
+
+class TestAgentEmbeddings:
+    """POST /api/llm/agent(/stream)"""
+
+    def test_executor_thread_counted(self, agent_app, base):
+        response = _post("/api/llm/agent", {"query": "토트넘 역습 전술 비교 분석해줘"})
+
+        assert response.status_code == 200, response.text
+        assert response.headers["X-Embedding-API-Calls"] == "1"
+
+    def test_no_header_on_stream(self, agent_app, base):
+        response = _post("/api/llm/agent/stream", {"query": "토트넘 역습 전술 비교 분석해줘"})
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        assert "X-Embedding-API-Calls" not in response.headers
+        assert '"type": "done"' in response.text
+        assert len(base.sent) == 1
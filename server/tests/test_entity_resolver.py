@@ -0,0 +1,163 @@
+"""
+EntityResolver 테스트
+
+- 오타/부분 이름/한글 표기/조사가 붙은 이름 매칭
+- 선수 통계 파일 기반 생성 + 파일 변경 시 재생성
+- stats / calendar / weather 연동
+"""
+
+import json
+import os
+
+import pytest
+
+from llm_service.services import player_stats_store
+from llm_service.services.player_stats_store import PlayerStatsStore
+from llm_service.utils import entity_resolver
+from llm_service.utils.entity_resolver import EntityResolver, build_entities, name_key
+
+
+PLAYERS = {
+    "프리미어리그": [
+        {"name": "Erling Haaland", "team": "Manchester City", "goals": 15, "assists": 3, "espn_id": 253989},
+        {"name": "Son Heung-Min", "ko_name": "손흥민", "team": "Tottenham Hotspur", "ko_team": "토트넘", "goals": 9, "assists": 6, "espn_id": 149945},
+        {"name": "Jackson Smith", "team": "Chelsea", "goals": 1, "assists": 0, "espn_id": 11},
+    ],
+    "라리가": [
+        {"name": "Lee Kang-In", "ko_name": "이강인", "team": "Paris Saint-Germain", "goals": 4, "assists": 2, "espn_id": 274197},
+    ],
+}
+
+
+@pytest.fixture
+def resolver():
+    players = [(league, p) for league, ps in PLAYERS.items() for p in ps]
+    return EntityResolver(build_entities(players))
+
+
+@pytest.fixture
+def shared_store(tmp_path, monkeypatch):
+    """공용 PlayerStatsStore / EntityResolver를 임시 파일 기준으로 교체"""
+    path = tmp_path / "espn_player_ids.json"
+    path.write_text(json.dumps(PLAYERS, ensure_ascii=False), encoding="utf-8")
+    store = PlayerStatsStore(str(path), reload_check_seconds=0)
+    monkeypatch.setattr(player_stats_store, "_player_stats_store", store)
+    monkeypatch.setattr(entity_resolver, "_resolver", None)
+    monkeypatch.setattr(entity_resolver, "_resolver_version", None)
+    return store
+
+
+class TestNormalization:
+    """이름 키"""
+
+    def test_accents_and_punctuation(self):
+        assert name_key("Kylian Mbappé") == name_key("kylian mbappe")
+        assert name_key("Son, Heung-Min") == name_key("son heungmin")
+
+    def test_hangul_is_decomposed(self):
+        """한 글자 오타도 자모 대부분이 겹침"""
+        a, b = set(name_key("홀란드")), set(name_key("할란드"))
+        assert len(a & b) >= len(a) - 1
+
+
+class TestEntityResolver:
+    """선수/팀 매칭"""
+
+    @pytest.mark.parametrize("query, expected", [
+        ("홀란", "Erling Haaland"),
+        ("haland", "Erling Haaland"),
+        ("할란드", "Erling Haaland"),
+        ("Son", "Son Heung-Min"),
+        ("Heung-Min Son", "Son Heung-Min"),
+        ("손흥민", "Son Heung-Min"),
+        ("이강인", "Lee Kang-In"),
+    ])
+    def test_player_variants(self, resolver, query, expected):
+        match = resolver.best(query, kind="player")
+        assert match is not None
+        assert match.entity.name == expected
+
+    def test_token_match_beats_substring(self, resolver):
+        """'son'은 Jackson보다 Son Heung-Min"""
+        matches = resolver.resolve("son", kind="player")
+        assert matches[0].entity.name == "Son Heung-Min"
+        assert all(m.entity.name != "Jackson Smith" or m.score < matches[0].score for m in matches)
+
+    @pytest.mark.parametrize("query, expected", [
+        ("토트넘", "Tottenham Hotspur"),
+        ("spurs", "Tottenham Hotspur"),
+        ("맨시티", "Manchester City"),
+        ("dortmnd", "Borussia Dortmund"),
+        ("파리 생제르맹", "Paris Saint-Germain"),
+    ])
+    def test_team_variants(self, resolver, query, expected):
+        assert resolver.best(query, kind="team").entity.name == expected
+
+    def test_player_team_merged_with_builtin_aliases(self, resolver):
+        """선수 데이터의 팀명은 내장 별칭 팀과 같은 엔티티"""
+        names = [e.name for e in resolver.entities if e.kind == "team"]
+        assert names.count("Tottenham Hotspur") == 1
+        assert names.count("Manchester City") == 1
+
+    def test_find_in_text_strips_particles(self, resolver):
+        match = resolver.find_best_in_text("손흥민은 이번 시즌 몇 골 넣었어?", kind="player")
+        assert match.entity.name == "Son Heung-Min"
+        match = resolver.find_best_in_text("토트넘에서 다음 경기 언제야?", kind="team")
+        assert match.entity.name == "Tottenham Hotspur"
+
+    @pytest.mark.parametrize("text", ["이번 주 경기", "내일 경기 일정 알려줘", "오늘 날씨 어때", "선수 통계 보여줘"])
+    def test_no_false_positive_on_common_words(self, resolver, text):
+        assert resolver.find_best_in_text(text) is None
+
+    def test_short_query_returns_nothing(self, resolver):
+        assert resolver.resolve("a") == []
+
+
+class TestSharedResolver:
+    """공용 인스턴스 생성/재생성"""
+
+    def test_built_from_player_file(self, shared_store):
+        resolver = entity_resolver.get_entity_resolver()
+        assert resolver.best("jackson smith", kind="player").entity.data["espn_id"] == 11
+        assert entity_resolver.get_entity_resolver() is resolver
+
+    def test_rebuilt_when_file_changes(self, shared_store):
+        first = entity_resolver.get_entity_resolver()
+        updated = json.loads(json.dumps(PLAYERS))
+        updated["라리가"].append({"name": "Kim Min-Jae", "ko_name": "김민재", "team": "Bayern Munich", "espn_id": 157688})
+        with open(shared_store.path, "w", encoding="utf-8") as f:
+            json.dump(updated, f, ensure_ascii=False)
+        stat = os.stat(shared_store.path)
+        os.utime(shared_store.path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        second = entity_resolver.get_entity_resolver()
+
+        assert second is not first
+        assert second.best("김민재", kind="player").entity.data["espn_id"] == 157688
+
+
+class TestIntegrations:
+    """stats / calendar / weather 연동"""
+
+    def test_stats_lookup_falls_back_to_fuzzy(self, shared_store):
+        from llm_service.routers import stats
+
+        assert stats.get_player_stats_from_cache("haland")["espn_id"] == 253989
+        assert stats.get_player_stats_from_cache("Unknown Person") is None
+
+    def test_calendar_filters_korean_team_name(self, shared_store):
+        """'토트넘'으로 영문 팀명 경기 필터링"""
+        from llm_service.tools.calendar_tool import filter_matches_by_team
+
+        matches = [
+            {"id": 1, "homeTeam": {"name": "Tottenham Hotspur FC"}, "awayTeam": {"name": "Arsenal FC"}},
+            {"id": 2, "homeTeam": {"name": "Chelsea FC"}, "awayTeam": {"name": "Everton FC"}},
+        ]
+
+        assert [m["id"] for m in filter_matches_by_team(matches, "토트넘")] == [1]
+
+    def test_weather_maps_team_variant_to_city(self, shared_store):
+        from llm_service.tools.weather_tool import _find_location_from_team
+
+        assert _find_location_from_team("Tottenham Hotspur") == "London"
+        assert _find_location_from_team("도르트문드") == "Dortmund"
@@ -0,0 +1,300 @@
+"""
+AsyncFootballDataClient 호출 한도 테스트
+
+호출 한도(고정 윈도우)를 강제하는 로컬 스텁 서버를 띄워서
+토큰 버킷 / 우선순위 / 부하 차단 / 429 Retry-After 처리를 검증
+"""
+
+import asyncio
+import time
+from typing import Optional
+
+import pytest
+import uvicorn
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+from llm_service.external_apis.football_data import AsyncFootballDataClient
+from llm_service.external_apis.rate_limiter import (
+    AsyncTokenBucket,
+    RateLimitExceeded,
+    RequestPriority,
+)
+
+
+# ============================================
+# 스텁 서버 (Football-Data와 같은 헤더로 한도 강제)
+# ============================================
+
+class StubFootballServer:
+    """
+    window_seconds마다 quota개만 허용, 초과 시 429 + Retry-After
+
+    윈도우는 첫 요청 시점에 시작 (서버 기동 시간만큼 어긋난 짧은 첫 윈도우가 없도록)
+    """
+
+    def __init__(self, quota: int, window_seconds: float, force_429: int = 0):
+        self.quota = quota
+        self.window_seconds = window_seconds
+        self.force_429 = force_429  # 처음 N번은 무조건 429
+        self.window_start: Optional[float] = None
+        self.count = 0
+        self.paths = []
+        self.rejected = 0
+        self.app = self._build_app()
+
+    def _build_app(self) -> FastAPI:
+        app = FastAPI()
+
+        @app.get("/{path:path}")
+        async def handle(path: str, request: Request):
+            now = time.monotonic()
+            if self.window_start is None or now - self.window_start >= self.window_seconds:
+                self.window_start = now
+                self.count = 0
+            reset = self.window_seconds - (now - self.window_start)
+
+            if self.force_429 > 0 or self.count >= self.quota:
+                self.force_429 = max(0, self.force_429 - 1)
+                self.rejected += 1
+                return JSONResponse(
+                    {"message": "You reached your request limit."},
+                    status_code=429,
+                    headers={"Retry-After": f"{reset:.3f}"},
+                )
+
+            self.count += 1
+            self.paths.append("/" + path)
+            return JSONResponse(
+                {"matches": [], "standings": [], "competitions": []},
+                headers={
+                    "X-Requests-Available-Minute": str(self.quota - self.count),
+                    "X-RequestCounter-Reset": f"{reset:.3f}",
+                },
+            )
+
+        return app
+
+
+async def _run_with_stub(stub: StubFootballServer, bucket: AsyncTokenBucket, scenario):
+    """스텁 서버를 띄우고 scenario(client) 실행"""
+    server = uvicorn.Server(uvicorn.Config(stub.app, host="127.0.0.1", port=0, log_level="warning"))
+    server.install_signal_handlers = lambda: None
+    serve_task = asyncio.create_task(server.serve())
+    while not server.started:
+        await asyncio.sleep(0.01)
+    port = server.servers[0].sockets[0].getsockname()[1]
+
+    client = AsyncFootballDataClient(
+        api_key="test-key", base_url=f"http://127.0.0.1:{port}", bucket=bucket
+    )
+    try:
+        return await scenario(client)
+    finally:
+        await client.close()
+        server.should_exit = True
+        await serve_task
+
+
+# ============================================
+# 테스트
+# ============================================
+
+class TestFootballRateLimit:
+    """토큰 버킷 + 스텁 서버 테스트"""
+
+    def test_burst_stays_within_quota(self):
+        """동시 요청 버스트가 서버 한도를 넘지 않음 (429 없음)"""
+        stub = StubFootballServer(quota=3, window_seconds=0.3)
+        # 어떤 0.3초 구간에도 capacity + rate x 0.3 <= 3이 되도록 (20% 여유 → 응답 지연/윈도우 위상과 무관)
+        bucket = AsyncTokenBucket(capacity=1, refill_per_second=0.8 * (3 - 1) / 0.3)
+
+        async def scenario(client):
+            return await asyncio.gather(*[client.get_standings("PL") for _ in range(9)])
+
+        results = asyncio.run(_run_with_stub(stub, bucket, scenario))
+
+        assert all(result is not None for result in results)
+        assert len(stub.paths) == 9
+        assert stub.rejected == 0
+
+    def test_tool_threads_share_bucket(self, monkeypatch):
+        """Agent Tool(executor 스레드)의 호출도 서버 루프의 같은 버킷을 거침 → 라우터 호출과 합쳐도 429 없음"""
+        from llm_service.external_apis import football_data
+
+        stub = StubFootballServer(quota=3, window_seconds=0.3)
+        bucket = AsyncTokenBucket(capacity=1, refill_per_second=0.8 * (3 - 1) / 0.3)
+        monkeypatch.setattr(football_data, "_football_rate_limiter", bucket)
+
+        async def scenario(client):
+            monkeypatch.setattr(football_data, "_async_football_client", client)
+            await bucket.acquire()  # 라우터가 먼저 호출해서 버킷이 서버 루프에 묶인 상태
+            tool_calls = [
+                asyncio.to_thread(
+                    football_data.call_football_api, lambda c, match_id=match_id: c.get_match_details(match_id)
+                )
+                for match_id in range(4)
+            ]
+            router_calls = [client.get_standings("PL") for _ in range(4)]
+            return await asyncio.gather(*tool_calls, *router_calls)
+
+        results = asyncio.run(_run_with_stub(stub, bucket, scenario))
+
+        assert all(result is not None for result in results)
+        assert sorted(stub.paths)[:4] == ["/competitions/2021/standings"] * 4
+        assert len(stub.paths) == 8
+        assert stub.rejected == 0
+        assert bucket.acquired == 9
+
+    def test_live_scores_before_team_lists(self):
+        """토큰이 없을 때 라이브 스코어가 먼저 큐에 들어온 팀 목록보다 먼저 처리"""
+        stub = StubFootballServer(quota=100, window_seconds=60)
+        bucket = AsyncTokenBucket(capacity=1, refill_per_second=5)
+
+        async def scenario(client):
+            await bucket.acquire()  # 토큰 소진
+            teams = asyncio.create_task(client.get_teams_by_competition("PL"))
+            await asyncio.sleep(0)
+            live = asyncio.create_task(client.get_live_matches())
+            await asyncio.gather(teams, live)
+
+        asyncio.run(_run_with_stub(stub, bucket, scenario))
+
+        assert stub.paths == ["/matches", "/competitions/2021/standings"]
+
+    def test_low_priority_is_shed(self):
+        """예상 대기가 우선순위별 한도를 넘으면 대기하지 않고 RateLimitExceeded"""
+        stub = StubFootballServer(quota=100, window_seconds=60)
+        bucket = AsyncTokenBucket(capacity=1, refill_per_second=1 / 60)
+
+        async def scenario(client):
+            await bucket.acquire()  # 토큰 소진 → 다음 토큰까지 60초
+            started = time.monotonic()
+            with pytest.raises(RateLimitExceeded) as exc_info:
+                await client.get_teams_by_competition("PL")
+            return time.monotonic() - started, exc_info.value
+
+        elapsed, error = asyncio.run(_run_with_stub(stub, bucket, scenario))
+
+        assert elapsed < 1.0
+        assert error.retry_after > 5
+        assert bucket.shed == 1
+        assert stub.paths == []
+
+    def test_retry_after_on_429(self):
+        """429 응답 시 Retry-After 동안 멈췄다가 재시도해서 성공"""
+        stub = StubFootballServer(quota=100, window_seconds=0.3, force_429=1)
+        bucket = AsyncTokenBucket(capacity=5, refill_per_second=10)
+
+        async def scenario(client):
+            started = time.monotonic()
+            result = await client.get_match_details(12345)
+            return time.monotonic() - started, result, client.get_stats()
+
+        elapsed, result, stats = asyncio.run(_run_with_stub(stub, bucket, scenario))
+
+        assert result is not None
+        assert stub.rejected == 1
+        assert stub.paths == ["/matches/12345"]
+        assert stats["rate_limited"] == 1
+        assert stats["bucket"]["pauses"] >= 1
+        assert elapsed >= 0.1
+
+    def test_bucket_priority_order(self):
+        """같은 버킷에서 대기자는 우선순위 → 도착 순서로 깨어남"""
+        bucket = AsyncTokenBucket(capacity=1, refill_per_second=50)
+        order = []
+
+        async def waiter(name, priority):
+            await bucket.acquire(priority)
+            order.append(name)
+
+        async def scenario():
+            await bucket.acquire()
+            tasks = [
+                asyncio.create_task(waiter("teams", RequestPriority.TEAMS)),
+                asyncio.create_task(waiter("standings", RequestPriority.STANDINGS)),
+                asyncio.create_task(waiter("live-1", RequestPriority.LIVE)),
+                asyncio.create_task(waiter("live-2", RequestPriority.LIVE)),
+            ]
+            await asyncio.gather(*tasks)
+
+        asyncio.run(scenario())
+
+        assert order == ["live-1", "live-2", "standings", "teams"]
+
+
+class TestBucketLoops:
+    """이벤트 루프 바인딩 / 취소 시 토큰 반납"""
+
+    def test_running_loop_is_not_rebound_from_another_thread(self):
+        import threading
+
+        bucket = AsyncTokenBucket(capacity=1, refill_per_second=50)
+        bound, release = threading.Event(), threading.Event()
+
+        async def hold():
+            await bucket.acquire()
+            bound.set()
+            await asyncio.to_thread(release.wait, 5)
+
+        thread = threading.Thread(target=asyncio.run, args=(hold(),))
+        thread.start()
+        assert bound.wait(5)
+        try:
+            with pytest.raises(RuntimeError):
+                asyncio.run(bucket.acquire(max_wait=5))
+        finally:
+            release.set()
+            thread.join()
+
+        # 이전 루프가 끝났으면 다시 바인딩
+        assert asyncio.run(bucket.acquire(max_wait=5)) >= 0
+
+    def test_fallback_threads_all_complete(self, monkeypatch):
+        """서버 루프가 없을 때 여러 스레드의 동기 호출이 대체 버킷을 차례로 쓰고 모두 끝남"""
+        from concurrent.futures import ThreadPoolExecutor
+
+        from llm_service.external_apis import football_data
+
+        class FakeClient:
+            def __init__(self, bucket=None):
+                self.bucket = bucket
+
+            async def close(self):
+                pass
+
+        shared = AsyncTokenBucket(capacity=1, refill_per_second=20)
+        fallback = AsyncTokenBucket(capacity=1, refill_per_second=20)
+        monkeypatch.setattr(football_data, "AsyncFootballDataClient", FakeClient)
+        monkeypatch.setattr(football_data, "_football_rate_limiter", shared)
+        monkeypatch.setattr(football_data, "_fallback_rate_limiter", fallback)
+
+        def call(_):
+            return football_data.call_football_api(lambda client: client.bucket.acquire(max_wait=5))
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            waits = list(pool.map(call, range(4), timeout=10))
+
+        assert len(waits) == 4
+        assert fallback.acquired == 4
+        assert shared.loop is None  # 공용 버킷은 임시 루프에 바인딩하지 않음
+
+    def test_token_refunded_on_cancel_wakes_next_waiter(self):
+        bucket = AsyncTokenBucket(capacity=1, refill_per_second=1 / 60)
+
+        async def scenario():
+            await bucket.acquire()  # 토큰 소진 → 다음 토큰까지 60초
+            first = asyncio.create_task(bucket.acquire())
+            second = asyncio.create_task(bucket.acquire())
+            await asyncio.sleep(0)
+
+            bucket._tokens = 1.0
+            bucket._dispatch()  # first에 토큰 전달
+            first.cancel()  # 깨어나기 전에 취소 → 반납된 토큰으로 second가 바로 통과
+            await asyncio.wait_for(second, timeout=1)
+            with pytest.raises(asyncio.CancelledError):
+                await first
+
+        asyncio.run(scenario())
+        assert bucket.acquired == 2
@@ -0,0 +1,220 @@
+"""
+Football 백그라운드 갱신기 테스트
+
+- 갱신기가 라이브/예정 경기/순위표를 공용 캐시에 채우는지
+- 라이브 경기 유무에 따른 주기 조절 (adaptive)
+- 호출 한도 몫에 맞춘 주기 조정
+- 캘린더 Tool이 채워진 캐시를 읽고 API를 호출하지 않는지, 동시 미스는 API 1회로 합치는지
+"""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from llm_service.external_apis.rate_limiter import AsyncTokenBucket
+from llm_service.utils.two_tier_cache import TwoTierCache
+
+
+class FakeAsyncClient:
+    """호출 기록용 AsyncFootballDataClient 대역"""
+
+    def __init__(self, live_matches=None, fixtures=None):
+        self.bucket = AsyncTokenBucket(capacity=100, refill_per_second=100)
+        self.calls = []
+        self.live_matches = live_matches or []
+        self.fixtures = fixtures
+
+    async def get_live_matches(self):
+        self.calls.append("live")
+        return self.live_matches
+
+    async def get_matches(self, competition, status, limit):
+        self.calls.append(f"matches_{competition}_{status}")
+        if self.fixtures is not None:
+            return self.fixtures
+        return [{"id": 1, "utcDate": "2030-01-01T15:00:00Z", "homeTeam": {"name": f"{competition} Home"}, "awayTeam": {"name": "Away"}}]
+
+    async def get_standings(self, competition):
+        self.calls.append(f"standings_{competition}")
+        return {"competition": competition, "standings": []}
+
+
+@pytest.fixture
+def shared_cache(monkeypatch):
+    """라우터/Tool이 같은 새 캐시를 보도록 교체"""
+    from backend.routers import football_data
+    from llm_service.external_apis import football_data as football_api
+
+    cache = TwoTierCache()
+    monkeypatch.setattr(football_data, "football_cache", cache)
+    monkeypatch.setattr(football_data, "football_flights", cache.flights)
+    monkeypatch.setattr(football_api, "_football_cache", cache)
+    return cache
+
+
+def _refresher(client, **kwargs):
+    from backend.football_refresher import FootballRefresher
+
+    kwargs.setdefault("competitions", ["PL", "BL"])
+    return FootballRefresher(client, db_getter=lambda: None, **kwargs)
+
+
+class TestFootballRefresher:
+    """갱신 작업"""
+
+    def test_run_due_warms_shared_cache(self, shared_cache):
+        """첫 실행에 라이브/리그별 예정 경기/순위표를 모두 캐시에 저장"""
+        client = FakeAsyncClient()
+        refresher = _refresher(client)
+
+        ran = asyncio.run(refresher.run_due())
+
+        assert ran == 5
+        assert sorted(client.calls) == sorted([
+            "live",
+            "matches_PL_SCHEDULED",
+            "matches_BL_SCHEDULED",
+            "standings_PL",
+            "standings_BL",
+        ])
+        assert shared_cache.peek("matches_PL_SCHEDULED_100")[0]["homeTeam"]["name"] == "PL Home"
+        assert shared_cache.peek("standings_BL") == {"competition": "BL", "standings": []}
+
+    def test_not_due_jobs_are_skipped(self, shared_cache):
+        """주기가 안 된 작업은 다시 호출하지 않음"""
+        client = FakeAsyncClient()
+        refresher = _refresher(client)
+
+        async def scenario():
+            await refresher.run_due()
+            return await refresher.run_due()
+
+        assert asyncio.run(scenario()) == 0
+        assert len(client.calls) == 5
+
+    def test_aliases_are_refreshed_once(self):
+        """CL은 EC와 같은 리그라 한 번만 갱신"""
+        from backend.football_refresher import unique_competitions
+
+        codes = unique_competitions()
+
+        assert "EC" in codes
+        assert "CL" not in codes
+
+
+class TestAdaptivePolling:
+    """라이브 경기 유무에 따른 주기"""
+
+    def test_live_match_switches_to_fast_polling(self, shared_cache):
+        """진행 중 경기가 있으면 라이브 주기로 전환"""
+        from backend.football_refresher import FOOTBALL_IDLE_POLL_SECONDS, FOOTBALL_LIVE_POLL_SECONDS
+
+        client = FakeAsyncClient(live_matches=[{"id": 7, "status": "IN_PLAY"}])
+        refresher = _refresher(client)
+        live_job = refresher.jobs[0]
+
+        assert refresher.interval_for(live_job) == FOOTBALL_IDLE_POLL_SECONDS
+        asyncio.run(refresher.run_due())
+
+        assert refresher.live_active is True
+        assert refresher.interval_for(live_job) == FOOTBALL_LIVE_POLL_SECONDS
+
+    def test_imminent_kickoff_counts_as_live(self, shared_cache):
+        """킥오프가 임박한 예정 경기가 있어도 라이브 주기"""
+        kickoff = (datetime.now(timezone.utc) + timedelta(minutes=5)).isoformat().replace("+00:00", "Z")
+        client = FakeAsyncClient(fixtures=[{"id": 1, "utcDate": kickoff}])
+        refresher = _refresher(client)
+
+        asyncio.run(refresher.run_due())
+
+        assert refresher.live_active is True
+
+    def test_no_live_match_stays_idle(self, shared_cache):
+        """라이브 경기도 임박한 경기도 없으면 느린 주기 유지"""
+        client = FakeAsyncClient()
+        refresher = _refresher(client)
+
+        asyncio.run(refresher.run_due())
+
+        assert refresher.live_active is False
+
+    def test_quota_share_stretches_intervals(self):
+        """갱신기 호출량이 한도 몫을 넘으면 주기를 늘림"""
+        client = FakeAsyncClient()
+        relaxed = _refresher(client, quota_share=0.5, rate_per_minute=10)
+        tight = _refresher(client, quota_share=0.05, rate_per_minute=10)
+
+        assert relaxed.get_stats()["interval_stretch"] == 1.0
+        assert tight.get_stats()["interval_stretch"] > 1.0
+        for job in tight.jobs:
+            assert tight.interval_for(job) > relaxed.interval_for(job)
+
+    def test_defers_when_users_are_waiting(self, shared_cache):
+        """토큰 여유가 없으면 예정 경기/순위표 갱신을 미룸"""
+        client = FakeAsyncClient()
+        client.bucket = AsyncTokenBucket(capacity=2, refill_per_second=0.001)
+        refresher = _refresher(client)
+
+        asyncio.run(refresher.run_due())
+
+        assert client.calls == ["live"]
+        assert refresher.deferred == 4
+
+
+class TestCalendarToolCache:
+    """캘린더 Tool이 공용 캐시를 읽는지"""
+
+    def test_calendar_reads_warm_cache(self, shared_cache, monkeypatch):
+        """갱신기가 채운 캐시가 있으면 API를 호출하지 않음"""
+        from llm_service.tools import calendar_tool
+
+        def no_api(fetch):
+            raise AssertionError("API를 호출하면 안 됨")
+
+        monkeypatch.setattr(calendar_tool, "call_football_api", no_api)
+        asyncio.run(_refresher(FakeAsyncClient()).run_due())
+
+        result = calendar_tool.get_matches_by_date("2030-01-01", "PL")
+
+        assert "PL Home vs Away" in result
+
+    def test_calendar_miss_populates_cache(self, shared_cache, monkeypatch):
+        """캐시가 비어 있으면 한 번만 API 호출하고 저장"""
+        from llm_service.tools import calendar_tool
+
+        client = FakeAsyncClient(fixtures=[
+            {"id": 2, "utcDate": "2030-01-02T15:00:00Z", "homeTeam": {"name": "Spurs"}, "awayTeam": {"name": "Arsenal"}}
+        ])
+        monkeypatch.setattr(calendar_tool, "call_football_api", lambda fetch: asyncio.run(fetch(client)))
+
+        calendar_tool.get_matches_by_date("2030-01-02", "PL")
+        result = calendar_tool.get_matches_by_date("2030-01-02", "PL")
+
+        assert "Spurs vs Arsenal" in result
+        assert client.calls == ["matches_PL_SCHEDULED"]
+
+    def test_concurrent_misses_share_one_call(self, shared_cache, monkeypatch):
+        """여러 Agent 스레드의 동시 미스는 서버 루프에서 API 1회 (공용 버킷 사용)"""
+        from llm_service.external_apis import football_data as football_api
+        from llm_service.tools import calendar_tool
+
+        class SlowClient(FakeAsyncClient):
+            async def get_matches(self, competition, status, limit):
+                await asyncio.sleep(0.05)
+                return await super().get_matches(competition, status, limit)
+
+        client = SlowClient()
+        monkeypatch.setattr(football_api, "_football_rate_limiter", client.bucket)
+        monkeypatch.setattr(football_api, "get_async_football_client", lambda: client)
+
+        async def scenario():
+            await client.bucket.acquire()  # 버킷이 서버 루프에 묶인 상태
+            return await asyncio.gather(*(
+                asyncio.to_thread(calendar_tool.get_scheduled_matches, "PL") for _ in range(3)
+            ))
+
+        results = asyncio.run(scenario())
+
+        assert client.calls == ["matches_PL_SCHEDULED"]
+        assert all(result and result[0]["id"] == 1 for result in results)
@@ -0,0 +1,156 @@
+"""
+Keyword 매칭 / 답변 캐시 키워드 사전 계산 테스트 (ChromaDB 없이)
+
+- score_keywords: 저장해 둔 키워드 집합으로 calculate_keyword_match와 같은 점수
+- CacheService: 저장 시 키워드 추출/보관, 조회 시 후보 여러 개를 한 번에 점수 계산 후 재정렬
+"""
+
+import asyncio
+
+import pytest
+
+from llm_service.services import cache_service as cache_module
+from llm_service.services.cache_service import CacheService
+from llm_service.utils import keyword_matcher
+from llm_service.utils.keyword_matcher import (
+    KEYWORD_EXTRACTOR_VERSION,
+    calculate_keyword_match,
+    dump_keywords,
+    extract_keywords,
+    load_keywords,
+    score_keyword_candidates,
+    score_keywords,
+)
+
+ANSWER = "손흥민은 2024년 토트넘에서 Premier League 12골을 기록했습니다. Tottenham 팬들은 환호했습니다."
+
+
+class FakeRag:
+    """cached_answers 컬렉션 대역 (저장 기록 + 고정 검색 결과)"""
+
+    def __init__(self):
+        self.added = []
+        self.results = {"ids": [], "documents": [], "metadatas": [], "distances": []}
+        self.top_k = None
+
+    def add_documents(self, collection_name, documents, metadatas, ids):
+        self.added.append((documents, metadatas, ids))
+
+    def search(self, collection_name, query, top_k=5, where=None):
+        self.top_k = top_k
+        return self.results
+
+
+@pytest.fixture
+def service(monkeypatch):
+    rag = FakeRag()
+    monkeypatch.setattr(cache_module, "get_rag_service", lambda persist_directory: rag)
+    return CacheService()
+
+
+def _stored_entry(service, query, answer):
+    """cache_answer로 저장된 (문서, metadata)"""
+    asyncio.run(service.cache_answer(query, answer))
+    documents, metadatas, _ = service.cache_rag.added[-1]
+    return documents[0], metadatas[0]
+
+
+class TestScoreKeywords:
+    """키워드 집합 점수"""
+
+    @pytest.mark.parametrize("query", [
+        "손흥민 최근 폼은?",
+        "토트넘 2024 시즌 기록",
+        "Premier League 득점 순위",
+        "?",
+    ])
+    def test_same_as_calculate_keyword_match(self, query):
+        assert score_keywords(extract_keywords(query), extract_keywords(ANSWER)) == calculate_keyword_match(query, ANSWER)
+
+    def test_candidates_scored_in_order(self):
+        candidates = [extract_keywords(ANSWER), extract_keywords("리버풀이 승리했습니다"), set()]
+
+        scores = score_keyword_candidates("손흥민 토트넘", candidates)
+
+        assert scores[0] == calculate_keyword_match("손흥민 토트넘", ANSWER)
+        assert scores[1] < scores[0]
+        assert scores[2] == 0.0
+
+    def test_dump_load_roundtrip(self):
+        keywords = extract_keywords(ANSWER) | {"son\nheung"}
+
+        assert load_keywords(dump_keywords(keywords)) == keywords
+
+    @pytest.mark.parametrize("value", [None, "", "not json", '{"a": 1}'])
+    def test_load_invalid(self, value):
+        assert load_keywords(value) is None
+
+
+class TestCacheServiceKeywords:
+    """답변 캐시 저장/조회"""
+
+    def test_cache_answer_stores_keyword_sets(self, service):
+        _, metadata = _stored_entry(service, "손흥민 최근 폼은?", ANSWER)
+
+        assert load_keywords(metadata["answer_keywords"]) == extract_keywords(ANSWER)
+        assert load_keywords(metadata["query_keywords"]) == extract_keywords("손흥민 최근 폼은?")
+        assert metadata["keyword_version"] == KEYWORD_EXTRACTOR_VERSION
+
+    def test_lookup_uses_stored_keywords(self, service, monkeypatch):
+        """조회 시 답변 본문에서 키워드를 다시 추출하지 않음"""
+        document, metadata = _stored_entry(service, "손흥민 최근 폼은?", ANSWER)
+        service.cache_rag.results = {
+            "ids": ["a"], "documents": [document], "metadatas": [metadata], "distances": [0.1],
+        }
+        expected = calculate_keyword_match("손흥민 토트넘", ANSWER)
+        extracted = []
+
+        def counting_extract(text):
+            extracted.append(text)
+            return extract_keywords(text)
+
+        monkeypatch.setattr(cache_module, "extract_keywords", counting_extract)
+        monkeypatch.setattr(keyword_matcher, "extract_keywords", counting_extract)
+
+        cached = asyncio.run(service.get_cached_answer("손흥민 토트넘"))
+
+        assert cached["answer"] == ANSWER
+        assert cached["keyword_score"] == expected
+        assert extracted == ["손흥민 토트넘"]
+
+    def test_rerank_skips_neighbour_with_low_keyword_score(self, service):
+        """가장 가까운 이웃의 Keyword 점수가 낮으면 다음 후보 사용 (기존: 바로 캐시 미스)"""
+        wrong_doc, wrong_meta = _stored_entry(service, "리버풀 최근 폼은?", "리버풀은 최근 5연승입니다.")
+        right_doc, right_meta = _stored_entry(service, "손흥민 최근 폼은?", ANSWER)
+        service.cache_rag.results = {
+            "ids": ["wrong", "right"],
+            "documents": [wrong_doc, right_doc],
+            "metadatas": [wrong_meta, right_meta],
+            "distances": [0.05, 0.15],
+        }
+
+        cached = asyncio.run(service.get_cached_answer("손흥민 토트넘"))
+
+        assert service.cache_rag.top_k == cache_module.CACHE_RERANK_TOP_K
+        assert cached["answer"] == ANSWER
+        assert cached["similarity"] == pytest.approx(0.85)
+
+    def test_legacy_entry_without_keywords(self, service):
+        """키워드 없이 저장된 이전 항목은 답변에서 추출해서 점수 계산"""
+        service.cache_rag.results = {
+            "ids": ["old"], "documents": [ANSWER], "metadatas": [{"normalized_query": "old"}], "distances": [0.1],
+        }
+
+        cached = asyncio.run(service.get_cached_answer("손흥민 토트넘"))
+
+        assert cached["keyword_score"] == calculate_keyword_match("손흥민 토트넘", ANSWER)
+
+    def test_all_candidates_below_thresholds(self, service):
+        service.cache_rag.results = {
+            "ids": ["far", "off"],
+            "documents": [ANSWER, "리버풀은 최근 5연승입니다."],
+            "metadatas": [{}, {}],
+            "distances": [0.5, 0.1],
+        }
+
+        assert asyncio.run(service.get_cached_answer("손흥민 토트넘")) is None
@@ -0,0 +1,118 @@
+"""
+OpenAIService 비동기 클라이언트 테스트 (OpenAI 호출 없이, httpx MockTransport)
+
+- 공용 커넥션 풀: shutdown(close_openai_clients) 후 다시 시작해도 새 풀로 호출 (TestClient 재사용)
+- ContentSafetyService의 async_llm_client도 같은 풀을 따라감
+- 동시 호출 수 제한 (OPENAI_MAX_CONCURRENCY), 호출별/기본 타임아웃 전달
+"""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from llm_service.services import openai_service as openai_module
+from llm_service.services.content_safety_service import ContentSafetyService
+from llm_service.services.openai_service import OpenAIService, close_openai_clients
+
+
+class FakeOpenAIServer:
+    """chat.completions 응답 대역 (요청 타임아웃/동시 처리 수 기록)"""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.timeouts = []
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.timeouts.append(request.extensions["timeout"]["read"])
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.in_flight -= 1
+        return httpx.Response(200, json={
+            "id": "chatcmpl-test", "object": "chat.completion", "created": 0, "model": "gpt-4o-mini",
+            "choices": [{
+                "index": 0, "finish_reason": "stop",
+                "message": {"role": "assistant", "content": json.dumps({"is_safe": True})},
+            }],
+        })
+
+
+@pytest.fixture
+def server(monkeypatch):
+    """공용 풀이 MockTransport로 요청을 보내도록 (풀을 다시 만들어도 유지)"""
+    server = FakeOpenAIServer()
+    real_client = httpx.AsyncClient
+
+    class MockPoolClient(real_client):
+        def __init__(self, **kwargs):
+            super().__init__(transport=httpx.MockTransport(server), **kwargs)
+
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+    monkeypatch.setattr(openai_module, "_shared_http_client", None)
+    monkeypatch.setattr(openai_module.httpx, "AsyncClient", MockPoolClient)
+    monkeypatch.setattr(openai_module, "OPENAI_MAX_RETRIES", 0)
+    yield server
+    asyncio.run(close_openai_clients())
+
+
+def _chat(service, **kwargs):
+    return service.generate_chat_response([{"role": "user", "content": "안녕"}], **kwargs)
+
+
+class TestSharedPool:
+    """공용 커넥션 풀과 재시작"""
+
+    def test_services_survive_lifespan_restart(self, server):
+        service = OpenAIService()
+        safety = ContentSafetyService(use_llm=True)
+
+        async def lifespan(round_no):
+            answer = await _chat(service)
+            # 판정 캐시에 걸리지 않도록 매번 다른 질문
+            verdict = await safety.check_input_async(f"{round_no}라운드 경기 어땠어?")
+            await close_openai_clients()
+            return answer, verdict.is_safe
+
+        # 서버 시작/종료를 두 번 (각각 다른 이벤트 루프)
+        for round_no in range(2):
+            assert asyncio.run(lifespan(round_no)) == ('{"is_safe": true}', True)
+        assert len(server.timeouts) == 4
+
+    def test_async_client_reused_while_pool_open(self, server):
+        service = OpenAIService()
+
+        assert service.async_client is service.async_client
+        assert service.async_client._client is openai_module.get_shared_http_client()
+
+
+class TestLimits:
+    """동시 호출 제한 / 타임아웃"""
+
+    def test_concurrency_bounded(self, server, monkeypatch):
+        monkeypatch.setattr(openai_module, "OPENAI_MAX_CONCURRENCY", 3)
+        server.delay = 0.02
+        service = OpenAIService()
+
+        async def run():
+            return await asyncio.gather(*(_chat(service) for _ in range(10)))
+
+        answers = asyncio.run(run())
+
+        assert len(answers) == 10 and server.max_in_flight == 3
+
+    def test_timeout_passed_per_call(self, server):
+        service = OpenAIService()
+
+        async def run():
+            await _chat(service)
+            await _chat(service, timeout=2.5)
+
+        asyncio.run(run())
+
+        assert server.timeouts == [openai_module.OPENAI_TIMEOUT_SECONDS, 2.5]
@@ -0,0 +1,173 @@
+"""
+키셋(커서) 페이지네이션 테스트
+
+- 커서 인코딩/검증 (잘못된 커서 → 400, 필터 문자열 주입 차단)
+- 게시글/댓글/신고 목록: 커서로 끝까지 넘기면 offset 정렬과 같은 순서, 중복/누락 없음
+- 커서 모드는 본문 제외 컬럼 + 개수 쿼리 생략 (count 파라미터로 estimated/exact)
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+
+from backend.pagination import decode_cursor, encode_cursor
+from backend.routers import posts as posts_router
+from backend.routers import reports as reports_router
+from tests.conftest import FakeSupabaseClient
+
+
+def _last_select(db):
+    query = db.selects()[-1]
+    return query.columns, query.count
+
+
+def _posts(n):
+    # created_at이 같은 게시글이 섞이도록 (3개씩 같은 시각)
+    return [
+        {
+            "post_id": f"post-{i:03d}", "author_id": "u1", "author_username": "tester",
+            "title": f"제목 {i}", "content": f"본문 {i}", "category": "general",
+            "views": 0, "likes": 0, "comment_count": 0, "is_deleted": False,
+            "created_at": f"2025-01-{1 + i // 3:02d}T10:00:00+00:00", "updated_at": None,
+        }
+        for i in range(n)
+    ]
+
+
+def _list_posts(db, **params):
+    defaults = dict(page=1, page_size=10, category=None, pagination="offset", cursor=None, count=None, current_user=None)
+    defaults.update(params)
+    return asyncio.run(posts_router.get_posts(db=db, **defaults))
+
+
+class TestCursor:
+    """커서 인코딩"""
+
+    def test_roundtrip(self):
+        cursor = encode_cursor("2025-01-15T10:30:00.123+00:00", "post-1")
+
+        assert "=" not in cursor
+        assert decode_cursor(cursor) == ("2025-01-15T10:30:00.123+00:00", "post-1")
+
+    @pytest.mark.parametrize("cursor", [
+        "not-a-cursor",
+        encode_cursor("어제", "post-1"),
+        encode_cursor("2025-01-15T10:30:00", 'x",or(is_deleted.eq.true'),
+    ])
+    def test_invalid_cursor_is_400(self, cursor):
+        with pytest.raises(HTTPException) as exc:
+            decode_cursor(cursor)
+
+        assert exc.value.status_code == 400
+
+
+class TestPostList:
+    """게시글 목록"""
+
+    def test_cursor_walk_matches_offset_order(self):
+        db = FakeSupabaseClient({"posts": _posts(53)})
+        expected = [p.post_id for p in _list_posts(db, page_size=100).posts]
+
+        seen, cursor, pages = [], None, 0
+        while True:
+            response = _list_posts(db, page_size=10, pagination="cursor", cursor=cursor)
+            seen += [p.post_id for p in response.posts]
+            pages += 1
+            cursor = response.next_cursor
+            if cursor is None:
+                break
+
+        assert seen == expected
+        assert pages == 6
+
+    def test_cursor_mode_projection_and_count(self):
+        db = FakeSupabaseClient({"posts": _posts(5)})
+
+        response = _list_posts(db, pagination="cursor")
+
+        columns, count = _last_select(db)
+        assert "content" not in columns.split(",")
+        assert count is None
+        assert response.total_count is None and response.page is None
+        assert response.posts[0].content is None
+
+    def test_cursor_mode_estimated_count(self):
+        db = FakeSupabaseClient({"posts": _posts(5)})
+
+        response = _list_posts(db, pagination="cursor", count="estimated")
+
+        assert _last_select(db)[1] == "estimated"
+        assert response.total_count == 5
+
+    def test_offset_mode_unchanged(self):
+        db = FakeSupabaseClient({"posts": _posts(25)})
+
+        response = _list_posts(db, page=3, page_size=10)
+
+        assert _last_select(db) == ("*", "exact")
+        assert response.total_count == 25
+        assert response.page == 3
+        assert len(response.posts) == 5
+        assert response.posts[0].content is not None
+        assert response.next_cursor is None
+
+    def test_invalid_cursor(self):
+        with pytest.raises(HTTPException) as exc:
+            _list_posts(FakeSupabaseClient({"posts": _posts(3)}), cursor="garbage")
+
+        assert exc.value.status_code == 400
+
+
+class TestCommentAndReportList:
+    """댓글 / 신고 목록"""
+
+    def test_comments_paged_ascending(self):
+        comments = [
+            {
+                "comment_id": f"c-{i:02d}", "post_id": "p1", "author_id": "u1", "author_username": "tester",
+                "content": f"댓글 {i}", "likes": 0, "parent_comment_id": None, "is_deleted": False,
+                "created_at": f"2025-01-01T10:{i // 2:02d}:00+00:00", "updated_at": None,
+            }
+            for i in range(7)
+        ]
+        db = FakeSupabaseClient({"comments": comments})
+
+        seen, cursor = [], None
+        while True:
+            response = asyncio.run(posts_router.get_comments("p1", limit=3, cursor=cursor, count="none", db=db))
+            seen += [c.comment_id for c in response.comments]
+            cursor = response.next_cursor
+            if cursor is None:
+                break
+
+        assert seen == [f"c-{i:02d}" for i in range(7)]
+        full = asyncio.run(posts_router.get_comments("p1", limit=None, cursor=None, count="none", db=db))
+        assert full.total_count == 7 and full.next_cursor is None
+
+    def test_admin_reports_cursor(self):
+        reports = [
+            {
+                "report_id": f"r-{i:02d}", "reporter_id": "u1", "reporter_username": "tester",
+                "target_type": "post", "target_id": "p1", "target_author_id": "u2",
+                "category": "spam", "reason": "스팸", "status": "pending", "admin_note": None,
+                "created_at": f"2025-01-{1 + i // 2:02d}T10:00:00+00:00", "resolved_at": None,
+            }
+            for i in range(9)
+        ]
+        db = FakeSupabaseClient({"reports": reports})
+        user = SimpleNamespace(uid="admin")
+
+        seen, cursor = [], None
+        while True:
+            response = asyncio.run(reports_router.get_all_reports(
+                page=1, page_size=4, status_filter=None, pagination="cursor", cursor=cursor,
+                count=None, current_user=user, db=db,
+            ))
+            seen += [r.report_id for r in response.reports]
+            cursor = response.next_cursor
+            if cursor is None:
+                break
+
+        assert seen == [f"r-{i:02d}" for i in reversed(range(9))]
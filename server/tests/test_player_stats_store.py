@@ -0,0 +1,136 @@
+"""
+PlayerStatsStore 테스트
+
+- 기존 JSON 매 요청 로드 방식과 같은 결과 (순위 순서, 이름 매칭 우선순위)
+- 파일 mtime이 바뀌면 다시 로드, 깨진 파일이면 이전 데이터 유지
+"""
+
+import json
+import os
+
+import pytest
+
+from llm_service.services.player_stats_store import PlayerStatsStore
+
+
+SAMPLE = {
+    "프리미어리그": [
+        {"name": "Erling Haaland", "team": "Manchester City", "goals": 15, "assists": 3, "espn_id": 1},
+        {"name": "Son Heung-Min", "ko_name": "손흥민", "team": "Tottenham", "goals": 9, "assists": 6, "espn_id": 2},
+        {"name": "Mohamed Salah", "team": "Liverpool", "goals": 9, "assists": 8, "espn_id": 3},
+        {"name": "Bukayo Saka", "team": "Arsenal", "goals": 5, "assists": 6, "espn_id": 4},
+    ],
+    "라리가": [
+        {"name": "Lee Kang-In", "ko_name": "이강인", "team": "Mallorca", "goals": 4, "assists": 2, "espn_id": 5},
+        {"name": "Son Heung-Min", "team": "Duplicate FC", "goals": 1, "assists": 0, "espn_id": 6},
+    ],
+}
+
+
+def _write(path, data):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False)
+
+
+def _bump_mtime(path):
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+@pytest.fixture
+def store(tmp_path):
+    path = tmp_path / "espn_player_ids.json"
+    _write(path, SAMPLE)
+    return PlayerStatsStore(str(path), reload_check_seconds=0)
+
+
+class TestPlayerStatsStore:
+    """조회 결과"""
+
+    def test_rankings_match_sorted_order(self, store):
+        """순위는 기존 sorted(reverse=True)와 같은 순서 (동점자는 파일 순서)"""
+        players = SAMPLE["프리미어리그"]
+        expected_goals = sorted(players, key=lambda x: x.get("goals", 0), reverse=True)
+        expected_assists = sorted(players, key=lambda x: x.get("assists", 0), reverse=True)
+
+        assert store.top_scorers("프리미어리그", 3) == expected_goals[:3]
+        assert store.top_assists("프리미어리그", 10) == expected_assists
+        assert [p["name"] for p in store.top_scorers("프리미어리그", 3)][1:] == ["Son Heung-Min", "Mohamed Salah"]
+
+    def test_unknown_league_is_empty(self, store):
+        """없는 리그는 빈 목록"""
+        assert store.top_scorers("K리그") == []
+        assert store.leagues() == ["프리미어리그", "라리가"]
+
+    def test_find_player_by_english_or_korean_name(self, store):
+        """영문(대소문자 무시) / 한글 이름 조회"""
+        assert store.find_player("erling haaland")["espn_id"] == 1
+        assert store.find_player("이강인")["espn_id"] == 5
+        assert store.find_player("Unknown Player") is None
+
+    def test_first_league_wins_on_duplicate_name(self, store):
+        """같은 이름이 여러 리그에 있으면 먼저 나온 선수 (기존 선형 탐색과 동일)"""
+        assert store.find_player("Son Heung-Min")["team"] == "Tottenham"
+        assert store.find_player("손흥민")["team"] == "Tottenham"
+
+    def test_loaded_once(self, store):
+        """파일이 그대로면 다시 로드하지 않음"""
+        for _ in range(5):
+            store.top_scorers("프리미어리그")
+            store.find_player("손흥민")
+
+        assert store.loads == 1
+
+
+class TestHotReload:
+    """mtime 기반 다시 로드"""
+
+    def test_reload_on_file_change(self, store):
+        """파일이 바뀌면 새 데이터로 교체"""
+        assert store.top_scorers("프리미어리그", 1)[0]["name"] == "Erling Haaland"
+
+        updated = json.loads(json.dumps(SAMPLE))
+        updated["프리미어리그"][3]["goals"] = 30
+        _write(store.path, updated)
+        _bump_mtime(store.path)
+
+        assert store.top_scorers("프리미어리그", 1)[0]["name"] == "Bukayo Saka"
+        assert store.loads == 2
+
+    def test_broken_file_keeps_previous_data(self, store):
+        """쓰는 중이거나 깨진 파일이면 이전 스냅샷 유지"""
+        store.top_scorers("프리미어리그")
+        with open(store.path, "w", encoding="utf-8") as f:
+            f.write('{"프리미어리그": [')
+        _bump_mtime(store.path)
+
+        assert store.find_player("손흥민")["espn_id"] == 2
+
+    def test_missing_file(self, tmp_path):
+        """파일이 없으면 FileNotFoundError (라우터에서 빈 결과/None으로 처리)"""
+        store = PlayerStatsStore(str(tmp_path / "missing.json"))
+
+        with pytest.raises(FileNotFoundError):
+            store.leagues()
+
+
+class TestStatsRouter:
+    """stats 라우터가 저장소를 쓰는지"""
+
+    def test_router_helpers_use_store(self, store, monkeypatch):
+        from llm_service.routers import stats
+
+        monkeypatch.setattr(stats, "get_player_stats_store", lambda: store)
+
+        assert stats.get_top_scorers_from_cache("프리미어리그", 1)[0]["name"] == "Erling Haaland"
+        assert stats.get_top_assists_from_cache("라리가", 1)[0]["name"] == "Lee Kang-In"
+        assert stats.get_player_stats_from_cache("손흥민")["team"] == "Tottenham"
+
+    def test_router_helpers_without_file(self, tmp_path, monkeypatch):
+        from llm_service.routers import stats
+
+        missing = PlayerStatsStore(str(tmp_path / "missing.json"))
+        monkeypatch.setattr(stats, "get_player_stats_store", lambda: missing)
+
+        assert stats.get_top_scorers_from_cache() == []
+        assert stats.get_player_stats_from_cache("손흥민") is None
@@ -0,0 +1,279 @@
+"""
+게시글 검색 인덱스 테스트 (Supabase 없이)
+
+- 한글 2-gram 토큰, BM25 순위 (제목 가중치), 한 글자 검색어
+- 게시글 생성/수정/삭제 시 인덱스 갱신, 지운 문서 백그라운드 압축 (압축 중 갱신 유지)
+- Supabase 페이지 단위 적재 (적재 중 들어온 갱신 유지)
+- GET /api/posts/search (적재 전 503), posts_search Tool
+- 신고 처리로 삭제한 글 / 다른 인스턴스에서 삭제한 글은 검색 결과에서 제외
+"""
+
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+
+from backend.models import PostUpdate, ReportAction, ReportStatus, UserResponse
+from backend.routers import posts as posts_router
+from backend.routers import reports as reports_router
+from llm_service.tools import posts_search_tool
+from llm_service.utils import post_search_index as index_module
+from llm_service.utils.post_search_index import PostSearchIndex, tokenize
+from tests.conftest import FakeSupabaseClient
+
+
+def _posts_db(rows):
+    return FakeSupabaseClient({"posts": rows})
+
+
+def _reads(db):
+    """posts 조회 횟수"""
+    return len(db.selects("posts"))
+
+
+def _post(post_id, title, content, category="general", **extra):
+    return {
+        "post_id": post_id, "author_id": "u1", "author_username": "tester", "title": title,
+        "content": content, "category": category, "views": 0, "likes": 0, "comment_count": 0,
+        "created_at": f"2025-01-01T00:00:{post_id[-2:]}", "updated_at": None, "is_deleted": False, **extra,
+    }
+
+
+POSTS = [
+    _post("p01", "손흥민 시즌 10호골", "토트넘 손흥민이 오늘 경기에서 골을 넣었습니다"),
+    _post("p02", "아스날 경기 분석", "아스날의 압박 전술과 손흥민 수비 대응을 분석합니다", category="축구분석"),
+    _post("p03", "맨시티 우승 전망", "맨시티는 이번 시즌에도 강력합니다"),
+    _post("p04", "EPL 이적시장", "Arsenal signs a new striker before the deadline"),
+]
+
+
+@pytest.fixture
+def index(monkeypatch):
+    index = PostSearchIndex(refresh_seconds=0, page_size=2)
+    monkeypatch.setattr(index_module, "_post_search_index", index)
+    return index
+
+
+def _ids(hits):
+    return [hit.post_id for hit in hits]
+
+
+def _wait_until(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.01)
+
+
+class TestTokenize:
+    """토큰화"""
+
+    def test_hangul_bigrams_and_latin_words(self):
+        assert tokenize("손흥민이 Arsenal 2골!") == ["손흥", "흥민", "민이", "arsenal", "2", "골"]
+
+
+class TestSearch:
+    """BM25 검색"""
+
+    def test_ranks_title_match_first(self, index):
+        index.build(POSTS)
+
+        hits, total = index.search("손흥민")
+
+        assert _ids(hits) == ["p01", "p02"]
+        assert total == 2
+        assert hits[0].score > hits[1].score > 0
+
+    def test_category_latin_and_single_syllable(self, index):
+        index.build(POSTS)
+
+        assert _ids(index.search("손흥민", category="축구분석")[0]) == ["p02"]
+        assert _ids(index.search("arsenal")[0]) == ["p04"]
+        # 한 글자 검색어는 그 글자로 시작하는 2-gram으로 확장 ("골" → "골을", "호골"은 제외)
+        assert _ids(index.search("골")[0]) == ["p01"]
+        assert index.search("레알 마드리드") == ([], 0)
+
+    def test_python_fallback_matches_numpy(self, index, monkeypatch):
+        index.build(POSTS)
+        queries = ["손흥민", "아스날 분석", "골", "시즌"]
+        expected = [index.search(q) for q in queries]
+
+        monkeypatch.setattr(index_module, "np", None)
+
+        for query, (hits, total) in zip(queries, expected):
+            fallback_hits, fallback_total = index.search(query)
+            assert _ids(fallback_hits) == _ids(hits) and fallback_total == total
+            assert [h.score for h in fallback_hits] == pytest.approx([h.score for h in hits], rel=1e-4)
+
+    def test_upsert_remove_and_compaction(self, index):
+        index.build(POSTS)
+
+        index.upsert({**POSTS[2], "title": "맨시티 손흥민 영입설"})
+        index.remove("p01")
+
+        assert _ids(index.search("손흥민")[0]) == ["p03", "p02"]
+        assert _ids(index.search("우승")[0]) == []
+
+        for i in range(1200):
+            index.upsert(_post(f"x{i:04d}", "더미", f"내용 {i}"))
+            index.remove(f"x{i:04d}")
+        _wait_until(lambda: not index.get_stats()["compacting"])
+
+        stats = index.get_stats()
+        assert stats["compactions"] >= 1
+        assert stats["posts"] == 3
+        assert _ids(index.search("손흥민")[0]) == ["p03", "p02"]
+
+    def test_compaction_runs_off_lock_and_keeps_concurrent_updates(self, index, monkeypatch):
+        index.build(POSTS)
+        started, release = threading.Event(), threading.Event()
+        compacted = index_module._IndexState.compacted
+
+        def slow_compacted(state, limit):
+            started.set()
+            release.wait(5)
+            return compacted(state, limit)
+
+        monkeypatch.setattr(index_module._IndexState, "compacted", slow_compacted)
+        for i in range(1001):
+            index.upsert(_post(f"x{i:04d}", "더미", f"내용 {i}"))
+            index.remove(f"x{i:04d}")
+        assert started.wait(5)
+
+        # 압축 중에도 갱신/검색은 기다리지 않음, 압축 중 갱신은 새 인덱스에 다시 적용
+        index.upsert(_post("p99", "손흥민 해트트릭", "새 글"))
+        index.remove("p02")
+        assert _ids(index.search("손흥민")[0]) == ["p99", "p01"]
+        assert index.get_stats()["compacting"] is True
+
+        release.set()
+        _wait_until(lambda: not index.get_stats()["compacting"])
+
+        stats = index.get_stats()
+        assert stats["compactions"] == 1
+        assert stats["posts"] == 4 and stats["deleted_slots"] == 0
+        assert _ids(index.search("손흥민")[0]) == ["p99", "p01"]
+        assert _ids(index.search("더미")[0]) == []
+
+
+class TestLoad:
+    """Supabase 적재"""
+
+    def test_pages_through_posts_and_keeps_updates_made_during_load(self, index):
+        db = _posts_db(POSTS + [_post("p05", "삭제된 글 손흥민", "내용", is_deleted=True)])
+
+        def update_during_load(table):
+            if _reads(db) == 1:
+                # 첫 페이지 읽은 직후 다른 요청에서 글 생성/삭제
+                index.upsert(_post("p99", "손흥민 해트트릭", "새 글"))
+                index.remove("p02")
+
+        db.on_read = update_during_load
+        assert index.load(db) == 4  # p01, p03, p04 + 적재 중 생성된 p99
+
+        assert _reads(db) == 3  # page_size=2: 2 + 2 + 0
+        assert _ids(index.search("손흥민")[0]) == ["p99", "p01"]
+        assert index.load(db) == 0  # refresh_seconds=0 → 다시 적재하지 않음
+
+    def test_concurrent_ensure_loaded_loads_once(self, index):
+        db = _posts_db(POSTS)
+        threads = [threading.Thread(target=index.ensure_loaded, args=(db,)) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert index.get_stats()["loads"] == 1
+        assert _reads(db) == 3
+
+
+class TestSearchRoute:
+    """GET /api/posts/search / posts_search Tool"""
+
+    def test_route_returns_503_until_loaded(self, index):
+        db = _posts_db(POSTS)
+        loading = threading.Event()
+        db.on_read = lambda table: loading.wait(5)
+
+        with pytest.raises(HTTPException) as exc:
+            asyncio.run(posts_router.search_posts(q="손흥민", limit=10, category=None, db=db))
+        assert exc.value.status_code == 503
+        assert exc.value.headers["Retry-After"] == str(posts_router.POST_SEARCH_RETRY_AFTER_SECONDS)
+
+        # 적재는 요청과 별개로 백그라운드에서 진행
+        loading.set()
+        _wait_until(lambda: index.ready)
+        result = asyncio.run(posts_router.search_posts(q="손흥민", limit=10, category=None, db=db))
+        assert [post.post_id for post in result.posts] == ["p01", "p02"]
+        assert index.get_stats()["loads"] == 1
+
+    def test_route_returns_fresh_rows_and_reflects_edits(self, index, monkeypatch):
+        monkeypatch.setattr(posts_router, "get_content_safety_service", lambda: None)
+        db = _posts_db(POSTS)
+        index.load(db)
+        db.tables["posts"][1]["likes"] = 7
+        user = UserResponse(uid="u1", email="u1@example.com", username="tester", created_at="2025-01-01T00:00:00")
+
+        result = asyncio.run(posts_router.search_posts(q="손흥민 분석", limit=10, category=None, db=db))
+
+        assert [post.post_id for post in result.posts] == ["p02", "p01"]
+        assert result.posts[0].likes == 7 and result.posts[0].content
+        assert result.total_matches == 2
+
+        asyncio.run(posts_router.update_post("p03", PostUpdate(title="맨시티 전술 분석"), current_user=user, db=db))
+        asyncio.run(posts_router.delete_post("p01", current_user=user, db=db))
+
+        result = asyncio.run(posts_router.search_posts(q="분석", limit=10, category=None, db=db))
+        assert sorted(post.post_id for post in result.posts) == ["p02", "p03"]
+        assert index.get_stats()["loads"] == 1
+
+    def test_tool_uses_index(self, index, monkeypatch):
+        db = _posts_db(POSTS)
+        monkeypatch.setattr("backend.supabase_config.get_supabase_client", lambda: db)
+
+        loading = threading.Event()
+        db.on_read = lambda table: loading.wait(5)
+
+        assert "준비 중" in posts_search_tool.search_posts("손흥민")
+        loading.set()
+        _wait_until(lambda: index.ready)
+
+        output = posts_search_tool.search_posts("손흥민")
+
+        assert "게시글 2개" in output
+        assert output.index("손흥민 시즌 10호골") < output.index("아스날 경기 분석")
+
+    def test_moderation_delete_removes_post(self, index, monkeypatch):
+        report = {
+            "report_id": "r1", "reporter_id": "reporter", "reporter_username": "tester", "target_type": "post",
+            "target_id": "p01", "target_author_id": "u1", "category": "spam", "reason": "스팸 게시글",
+            "status": "pending", "admin_note": None, "created_at": "2025-01-02T00:00:00", "resolved_at": None,
+        }
+        db = FakeSupabaseClient({"posts": POSTS, "reports": [report]})
+        monkeypatch.setattr("backend.supabase_config.get_supabase_client", lambda: db)
+        index.load(db)
+
+        action = ReportAction(status=ReportStatus.RESOLVED, delete_content=True)
+        asyncio.run(reports_router.process_report("r1", action, current_user=SimpleNamespace(uid="admin"), db=db))
+
+        assert _ids(index.search("손흥민")[0]) == ["p02"]
+        result = asyncio.run(posts_router.search_posts(q="손흥민", limit=10, category=None, db=db))
+        assert [post.post_id for post in result.posts] == ["p02"]
+        output = posts_search_tool.search_posts("손흥민")
+        assert "게시글 1개" in output and "손흥민 시즌 10호골" not in output
+
+    def test_tool_skips_posts_deleted_elsewhere(self, index, monkeypatch):
+        db = _posts_db(POSTS)
+        monkeypatch.setattr("backend.supabase_config.get_supabase_client", lambda: db)
+        index.load(db)
+        # 다른 인스턴스에서 삭제 (이 인스턴스의 인덱스에는 아직 남아 있음)
+        db.tables["posts"][0]["is_deleted"] = True
+
+        output = posts_search_tool.search_posts("손흥민")
+
+        assert _ids(index.search("손흥민")[0]) == ["p01", "p02"]
+        assert "게시글 1개" in output
+        assert "손흥민 시즌 10호골" not in output and "아스날 경기 분석" in output
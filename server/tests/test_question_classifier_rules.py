@@ -0,0 +1,112 @@
+"""
+질문 분류 규칙 엔진 / 분류 캐시 테스트 (ChromaDB, LLM 없이)
+
+- match_rules: 어떤 규칙이 판정했는지, 기존 순차 검사와 같은 우선순위
+- 분류 캐시: 크기 상한 (LRU), 히트율 통계
+"""
+
+import asyncio
+
+import pytest
+
+from llm_service.services import openai_service as openai_module
+from llm_service.utils import question_classifier
+from llm_service.utils.question_classifier import get_classifier_stats, is_complex_question, match_rules
+from llm_service.utils.ttl_cache import TTLCache
+
+
+@pytest.fixture(autouse=True)
+def isolated_classifier(monkeypatch):
+    """ChromaDB 비활성화 + 모듈 캐시/집계 격리"""
+    monkeypatch.setattr(question_classifier, "_get_classification_rag", lambda: None)
+    monkeypatch.setattr(question_classifier, "_question_classification_cache", TTLCache(maxsize=100, ttl_seconds=60))
+    question_classifier._decision_counts.clear()
+
+
+class TestMatchRules:
+    """규칙 판정"""
+
+    @pytest.mark.parametrize("query, rule, is_complex", [
+        ("손흥민 그리고 케인", "multi_action", True),
+        ("손흥민 정보 알려주고 최근 경기도 보여줘", "verb_connector", True),
+        ("경기 123456 분석해줘", "match_id", True),
+        ("손흥민과 홀란드 누가 더 좋아요?", "comparison_intent", True),
+        ("맨유 토트넘", "abbreviated_comparison", True),
+        ("맨유 vs 토트넘 비교", "comparison_pattern", True),
+        ("비교", "comparison_without_targets", False),
+        ("경기를 분석해서 정리", "complex_action", True),
+        ("하이라이트 영상", "video", True),
+        ("오늘 경기 결과는?", "match_result", False),
+        ("이번 주 경기 스케줄", "calendar", True),
+        ("내가 좋아하는 팀", "preference", True),
+    ])
+    def test_rule_fired(self, query, rule, is_complex):
+        matched = match_rules(query)
+
+        assert matched.rule == rule
+        assert matched.is_complex is is_complex
+
+    def test_no_rule(self):
+        assert match_rules("손흥민 최근 폼은?") is None
+
+    def test_priority_not_position(self):
+        """키워드 등장 위치가 아니라 규칙 순서로 판정 (영상 요청이 경기 결과 조회보다 우선)"""
+        assert match_rules("경기 결과 영상").rule == "video"
+
+    def test_question_marker_blocks_abbreviation(self):
+        assert match_rules("맨유는 토트넘") is None
+
+    def test_persist_only_for_multi_action_rules(self):
+        assert match_rules("손흥민 그리고 케인").persist
+        assert not match_rules("하이라이트 영상").persist
+
+
+class TestClassificationCache:
+    """분류 캐시 / 통계"""
+
+    def test_cache_hit_and_stats(self):
+        async def run():
+            await is_complex_question("맨유 vs 토트넘 비교", use_llm_fallback=False)
+            return await is_complex_question("  맨유 VS 토트넘 비교 ", use_llm_fallback=False)
+
+        assert asyncio.run(run()) is True
+
+        stats = get_classifier_stats()
+        assert stats["cache"]["hits"] == 1
+        assert stats["cache"]["size"] == 1
+        assert stats["decisions"] == {"comparison_pattern": 1}
+
+    def test_cache_is_bounded(self, monkeypatch):
+        monkeypatch.setattr(question_classifier, "_question_classification_cache", TTLCache(maxsize=10, ttl_seconds=60))
+
+        async def run():
+            for i in range(50):
+                await is_complex_question(f"손흥민 최근 폼 {i}", use_llm_fallback=False)
+
+        asyncio.run(run())
+
+        stats = get_classifier_stats()["cache"]
+        assert stats["size"] == 10
+        assert stats["evictions"] == 40
+        assert question_classifier._decision_counts["default"] == 50
+
+    def test_llm_fallback_uses_shared_service(self, monkeypatch):
+        """LLM fallback은 get_openai_service() 싱글톤 재사용"""
+        calls = []
+
+        class FakeService:
+            async def chat(self, messages, timeout=None):
+                calls.append(messages)
+                return "COMPLEX"
+
+        fake = FakeService()
+        monkeypatch.setattr(openai_module, "get_openai_service", lambda: fake)
+
+        async def run():
+            first = await is_complex_question("손흥민과 토트넘", use_llm_fallback=True)
+            second = await is_complex_question("손흥민과 토트넘", use_llm_fallback=True)
+            return first, second
+
+        assert asyncio.run(run()) == (True, True)
+        assert len(calls) == 1
+        assert get_classifier_stats()["decisions"] == {"llm": 1}
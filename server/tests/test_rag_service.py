@@ -0,0 +1,342 @@
+"""
+RAGService 테스트 (실제 Chroma, 임시 디렉토리 + 가짜 임베딩)
+
+- 거리 → 유사도: 기존 l2 컬렉션과 새 cosine 컬렉션 모두 코사인 거리로 반환 (similarity = 1 - distance)
+- "default": 기본 지식 컬렉션 여러 개를 합쳐 거리순 top_k
+- search_batch: 질의 여러 개를 임베딩 1회로 검색, where 메타데이터 필터
+- 경기 분석 (라우터/Tool): 요청 리그 또는 경기의 대회 코드로 검색 범위 제한
+- 답변 캐시 이전: 예전 "langchain" 컬렉션의 답변을 cached_answers로 옮김
+- 레지스트리: 디렉토리별 싱글톤, close_rag_services 후 다시 열기
+- get_cache_service: 동시 첫 호출에도 1회 생성, 초기화 실패는 백오프 후 재시도
+"""
+
+import asyncio
+import hashlib
+import math
+from types import SimpleNamespace
+
+import pytest
+
+from llm_service.services import cache_service as cache_service_module
+from llm_service.services import rag_service as rag_service_module
+from llm_service.services.cache_service import CacheService
+from llm_service.routers import match_analysis as match_analysis_router
+from llm_service.models import MatchAnalysisRequest
+from llm_service.services.data_ingestion import DataIngestionService
+from llm_service.services.rag_service import RAGService
+from llm_service.tools import match_analysis_tool
+
+DIM = 32
+
+
+class FakeEmbeddings:
+    """단어 해시 bag-of-words 단위 벡터 (호출 수 집계)"""
+
+    def __init__(self):
+        self.calls = 0
+
+    @staticmethod
+    def vector(text):
+        values = [0.0] * DIM
+        for word in text.lower().split():
+            values[int(hashlib.md5(word.encode()).hexdigest(), 16) % DIM] += 1.0
+        norm = math.sqrt(sum(v * v for v in values)) or 1.0
+        return [v / norm for v in values]
+
+    def embed_documents(self, texts):
+        self.calls += 1
+        return [self.vector(text) for text in texts]
+
+    def embed_query(self, text):
+        self.calls += 1
+        return self.vector(text)
+
+
+def cosine(a, b):
+    return sum(x * y for x, y in zip(FakeEmbeddings.vector(a), FakeEmbeddings.vector(b)))
+
+
+@pytest.fixture
+def embeddings(monkeypatch):
+    embeddings = FakeEmbeddings()
+    monkeypatch.setattr(rag_service_module, "get_embeddings", lambda: embeddings)
+    return embeddings
+
+
+@pytest.fixture
+def rag(tmp_path, embeddings):
+    service = RAGService(persist_directory=str(tmp_path / "chroma"))
+    yield service
+    service.close()
+
+
+class TestDistances:
+    """거리 → 유사도"""
+
+    def test_to_cosine_distance(self):
+        assert RAGService._to_cosine_distance(0.5, "l2") == 0.25
+        assert RAGService._to_cosine_distance(0.5, "cosine") == 0.5
+        assert RAGService._to_cosine_distance(0.5, "ip") == 0.5
+
+    @pytest.mark.parametrize("collection", ["langchain", "cached_answers"])
+    def test_similarity_matches_cosine(self, rag, collection):
+        """l2(기존 기본 컬렉션)/cosine(새 컬렉션) 모두 1 - distance = 코사인 유사도"""
+        docs = ["arsenal tactics pressing", "son heung-min goal", "weather london rain"]
+        rag.add_documents(collection, docs)
+
+        result = rag.search(collection, "arsenal pressing tactics analysis", top_k=3)
+
+        assert result["documents"][0] == docs[0]
+        for document, distance in zip(result["documents"], result["distances"]):
+            assert 1 - distance == pytest.approx(cosine("arsenal pressing tactics analysis", document), abs=1e-4)
+        assert result["distances"] == sorted(result["distances"])
+
+
+class TestCollections:
+    """컬렉션 별칭 / 배치 검색 / 필터"""
+
+    def test_default_merges_knowledge_collections(self, rag):
+        rag.add_documents("default", ["arsenal history"])
+        rag.add_documents("matches", ["arsenal chelsea match report"])
+        rag.add_documents("standings", ["arsenal standings first place"])
+        rag.add_documents("cached_answers", ["arsenal cached answer"])  # default 대상 아님
+
+        result = rag.search("default", "arsenal match report", top_k=2)
+
+        assert result["documents"] == ["arsenal chelsea match report", "arsenal history"]
+        assert rag.get_collection_stats("default")["count"] == 3
+        assert rag.search("missing", "arsenal")["ids"] == []
+
+    def test_search_batch_embeds_once(self, rag, embeddings):
+        rag.add_documents("matches", ["arsenal chelsea", "liverpool everton", "tottenham arsenal"])
+        embeddings.calls = 0
+
+        results = rag.search_batch("matches", ["liverpool", "chelsea", "tottenham"], top_k=1)
+
+        assert [r["documents"] for r in results] == [["liverpool everton"], ["arsenal chelsea"], ["tottenham arsenal"]]
+        assert embeddings.calls == 1
+        assert rag.search_batch("matches", []) == []
+
+    def test_where_filter(self, rag):
+        rag.add_documents(
+            "standings",
+            ["arsenal first place", "arsenal scorers"],
+            metadatas=[{"type": "standing"}, {"type": "scorer"}],
+        )
+
+        result = rag.search("standings", "arsenal first place", top_k=5, where={"type": "scorer"})
+
+        assert result["documents"] == ["arsenal scorers"]
+        assert result["metadatas"][0]["type"] == "scorer"
+
+    def test_upsert_same_id(self, rag):
+        rag.add_documents("teams", ["arsenal old"], ids=["t1"])
+        rag.add_documents("teams", ["arsenal new"], ids=["t1"])
+
+        assert rag.search("teams", "arsenal")["documents"] == ["arsenal new"]
+
+
+def _match(match_id, home, away, competition):
+    return {
+        "id": match_id, "homeTeam": {"id": match_id * 10, "name": home}, "awayTeam": {"id": match_id * 10 + 1, "name": away},
+        "score": {"fullTime": {"home": 1, "away": 0}}, "utcDate": "2025-01-01T15:00:00Z", "status": "FINISHED",
+        "competition": {"code": competition},
+    }
+
+
+class TestLeagueFilter:
+    """경기 분석 RAG 검색의 리그 필터"""
+
+    @pytest.fixture
+    def league_rag(self, rag, monkeypatch):
+        # initialize_rag.py와 같은 경로로 저장 (DataIngestionService 문서 → matches/teams 컬렉션)
+        ingestion = DataIngestionService(football_client=None, openai_service=None)
+        matches = [
+            ingestion.format_match_document(_match(1, "Arsenal", "Chelsea", "PL"), "PL"),
+            ingestion.format_match_document(_match(2, "Arsenal", "Sevilla", "LA")),
+        ]
+        teams = [ingestion.format_team_document({"id": 57, "name": "Arsenal", "shortName": "ARS"}, "PL")]
+        for collection, docs in (("matches", matches), ("teams", teams)):
+            rag.add_documents(
+                collection,
+                [doc["document"] for doc in docs],
+                metadatas=[doc["metadata"] for doc in docs],
+                ids=[doc["id"] for doc in docs],
+            )
+        rag.add_documents("default", ["Arsenal history without league"])
+        monkeypatch.setattr(match_analysis_tool, "get_rag_service", lambda: rag)
+        monkeypatch.setattr(match_analysis_router, "get_rag_service", lambda: rag)
+        return rag
+
+    def test_tool_searches_match_competition(self, league_rag, monkeypatch):
+        monkeypatch.setattr(match_analysis_tool, "call_football_api", lambda call: _match(3, "Arsenal", "Chelsea", "PL"))
+
+        output = match_analysis_tool.analyze_match("3")
+
+        assert "Arsenal vs Chelsea" in output and "팀: Arsenal (ARS)" in output
+        assert "Sevilla" not in output and "without league" not in output
+
+    def test_route_uses_request_league(self, league_rag, monkeypatch):
+        sent = []
+        openai = SimpleNamespace(
+            prompt_service=SimpleNamespace(manager=SimpleNamespace(get_prompt=lambda *args: "system")),
+            chat_completion=lambda messages: sent.append(messages[-1]["content"]) or "분석",
+        )
+
+        async def get_match_details(match_id):
+            return _match(match_id, "Arsenal", "Chelsea", "PL")
+
+        monkeypatch.setattr(match_analysis_router, "get_openai_service", lambda: openai)
+        monkeypatch.setattr(
+            match_analysis_router, "get_async_football_client",
+            lambda: SimpleNamespace(get_match_details=get_match_details),
+        )
+
+        response = asyncio.run(match_analysis_router.analyze_match(3, MatchAnalysisRequest(match_id=3, league="LA")))
+
+        assert response.score == "1-0"
+        assert "Sevilla" in sent[0]
+        assert "Chelsea (1-0)" not in sent[0] and "ARS" not in sent[0] and "without league" not in sent[0]
+
+
+class TestLegacyAnswerMigration:
+    """예전 답변 캐시 ("langchain" 컬렉션) 이전"""
+
+    def test_cache_service_moves_legacy_answers(self, tmp_path, embeddings, monkeypatch):
+        legacy = RAGService(persist_directory=str(tmp_path / "cache"))
+        legacy.add_documents(
+            "langchain",
+            ["arsenal pressing answer", "son goal answer"],
+            metadatas=[{"original_query": "arsenal pressing"}, {"original_query": "son goal"}],
+            ids=["answer_a", "answer_b"],
+        )
+        monkeypatch.setattr(cache_service_module, "get_rag_service", lambda persist_directory: legacy)
+
+        CacheService()
+        CacheService()  # 두 번째 시작은 옮길 것이 없음
+
+        assert legacy.get_collection_stats("langchain")["count"] == 0
+        assert legacy.get_collection_stats("cached_answers")["count"] == 2
+        result = legacy.search("cached_answers", "arsenal pressing", top_k=1)
+        assert result["ids"] == ["answer_a"]
+        assert result["metadatas"][0]["original_query"] == "arsenal pressing"
+        assert 1 - result["distances"][0] == pytest.approx(cosine("arsenal pressing", "arsenal pressing answer"), abs=1e-4)
+        legacy.close()
+
+    def test_migrate_missing_source_is_noop(self, rag):
+        assert rag.migrate_collection("nothing_here", "cached_answers") == 0
+        assert rag.search("cached_answers", "arsenal")["ids"] == []
+
+
+@pytest.fixture
+def registry(tmp_path, embeddings, monkeypatch):
+    monkeypatch.setattr(rag_service_module, "_rag_registry", {})
+    yield tmp_path
+    rag_service_module.close_rag_services()
+
+
+class TestRegistry:
+    """persist_directory별 RAGService 레지스트리"""
+
+    def test_one_service_per_directory(self, registry):
+        kb = str(registry / "chroma_db")
+        cache = str(registry / "chroma_db_cache")
+
+        assert rag_service_module.get_rag_service(kb) is rag_service_module.get_rag_service(kb)
+        assert rag_service_module.get_rag_service(cache) is not rag_service_module.get_rag_service(kb)
+
+    def test_concurrent_first_calls_share_instance(self, registry):
+        from concurrent.futures import ThreadPoolExecutor
+
+        path = str(registry / "chroma_db")
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            services = list(pool.map(lambda _: rag_service_module.get_rag_service(path), range(16)))
+
+        assert all(service is services[0] for service in services)
+
+    def test_close_then_reopen(self, registry):
+        path = str(registry / "chroma_db")
+        first = rag_service_module.get_rag_service(path)
+        first.add_documents("matches", ["arsenal chelsea"])
+
+        rag_service_module.close_rag_services()
+
+        assert rag_service_module._rag_registry == {}
+        assert first._stores == {}
+        # 재시작 후 같은 디렉토리를 새 핸들로 다시 열면 데이터 유지
+        second = rag_service_module.get_rag_service(path)
+        assert second is not first
+        assert second.search("matches", "arsenal")["documents"] == ["arsenal chelsea"]
+
+
+class FlakyRagFactory:
+    """처음 failures번은 ChromaDB를 열지 못하는 get_rag_service 대역"""
+
+    DEFAULT_COLLECTION = "langchain"
+
+    def __init__(self, failures):
+        self.failures = failures
+        self.attempts = 0
+
+    def __call__(self, persist_directory):
+        self.attempts += 1
+        if self.attempts <= self.failures:
+            raise RuntimeError(f"{persist_directory} 잠김")
+        return self
+
+    def migrate_collection(self, source, target):
+        return 0
+
+
+class TestCacheServiceSingleton:
+    """get_cache_service 지연 생성 / 재시도"""
+
+    @pytest.fixture
+    def singleton(self, monkeypatch):
+        clock = [1000.0]
+        monkeypatch.setattr(cache_service_module, "_cache_service", None)
+        monkeypatch.setattr(cache_service_module, "_cache_service_failures", 0)
+        monkeypatch.setattr(cache_service_module, "_cache_service_retry_at", 0.0)
+        monkeypatch.setattr(cache_service_module, "CACHE_SERVICE_RETRY_SECONDS", 5)
+        monkeypatch.setattr(cache_service_module, "CACHE_SERVICE_RETRY_MAX_SECONDS", 15)
+        monkeypatch.setattr(cache_service_module.time, "monotonic", lambda: clock[0])
+        return clock
+
+    def test_transient_failure_retried_with_backoff(self, singleton, monkeypatch):
+        flaky = FlakyRagFactory(failures=3)
+        monkeypatch.setattr(cache_service_module, "get_rag_service", flaky)
+
+        assert cache_service_module.get_cache_service() is None
+        assert cache_service_module.get_cache_service() is None  # 백오프 중에는 시도 안 함
+        assert flaky.attempts == 1
+        assert cache_service_module._cache_service_failures == 1
+
+        for delay in (5, 10, 15):  # 5초 → 10초 → 최대 15초
+            singleton[0] += delay
+            service = cache_service_module.get_cache_service()
+
+        # 성공한 시도에서 답변 캐시 / 지식 베이스 두 디렉토리를 엶
+        assert service is not None and flaky.attempts == 5
+        assert service.cache_rag is flaky
+        assert cache_service_module._cache_service_failures == 0
+        assert cache_service_module.get_cache_service() is service
+
+    def test_concurrent_first_calls_create_once(self, singleton, monkeypatch):
+        import threading
+        from concurrent.futures import ThreadPoolExecutor
+
+        created = []
+        barrier = threading.Barrier(8)
+
+        def make_service():
+            created.append(object())
+            return created[-1]
+
+        monkeypatch.setattr(cache_service_module, "CacheService", make_service)
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            services = list(pool.map(
+                lambda _: (barrier.wait(), cache_service_module.get_cache_service())[1], range(8)
+            ))
+
+        assert len(created) == 1
+        assert all(service is created[0] for service in services)
@@ -0,0 +1,213 @@
+"""
+신고 남용 통계 테스트 (Supabase 없이)
+
+- 신고자별 통계: 기존 전체 이력 집계와 같은 값 (RPC / 개수 쿼리 두 경로)
+- 슬라이딩 윈도우 만료, 대상 유저 집중 카운트
+- create_report / process_report가 메모리 통계를 갱신 → 두 번째 신고부터 reports 이력 조회 없음
+"""
+
+import asyncio
+import random
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+
+from backend import report_abuse
+from backend.models import ReportAction, ReportCategory, ReportCreate, ReportStatus, ReportTargetType
+from backend.report_abuse import REPORT_ABUSE_RPC, ReportAbuseTracker, parse_report_time
+from backend.routers import reports as reports_router
+from tests.conftest import FakeSupabaseClient
+
+
+def _after(created_at, since):
+    """timestamptz 비교 대역 (naive 값은 로컬 시각)"""
+    return parse_report_time(created_at) > parse_report_time(since)
+
+
+def _reports_db(reports, rpc=False):
+    """reports/posts 테이블 (+ rpc=True면 reporter_abuse_stats RPC) 대역"""
+    db = FakeSupabaseClient({"reports": reports, "posts": [{"post_id": "p1", "author_id": "author"}]})
+
+    def abuse_stats(params):
+        rows = [r for r in db.tables["reports"] if r["reporter_id"] == params["p_reporter_id"]]
+        return {
+            "total_reports": len(rows),
+            "dismissed_count": sum(r["status"] == "dismissed" for r in rows),
+            "resolved_count": sum(r["status"] == "resolved" for r in rows),
+            "recent": [r for r in rows if _after(r["created_at"], params["p_since"])],
+        }
+
+    if rpc:
+        db.rpcs[REPORT_ABUSE_RPC] = abuse_stats
+    return db
+
+
+def _report_reads(db):
+    """reports 이력 조회 수 (테이블 조회 + 통계 RPC)"""
+    return len(db.selects("reports")) + sum(name == REPORT_ABUSE_RPC for name, _ in db.rpc_calls)
+
+
+def _legacy_stats(reports, reporter_id, now):
+    """기존 check_reporter_abuse 집계 (전체 이력 순회)"""
+    one_hour_ago = (now - timedelta(hours=1)).isoformat()
+    one_day_ago = (now - timedelta(days=1)).isoformat()
+    rows = [r for r in reports if r["reporter_id"] == reporter_id]
+    hour = day = dismissed = resolved = 0
+    targets = {}
+    for r in rows:
+        if r["created_at"] > one_hour_ago:
+            hour += 1
+        if r["created_at"] > one_day_ago:
+            day += 1
+            if r.get("target_author_id"):
+                targets[r["target_author_id"]] = targets.get(r["target_author_id"], 0) + 1
+        if r["status"] == "dismissed":
+            dismissed += 1
+        elif r["status"] in ["resolved", "dismissed"]:
+            resolved += 1
+    return {
+        "total_reports": len(rows),
+        "reports_last_hour": hour,
+        "reports_last_day": day,
+        "dismissed_count": dismissed,
+        "resolved_count": resolved,
+        "max_target_count": max([c for c in targets.values() if c >= 3], default=0),
+    }
+
+
+def _history(n, now, seed, statuses=("pending", "reviewing", "resolved", "dismissed")):
+    rng = random.Random(seed)
+    return [
+        {
+            "report_id": f"r{i}",
+            "reporter_id": "reporter",
+            "target_author_id": rng.choice(["a", "b", "c", None]),
+            "status": rng.choice(statuses),
+            "created_at": (now - timedelta(minutes=rng.randint(1, 60 * 24 * 3))).isoformat(),
+        }
+        for i in range(n)
+    ]
+
+
+@pytest.fixture
+def tracker(monkeypatch):
+    tracker = ReportAbuseTracker(maxsize=100, reseed_seconds=600)
+    monkeypatch.setattr(report_abuse, "_report_abuse_tracker", tracker)
+    return tracker
+
+
+class TestSnapshot:
+    """통계 값"""
+
+    @pytest.mark.parametrize("rpc", [True, False])
+    @pytest.mark.parametrize("seed", [1, 2, 3])
+    def test_matches_full_history_scan(self, tracker, rpc, seed):
+        now = datetime.now()
+        reports = _history(300, now, seed)
+        db = _reports_db(reports, rpc=rpc)
+
+        snapshot = asyncio.run(tracker.snapshot(db, "reporter", now=now))
+
+        expected = _legacy_stats(reports, "reporter", now)
+        assert {k: snapshot[k] for k in expected} == expected
+        assert tracker.seeds == ({"rpc": 1, "queries": 0} if rpc else {"rpc": 0, "queries": 1})
+
+    def test_windows_expire_incrementally(self, tracker):
+        now = datetime.now()
+        db = _reports_db([])
+        asyncio.run(tracker.snapshot(db, "reporter", now=now))
+
+        for minutes in (50, 40, 30):
+            tracker.record_report("reporter", (now - timedelta(minutes=minutes)).isoformat(), "victim")
+
+        snapshot = asyncio.run(tracker.snapshot(db, "reporter", now=now))
+        assert (snapshot["reports_last_hour"], snapshot["max_target_count"]) == (3, 3)
+
+        later = asyncio.run(tracker.snapshot(db, "reporter", now=now + timedelta(minutes=15)))
+        assert later["reports_last_hour"] == 2
+        assert later["reports_last_day"] == 3
+
+        next_day = asyncio.run(tracker.snapshot(db, "reporter", now=now + timedelta(days=1)))
+        assert next_day["reports_last_day"] == 0
+        assert next_day["max_target_count"] == 0 and next_day["hot_targets"] == 0
+        assert next_day["total_reports"] == 3
+        assert _report_reads(db) == 4  # 처음 집계 (개수 쿼리 3 + 최근 행 1)만
+
+    def test_transient_rpc_error_keeps_rpc(self, tracker):
+        db = _reports_db([], rpc=True)
+        db.rpc_errors[REPORT_ABUSE_RPC] = TimeoutError("read timeout")
+        asyncio.run(tracker.snapshot(db, "reporter"))
+
+        db.rpc_errors.clear()
+        asyncio.run(tracker.snapshot(db, "other"))
+
+        assert tracker.get_stats()["rpc_available"] is True
+        assert tracker.seeds == {"rpc": 1, "queries": 1}
+
+    def test_seed_since_is_utc(self, tracker):
+        sent = []
+        db = _reports_db([], rpc=True)
+        abuse_stats = db.rpcs[REPORT_ABUSE_RPC]
+
+        def recording(params):
+            sent.append(params["p_since"])
+            return abuse_stats(params)
+
+        db.rpcs[REPORT_ABUSE_RPC] = recording
+        asyncio.run(tracker.snapshot(db, "reporter"))
+
+        since = datetime.fromisoformat(sent[0])
+        assert since.utcoffset() == timedelta(0)
+        assert abs(datetime.now(timezone.utc) - timedelta(days=1) - since) < timedelta(minutes=1)
+
+
+class TestReportRoutes:
+    """create_report / process_report 연동"""
+
+    def _create(self, db, reporter="reporter"):
+        report = ReportCreate(
+            target_type=ReportTargetType.POST, target_id="p1",
+            category=ReportCategory.SPAM, reason="스팸 게시글입니다 신고합니다",
+        )
+        return asyncio.run(reports_router.create_report(
+            report, current_user=SimpleNamespace(uid=reporter, username="tester"), db=db
+        ))
+
+    def test_history_read_once_then_rate_limited_from_memory(self, tracker):
+        """이력 1만 건 신고자: 첫 신고에서만 집계, 이후 신고는 메모리 통계로 판정"""
+        history = _history(10000, datetime.now() - timedelta(days=2), seed=7, statuses=("pending", "resolved"))
+        db = _reports_db(history, rpc=True)
+
+        for _ in range(3):
+            self._create(db)
+        assert _report_reads(db) == 1
+
+        # 같은 작성자를 24시간 내 3회 신고 → 네 번째는 차단 (DB 재조회 없이)
+        with pytest.raises(HTTPException) as exc:
+            self._create(db)
+        assert exc.value.status_code == 429
+        assert exc.value.detail["abuse_type"] == "targeting"
+        assert _report_reads(db) == 1
+        assert tracker.get_stats()["recorded"] == 3
+
+    def test_process_report_updates_dismissal_rate(self, tracker):
+        now = datetime.now()
+        reports = [
+            {"report_id": f"r{i}", "reporter_id": "reporter", "reporter_username": "tester",
+             "target_type": "post", "target_id": f"x{i}", "target_author_id": None, "category": "spam",
+             "reason": "스팸", "status": "dismissed" if i < 3 else "resolved" if i < 8 else "pending",
+             "admin_note": None, "created_at": (now - timedelta(days=3)).isoformat(), "resolved_at": None}
+            for i in range(10)
+        ]
+        db = _reports_db(reports, rpc=True)
+        assert not asyncio.run(reports_router.check_reporter_abuse(db, "reporter"))["is_abusive"]
+
+        action = ReportAction(status=ReportStatus.DISMISSED, admin_note="기각")
+        asyncio.run(reports_router.process_report("r9", action, current_user=SimpleNamespace(uid="admin"), db=db))
+
+        result = asyncio.run(reports_router.check_reporter_abuse(db, "reporter"))
+        assert result["stats"]["dismissed_count"] == 4
+        assert result["abuse_type"] == "high_dismissal"
+        assert tracker.get_stats()["status_updates"] == 1
@@ -0,0 +1,191 @@
+"""
+Single-flight 요청 합치기 테스트
+
+- SingleFlight 단위 동작 (결과/예외 공유, 취소 격리)
+- football_data 라우터: 동시 캐시 미스가 업스트림 호출 1회 + Firestore 저장 1회로 합쳐지는지
+"""
+
+import asyncio
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from llm_service.utils.single_flight import SingleFlight
+from llm_service.utils.two_tier_cache import TwoTierCache
+
+
+class TestSingleFlight:
+    """SingleFlight 단위 테스트"""
+
+    def test_concurrent_calls_share_one_execution(self):
+        """같은 키 동시 호출은 한 번만 실행"""
+        flights = SingleFlight()
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return {"value": 42}
+
+        async def scenario():
+            return await asyncio.gather(*[flights.do("key", fetch) for _ in range(20)])
+
+        results = asyncio.run(scenario())
+
+        assert len(calls) == 1
+        assert all(data == {"value": 42} for data, _ in results)
+        assert sum(1 for _, shared in results if shared) == 19
+        assert flights.in_flight() == 0
+
+    def test_different_keys_run_separately(self):
+        """키가 다르면 각각 실행"""
+        flights = SingleFlight()
+
+        async def scenario():
+            return await asyncio.gather(
+                flights.do("a", lambda: asyncio.sleep(0.01, result="A")),
+                flights.do("b", lambda: asyncio.sleep(0.01, result="B")),
+            )
+
+        results = asyncio.run(scenario())
+
+        assert [data for data, _ in results] == ["A", "B"]
+        assert flights.calls == 2
+
+    def test_exception_propagates_to_all_waiters(self):
+        """실패하면 모든 대기자가 같은 예외를 받고, 다음 호출은 새로 실행"""
+        flights = SingleFlight()
+        calls = []
+
+        async def failing():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            raise RuntimeError("upstream down")
+
+        async def scenario():
+            results = await asyncio.gather(
+                *[flights.do("key", failing) for _ in range(5)], return_exceptions=True
+            )
+            with pytest.raises(RuntimeError):
+                await flights.do("key", failing)
+            return results
+
+        results = asyncio.run(scenario())
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert len(calls) == 2
+
+    def test_leader_cancel_does_not_cancel_followers(self):
+        """먼저 온 요청이 취소돼도 나머지 대기자는 결과를 받음"""
+        flights = SingleFlight()
+
+        async def fetch():
+            await asyncio.sleep(0.05)
+            return "ok"
+
+        async def scenario():
+            leader = asyncio.create_task(flights.do("key", fetch))
+            await asyncio.sleep(0)
+            follower = asyncio.create_task(flights.do("key", fetch))
+            await asyncio.sleep(0.01)
+            leader.cancel()
+            return await follower
+
+        data, shared = asyncio.run(scenario())
+
+        assert data == "ok"
+        assert shared is True
+
+
+# ============================================
+# football_data 라우터 스탬피드 테스트
+# ============================================
+
+class FakeFirestore:
+    """캐시 미스만 반환하고 저장 횟수를 기록하는 Firestore 대역"""
+
+    def __init__(self):
+        self.writes = []
+
+    def collection(self, name):
+        return self
+
+    def document(self, key):
+        firestore = self
+
+        class Doc:
+            exists = False
+
+            def get(self):
+                return self
+
+            def set(self, data):
+                firestore.writes.append(key)
+
+        return Doc()
+
+
+class FakeFootballClient:
+    """호출 횟수를 세는 업스트림 대역"""
+
+    def __init__(self):
+        self.calls = 0
+
+    async def get_standings(self, competition):
+        self.calls += 1
+        await asyncio.sleep(0.05)
+        return {"competition": competition, "standings": []}
+
+    async def get_live_matches(self):
+        self.calls += 1
+        await asyncio.sleep(0.05)
+        return [{"id": 1, "status": "IN_PLAY"}]
+
+
+class TestFootballStampede:
+    """동시 캐시 미스 합치기"""
+
+    @pytest.fixture
+    def app_and_fakes(self, monkeypatch):
+        from backend.routers import football_data
+        from backend.dependencies import get_optional_firestore_db
+
+        fake_db = FakeFirestore()
+        fake_client = FakeFootballClient()
+        monkeypatch.setattr(football_data, "get_football_api", lambda: fake_client)
+        flights = SingleFlight()
+        monkeypatch.setattr(football_data, "football_flights", flights)
+        monkeypatch.setattr(football_data, "football_cache", TwoTierCache(flights=flights))
+
+        app = FastAPI()
+        app.include_router(football_data.router, prefix="/api")
+        app.dependency_overrides[get_optional_firestore_db] = lambda: fake_db
+        return app, fake_db, fake_client
+
+    def _burst(self, app, path, count):
+        async def scenario():
+            async with httpx.AsyncClient(app=app, base_url="http://test") as client:
+                return await asyncio.gather(*[client.get(path) for _ in range(count)])
+
+        return asyncio.run(scenario())
+
+    def test_standings_stampede_single_upstream_call(self, app_and_fakes):
+        """순위표 동시 요청 50개 → 업스트림 1회, Firestore 저장 1회"""
+        app, fake_db, fake_client = app_and_fakes
+
+        responses = self._burst(app, "/api/football/standings?competition=PL", 50)
+
+        assert all(r.status_code == 200 for r in responses)
+        assert fake_client.calls == 1
+        assert fake_db.writes == ["standings_PL"]
+
+    def test_live_matches_stampede_single_upstream_call(self, app_and_fakes):
+        """라이브 경기 동시 요청 50개 → 업스트림 1회"""
+        app, fake_db, fake_client = app_and_fakes
+
+        responses = self._burst(app, "/api/football/matches/live", 50)
+
+        assert all(r.status_code == 200 for r in responses)
+        assert fake_client.calls == 1
+        assert fake_db.writes == ["matches_live_all"]
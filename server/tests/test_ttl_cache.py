@@ -0,0 +1,151 @@
+"""
+TTLCache + L1 답변 캐시 테스트
+
+- LRU 제거 순서 (조회하면 최근 사용으로 이동), 항목별 TTL 만료, 히트/미스/제거 카운터
+- CacheService L1: 정규화 질문이 같으면 ChromaDB 검색 없이 응답, 다르면 ChromaDB로,
+  Keyword 점수가 낮으면 L1 히트여도 캐시 무시
+"""
+
+import asyncio
+
+import pytest
+
+from llm_service.services import cache_service as cache_service_module
+from llm_service.services.cache_service import CacheService
+from llm_service.utils import ttl_cache as ttl_cache_module
+from llm_service.utils.ttl_cache import TTLCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(ttl_cache_module, "time", clock)
+    return clock
+
+
+class TestTTLCache:
+    """LRU + TTL"""
+
+    def test_lru_eviction_order(self, clock):
+        cache = TTLCache(maxsize=3, ttl_seconds=60)
+        for key in "abc":
+            cache.set(key, key.upper())
+
+        assert cache.get("a") == "A"  # a가 가장 최근 사용으로 이동
+        cache.set("d", "D")  # b 제거
+        cache.set("c", "C2")  # 덮어쓰기도 최근 사용으로 이동
+        cache.set("e", "E")  # a 제거
+
+        assert [key for key in "abcde" if key in cache] == ["c", "d", "e"]
+        assert cache.get("c") == "C2"
+        assert cache.evictions == 2
+
+    def test_ttl_expiry(self, clock):
+        cache = TTLCache(maxsize=10, ttl_seconds=60)
+        cache.set("default", 1)
+        cache.set("short", 2, ttl_seconds=5)
+
+        clock.now += 5
+        assert "short" not in cache
+        assert cache.get("short") is None
+        assert cache.get("default") == 1
+
+        clock.now += 55
+        assert cache.get("default", "만료") == "만료"
+        assert len(cache) == 0
+
+    def test_stats_counters(self, clock):
+        cache = TTLCache(maxsize=1, ttl_seconds=60)
+        cache.set("a", 1)
+        cache.get("a")
+        cache.get("a")
+        cache.get("missing")
+        cache.set("b", 2)  # a 제거
+        cache.get("a")
+
+        assert cache.get_stats() == {
+            "size": 1, "maxsize": 1, "hits": 2, "misses": 2, "evictions": 1, "hit_rate": 0.5,
+        }
+
+    def test_delete_and_clear(self, clock):
+        cache = TTLCache(maxsize=10, ttl_seconds=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+
+        assert cache.delete("a") is True
+        assert cache.delete("a") is False
+        cache.clear()
+        assert len(cache) == 0
+
+
+class FakeCacheRag:
+    """cached_answers 컬렉션 대역 (검색 호출 수 집계)"""
+
+    DEFAULT_COLLECTION = "langchain"
+
+    def __init__(self):
+        self.searches = 0
+        self.added = []
+
+    def search(self, collection_name, query, top_k=5, **kwargs):
+        self.searches += 1
+        return {"ids": [], "documents": [], "metadatas": [], "distances": []}
+
+    def add_documents(self, collection_name, documents, metadatas=None, ids=None, **kwargs):
+        self.added.append((collection_name, ids))
+
+    def migrate_collection(self, source, target):
+        return 0
+
+
+@pytest.fixture
+def cache_service(monkeypatch, clock):
+    rag = FakeCacheRag()
+    monkeypatch.setattr(cache_service_module, "get_rag_service", lambda persist_directory: rag)
+    return CacheService()
+
+
+QUERY = "Son 최근 경기 폼"
+ANSWER = "Son 최근 경기 폼은 3경기 2골로 좋습니다."
+
+
+class TestAnswerL1:
+    """CacheService L1 답변 캐시"""
+
+    def test_normalized_query_hits_l1(self, cache_service):
+        asyncio.run(cache_service.cache_answer(QUERY, ANSWER))
+
+        cached = asyncio.run(cache_service.get_cached_answer(f"  {QUERY.upper()}  "))
+
+        assert cached["answer"] == ANSWER
+        assert cached["source"] == "memory_cache"
+        assert cache_service.cache_rag.searches == 0
+        assert cache_service.answer_l1.get_stats()["hits"] == 1
+
+    def test_different_query_falls_through_to_chroma(self, cache_service):
+        asyncio.run(cache_service.cache_answer(QUERY, ANSWER))
+
+        assert asyncio.run(cache_service.get_cached_answer("아스날 다음 경기 일정")) is None
+        assert cache_service.cache_rag.searches == 1
+        assert cache_service.answer_l1.get_stats()["misses"] == 1
+
+    def test_low_keyword_score_ignored(self, cache_service):
+        asyncio.run(cache_service.cache_answer(QUERY, "죄송합니다. 지금은 답변할 수 없습니다."))
+
+        assert asyncio.run(cache_service.get_cached_answer(QUERY)) is None
+        assert cache_service.cache_rag.searches == 0
+
+    def test_l1_expires(self, cache_service, clock):
+        asyncio.run(cache_service.cache_answer(QUERY, ANSWER))
+        clock.now += cache_service.answer_l1.ttl_seconds
+
+        assert asyncio.run(cache_service.get_cached_answer(QUERY)) is None
+        assert cache_service.cache_rag.searches == 1
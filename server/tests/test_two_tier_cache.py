@@ -0,0 +1,209 @@
+"""
+TwoTierCache 테스트
+
+메모리(L1) → 저장소(L2) → 업스트림 순서 조회와 stale-while-revalidate 동작 검증
+"""
+
+import asyncio
+import time
+
+from llm_service.utils.two_tier_cache import TwoTierCache
+
+
+class FakeStore:
+    """Firestore 대역 (읽기/쓰기 횟수 기록)"""
+
+    def __init__(self, entries=None):
+        self.entries = dict(entries or {})
+        self.reads = 0
+        self.writes = []
+
+    def get(self, key):
+        self.reads += 1
+        return self.entries.get(key)
+
+    def set(self, key, value, metadata=None):
+        self.writes.append((key, metadata))
+        self.entries[key] = (value, time.time())
+
+
+class Upstream:
+    """업스트림 API 대역"""
+
+    def __init__(self, delay=0.0, fail=False):
+        self.calls = 0
+        self.delay = delay
+        self.fail = fail
+
+    async def fetch(self):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("upstream down")
+        return {"version": self.calls}
+
+
+class TestTwoTierCache:
+    """2단 캐시 조회 순서"""
+
+    def test_miss_then_memory_hit(self):
+        """첫 요청은 API, 이후는 메모리에서 (저장소 재조회 없음)"""
+        cache = TwoTierCache()
+        store = FakeStore()
+        upstream = Upstream()
+
+        async def scenario():
+            first = await cache.get_or_fetch("k", upstream.fetch, ttl_seconds=60, store=store)
+            second = await cache.get_or_fetch("k", upstream.fetch, ttl_seconds=60, store=store)
+            return first, second
+
+        first, second = asyncio.run(scenario())
+
+        assert first == ({"version": 1}, "api")
+        assert second == ({"version": 1}, "memory")
+        assert upstream.calls == 1
+        assert store.reads == 1
+        assert [key for key, _ in store.writes] == ["k"]
+
+    def test_store_hit_promotes_to_memory(self):
+        """다른 인스턴스가 저장한 값은 저장소에서 읽고 메모리로 올림"""
+        cache = TwoTierCache()
+        store = FakeStore({"k": ({"version": "stored"}, time.time() - 5)})
+        upstream = Upstream()
+
+        async def scenario():
+            first = await cache.get_or_fetch("k", upstream.fetch, ttl_seconds=60, store=store)
+            second = await cache.get_or_fetch("k", upstream.fetch, ttl_seconds=60, store=store)
+            return first, second
+
+        first, second = asyncio.run(scenario())
+
+        assert first == ({"version": "stored"}, "store")
+        assert second == ({"version": "stored"}, "memory")
+        assert store.reads == 1
+        assert upstream.calls == 0
+
+    def test_concurrent_store_reads_are_coalesced(self):
+        """메모리 미스가 동시에 몰려도 저장소 조회는 1회"""
+        cache = TwoTierCache()
+        store = FakeStore({"k": ({"version": "stored"}, time.time())})
+
+        async def scenario():
+            return await asyncio.gather(
+                *[cache.get_or_fetch("k", Upstream().fetch, ttl_seconds=60, store=store) for _ in range(20)]
+            )
+
+        results = asyncio.run(scenario())
+
+        assert all(value == {"version": "stored"} for value, _ in results)
+        assert store.reads == 1
+
+    def test_force_refresh_skips_cache(self):
+        """force_refresh는 캐시를 무시하고 업스트림 호출"""
+        cache = TwoTierCache()
+        upstream = Upstream()
+
+        async def scenario():
+            await cache.get_or_fetch("k", upstream.fetch, ttl_seconds=60)
+            return await cache.get_or_fetch("k", upstream.fetch, ttl_seconds=60, force_refresh=True)
+
+        value, source = asyncio.run(scenario())
+
+        assert (value, source) == ({"version": 2}, "api")
+
+    def test_empty_result_is_not_cached(self):
+        """빈 결과는 저장하지 않음"""
+        cache = TwoTierCache()
+        store = FakeStore()
+
+        async def empty():
+            return []
+
+        async def scenario():
+            await cache.get_or_fetch("k", empty, ttl_seconds=60, store=store)
+            return await cache.get_or_fetch("k", empty, ttl_seconds=60, store=store)
+
+        _, source = asyncio.run(scenario())
+
+        assert source == "api"
+        assert store.writes == []
+
+
+class TestStaleWhileRevalidate:
+    """만료 항목 즉시 반환 + 백그라운드 갱신"""
+
+    def test_stale_served_and_refreshed_once(self):
+        """stale 항목은 즉시 반환되고, 동시 요청이 많아도 갱신은 1회"""
+        cache = TwoTierCache()
+        store = FakeStore({"k": ({"version": "old"}, time.time() - 90)})
+        upstream = Upstream(delay=0.05)
+
+        async def scenario():
+            started = time.monotonic()
+            results = await asyncio.gather(
+                *[cache.get_or_fetch("k", upstream.fetch, ttl_seconds=60, store=store) for _ in range(10)]
+            )
+            elapsed = time.monotonic() - started
+            await cache.wait_refreshes()
+            after = await cache.get_or_fetch("k", upstream.fetch, ttl_seconds=60, store=store)
+            return results, elapsed, after
+
+        results, elapsed, after = asyncio.run(scenario())
+
+        assert all(result == ({"version": "old"}, "stale") for result in results)
+        assert elapsed < 0.05
+        assert upstream.calls == 1
+        assert after == ({"version": 1}, "memory")
+
+    def test_expired_beyond_stale_window_blocks_on_fetch(self):
+        """stale 기간까지 지난 항목은 업스트림 결과를 기다림"""
+        cache = TwoTierCache()
+        store = FakeStore({"k": ({"version": "old"}, time.time() - 200)})
+        upstream = Upstream()
+
+        value, source = asyncio.run(
+            cache.get_or_fetch("k", upstream.fetch, ttl_seconds=60, stale_seconds=60, store=store)
+        )
+
+        assert (value, source) == ({"version": 1}, "api")
+
+    def test_refresh_failure_keeps_stale_value(self):
+        """백그라운드 갱신이 실패해도 stale 값은 계속 반환"""
+        cache = TwoTierCache()
+        store = FakeStore({"k": ({"version": "old"}, time.time() - 90)})
+        upstream = Upstream(fail=True)
+
+        async def scenario():
+            first = await cache.get_or_fetch("k", upstream.fetch, ttl_seconds=60, store=store)
+            await cache.wait_refreshes()
+            second = await cache.get_or_fetch("k", upstream.fetch, ttl_seconds=60, store=store)
+            await cache.wait_refreshes()
+            return first, second
+
+        first, second = asyncio.run(scenario())
+
+        assert first == ({"version": "old"}, "stale")
+        assert second == ({"version": "old"}, "stale")
+        assert cache.stats["refresh_errors"] == 2
+
+    def test_ttl_by_result(self):
+        """결과별 TTL (끝난 경기는 길게, 진행 중 경기는 짧게)"""
+        cache = TwoTierCache()
+        now = time.time()
+        store = FakeStore({
+            "finished": ({"status": "FINISHED"}, now - 30 * 60),
+            "live": ({"status": "IN_PLAY"}, now - 30 * 60),
+        })
+
+        def ttl(data):
+            return 3600 if data["status"] == "FINISHED" else 600
+
+        async def fetch_live():
+            return {"status": "IN_PLAY"}
+
+        async def scenario():
+            finished = await cache.get_or_fetch("finished", fetch_live, ttl_seconds=ttl, store=store)
+            live = await cache.get_or_fetch("live", fetch_live, ttl_seconds=ttl, store=store, stale_seconds=0)
+            return finished[1], live[1]
+
+        assert asyncio.run(scenario()) == ("store", "api")
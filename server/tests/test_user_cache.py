@@ -0,0 +1,207 @@
+"""
+인증 사용자 캐시 테스트 (Supabase 없이)
+
+- get_current_user: 사용자당 TTL 동안 users 조회 1번
+- 로그인 시 미리 채움, 사용자 정보 수정 시 무효화
+- 동시 미스 합치기, 조회 중 무효화, 공유 저장소
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+
+from backend import dependencies
+from backend import user_cache as user_cache_module
+from backend.dependencies import create_access_token, get_current_user
+from backend.models import UserLogin, UserProfileUpdate, UserResponse, UserUpdate
+from backend.routers import auth as auth_router
+from backend.routers import users as users_router
+from backend.user_cache import UserCache
+from llm_service.utils import ttl_cache as ttl_cache_module
+from tests.conftest import FakeSupabaseClient
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+
+def _user_row(uid, username):
+    return {"uid": uid, "email": f"{uid}@example.com", "username": username, "created_at": "2025-01-01T00:00:00"}
+
+
+def _user_reads(db):
+    """users 조회 조건 목록 (조회 순서대로)"""
+    return [q.eqs for q in db.selects("users")]
+
+
+@pytest.fixture
+def db(monkeypatch):
+    db = FakeSupabaseClient({"users": [_user_row("u1", "alice"), _user_row("u2", "bob")]})
+    monkeypatch.setattr(dependencies, "get_supabase_client", lambda: db)
+    return db
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(ttl_cache_module, "time", clock)
+    return clock
+
+
+@pytest.fixture
+def cache(monkeypatch, clock):
+    cache = UserCache(maxsize=100, ttl_seconds=60)
+    monkeypatch.setattr(user_cache_module, "_user_cache", cache)
+    return cache
+
+
+def _auth(uid):
+    return SimpleNamespace(credentials=create_access_token({"uid": uid}))
+
+
+def _current_user(uid):
+    return asyncio.run(get_current_user(_auth(uid)))
+
+
+class TestGetCurrentUser:
+    """get_current_user 캐시"""
+
+    def test_db_hit_once_per_user_per_ttl(self, db, cache, clock):
+        for _ in range(5):
+            assert _current_user("u1").username == "alice"
+            assert _current_user("u2").username == "bob"
+
+        assert _user_reads(db) == [{"uid": "u1"}, {"uid": "u2"}]
+
+        clock.now += 61
+        _current_user("u1")
+        _current_user("u1")
+
+        assert _user_reads(db) == [{"uid": "u1"}, {"uid": "u2"}, {"uid": "u1"}]
+        stats = cache.get_stats()
+        assert stats["db_loads"] == 3
+        assert stats["hits"] == 9
+
+    def test_unknown_user_not_cached(self, db, cache):
+        for _ in range(2):
+            with pytest.raises(HTTPException) as exc:
+                _current_user("ghost")
+            assert exc.value.status_code == 404
+
+        assert len(_user_reads(db)) == 2
+
+    def test_concurrent_misses_coalesced(self, db, cache):
+        async def run():
+            return await asyncio.gather(*(get_current_user(_auth("u1")) for _ in range(10)))
+
+        users = asyncio.run(run())
+
+        assert {u.username for u in users} == {"alice"}
+        assert len(_user_reads(db)) == 1
+
+
+class TestPopulateAndInvalidate:
+    """로그인 시 채움 / 수정 시 무효화"""
+
+    def test_login_populates(self, db, cache):
+        db.tables["users"][0]["email"] = "alice@example.com"
+
+        asyncio.run(auth_router.login(UserLogin(email="alice@example.com", password="pw"), db=db))
+        reads = len(_user_reads(db))
+
+        assert _current_user("u1").username == "alice"
+        assert len(_user_reads(db)) == reads
+
+    @pytest.mark.parametrize("update", [
+        lambda user, db: users_router.update_current_user(UserUpdate(username="alice2"), current_user=user, db=db),
+        lambda user, db: users_router.update_my_profile(UserProfileUpdate(username="alice2"), current_user=user, db=db),
+        lambda user, db: auth_router.update_user({"username": "alice2"}, current_user=user, db=db),
+    ])
+    def test_profile_update_invalidates(self, db, cache, update):
+        user = _current_user("u1")
+
+        asyncio.run(update(user, db))
+
+        assert _current_user("u1").username == "alice2"
+        assert _user_reads(db).count({"uid": "u1"}) == 2
+        assert cache.get_stats()["invalidations"] == 1
+
+    def test_invalidate_during_load_skips_store(self, cache):
+        def user(username):
+            return UserResponse(uid="u1", email="u1@example.com", username=username, created_at="2025-01-01T00:00:00")
+
+        async def run():
+            started, release = asyncio.Event(), asyncio.Event()
+
+            async def load_old():
+                started.set()
+                await release.wait()
+                return user("old")
+
+            async def load_new():
+                return user("new")
+
+            first = asyncio.create_task(cache.get_or_load("u1", load_old))
+            await started.wait()
+            cache.invalidate("u1")  # 조회 도중 프로필 수정
+            # 무효화 이후 요청은 진행 중인 (수정 전) 조회에 합치지 않고 새로 조회
+            second = await asyncio.wait_for(cache.get_or_load("u1", load_new), timeout=1)
+            release.set()
+            return await first, second
+
+        first, second = asyncio.run(run())
+
+        assert (first.username, second.username) == ("old", "new")
+        assert cache.get("u1").username == "new"
+        assert cache.get_stats()["coalesced"] == 0
+        assert cache._loading == {}
+
+    def test_invalidation_state_not_kept_after_load(self, db, cache):
+        # 조회 중이 아닌 uid의 무효화는 상태를 남기지 않음 (uid 수만큼 커지지 않음)
+        for i in range(100):
+            cache.invalidate(f"u{i}")
+        _current_user("u1")
+        with pytest.raises(HTTPException):
+            _current_user("ghost")
+
+        assert cache._loading == {}
+        assert cache.get_stats()["invalidations"] == 100
+        assert cache.get("u1").username == "alice"
+
+
+class TestSharedStore:
+    """공유 저장소"""
+
+    class DictStore:
+        def __init__(self):
+            self.data = {}
+
+        def get(self, uid):
+            return self.data.get(uid)
+
+        def set(self, uid, value, ttl_seconds):
+            self.data[uid] = value
+
+        def delete(self, uid):
+            self.data.pop(uid, None)
+
+    def test_other_worker_reads_shared_value(self, db, clock):
+        store = self.DictStore()
+        worker_a = UserCache(shared=store)
+        worker_b = UserCache(shared=store)
+
+        asyncio.run(worker_a.get_or_load("u1", lambda: dependencies._load_user("u1")))
+        user = asyncio.run(worker_b.get_or_load("u1", lambda: dependencies._load_user("u1")))
+
+        assert user.username == "alice"
+        assert len(_user_reads(db)) == 1
+        assert worker_b.get_stats()["shared_hits"] == 1
+
+        worker_b.invalidate("u1")
+        assert store.data == {}